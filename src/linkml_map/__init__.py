@@ -1,6 +1,33 @@
-from linkml_map.transformer.object_transformer import ObjectTransformer
+"""Transform data between LinkML schemas.
+
+The public classes are imported on first access, so that importing a
+submodule (such as the CLI) does not pay for the whole transformer stack.
+"""
+
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from linkml_map.session import Session
+    from linkml_map.transformer.object_transformer import ObjectTransformer
 
 __all__ = [
     "ObjectTransformer",
     "Session",
 ]
+
+_LAZY_ATTRIBUTES = {
+    "ObjectTransformer": "linkml_map.transformer.object_transformer",
+    "Session": "linkml_map.session",
+}
+
+
+def __getattr__(name: str) -> Any:  # noqa: ANN401
+    """Import public classes on first access."""
+    module = _LAZY_ATTRIBUTES.get(name)
+    if module is None:
+        msg = f"module {__name__!r} has no attribute {name!r}"
+        raise AttributeError(msg)
+    value = getattr(import_module(module), name)
+    globals()[name] = value
+    return value
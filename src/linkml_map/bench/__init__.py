@@ -0,0 +1,17 @@
+"""Throughput benchmarks over synthetic data."""
+
+from linkml_map.bench.runner import format_report, run_benchmarks, run_scenario
+from linkml_map.bench.scenarios import SCENARIOS, Scenario, get_scenarios
+from linkml_map.bench.synthetic import RowGenerator, spec_references, write_synthetic_data
+
+__all__ = [
+    "SCENARIOS",
+    "RowGenerator",
+    "Scenario",
+    "format_report",
+    "get_scenarios",
+    "run_benchmarks",
+    "run_scenario",
+    "spec_references",
+    "write_synthetic_data",
+]
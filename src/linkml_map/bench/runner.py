@@ -0,0 +1,221 @@
+"""Run benchmark scenarios and report throughput, memory and per-stage time."""
+
+from __future__ import annotations
+
+import logging
+import multiprocessing
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+from importlib.metadata import PackageNotFoundError, version
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+import yaml
+from more_itertools import chunked
+
+from linkml_map.bench.scenarios import SOURCE_SCHEMA, TARGET_SCHEMA, Scenario, get_scenarios
+from linkml_map.bench.synthetic import RowGenerator, spec_references, write_synthetic_data
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+logger = logging.getLogger(__name__)
+
+REPORT_VERSION = 1
+_CHUNK_SIZE = 1000
+
+
+def peak_rss_mb() -> float | None:
+    """Peak resident set size of this process in MiB, or ``None`` where unsupported."""
+    try:
+        import resource
+    except ImportError:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports KiB, macOS bytes.
+    return round(peak / (1 << 20 if sys.platform == "darwin" else 1 << 10), 1)
+
+
+def _git_commit() -> str | None:
+    try:
+        result = subprocess.run(  # noqa: S603
+            ["git", "rev-parse", "--short", "HEAD"],  # noqa: S607
+            capture_output=True,
+            text=True,
+            check=True,
+            cwd=Path(__file__).parent,
+            timeout=5,
+        )
+    except (OSError, subprocess.SubprocessError):
+        return None
+    return result.stdout.strip() or None
+
+
+def environment() -> dict[str, Any]:
+    """Describe the software and machine a report was produced on."""
+    try:
+        linkml_map_version = version("linkml-map")
+    except PackageNotFoundError:
+        linkml_map_version = "unknown"
+    return {
+        "linkml_map": linkml_map_version,
+        "commit": _git_commit(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "cpu_count": multiprocessing.cpu_count(),
+    }
+
+
+def run_scenario(scenario: Scenario, rows: int, workdir: str | Path, seed: int = 0) -> dict[str, Any]:
+    """
+    Generate data for *scenario*, run it once and measure it.
+
+    Stages are timed separately: ``generate`` (writing the synthetic input,
+    not part of the throughput), ``load`` (schemas and specification,
+    including derivation), ``transform`` (producing rows with
+    ``transform_spec``) and ``serialize`` (encoding them as JSONL).
+    ``rows_per_second`` counts primary source rows over ``transform`` plus
+    ``serialize``.
+
+    :param scenario: Workload to run.
+    :param rows: Number of primary source rows.
+    :param workdir: Directory for the generated input.
+    :param seed: Seed for the synthetic data.
+    """
+    from linkml_runtime import SchemaView
+
+    from linkml_map.loaders import DataLoader
+    from linkml_map.transformer.engine import transform_spec
+    from linkml_map.transformer.object_transformer import ObjectTransformer
+    from linkml_map.writers import OutputFormat, make_stream_writer
+
+    stages: dict[str, float] = {}
+    spec = yaml.safe_load(scenario.spec)
+
+    start = time.perf_counter()
+    tr = ObjectTransformer()
+    tr.source_schemaview = SchemaView(SOURCE_SCHEMA)
+    tr.target_schemaview = SchemaView(TARGET_SCHEMA)
+    tr.create_transformer_specification(spec)
+    derived = tr.derived_specification
+    stages["load"] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    counts = scenario.counts(rows)
+    generator = RowGenerator(
+        tr.source_schemaview, counts, references=spec_references(derived, tr.source_schemaview), seed=seed
+    )
+    data_dir = Path(workdir) / scenario.name
+    write_synthetic_data(generator, data_dir)
+    stages["generate"] = time.perf_counter() - start
+
+    loader = DataLoader(data_dir, schemaview=tr.source_schemaview)
+    writer = make_stream_writer(OutputFormat.JSONL)
+    rows_out = bytes_out = 0
+    transform_time = serialize_time = 0.0
+    chunks = iter(chunked(transform_spec(tr, loader, join_engine=scenario.join_engine), _CHUNK_SIZE))
+    while True:
+        start = time.perf_counter()
+        chunk = next(chunks, None)
+        transform_time += time.perf_counter() - start
+        if chunk is None:
+            break
+        start = time.perf_counter()
+        bytes_out += sum(len(fragment) for fragment in writer.write_chunk(chunk))
+        serialize_time += time.perf_counter() - start
+        rows_out += len(chunk)
+    bytes_out += sum(len(fragment) for fragment in writer.finalize())
+    stages["transform"] = transform_time
+    stages["serialize"] = serialize_time
+
+    seconds = transform_time + serialize_time
+    return {
+        "scenario": scenario.name,
+        "rows_in": counts[scenario.primary],
+        "rows_out": rows_out,
+        "bytes_out": bytes_out,
+        "seconds": round(seconds, 4),
+        "rows_per_second": round(counts[scenario.primary] / seconds, 1) if seconds else None,
+        "peak_rss_mb": peak_rss_mb(),
+        "stages": {name: round(value, 4) for name, value in stages.items()},
+    }
+
+
+def _run_isolated(name: str, rows: int, workdir: str, seed: int) -> dict[str, Any]:
+    """Entry point for running one scenario in a fresh process."""
+    (scenario,) = get_scenarios([name])
+    return run_scenario(scenario, rows, workdir, seed)
+
+
+def run_benchmarks(
+    scenarios: Iterable[Scenario],
+    rows: int,
+    seed: int = 0,
+    repeat: int = 1,
+    isolate: bool = True,
+) -> dict[str, Any]:
+    """
+    Run *scenarios* and return a JSON-serializable report.
+
+    Each scenario runs *repeat* times and the fastest run is reported, the
+    usual way to filter out scheduling noise. With *isolate* every run
+    happens in a freshly spawned interpreter, so ``peak_rss_mb`` reflects that
+    scenario alone and no scenario benefits from caches warmed by another.
+
+    :param scenarios: Workloads to run.
+    :param rows: Number of primary source rows per scenario.
+    :param seed: Seed for the synthetic data (fixed, so runs are comparable).
+    :param repeat: Runs per scenario.
+    :param isolate: Run each scenario in its own process.
+    """
+    results = []
+    with tempfile.TemporaryDirectory(prefix="linkml-map-bench-") as workdir:
+        for scenario in scenarios:
+            runs = []
+            for _ in range(repeat):
+                if isolate:
+                    with multiprocessing.get_context("spawn").Pool(1) as pool:
+                        runs.append(pool.apply(_run_isolated, (scenario.name, rows, workdir, seed)))
+                else:
+                    runs.append(run_scenario(scenario, rows, workdir, seed))
+            best = min(runs, key=lambda r: r["seconds"])
+            peaks = [r["peak_rss_mb"] for r in runs if r["peak_rss_mb"] is not None]
+            best["peak_rss_mb"] = max(peaks) if peaks else None
+            logger.info("%s: %s rows/s", scenario.name, best["rows_per_second"])
+            results.append(best)
+    return {
+        "version": REPORT_VERSION,
+        "environment": environment(),
+        "settings": {"rows": rows, "seed": seed, "repeat": repeat, "isolate": isolate},
+        "results": results,
+    }
+
+
+def format_report(report: dict[str, Any], baseline: dict[str, Any] | None = None) -> str:
+    """
+    Render *report* as a text table, with the speed-up over *baseline* if given.
+
+    A speed-up above 1 means *report* is faster than *baseline* for that scenario.
+    """
+    previous = {r["scenario"]: r for r in (baseline or {}).get("results", [])}
+    header = f"{'scenario':<16} {'rows/s':>12} {'peak MiB':>9} {'transform s':>12} {'serialize s':>12}"
+    if baseline is not None:
+        header += f" {'speed-up':>9}"
+    lines = [header]
+    for r in report["results"]:
+        line = (
+            f"{r['scenario']:<16} {r['rows_per_second'] or 0:>12,.0f} {r['peak_rss_mb'] or 0:>9.1f} "
+            f"{r['stages']['transform']:>12.3f} {r['stages']['serialize']:>12.3f}"
+        )
+        if baseline is not None:
+            old = previous.get(r["scenario"])
+            if old and old.get("rows_per_second") and r["rows_per_second"]:
+                line += f" {r['rows_per_second'] / old['rows_per_second']:>8.2f}x"
+            else:
+                line += f" {'-':>9}"
+        lines.append(line)
+    return "\n".join(lines)
@@ -0,0 +1,316 @@
+"""Representative transformation workloads for benchmarking.
+
+All scenarios share one source schema (people, their visits and
+measurements) and one target schema, so their throughput can be compared
+with each other as well as across commits.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+
+SOURCE_SCHEMA = """\
+id: https://w3id.org/linkml-map/bench/source
+name: bench_source
+prefixes:
+  linkml: https://w3id.org/linkml/
+  bench: https://w3id.org/linkml-map/bench/
+default_prefix: bench
+default_range: string
+imports:
+  - linkml:types
+classes:
+  Person:
+    attributes:
+      id: {identifier: true}
+      name: {}
+      email: {}
+      age_in_years: {range: integer, minimum_value: 0, maximum_value: 99}
+      birth_date: {range: date}
+      height_cm: {range: float, minimum_value: 140, maximum_value: 210, unit: {ucum_code: cm}}
+      weight_g: {range: float, minimum_value: 40000, maximum_value: 150000, unit: {ucum_code: g}}
+      smoker: {range: boolean}
+      status: {range: PersonStatus}
+      street: {}
+      city: {}
+      postal_code: {}
+      # Placeholder for the melted slot of the pivot scenario (not generated).
+      measurements: {multivalued: true}
+  Visit:
+    attributes:
+      id: {identifier: true}
+      person_id: {}
+      visit_date: {range: date}
+      systolic: {range: integer, minimum_value: 90, maximum_value: 180}
+      diastolic: {range: integer, minimum_value: 60, maximum_value: 110}
+      site: {}
+enums:
+  PersonStatus:
+    permissible_values: {ACTIVE: {}, INACTIVE: {}, PENDING: {}, DECEASED: {}}
+"""
+
+TARGET_SCHEMA = """\
+id: https://w3id.org/linkml-map/bench/target
+name: bench_target
+prefixes:
+  linkml: https://w3id.org/linkml/
+  bench: https://w3id.org/linkml-map/bench/
+default_prefix: bench
+default_range: string
+imports:
+  - linkml:types
+classes:
+  Agent:
+    attributes:
+      id: {identifier: true}
+      name: {}
+      email: {}
+      age_in_years: {range: integer}
+      birth_date: {range: date}
+      smoker: {range: boolean}
+      city: {}
+      postal_code: {}
+      status: {range: AgentStatus}
+      label: {}
+      age_in_months: {range: integer}
+      bmi: {range: float}
+      age_group: {}
+      domain: {}
+      address: {range: Address, inlined: true}
+      height_m: {range: float}
+      weight_kg: {range: float}
+      measurements: {range: Observation, multivalued: true, inlined_as_list: true}
+  Address:
+    attributes:
+      street: {}
+      city: {}
+      postal_code: {}
+  Observation:
+    attributes:
+      id: {}
+      variable: {}
+      value: {range: float}
+  Encounter:
+    attributes:
+      id: {identifier: true}
+      visit_date: {range: date}
+      person_name: {}
+      person_age: {range: integer}
+      person_city: {}
+      pulse_pressure: {range: integer}
+      person_key: {}
+      site_slug: {}
+enums:
+  AgentStatus:
+    permissible_values: {current: {}, former: {}, unknown: {}}
+"""
+
+
+@dataclass
+class Scenario:
+    """
+    One benchmark workload.
+
+    :param name: Short identifier, used on the command line and in reports.
+    :param description: What the workload exercises.
+    :param spec: Transformation specification (YAML).
+    :param primary: Source class whose rows drive the run; its row count is
+        the benchmark's ``--rows``.
+    :param tables: Row count of each other source table, relative to the
+        primary's.
+    :param join_engine: Whether joined blocks may use the set-based join engine.
+    """
+
+    name: str
+    description: str
+    spec: str
+    primary: str
+    tables: dict[str, float] = field(default_factory=dict)
+    join_engine: bool = True
+
+    def counts(self, rows: int) -> dict[str, int]:
+        """Row count per source table for a run over *rows* primary rows."""
+        counts = {self.primary: rows}
+        for table, ratio in self.tables.items():
+            counts[table] = max(1, round(rows * ratio))
+        return counts
+
+
+_JOIN_SPEC = """\
+class_derivations:
+  Encounter:
+    populated_from: Visit
+    joins:
+      Person: {source_key: person_id, lookup_key: id}
+    slot_derivations:
+      id:
+      visit_date:
+      person_name: {expr: "{Person.name}"}
+      person_age: {expr: "{Person.age_in_years}"}
+      person_city: {expr: "{Person.city}"}
+      pulse_pressure: {expr: "{systolic} - {diastolic}"}
+"""
+
+SCENARIOS = [
+    Scenario(
+        name="flat_copy",
+        description="Copy scalar slots one to one.",
+        primary="Person",
+        spec="""\
+class_derivations:
+  Agent:
+    populated_from: Person
+    slot_derivations:
+      id:
+      name:
+      email:
+      age_in_years:
+      birth_date:
+      smoker:
+      city:
+      postal_code:
+""",
+    ),
+    Scenario(
+        name="expr_heavy",
+        description="Arithmetic, string and conditional expressions on every row.",
+        primary="Person",
+        spec="""\
+class_derivations:
+  Agent:
+    populated_from: Person
+    slot_derivations:
+      id:
+      label: {expr: "{name} + ' <' + {email} + '>'"}
+      age_in_months: {expr: "{age_in_years} * 12"}
+      bmi: {expr: "round({weight_g} / 1000 / ({height_cm} / 100) ** 2, 1)"}
+      age_group: {expr: "'adult' if {age_in_years} >= 18 else 'minor'"}
+      domain: {expr: "substr({email}, 0, 5)"}
+""",
+    ),
+    Scenario(
+        name="enum_mapping",
+        description="Map a source enum to a target enum through permissible value derivations.",
+        primary="Person",
+        spec="""\
+class_derivations:
+  Agent:
+    populated_from: Person
+    slot_derivations:
+      id:
+      status:
+enum_derivations:
+  AgentStatus:
+    populated_from: PersonStatus
+    permissible_value_derivations:
+      current: {populated_from: [ACTIVE, PENDING]}
+      former: {populated_from: [INACTIVE, DECEASED]}
+""",
+    ),
+    Scenario(
+        name="join_engine",
+        description="Star join resolved set-based by the DuckDB join engine.",
+        primary="Visit",
+        tables={"Person": 0.25},
+        spec=_JOIN_SPEC,
+    ),
+    Scenario(
+        name="join_fallback",
+        description="The same join resolved row by row through the lookup index.",
+        primary="Visit",
+        tables={"Person": 0.25},
+        spec=_JOIN_SPEC,
+        join_engine=False,
+    ),
+    Scenario(
+        name="join_functions",
+        description="Join with slugify/uuid5 expressions (DuckDB UDFs with the 'arrow' extra installed).",
+        primary="Visit",
+        tables={"Person": 0.25},
+        spec="""\
+class_derivations:
+  Encounter:
+    populated_from: Visit
+    joins:
+      Person: {source_key: person_id, lookup_key: id}
+    slot_derivations:
+      id:
+      person_key: {expr: "uuid5('https://w3id.org/linkml-map/bench/', {Person.id})"}
+      site_slug: {expr: "slugify({site} + ' ' + {Person.city})"}
+""",
+    ),
+    Scenario(
+        name="nested",
+        description="Build an inlined object from columns of the same row.",
+        primary="Person",
+        spec="""\
+class_derivations:
+  Agent:
+    populated_from: Person
+    slot_derivations:
+      id:
+      name:
+      address:
+        class_derivations:
+          Address:
+            populated_from: Person
+            slot_derivations:
+              street:
+              city:
+              postal_code:
+""",
+    ),
+    Scenario(
+        name="pivot",
+        description="Melt wide measurement columns into a list of observations.",
+        primary="Person",
+        spec="""\
+class_derivations:
+  Agent:
+    populated_from: Person
+    slot_derivations:
+      id:
+      measurements:
+        pivot_operation:
+          direction: MELT
+          variable_slot: variable
+          value_slot: value
+          source_slots: [age_in_years, height_cm, weight_g]
+          id_slots: [id]
+""",
+    ),
+    Scenario(
+        name="unit_conversion",
+        description="Convert UCUM units on two slots of every row.",
+        primary="Person",
+        spec="""\
+class_derivations:
+  Agent:
+    populated_from: Person
+    slot_derivations:
+      id:
+      height_m:
+        populated_from: height_cm
+        unit_conversion: {target_unit: m}
+      weight_kg:
+        populated_from: weight_g
+        unit_conversion: {target_unit: kg}
+""",
+    ),
+]
+
+
+def get_scenarios(names: list[str] | tuple[str, ...] | None = None) -> list[Scenario]:
+    """
+    Return the named scenarios, or all of them.
+
+    :raises ValueError: If a name is unknown.
+    """
+    if not names:
+        return list(SCENARIOS)
+    by_name = {s.name: s for s in SCENARIOS}
+    unknown = [n for n in names if n not in by_name]
+    if unknown:
+        msg = f"Unknown scenario(s): {', '.join(unknown)}; choose from {', '.join(by_name)}"
+        raise ValueError(msg)
+    return [by_name[n] for n in names]
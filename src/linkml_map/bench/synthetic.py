@@ -0,0 +1,190 @@
+"""Deterministic synthetic source data generated from a LinkML schema."""
+
+from __future__ import annotations
+
+import csv
+import random
+from datetime import date, datetime, timedelta
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator, Mapping
+
+    from linkml_runtime import SchemaView
+    from linkml_runtime.linkml_model import SlotDefinition
+
+    from linkml_map.datamodel.transformer_model import TransformationSpecification
+
+_INTEGER_TYPES = frozenset({"integer"})
+_FLOAT_TYPES = frozenset({"float", "double", "decimal"})
+_EPOCH = date(2000, 1, 1)
+
+
+def identifier_value(class_name: str, index: int) -> str:
+    """Return the identifier of the *index*-th generated row of *class_name*."""
+    return f"{class_name}:{index:08d}"
+
+
+def _type_base(sv: SchemaView, range_name: str | None) -> str:
+    """Resolve a type range through ``typeof`` to its builtin LinkML type name."""
+    seen = set()
+    while range_name is not None and range_name not in seen:
+        seen.add(range_name)
+        t = sv.get_type(range_name)
+        if t is None or t.typeof is None:
+            return range_name
+        range_name = t.typeof
+    return range_name or "string"
+
+
+class RowGenerator:
+    """
+    Generate rows for the classes of a schema.
+
+    Values follow each induced slot: identifiers are unique and predictable
+    (see :func:`identifier_value`), enum slots draw from the permissible
+    values, numeric slots respect ``minimum_value``/``maximum_value``, dates
+    and booleans are well formed, and slots whose range is a class with an
+    identifier reference an existing row of that class. *references* adds
+    the same for plain key columns, such as a join's ``lookup_key``.
+
+    Multivalued and inlined slots are left out, since the generated rows
+    are written to flat files.
+
+    :param sv: Source schema.
+    :param counts: Number of rows per class; references point into this range.
+    :param references: ``{(class, slot): referenced_class}`` for key columns
+        that are not typed as references in the schema.
+    :param seed: Random seed; equal inputs always generate equal rows.
+    :param null_rate: Probability that an optional slot is left empty.
+    """
+
+    def __init__(
+        self,
+        sv: SchemaView,
+        counts: Mapping[str, int],
+        references: Mapping[tuple[str, str], str] | None = None,
+        seed: int = 0,
+        null_rate: float = 0.0,
+    ) -> None:
+        """Initialize with the schema, row counts and generation settings."""
+        self.sv = sv
+        self.counts = dict(counts)
+        self.references = dict(references or {})
+        self.seed = seed
+        self.null_rate = null_rate
+
+    def columns(self, class_name: str) -> list[SlotDefinition]:
+        """Induced slots of *class_name* that are generated (single-valued, not inlined)."""
+        return [
+            s
+            for s in self.sv.class_induced_slots(class_name)
+            if not s.multivalued and not (s.inlined and s.range in self.sv.all_classes())
+        ]
+
+    def rows(self, class_name: str) -> Iterator[dict[str, Any]]:
+        """Yield ``counts[class_name]`` rows of *class_name*."""
+        rng = random.Random(f"{self.seed}:{class_name}")  # noqa: S311 - not security relevant
+        slots = self.columns(class_name)
+        for index in range(self.counts.get(class_name, 0)):
+            yield {s.name: self._value(rng, class_name, s, index) for s in slots}
+
+    def _value(self, rng: random.Random, class_name: str, slot: SlotDefinition, index: int) -> Any:  # noqa: ANN401
+        if slot.identifier:
+            return identifier_value(class_name, index)
+        referenced = self.references.get((class_name, slot.name))
+        if referenced is None and slot.range in self.sv.all_classes():
+            if self.sv.get_identifier_slot(slot.range) is not None:
+                referenced = slot.range
+        if referenced is not None:
+            count = self.counts.get(referenced, 0)
+            return identifier_value(referenced, rng.randrange(count)) if count else None
+        if not slot.required and self.null_rate and rng.random() < self.null_rate:
+            return None
+        enum = self.sv.get_enum(slot.range) if slot.range else None
+        if enum is not None:
+            values = list(enum.permissible_values)
+            return rng.choice(values) if values else None
+        base = _type_base(self.sv, slot.range)
+        lo = slot.minimum_value if isinstance(slot.minimum_value, (int, float)) else 0
+        hi = slot.maximum_value if isinstance(slot.maximum_value, (int, float)) else lo + 1000
+        if base in _INTEGER_TYPES:
+            return rng.randint(int(lo), int(hi))
+        if base in _FLOAT_TYPES:
+            return round(rng.uniform(lo, hi), 3)
+        if base == "boolean":
+            return rng.random() < 0.5
+        if base == "date":
+            return (_EPOCH + timedelta(days=rng.randrange(9000))).isoformat()
+        if base == "datetime":
+            return (datetime(2000, 1, 1) + timedelta(seconds=rng.randrange(9000 * 86400))).isoformat()
+        return f"{slot.name}-{rng.randrange(1_000_000):06d}"
+
+
+def spec_references(spec: TransformationSpecification, sv: SchemaView) -> dict[tuple[str, str], str]:
+    """
+    Derive the key-column references implied by a specification's joins.
+
+    For a block populated from ``P`` that joins table ``T`` on
+    ``P.source_key = T.lookup_key``: when ``source_key`` is ``P``'s
+    identifier the joined rows reference ``P``; otherwise ``P``'s column
+    references ``T``.
+
+    :param spec: A (derived) transformation specification.
+    :param sv: Source schema.
+    :return: References suitable for :class:`RowGenerator`.
+    """
+    references: dict[tuple[str, str], str] = {}
+    for cd in spec.class_derivations or []:
+        primary = cd.populated_from or cd.name
+        for table, join in (cd.joins or {}).items():
+            source_key = join.source_key or join.join_on
+            lookup_key = join.lookup_key or join.join_on
+            if not source_key or not lookup_key:
+                continue
+            primary_id = sv.get_identifier_slot(primary) if primary in sv.all_classes() else None
+            if primary_id is not None and primary_id.name == source_key:
+                references[(table, lookup_key)] = primary
+            else:
+                references[(primary, source_key)] = table
+    return references
+
+
+def _cell(value: Any) -> str:  # noqa: ANN401
+    if value is None:
+        return ""
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    return str(value)
+
+
+def write_synthetic_data(
+    generator: RowGenerator,
+    output_dir: str | Path,
+    classes: list[str] | None = None,
+    separator: str = "\t",
+) -> dict[str, Path]:
+    """
+    Write one delimited file per class, named after the class, for ``DataLoader``.
+
+    :param generator: Configured row generator.
+    :param output_dir: Directory to write into (created if missing).
+    :param classes: Classes to write; defaults to every class with a row count.
+    :param separator: Column separator; ``"\\t"`` writes ``.tsv``, ``","`` ``.csv``.
+    :return: Written file per class.
+    """
+    output_dir = Path(output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+    suffix = ".csv" if separator == "," else ".tsv"
+    written = {}
+    for class_name in classes or list(generator.counts):
+        path = output_dir / f"{class_name}{suffix}"
+        columns = [s.name for s in generator.columns(class_name)]
+        with open(path, "w", encoding="utf-8", newline="") as fh:
+            writer = csv.writer(fh, delimiter=separator, lineterminator="\n")
+            writer.writerow(columns)
+            for row in generator.rows(class_name):
+                writer.writerow([_cell(row[c]) for c in columns])
+        written[class_name] = path
+    return written
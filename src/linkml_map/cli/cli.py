@@ -1,37 +1,55 @@
-"""Command line interface for linkml-map."""
+"""Command line interface for linkml-map.
 
+Heavy dependencies (linkml-runtime, the transformer, compilers, DuckDB) are
+imported inside the commands that need them, so that ``--help`` and light
+subcommands start quickly.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
 import logging
-import os
 import sys
+from collections.abc import Callable, Iterator
 from contextlib import nullcontext
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 import click
 import yaml
-from linkml_runtime import SchemaView
-from linkml_runtime.dumpers import yaml_dumper
 from more_itertools import chunked
 
-from linkml_map.compiler.markdown_compiler import MarkdownCompiler
-from linkml_map.compiler.python_compiler import PythonCompiler
-from linkml_map.inference.inverter import TransformationSpecificationInverter
-from linkml_map.inference.schema_mapper import SchemaMapper
-from linkml_map.loaders import DataLoader
-from linkml_map.transformer.engine import transform_spec
 from linkml_map.transformer.errors import TransformationError
-from linkml_map.transformer.object_transformer import ObjectTransformer
 from linkml_map.utils.extensions import ExtensionError, load_extensions
+from linkml_map.utils.pipeline import Pipeline
 from linkml_map.writers import (
+    DATABASE_EXTENSIONS,
+    DEFAULT_WRITE_BUFFER_SIZE,
     EXTENSION_FORMAT_MAP,
+    JSON_BACKENDS,
+    Checkpoint,
+    CheckpointedWriter,
+    DatabaseSink,
+    JSONBackend,
     MultiStreamWriter,
     OutputFormat,
+    PartitionedWriter,
     StreamWriter,
-    get_stream_writer,
+    TabularStreamWriter,
+    get_json_backend,
+    is_database_path,
     make_stream_writer,
-    rewrite_header_and_pad,
+    rewrite_tabular_output,
+    tee_to_databases,
 )
 
+if TYPE_CHECKING:
+    from linkml_map.transformer.object_transformer import ObjectTransformer
+    from linkml_map.transformer.profiling import SlotProfiler
+    from linkml_map.utils.manifest import RowManifest
+    from linkml_map.utils.metrics import TransformMetrics
+
 __all__ = [
     "main",
 ]
@@ -52,6 +70,16 @@ entity_option = click.option(
     "--entity",
     help="Only process class_derivations matching this class name.",
 )
+spec_cache_option = click.option(
+    "--spec-cache-dir",
+    envvar="LINKML_MAP_SPEC_CACHE_DIR",
+    type=click.Path(file_okay=False),
+    default=None,
+    help=(
+        "Cache the loaded, derived and validated specification in this directory, keyed by the spec "
+        "and schema files, and reuse it while they are unchanged. Also read from LINKML_MAP_SPEC_CACHE_DIR."
+    ),
+)
 
 logger = logging.getLogger(__name__)
 
@@ -115,7 +143,176 @@ def main(verbose: int, quiet: bool) -> None:
     "-O",
     "--additional-output",
     multiple=True,
-    help="Additional output files. Format inferred from extension. Can be repeated.",
+    help=(
+        "Additional output files. Format inferred from extension. Can be repeated. "
+        "A .duckdb or .sqlite path loads rows into one table per target class."
+    ),
+)
+@click.option(
+    "--json-backend",
+    type=click.Choice(sorted(JSON_BACKENDS)),
+    default="json",
+    show_default=True,
+    help="Serializer for JSON/JSONL output. 'orjson' requires the optional orjson package.",
+)
+@click.option(
+    "--write-buffer-size",
+    type=click.IntRange(min=0),
+    default=DEFAULT_WRITE_BUFFER_SIZE,
+    show_default=True,
+    help="Characters of output to buffer before each write to a file, pipe or stdout. 0 disables buffering.",
+)
+@click.option(
+    "--parallel-writers/--no-parallel-writers",
+    default=False,
+    show_default=True,
+    help="With -O, serialize and write each output on its own thread.",
+)
+@click.option(
+    "--writer-queue-size",
+    type=click.IntRange(min=1),
+    default=4,
+    show_default=True,
+    help="Chunks buffered per output before transformation waits for a slow writer (with -O).",
+)
+@click.option(
+    "--pipeline/--no-pipeline",
+    "use_pipeline",
+    default=False,
+    show_default=True,
+    help=(
+        "Run reading, transformation and writing on separate threads connected by bounded "
+        "queues, and report per-stage wait times at the end."
+    ),
+)
+@click.option(
+    "--pipeline-queue-size",
+    type=click.IntRange(min=1),
+    default=8,
+    show_default=True,
+    help="Batches (of --chunk-size rows) buffered between pipeline stages.",
+)
+@click.option(
+    "--output-dir",
+    type=click.Path(file_okay=False),
+    default=None,
+    help=(
+        "Write partitioned output: one subdirectory per target class, split into part files. "
+        "Format comes from -f (default jsonl). Cannot be combined with -o or -O."
+    ),
+)
+@click.option("--partition-key", default=None, help="With --output-dir, hash-partition rows by this target slot.")
+@click.option(
+    "--partitions",
+    type=click.IntRange(min=1),
+    default=16,
+    show_default=True,
+    help="Number of hash buckets for --partition-key.",
+)
+@click.option(
+    "--max-rows-per-file",
+    type=click.IntRange(min=1),
+    default=None,
+    help="With --output-dir, roll to a new part file after this many rows.",
+)
+@click.option(
+    "--max-bytes-per-file",
+    type=click.IntRange(min=1),
+    default=None,
+    help="With --output-dir, roll to a new part file once this many bytes are written.",
+)
+@click.option(
+    "--checkpoint",
+    "checkpoint_path",
+    type=click.Path(dir_okay=False),
+    default=None,
+    help=(
+        "Save progress to this file periodically, so an interrupted run can be continued with "
+        "--resume. Requires tabular or directory input and -o or --output-dir."
+    ),
+)
+@click.option(
+    "--checkpoint-every",
+    type=click.IntRange(min=1),
+    default=100_000,
+    show_default=True,
+    help="Rows written between checkpoints.",
+)
+@click.option(
+    "--resume",
+    is_flag=True,
+    default=False,
+    help="Continue from the --checkpoint file if it exists; otherwise start from the beginning.",
+)
+@click.option(
+    "--manifest",
+    "manifest_path",
+    type=click.Path(dir_okay=False),
+    default=None,
+    help=(
+        "Incremental mode: track a content hash per source row (keyed by its identifier) in this "
+        "SQLite file, and output only rows that are new or changed since the previous run."
+    ),
+)
+@click.option(
+    "--tombstones",
+    "tombstones_path",
+    type=click.Path(dir_okay=False),
+    default=None,
+    help="With --manifest, write a JSONL record for each row removed since the previous run.",
+)
+@spec_cache_option
+@click.option(
+    "--profile",
+    is_flag=True,
+    default=False,
+    help=(
+        "Time every slot derivation and print a report of calls, cumulative time, nulls and "
+        "errors per slot, with totals per strategy (expr, join, fk, enum, ...), to stderr."
+    ),
+)
+@click.option(
+    "--memoize-expressions",
+    is_flag=True,
+    default=False,
+    help=(
+        "Cache results of expressions that call only pure functions, keyed by their input values, "
+        "and print per-expression hit rates to stderr. Expressions with a poor hit rate stop being cached."
+    ),
+)
+@click.option(
+    "--progress",
+    is_flag=True,
+    default=False,
+    help=(
+        "Print a progress line to stderr every --metrics-interval seconds: current block, rows, "
+        "rows/s, estimated progress and ETA, join hits/misses, RSS and DuckDB memory."
+    ),
+)
+@click.option(
+    "--metrics-file",
+    type=click.Path(dir_okay=False, writable=True),
+    default=None,
+    help="Rewrite this file with run metrics as JSON every --metrics-interval seconds.",
+)
+@click.option(
+    "--prometheus-file",
+    type=click.Path(dir_okay=False, writable=True),
+    default=None,
+    help="Rewrite this file with run metrics in the Prometheus text format (for the node_exporter textfile collector).",
+)
+@click.option(
+    "--metrics-interval",
+    type=click.FloatRange(min=0.1),
+    default=10.0,
+    show_default=True,
+    help="Seconds between --progress lines and --metrics-file/--prometheus-file updates.",
+)
+@click.option(
+    "--profile-output",
+    type=click.Path(dir_okay=False, writable=True),
+    default=None,
+    help="Write the --profile report as JSON to this file (implies --profile).",
 )
 @click.option(
     "--continue-on-error",
@@ -149,6 +346,30 @@ def map_data(
     output_format: str | None,
     chunk_size: int,
     additional_output: tuple,
+    json_backend: str = "json",
+    write_buffer_size: int = DEFAULT_WRITE_BUFFER_SIZE,
+    parallel_writers: bool = False,
+    writer_queue_size: int = 4,
+    use_pipeline: bool = False,
+    pipeline_queue_size: int = 8,
+    output_dir: str | None = None,
+    partition_key: str | None = None,
+    partitions: int = 16,
+    max_rows_per_file: int | None = None,
+    max_bytes_per_file: int | None = None,
+    checkpoint_path: str | None = None,
+    checkpoint_every: int = 100_000,
+    resume: bool = False,
+    manifest_path: str | None = None,
+    tombstones_path: str | None = None,
+    spec_cache_dir: str | None = None,
+    profile: bool = False,
+    profile_output: str | None = None,
+    memoize_expressions: bool = False,
+    progress: bool = False,
+    metrics_file: str | None = None,
+    prometheus_file: str | None = None,
+    metrics_interval: float = 10.0,
     continue_on_error: bool = False,
     target_schema: str | None = None,
     entity: str | None = None,
@@ -182,6 +403,25 @@ def map_data(
         # Multi-output: write TSV, JSON, and JSONL simultaneously
         linkml-map map-data -T transform.yaml -s schema.yaml -f jsonl -O out.tsv -O out.json input.tsv
 
+        # Partitioned output: one directory per class, 8 buckets by id, 1M rows per file
+        linkml-map map-data -T specs/ -s schema.yaml --output-dir out/ --partition-key id \
+            --partitions 8 --max-rows-per-file 1000000 data/
+
+        # Resumable run: checkpoint every 1M rows, continue after a crash
+        linkml-map map-data -T specs/ -s schema.yaml -o out.jsonl --checkpoint out.ckpt \
+            --checkpoint-every 1000000 --resume data/
+
+        # Incremental run: output only new/changed rows, list removed ones
+        linkml-map map-data -T specs/ -s schema.yaml -o delta.jsonl --manifest rows.manifest \
+            --tombstones deleted.jsonl data/
+
+        # Long run: progress line on stderr and a Prometheus textfile every 30s
+        linkml-map map-data -T specs/ -s schema.yaml -o out.jsonl --progress \
+            --prometheus-file /var/lib/node_exporter/linkml_map.prom --metrics-interval 30 data/
+
+        # Find the slowest slot derivations
+        linkml-map map-data -T specs/ -s schema.yaml -o out.jsonl --profile data/
+
     """
     logger.info(f"Transforming {input_data} conforming to {schema} using {transformer_specification}")
 
@@ -194,7 +434,17 @@ def map_data(
 
     input_path = Path(input_data)
 
+    partition_opts = (partition_key, max_rows_per_file, max_bytes_per_file)
+    if output_dir is None and any(opt is not None for opt in partition_opts):
+        msg = "--partition-key, --max-rows-per-file and --max-bytes-per-file require --output-dir"
+        raise click.ClickException(msg)
+    if output_dir is not None and (output or additional_output):
+        msg = "--output-dir cannot be combined with -o/--output or -O/--additional-output"
+        raise click.ClickException(msg)
+
     # Determine output format
+    if output_format is None and output_dir is not None:
+        output_format = "jsonl"
     if output_format is None:
         if output:
             ext = Path(output).suffix.lower()
@@ -207,6 +457,75 @@ def map_data(
     is_tabular = input_path.suffix.lower() in (".tsv", ".csv")
     is_directory = input_path.is_dir()
 
+    partitioned_writer = None
+    if output_dir is not None:
+        if not (is_tabular or is_directory):
+            msg = "--output-dir requires tabular or directory input"
+            raise click.ClickException(msg)
+        try:
+            partitioned_writer = PartitionedWriter(
+                output_dir=Path(output_dir),
+                output_format=OutputFormat(output_format),
+                partition_key=partition_key,
+                num_partitions=partitions,
+                max_rows=max_rows_per_file,
+                max_bytes=max_bytes_per_file,
+                buffer_size=write_buffer_size,
+                json_backend=get_json_backend(json_backend),
+            )
+        except ValueError as err:
+            raise click.ClickException(str(err)) from err
+
+    if not (is_tabular or is_directory) and any(p and is_database_path(p) for p in (output, *additional_output)):
+        msg = "Database outputs (.duckdb, .sqlite) require tabular or directory input"
+        raise click.ClickException(msg)
+
+    if resume and checkpoint_path is None:
+        msg = "--resume requires --checkpoint"
+        raise click.ClickException(msg)
+    if checkpoint_path is not None:
+        if not (is_tabular or is_directory):
+            msg = "--checkpoint requires tabular or directory input"
+            raise click.ClickException(msg)
+        if output is None and output_dir is None:
+            msg = "--checkpoint requires -o/--output or --output-dir"
+            raise click.ClickException(msg)
+        if any(p and is_database_path(p) for p in (output, *additional_output)):
+            msg = "--checkpoint does not support database outputs (.duckdb, .sqlite)"
+            raise click.ClickException(msg)
+
+    if tombstones_path is not None and manifest_path is None:
+        msg = "--tombstones requires --manifest"
+        raise click.ClickException(msg)
+    if manifest_path is not None:
+        if not (is_tabular or is_directory):
+            msg = "--manifest requires tabular or directory input"
+            raise click.ClickException(msg)
+        if checkpoint_path is not None:
+            msg = "--manifest cannot be combined with --checkpoint"
+            raise click.ClickException(msg)
+
+    metrics = None
+    if progress or metrics_file or prometheus_file:
+        if not (is_tabular or is_directory):
+            msg = "--progress, --metrics-file and --prometheus-file require tabular or directory input"
+            raise click.ClickException(msg)
+        from linkml_map.utils.metrics import (
+            JsonFileReporter,
+            ProgressLineReporter,
+            PrometheusTextfileReporter,
+            TransformMetrics,
+        )
+
+        reporters = []
+        if progress:
+            reporters.append(ProgressLineReporter())
+        if metrics_file:
+            reporters.append(JsonFileReporter(metrics_file))
+        if prometheus_file:
+            reporters.append(PrometheusTextfileReporter(prometheus_file))
+        metrics = TransformMetrics(reporters, interval=metrics_interval)
+
     if is_tabular or is_directory:
         # Use streaming transformation for tabular/directory input
         _map_data_streaming(
@@ -218,6 +537,22 @@ def map_data(
             output_format=output_format,
             chunk_size=chunk_size,
             additional_output=additional_output,
+            json_backend=json_backend,
+            write_buffer_size=write_buffer_size,
+            parallel_writers=parallel_writers,
+            writer_queue_size=writer_queue_size,
+            pipeline=Pipeline(queue_size=pipeline_queue_size, batch_size=chunk_size) if use_pipeline else None,
+            partitioned_writer=partitioned_writer,
+            checkpoint_path=checkpoint_path,
+            checkpoint_every=checkpoint_every,
+            resume=resume,
+            manifest_path=manifest_path,
+            tombstones_path=tombstones_path,
+            metrics=metrics,
+            spec_cache_dir=spec_cache_dir,
+            profile=profile or profile_output is not None,
+            profile_output=profile_output,
+            memoize_expressions=memoize_expressions,
             target_schema=target_schema,
             continue_on_error=continue_on_error,
             entity=entity,
@@ -233,6 +568,10 @@ def map_data(
             transformer_specification=transformer_specification,
             output=output,
             output_format=output_format,
+            spec_cache_dir=spec_cache_dir,
+            profile=profile or profile_output is not None,
+            profile_output=profile_output,
+            memoize_expressions=memoize_expressions,
             target_schema=target_schema,
             continue_on_error=continue_on_error,
             entity=entity,
@@ -246,12 +585,53 @@ def _load_specs(tr: ObjectTransformer, transformer_specification: tuple[str, ...
     tr.load_transformer_specifications(transformer_specification)
 
 
-def _pre_flight_validate(
+def _load_and_check_specs(
     tr: ObjectTransformer,
+    transformer_specification: tuple[str, ...],
     *,
     source_schema: str | None = None,
     target_schema: str | None = None,
+    spec_cache_dir: str | None = None,
 ) -> None:
+    """Load specs and run pre-flight validation, reusing a cached result when inputs are unchanged.
+
+    Without *spec_cache_dir* this is ``_load_specs`` followed by
+    ``_pre_flight_validate``. With it, a cache hit restores the specification,
+    its derived form and the pre-flight findings (which are re-printed); a miss
+    computes them as usual and stores them.
+    """
+    cache = key = None
+    if spec_cache_dir is not None:
+        from linkml_map.utils.spec_cache import SpecCache
+
+        cache = SpecCache(spec_cache_dir)
+        key = cache.key(transformer_specification, source_schema, target_schema)
+        entry = cache.get(key) if key is not None else None
+        if entry is not None:
+            tr.specification = entry.specification
+            tr.spec_messages = entry.spec_messages
+            if entry.derived_specification is not None and tr.source_schemaview is not None:
+                tr.use_derived_specification(entry.derived_specification)
+            for msg in entry.preflight_messages:
+                click.echo(str(msg), err=True)
+            return
+
+    _load_specs(tr, transformer_specification)
+    messages = _pre_flight_validate(tr, source_schema=source_schema, target_schema=target_schema)
+    if key is not None:
+        from linkml_map.utils.spec_cache import CachedSpec
+
+        # Pre-flight derived the spec when a source schema view is set (or recorded
+        # why it could not); derived_specification is left unset only on failure.
+        cache.put(key, CachedSpec(tr.specification, tr.spec_messages, tr._derived_specification, messages))
+
+
+def _pre_flight_validate(
+    tr: ObjectTransformer,
+    *,
+    source_schema: str | None = None,
+    target_schema: str | None = None,
+) -> list[Any]:
     """Surface static spec checks before performing a CLI action.
 
     Replays pre-normalize scan messages captured at spec-load time and runs
@@ -266,11 +646,13 @@ def _pre_flight_validate(
     are still surfaced here. Reuses ``tr.source_schemaview`` and
     ``tr.target_schemaview`` when set, avoiding a duplicate load of large
     or remote schemas.
+
+    :return: The findings that were printed.
     """
     from linkml_map.validator import ValidationMessage, validate_spec_semantics
 
     if tr.specification is None:
-        return
+        return []
 
     messages = list(tr.spec_messages)
 
@@ -302,6 +684,7 @@ def _pre_flight_validate(
 
     for msg in messages:
         click.echo(str(msg), err=True)
+    return messages
 
 
 def _filter_spec_to_entity(tr: ObjectTransformer, entity: str | None) -> None:
@@ -342,6 +725,10 @@ def _map_data_single(
     transformer_specification: tuple[str, ...],
     output: str | None,
     output_format: str,
+    spec_cache_dir: str | None = None,
+    profile: bool = False,
+    profile_output: str | None = None,
+    memoize_expressions: bool = False,
     target_schema: str | None = None,
     continue_on_error: bool = False,
     entity: str | None = None,
@@ -349,16 +736,31 @@ def _map_data_single(
     **kwargs: dict[str, Any],
 ) -> None:
     """Original single-object transformation logic."""
+    from linkml_map.transformer.object_transformer import ObjectTransformer
+    from linkml_map.utils.schema_snapshot import load_schemaview
+
     tr = ObjectTransformer(**kwargs)
-    tr.source_schemaview = SchemaView(schema)
-    _load_specs(tr, transformer_specification)
+    tr.source_schemaview = load_schemaview(schema)
     if target_schema:
-        tr.target_schemaview = SchemaView(target_schema)
-
-    _pre_flight_validate(tr, source_schema=schema, target_schema=target_schema)
+        tr.target_schemaview = load_schemaview(target_schema)
+    _load_and_check_specs(
+        tr,
+        transformer_specification,
+        source_schema=schema,
+        target_schema=target_schema,
+        spec_cache_dir=spec_cache_dir,
+    )
     _filter_spec_to_entity(tr, entity)
     if emit_spec:
         _emit_spec_to_file(tr, emit_spec)
+    if profile:
+        from linkml_map.transformer.profiling import SlotProfiler
+
+        tr.profiler = SlotProfiler()
+    if memoize_expressions:
+        from linkml_map.utils.expr_memo import ExpressionMemo
+
+        tr.expression_memo = ExpressionMemo()
 
     # Load input data (YAML or JSON)
     with open(input_data) as file:
@@ -379,15 +781,31 @@ def _map_data_single(
         click.echo("\n1 transformation error:", err=True)
         click.echo(f"  - {err}", err=True)
         raise SystemExit(1) from err
+    finally:
+        if tr.profiler is not None:
+            _report_profile(tr.profiler, profile_output)
+        if tr.expression_memo is not None:
+            click.echo(f"Expression memo:\n{tr.expression_memo.report()}", err=True)
     dump_output(tr_obj, output_format, output)
 
 
+def _report_profile(profiler: SlotProfiler, profile_output: str | None) -> None:
+    """Print the slot-derivation profile to stderr, and write it as JSON to *profile_output*."""
+    click.echo(f"Slot derivation profile:\n{profiler.report()}", err=True)
+    if profile_output is not None:
+        with open(profile_output, "w", encoding="utf-8") as fh:
+            json.dump(profiler.to_dict(), fh, indent=2)
+        logger.info("Wrote slot derivation profile to %s", profile_output)
+
+
 def _build_additional_outputs(
     additional_output: tuple,
+    json_backend: JSONBackend | None = None,
 ) -> list[tuple[StreamWriter, Path]]:
     """Build (StreamWriter, Path) pairs for additional -O outputs.
 
     :param additional_output: Tuple of file path strings from the CLI.
+    :param json_backend: Serializer shared by JSON and JSONL outputs.
     :return: List of (StreamWriter, Path) tuples.
     :raises click.ClickException: If an extension cannot be mapped to a format.
     """
@@ -399,10 +817,127 @@ def _build_additional_outputs(
         if extra_fmt is None:
             msg = f"Cannot infer output format from extension: {ext}"
             raise click.ClickException(msg)
-        result.append((make_stream_writer(extra_fmt), extra_path))
+        result.append((make_stream_writer(extra_fmt, json_backend=json_backend), extra_path))
     return result
 
 
+def _target_ddl(tr: ObjectTransformer, database_path: str) -> str | None:
+    """Build ``CREATE TABLE`` DDL for a database output from the target schema.
+
+    Uses ``--target-schema`` when given, otherwise the schema derived from the
+    spec. If derivation fails, tables are created from the rows themselves.
+    """
+    from linkml_map.compiler.sql_compiler import SQLCompiler
+
+    compiler = SQLCompiler(source_schemaview=tr.source_schemaview)
+    compiler.dialect = DATABASE_EXTENSIONS[Path(database_path).suffix.lower()]
+    try:
+        target_sv = tr.target_schemaview or compiler.derived_target_schemaview(tr.derived_specification)
+        return compiler.create_ddl(target_sv)
+    except Exception as err:  # noqa: BLE001 - schema derivation is best-effort here
+        logger.warning("Could not derive target tables for %s (%s); inferring columns from rows", database_path, err)
+        return None
+
+
+def _commit_manifest(manifest: RowManifest, tombstones_path: str | None, backend: JSONBackend) -> None:
+    """Write tombstones for rows removed since the last run, then commit the manifest."""
+    if tombstones_path is not None:
+        writer = make_stream_writer(OutputFormat.JSONL, json_backend=backend)
+        with open(tombstones_path, "w", encoding="utf-8") as fh:
+            writer.write_to(chunked(manifest.tombstones(), 1000), fh)
+    manifest.commit()
+    click.echo(f"Incremental run: {manifest.summary()}", err=True)
+
+
+def _run_fingerprint(tr: ObjectTransformer, input_path: Path, **settings: Any) -> str:
+    """Digest of the spec, input files and output settings, so --resume never mixes runs."""
+    files = sorted(input_path.rglob("*")) if input_path.is_dir() else [input_path]
+    inputs = [[str(f), f.stat().st_size, f.stat().st_mtime_ns] for f in files if f.is_file()]
+    payload = {
+        "spec": tr.specification.model_dump(mode="json", exclude_none=True),
+        "inputs": inputs,
+        **settings,
+    }
+    return hashlib.sha256(json.dumps(payload, sort_keys=True, default=str).encode("utf-8")).hexdigest()
+
+
+def _write_text_outputs(
+    chunks: Any,
+    fmt: OutputFormat,
+    output: str | None,
+    additional_output: tuple,
+    backend: JSONBackend,
+    *,
+    write_primary: bool = True,
+    chunk_size: int = 1000,
+    write_buffer_size: int = DEFAULT_WRITE_BUFFER_SIZE,
+    parallel_writers: bool = False,
+    writer_queue_size: int = 4,
+    checkpoint: Checkpoint | None = None,
+    checkpoint_every: int = 100_000,
+    before_checkpoint: Callable[[Checkpoint], None] | None = None,
+) -> None:
+    """Write *chunks* to the primary output (file or stdout) and any -O outputs.
+
+    With ``write_primary=False`` (the primary output is a database) only the
+    -O outputs are written; if there are none, *chunks* is simply drained.
+    With a *checkpoint*, all outputs are files written by a
+    :class:`~linkml_map.writers.CheckpointedWriter`.
+    """
+    extra_outputs = _build_additional_outputs(additional_output, json_backend=backend)
+
+    # Validate no duplicate paths between primary and additional outputs
+    if output and extra_outputs:
+        primary_resolved = Path(output).resolve()
+        extra_paths = {p.resolve() for _, p in extra_outputs}
+        if primary_resolved in extra_paths:
+            msg = f"Primary output path duplicated in -O: {output}"
+            raise click.ClickException(msg)
+
+    if checkpoint is not None:
+        outputs = [(make_stream_writer(fmt, json_backend=backend), Path(output)), *extra_outputs]
+        CheckpointedWriter(
+            outputs,
+            checkpoint,
+            every=checkpoint_every,
+            before_save=before_checkpoint,
+            buffer_size=write_buffer_size,
+        ).write_all(chunks)
+        return
+
+    if not write_primary:
+        if extra_outputs:
+            MultiStreamWriter(
+                extra_outputs,
+                buffer_size=write_buffer_size,
+                threaded=parallel_writers,
+                queue_size=writer_queue_size,
+            ).write_all(chunks)
+        else:
+            for _chunk in chunks:
+                pass
+    elif extra_outputs:
+        primary_writer = make_stream_writer(fmt, json_backend=backend)
+        primary_target = Path(output) if output else sys.stdout
+        all_outputs = [(primary_writer, primary_target), *extra_outputs]
+        MultiStreamWriter(
+            all_outputs,
+            buffer_size=write_buffer_size,
+            threaded=parallel_writers,
+            queue_size=writer_queue_size,
+        ).write_all(chunks)
+    else:
+        stream_writer = make_stream_writer(fmt, json_backend=backend)
+
+        output_ctx = open(output, "w", encoding="utf-8") if output else nullcontext(sys.stdout)
+        with output_ctx as output_file:
+            stream_writer.write_to(chunks, output_file, buffer_size=write_buffer_size)
+
+        # Handle header rewrite for tabular output if needed
+        if output and isinstance(stream_writer, TabularStreamWriter) and stream_writer.headers_changed:
+            rewrite_tabular_output(output, stream_writer, chunk_size)
+
+
 def _map_data_streaming(
     input_path: Path,
     schema: str,
@@ -412,6 +947,22 @@ def _map_data_streaming(
     output_format: str,
     chunk_size: int,
     additional_output: tuple = (),
+    json_backend: str = "json",
+    write_buffer_size: int = DEFAULT_WRITE_BUFFER_SIZE,
+    parallel_writers: bool = False,
+    writer_queue_size: int = 4,
+    pipeline: Pipeline | None = None,
+    partitioned_writer: PartitionedWriter | None = None,
+    checkpoint_path: str | None = None,
+    checkpoint_every: int = 100_000,
+    resume: bool = False,
+    manifest_path: str | None = None,
+    tombstones_path: str | None = None,
+    metrics: TransformMetrics | None = None,
+    spec_cache_dir: str | None = None,
+    profile: bool = False,
+    profile_output: str | None = None,
+    memoize_expressions: bool = False,
     target_schema: str | None = None,
     continue_on_error: bool = False,
     entity: str | None = None,
@@ -419,17 +970,35 @@ def _map_data_streaming(
     **kwargs: dict[str, Any],
 ) -> None:
     """Streaming transformation for tabular/directory input."""
+    from linkml_map.loaders import DataLoader
+    from linkml_map.transformer.engine import TransformProgress, transform_spec
+    from linkml_map.transformer.object_transformer import ObjectTransformer
+    from linkml_map.utils.manifest import RowManifest
+    from linkml_map.utils.schema_snapshot import load_schemaview
+
     # Initialize transformer
     tr = ObjectTransformer(**kwargs)
-    tr.source_schemaview = SchemaView(schema)
-    _load_specs(tr, transformer_specification)
+    tr.source_schemaview = load_schemaview(schema)
     if target_schema:
-        tr.target_schemaview = SchemaView(target_schema)
-
-    _pre_flight_validate(tr, source_schema=schema, target_schema=target_schema)
+        tr.target_schemaview = load_schemaview(target_schema)
+    _load_and_check_specs(
+        tr,
+        transformer_specification,
+        source_schema=schema,
+        target_schema=target_schema,
+        spec_cache_dir=spec_cache_dir,
+    )
     _filter_spec_to_entity(tr, entity)
     if emit_spec:
         _emit_spec_to_file(tr, emit_spec)
+    if profile:
+        from linkml_map.transformer.profiling import SlotProfiler
+
+        tr.profiler = SlotProfiler()
+    if memoize_expressions:
+        from linkml_map.utils.expr_memo import ExpressionMemo
+
+        tr.expression_memo = ExpressionMemo()
 
     # Initialize data loader (schema enables type-preserving coercion for TSV/CSV)
     data_loader = DataLoader(input_path, schemaview=tr.source_schemaview)
@@ -445,68 +1014,173 @@ def _map_data_streaming(
 
     on_error = report_error if continue_on_error else None
 
-    # Create transform iterator and chunk it
-    transform_iter = transform_spec(tr, data_loader, source_type, on_error=on_error)
-    chunks = chunked(transform_iter, chunk_size)
+    checkpoint = None
+    progress = None
+    if checkpoint_path is not None:
+        fingerprint = _run_fingerprint(
+            tr,
+            input_path,
+            source_type=source_type,
+            output=output,
+            additional_output=list(additional_output),
+            output_format=output_format,
+            partitioned=partitioned_writer
+            and {
+                "output_dir": str(partitioned_writer.output_dir),
+                "partition_key": partitioned_writer.partition_key,
+                "num_partitions": partitioned_writer.num_partitions,
+                "max_rows": partitioned_writer.max_rows,
+                "max_bytes": partitioned_writer.max_bytes,
+            },
+        )
+        try:
+            checkpoint = Checkpoint.load(checkpoint_path, fingerprint) if resume else None
+        except ValueError as err:
+            raise click.ClickException(str(err)) from err
+        if checkpoint is None:
+            if resume:
+                logger.info("No checkpoint at %s; starting from the beginning", checkpoint_path)
+            checkpoint = Checkpoint(path=Path(checkpoint_path), fingerprint=fingerprint)
+            checkpoint.remove()
+        else:
+            click.echo(f"Resuming from {checkpoint_path} (block {checkpoint.block}, row {checkpoint.row})", err=True)
+        progress = TransformProgress(block=checkpoint.block, row=checkpoint.row)
+        error_count = checkpoint.errors
+
+    manifest = RowManifest(manifest_path) if manifest_path is not None else None
+
+    def record_position(cp: Checkpoint) -> None:
+        """Store the input position reached by the rows written so far."""
+        cp.block, cp.row, cp.errors = progress.block, progress.row, error_count
+
+    def transformed_chunks(tagged: bool = False) -> Iterator[list[Any]]:
+        """Chunked transform output; with a pipeline, transformation runs on its own thread."""
+        rows = transform_spec(
+            tr,
+            data_loader,
+            source_type,
+            on_error=on_error,
+            with_class_derivation=tagged,
+            pipeline=pipeline,
+            progress=progress,
+            manifest=manifest,
+            metrics=metrics,
+        )
+        chunks = chunked(rows, chunk_size)
+        # A checkpoint records the input position when a chunk is written, so the
+        # transform stage must not run ahead of the writer.
+        if pipeline is not None and progress is None:
+            return pipeline.prefetch(chunks, "transform")
+        return chunks
+
+    def finish_run() -> None:
+        """Clean up, report and set the exit status once every output is written."""
+        if metrics is not None:
+            metrics.stop()
+        if checkpoint is not None:
+            checkpoint.remove()
+        if manifest is not None:
+            _commit_manifest(manifest, tombstones_path, get_json_backend(json_backend))
+        if pipeline is not None:
+            click.echo(f"Pipeline stages:\n{pipeline.report()}", err=True)
+        if tr.profiler is not None:
+            _report_profile(tr.profiler, profile_output)
+        if tr.expression_memo is not None:
+            click.echo(f"Expression memo:\n{tr.expression_memo.report()}", err=True)
+        # Errors were already printed as they occurred; a mid-stream crash would
+        # have propagated before reaching here. Reached only on clean completion.
+        if error_count:
+            click.echo(f"\n{error_count} transformation error(s)", err=True)
+            raise SystemExit(1)
 
-    # Resolve output format
+    if metrics is not None:
+        metrics.start()
     try:
-        fmt = OutputFormat(output_format)
-    except ValueError:
-        msg = f"Unsupported output format: {output_format}"
-        raise click.ClickException(msg) from None
-
-    if additional_output:
-        extra_outputs = _build_additional_outputs(additional_output)
+        if partitioned_writer is not None:
+            on_checkpoint = None
+            if checkpoint is not None:
+                if "partitioned" in checkpoint.outputs:
+                    partitioned_writer.set_state(checkpoint.outputs["partitioned"])
+
+                def on_checkpoint(state: dict[str, Any]) -> None:
+                    checkpoint.outputs["partitioned"] = state
+                    record_position(checkpoint)
+                    checkpoint.save()
+
+            written = partitioned_writer.write_all(
+                transformed_chunks(tagged=True),
+                checkpoint_every=checkpoint_every if checkpoint is not None else None,
+                on_checkpoint=on_checkpoint,
+            )
+            logger.info("Wrote %d part file(s) under %s", len(written), partitioned_writer.output_dir)
+            finish_run()
+            return
+
+        # Resolve output format
+        try:
+            fmt = OutputFormat(output_format)
+        except ValueError:
+            msg = f"Unsupported output format: {output_format}"
+            raise click.ClickException(msg) from None
 
-        # Validate no duplicate paths between primary and additional outputs
-        if output:
-            primary_resolved = Path(output).resolve()
-            extra_paths = {p.resolve() for _, p in extra_outputs}
-            if primary_resolved in extra_paths:
-                msg = f"Primary output path duplicated in -O: {output}"
-                raise click.ClickException(msg)
+        try:
+            backend = get_json_backend(json_backend)
+        except ValueError as err:
+            raise click.ClickException(str(err)) from err
 
-        primary_writer = make_stream_writer(fmt)
-        primary_target = Path(output) if output else sys.stdout
-        all_outputs = [(primary_writer, primary_target), *extra_outputs]
-        MultiStreamWriter(all_outputs).write_all(chunks)
-    else:
-        # Original single-output path (backward compatible)
-        stream_writer = get_stream_writer(fmt)
+        # Database targets (-o/-O with a .duckdb/.sqlite extension) are loaded from
+        # class-tagged rows alongside the text outputs, in the same pass.
+        database_paths = [p for p in (output, *additional_output) if p and is_database_path(p)]
+        additional_output = tuple(p for p in additional_output if not is_database_path(p))
+        text_primary = output is None or not is_database_path(output)
+        database_sinks = [DatabaseSink(p, ddl=_target_ddl(tr, p)) for p in database_paths]
 
-        output_ctx = open(output, "w", encoding="utf-8") if output else nullcontext(sys.stdout)
-        with output_ctx as output_file:
-            for chunk_str in stream_writer(chunks):
-                output_file.write(chunk_str)
-
-        # Handle header rewrite for tabular output if needed
-        if output and hasattr(stream_writer, "headers"):
-            logger.info("Rewriting output with updated headers")
-            tmp_path = output + ".tmp"
-            with open(output, encoding="utf-8") as src, open(tmp_path, "w", encoding="utf-8") as dst:
-                separator = "\t" if output_format == "tsv" else ","
-                for line in rewrite_header_and_pad(iter(src), stream_writer.headers, separator, chunk_size):
-                    dst.write(line)
-            os.replace(tmp_path, output)
-
-    # Errors were already printed as they occurred; a mid-stream crash would
-    # have propagated before reaching here. Reached only on clean completion.
-    if error_count:
-        click.echo(f"\n{error_count} transformation error(s)", err=True)
-        raise SystemExit(1)
+        try:
+            if database_sinks:
+                chunks = tee_to_databases(transformed_chunks(tagged=True), database_sinks)
+            else:
+                chunks = transformed_chunks()
+            _write_text_outputs(
+                chunks,
+                fmt,
+                output if text_primary else None,
+                additional_output,
+                backend,
+                write_primary=text_primary,
+                chunk_size=chunk_size,
+                write_buffer_size=write_buffer_size,
+                parallel_writers=parallel_writers,
+                writer_queue_size=writer_queue_size,
+                checkpoint=checkpoint,
+                checkpoint_every=checkpoint_every,
+                before_checkpoint=record_position,
+            )
+        finally:
+            for sink in database_sinks:
+                sink.close()
+        for sink in database_sinks:
+            for table, count in sink.rows_written.items():
+                logger.info("Loaded %d row(s) into %s:%s", count, sink.path, table)
+        finish_run()
+    finally:
+        if metrics is not None:
+            metrics.stop(done=False)
+        if manifest is not None:
+            manifest.close()
 
 
 @main.command()
 @output_option
 @transformer_specification_option
 @schema_option
+@spec_cache_option
 @click.option("--target", default="python", show_default=True, help="Target representation.")
 def compile(
     schema: str,
     transformer_specification: tuple[str, ...],
     target: str,
     output: str | None,
+    spec_cache_dir: str | None,
     **kwargs: Any,
 ) -> None:
     """
@@ -516,8 +1190,13 @@ def compile(
         linkml-map compile -T X-to-Y-tr.yaml -s X.yaml
 
     """
+    from linkml_map.compiler.markdown_compiler import MarkdownCompiler
+    from linkml_map.compiler.python_compiler import PythonCompiler
+    from linkml_map.transformer.object_transformer import ObjectTransformer
+    from linkml_map.utils.schema_snapshot import load_schemaview
+
     logger.info(f"Compiling {transformer_specification} with {schema}")
-    sv = SchemaView(schema)
+    sv = load_schemaview(schema)
     compiler_args = {"source_schemaview": sv}
     if target == "python":
         compiler = PythonCompiler(**compiler_args)
@@ -528,8 +1207,7 @@ def compile(
         raise NotImplementedError(msg)
     tr = ObjectTransformer()
     tr.source_schemaview = sv
-    _load_specs(tr, transformer_specification)
-    _pre_flight_validate(tr, source_schema=schema)
+    _load_and_check_specs(tr, transformer_specification, source_schema=schema, spec_cache_dir=spec_cache_dir)
     result = compiler.compile(tr.derived_specification)
     # dump as-is, no encoding
     dump_output(result.serialization, None, output)
@@ -538,11 +1216,13 @@ def compile(
 @main.command()
 @output_option
 @transformer_specification_option
+@spec_cache_option
 @click.argument("schema")
 def derive_schema(
     schema: str,
     transformer_specification: tuple[str, ...],
     output: str | None,
+    spec_cache_dir: str | None,
     **kwargs: Any,
 ) -> None:
     """
@@ -559,12 +1239,15 @@ def derive_schema(
         linkml-map derive-schema -T transform/personinfo-to-agent.transform.yaml source/personinfo.yaml
 
     """
+    from linkml_map.inference.schema_mapper import SchemaMapper
+    from linkml_map.transformer.object_transformer import ObjectTransformer
+    from linkml_map.utils.schema_snapshot import load_schemaview
+
     logger.info(f"Transforming {schema} using {transformer_specification}")
     tr = ObjectTransformer()
-    _load_specs(tr, transformer_specification)
-    _pre_flight_validate(tr, source_schema=schema)
+    _load_and_check_specs(tr, transformer_specification, source_schema=schema, spec_cache_dir=spec_cache_dir)
     mapper = SchemaMapper(transformer=tr)
-    mapper.source_schemaview = SchemaView(schema)
+    mapper.source_schemaview = load_schemaview(schema)
     target_schema = mapper.derive_schema()
     dump_output(target_schema, "yaml", output)
 
@@ -572,12 +1255,14 @@ def derive_schema(
 @main.command()
 @output_option
 @transformer_specification_option
+@spec_cache_option
 @click.option("--strict/--no-strict", default=True, show_default=True, help="Strict mode.")
 @click.argument("schema")
 def invert(
     schema: str,
     transformer_specification: tuple[str, ...],
     output: str | None,
+    spec_cache_dir: str | None,
     **kwargs: Any,
 ) -> None:
     """
@@ -587,18 +1272,263 @@ def invert(
         linkml-map invert -T transform/personinfo-to-agent.transform.yaml source/personinfo.yaml
 
     """
+    from linkml_map.inference.inverter import TransformationSpecificationInverter
+    from linkml_map.transformer.object_transformer import ObjectTransformer
+    from linkml_map.utils.schema_snapshot import load_schemaview
+
     logger.info(f"Inverting {transformer_specification} using {schema} as source")
     tr = ObjectTransformer()
-    _load_specs(tr, transformer_specification)
-    _pre_flight_validate(tr, source_schema=schema)
+    _load_and_check_specs(tr, transformer_specification, source_schema=schema, spec_cache_dir=spec_cache_dir)
     inverter = TransformationSpecificationInverter(
-        source_schemaview=SchemaView(schema),
+        source_schemaview=load_schemaview(schema),
         **kwargs,
     )
     inverted_spec = inverter.invert(tr.specification)
     dump_output(inverted_spec, "yaml", output)
 
 
+@main.command()
+@transformer_specification_option
+@schema_option
+@entity_option
+@spec_cache_option
+@click.option(
+    "--join-engine/--no-join-engine",
+    default=True,
+    show_default=True,
+    help="With --no-join-engine, explain the plan as if every block were forced onto the per-row path.",
+)
+@click.option(
+    "--analyze",
+    is_flag=True,
+    default=False,
+    help="Run each join engine query under DuckDB EXPLAIN ANALYZE and show its timings.",
+)
+@click.option(
+    "--format",
+    "output_format",
+    type=click.Choice(["text", "json"]),
+    default="text",
+    show_default=True,
+    help="Report format.",
+)
+@click.argument("input_data")
+def explain(
+    input_data: str,
+    schema: str,
+    transformer_specification: tuple[str, ...],
+    entity: str | None,
+    spec_cache_dir: str | None,
+    join_engine: bool,
+    analyze: bool,
+    output_format: str,
+) -> None:
+    """
+    Show how map-data would run each class_derivation block over INPUT_DATA.
+
+    For every block this reports whether it runs through the set-based join
+    engine or the per-row lookup fallback, why the join engine was rejected,
+    the joins collected for the block, and the SQL each path runs.
+
+    Example:
+        linkml-map explain -T specs/ -s schema.yaml --analyze data/
+
+    """
+    from linkml_map.loaders import DataLoader
+    from linkml_map.transformer.explain import explain_spec, format_plans
+    from linkml_map.transformer.object_transformer import ObjectTransformer
+    from linkml_map.utils.schema_snapshot import load_schemaview
+
+    tr = ObjectTransformer()
+    tr.source_schemaview = load_schemaview(schema)
+    _load_and_check_specs(tr, transformer_specification, source_schema=schema, spec_cache_dir=spec_cache_dir)
+    _filter_spec_to_entity(tr, entity)
+    data_loader = DataLoader(Path(input_data), schemaview=tr.source_schemaview)
+    plans = explain_spec(tr, data_loader, join_engine=join_engine, analyze=analyze)
+    if output_format == "json":
+        click.echo(json.dumps([plan.to_dict() for plan in plans], indent=2))
+    else:
+        click.echo(format_plans(plans))
+
+
+@main.command(name="schema-snapshot")
+@click.option(
+    "-o",
+    "--output",
+    required=True,
+    type=click.Path(dir_okay=False),
+    help="Snapshot file to write; its name must end in .schema-snapshot.",
+)
+@click.argument("schema")
+def schema_snapshot(schema: str, output: str) -> None:
+    """
+    Precompile a schema into a snapshot that loads quickly.
+
+    The snapshot holds the schema merged with all its imports and the
+    induced slots of every class. Pass it anywhere a schema path is accepted
+    (-s, --target-schema, --source-schema); only paths ending in
+    .schema-snapshot are read as snapshots. Recreate it whenever the schema
+    or linkml-runtime changes.
+
+    Example:
+        linkml-map schema-snapshot -o personinfo.schema-snapshot source/personinfo.yaml
+
+    """
+    from linkml_map.utils.schema_snapshot import SNAPSHOT_SUFFIX, write_schema_snapshot
+
+    if not output.endswith(SNAPSHOT_SUFFIX):
+        msg = f"must end in {SNAPSHOT_SUFFIX}"
+        raise click.BadParameter(msg, param_hint="'-o' / '--output'")
+    sv = write_schema_snapshot(schema, output)
+    click.echo(f"Wrote snapshot of {len(sv.all_classes())} classes to {output}", err=True)
+
+
+@main.command()
+@click.option(
+    "--rows", default=10_000, show_default=True, type=click.IntRange(min=1), help="Primary rows per scenario."
+)
+@click.option(
+    "--scenario",
+    "scenario_names",
+    multiple=True,
+    help="Scenario to run (repeatable; default: all). See --list.",
+)
+@click.option("--seed", default=0, show_default=True, help="Seed for the synthetic data.")
+@click.option(
+    "--repeat",
+    default=1,
+    show_default=True,
+    type=click.IntRange(min=1),
+    help="Runs per scenario; the fastest is reported.",
+)
+@click.option(
+    "--isolate/--no-isolate",
+    default=True,
+    show_default=True,
+    help="Run every scenario in a fresh process, so memory and caches are measured per scenario.",
+)
+@click.option(
+    "--baseline",
+    type=click.Path(exists=True, dir_okay=False),
+    help="Earlier report (JSON) to compare against.",
+)
+@click.option("--list", "list_scenarios", is_flag=True, help="List the scenarios and exit.")
+@click.option("-o", "--output", type=click.Path(dir_okay=False), help="Write the JSON report here instead of stdout.")
+def bench(
+    rows: int,
+    scenario_names: tuple[str, ...],
+    seed: int,
+    repeat: int,
+    isolate: bool,
+    baseline: str | None,
+    list_scenarios: bool,
+    output: str | None,
+) -> None:
+    """
+    Benchmark transformation throughput on synthetic data.
+
+    Each scenario generates deterministic source data for a representative
+    spec (flat copy, expressions, enum mapping, joins through the engine and
+    the fallback, nesting, pivot, unit conversion), transforms it and reports
+    rows/s, peak RSS and per-stage time as JSON. A summary table goes to
+    stderr; with --baseline it includes the speed-up per scenario.
+
+    Example:
+        linkml-map bench --rows 100000 -o after.json --baseline before.json
+
+    """
+    from linkml_map.bench import format_report, get_scenarios, run_benchmarks
+
+    if list_scenarios:
+        for scenario in get_scenarios():
+            click.echo(f"{scenario.name:<16} {scenario.description}")
+        return
+    try:
+        scenarios = get_scenarios(scenario_names)
+    except ValueError as err:
+        raise click.BadParameter(str(err), param_hint="--scenario") from err
+
+    report = run_benchmarks(scenarios, rows, seed=seed, repeat=repeat, isolate=isolate)
+    previous = json.loads(Path(baseline).read_text(encoding="utf-8")) if baseline else None
+    click.echo(format_report(report, previous), err=True)
+    text = json.dumps(report, indent=2) + "\n"
+    if output:
+        Path(output).write_text(text, encoding="utf-8")
+    else:
+        click.echo(text, nl=False)
+
+
+@main.command(name="generate-data")
+@schema_option
+@transformer_specification_option
+@click.option(
+    "-c",
+    "--count",
+    "counts",
+    multiple=True,
+    required=True,
+    help="CLASS=ROWS: generate ROWS rows of CLASS (repeatable).",
+)
+@click.option("--output-dir", required=True, type=click.Path(file_okay=False), help="Directory to write into.")
+@click.option("--seed", default=0, show_default=True, help="Random seed.")
+@click.option(
+    "--null-rate",
+    default=0.0,
+    show_default=True,
+    type=click.FloatRange(0, 1),
+    help="Probability that an optional slot is left empty.",
+)
+@click.option("--csv", "as_csv", is_flag=True, help="Write CSV instead of TSV.")
+def generate_data(
+    schema: str,
+    transformer_specification: tuple[str, ...],
+    counts: tuple[str, ...],
+    output_dir: str,
+    seed: int,
+    null_rate: float,
+    as_csv: bool,
+) -> None:
+    """
+    Generate synthetic source data for the classes of a schema.
+
+    Writes one file per class, named after it, for use as map-data input.
+    Identifiers are unique, enums and numeric bounds are respected and
+    reference slots point at generated rows. With -T, the spec's join keys
+    are generated as references too.
+
+    Example:
+        linkml-map generate-data -s schema.yaml -T spec.yaml -c Person=100000 -c Visit=400000 --output-dir data/
+
+    """
+    from linkml_map.bench.synthetic import RowGenerator, spec_references, write_synthetic_data
+    from linkml_map.utils.schema_snapshot import load_schemaview
+
+    if not schema:
+        msg = "-s/--schema is required"
+        raise click.UsageError(msg)
+    sv = load_schemaview(schema)
+    parsed: dict[str, int] = {}
+    for item in counts:
+        class_name, sep, number = item.partition("=")
+        if not sep or not number.isdigit() or class_name not in sv.all_classes():
+            msg = f"expected CLASS=ROWS with a class of the schema, got {item!r}"
+            raise click.BadParameter(msg, param_hint="--count")
+        parsed[class_name] = int(number)
+
+    references: dict[tuple[str, str], str] = {}
+    if transformer_specification:
+        from linkml_map.transformer.object_transformer import ObjectTransformer
+
+        tr = ObjectTransformer()
+        tr.source_schemaview = sv
+        _load_specs(tr, transformer_specification)
+        references = spec_references(tr.derived_specification, sv)
+
+    generator = RowGenerator(sv, parsed, references=references, seed=seed, null_rate=null_rate)
+    for class_name, path in write_synthetic_data(generator, output_dir, separator="," if as_csv else "\t").items():
+        click.echo(f"Wrote {parsed[class_name]} {class_name} row(s) to {path}", err=True)
+
+
 @main.command(name="validate-spec")
 @entity_option
 @click.option(
@@ -876,6 +1806,8 @@ def dump_output(
         msg = "No output to be printed"
         raise ValueError(msg)
 
+    from linkml_runtime.dumpers import yaml_dumper
+
     from linkml_map.writers.output_streams import _strip_nulls
 
     text_dump = output_data
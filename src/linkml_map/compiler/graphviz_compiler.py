@@ -1,13 +1,18 @@
+from __future__ import annotations
+
 import re
 from dataclasses import dataclass
+from typing import TYPE_CHECKING
 
-from graphviz import Digraph
 from linkml_runtime import SchemaView
 from pydantic import BaseModel
 
 from linkml_map.compiler.compiler import CompiledSpecification, Compiler
 from linkml_map.datamodel.transformer_model import TransformationSpecification
 
+if TYPE_CHECKING:
+    from graphviz import Digraph
+
 
 class Record(BaseModel):
     """
@@ -54,6 +59,8 @@ class GraphvizCompiler(Compiler):
     """
 
     def compile(self, specification: TransformationSpecification, elements: list[str] | None = None) -> GraphvizObject:
+        from graphviz import Digraph
+
         dg = Digraph(comment="UML Class Diagram", format="png")
         dg.attr(rankdir="LR")  # Set graph direction from left to right
         target_schemaview = self.derived_target_schemaview(specification)
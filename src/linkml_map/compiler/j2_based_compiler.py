@@ -1,7 +1,5 @@
 from dataclasses import dataclass
 
-from jinja2 import Environment, FileSystemLoader
-
 from linkml_map.compiler.compiler import CompiledSpecification, Compiler
 from linkml_map.compiler.templates import TEMPLATE_DIR
 from linkml_map.datamodel.transformer_model import TransformationSpecification
@@ -26,6 +24,8 @@ class J2BasedCompiler(Compiler):
         if not template_dir:
             msg = "template_dir must be set"
             raise ValueError(msg)
+        from jinja2 import Environment, FileSystemLoader
+
         loader = FileSystemLoader(template_dir)
         env = Environment(loader=loader, autoescape=True)
         if not self.template_name:
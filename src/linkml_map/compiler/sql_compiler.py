@@ -31,6 +31,8 @@ class SQLCompiler(Compiler):
 
     add_if_not_exists: bool = True
     new_table_when_transforming: bool = False
+    dialect: str = "duckdb"
+    """Target SQL dialect for DDL: ``duckdb`` (arrays, JSON) or ``sqlite`` (JSON stored as TEXT)."""
 
     def compile(self, specification: TransformationSpecification) -> CompiledSpecification:
         compiled = CompiledSpecification()
@@ -121,6 +123,9 @@ class SQLCompiler(Compiler):
         """
         Map LinkML types to DuckDB SQL types.
 
+        With ``dialect = "sqlite"``, complex and multivalued columns are TEXT,
+        since SQLite has no array or JSON column types.
+
         :param slot:
         :param schemaview:
         :return:
@@ -136,6 +141,8 @@ class SQLCompiler(Compiler):
                     # TODO: consider structs
                     typ = "JSON"
 
+        if self.dialect == "sqlite":
+            return "TEXT" if typ == "JSON" or slot.multivalued else typ
         if slot.multivalued:
             typ = f"{typ}[]"
         return typ
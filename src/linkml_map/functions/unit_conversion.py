@@ -5,14 +5,20 @@ Currently only native pint units or UCUM units are supported.
 
 For UCUM, the ucumvert library is used to convert UCUM units to pint units,
 see `<https://github.com/dalito/ucumvert>`_.
+
+pint, lark and ucumvert are imported on first conversion: building the UCUM
+registry is expensive and most specifications never convert units.
 """
 
+from __future__ import annotations
+
 from enum import Enum
 from functools import lru_cache
+from typing import TYPE_CHECKING
 
-import lark
-import pint
-from ucumvert import PintUcumRegistry
+if TYPE_CHECKING:
+    import pint
+    from ucumvert import PintUcumRegistry
 
 
 class UnitSystem(str, Enum):
@@ -23,11 +29,6 @@ class UnitSystem(str, Enum):
     SI = "SI"
 
 
-REGISTRIES = {
-    UnitSystem.UCUM: PintUcumRegistry(),
-}
-
-
 class UndefinedUnitError(Exception):
     """
     Raised when a unit is not defined.
@@ -82,6 +83,9 @@ def convert_units(
     :param to_unit:
     :return: converted magnitude
     """
+    import lark
+    import pint
+
     magnitude = float(magnitude)
     ureg: pint.UnitRegistry = get_unit_registry(system)
     from_unit = normalize_unit(from_unit, system)
@@ -140,11 +144,13 @@ def get_unit_registry(
     """
     import pint
 
+    if system == UnitSystem.UCUM:
+        from ucumvert import PintUcumRegistry
+
+        return PintUcumRegistry()
     ureg = pint.UnitRegistry()
     if not system:
         return ureg
-    if system in REGISTRIES:
-        return REGISTRIES[system]
     if system.value in dir(ureg.sys):
         ureg.default_system = system.value
         return ureg
@@ -156,6 +162,8 @@ def normalize_unit(unit: str, system: UnitSystem | None = None) -> str:
     """Normalize the unit to UnitSystem.UCUM, if possible."""
     if system is None or system != UnitSystem.UCUM:
         return unit
+    import lark
+    import pint
 
     # this is UnitSystem.UCUM
     try:
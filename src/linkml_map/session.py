@@ -13,6 +13,7 @@ from linkml_map.datamodel.transformer_model import TransformationSpecification
 from linkml_map.inference.inverter import TransformationSpecificationInverter
 from linkml_map.inference.schema_mapper import SchemaMapper
 from linkml_map.transformer.transformer import Transformer
+from linkml_map.utils.schema_snapshot import load_schemaview
 
 logger = logging.getLogger(__name__)
 
@@ -60,10 +61,8 @@ class Session:
         """
         Set the schema from a path or SchemaView object.
         """
-        if isinstance(schema, str):
-            sv = SchemaView(schema)
-        elif isinstance(schema, Path):
-            sv = SchemaView(str(schema))
+        if isinstance(schema, (str, Path)):
+            sv = load_schemaview(schema)
         elif isinstance(schema, dict):
             sv = SchemaView(yaml_dumper.dumps(schema))
         elif isinstance(schema, SchemaView):
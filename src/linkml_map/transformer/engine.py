@@ -4,26 +4,51 @@ from __future__ import annotations
 
 import logging
 from collections.abc import Callable
+from dataclasses import dataclass
+from itertools import islice
+from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
 from linkml_map.transformer.errors import TransformationError
+from linkml_map.transformer.explain import JOIN_ENGINE, explain_block
 from linkml_map.transformer.join_engine import (
+    _table_path,
     can_use_join_engine,
     transform_block_via_join,
 )
 from linkml_map.utils.join_utils import join_keys
 from linkml_map.utils.lookup_index import LookupIndex, make_connection
+from linkml_map.utils.manifest import block_key, content_digest, identifier_slot_name, joined_tables_salt
 
 if TYPE_CHECKING:
-    from collections.abc import Iterator
+    from collections.abc import Iterable, Iterator
 
     from linkml_map.datamodel.transformer_model import ClassDerivation
     from linkml_map.loaders.data_loaders import DataLoader
     from linkml_map.transformer.object_transformer import ObjectTransformer
+    from linkml_map.utils.manifest import RowManifest
+    from linkml_map.utils.metrics import TransformMetrics
+    from linkml_map.utils.pipeline import Pipeline
 
 logger = logging.getLogger(__name__)
 
 
+@dataclass
+class TransformProgress:
+    """
+    Position of :func:`transform_spec` in its input, for checkpoint and resume.
+
+    ``block`` indexes ``class_derivations`` in the derived specification and
+    ``row`` counts the source rows of that block already consumed. Whenever
+    ``transform_spec`` yields a row, every source row up to and including the
+    one that produced it is counted, so a run restarted from a saved position
+    produces exactly the rows that were not yet yielded.
+    """
+
+    block: int = 0
+    row: int = 0
+
+
 def _collect_all_joins(class_deriv: ClassDerivation) -> dict[str, tuple[str, str]]:
     """Collect all join specs from a class derivation and its nested descendants.
 
@@ -53,12 +78,56 @@ def _collect_all_joins(class_deriv: ClassDerivation) -> dict[str, tuple[str, str
     return result
 
 
+#: Source rows read ahead per chunk when mapping with ``map_batch`` or
+#: prefetching batched extension calls.
+BATCH_ROWS = 1000
+
+
+#: Stands in for the target object of a row not mapped up front; see :func:`_mapped_in_batches`.
+_UNMAPPED = object()
+
+
+def _prefetching_batch_calls(
+    transformer: ObjectTransformer,
+    rows: Iterable[dict[str, Any]],
+    class_deriv: ClassDerivation,
+    source_type: str,
+) -> Iterator[dict[str, Any]]:
+    """Yield *rows*, prefetching batched extension calls one chunk ahead of consumption."""
+    rows = iter(rows)
+    while chunk := list(islice(rows, BATCH_ROWS)):
+        transformer.prefetch_batch_calls(chunk, class_deriv, source_type)
+        yield from chunk
+
+
+def _mapped_in_batches(
+    transformer: ObjectTransformer,
+    rows: Iterable[dict[str, Any]],
+    class_deriv: ClassDerivation,
+    source_type: str,
+) -> Iterator[tuple[dict[str, Any], dict[str, Any] | TransformationError | None]]:
+    """Yield each row with its target object (or the error it raised), mapping a chunk at a time."""
+    rows = iter(rows)
+    while chunk := list(islice(rows, BATCH_ROWS)):
+        errors: dict[int, TransformationError] = {}
+        results = transformer.map_batch(chunk, class_deriv, source_type, on_error=errors.__setitem__)
+        for i, row in enumerate(chunk):
+            yield row, errors[i] if i in errors else results[i]
+
+
 def transform_spec(
     transformer: ObjectTransformer,
     data_loader: DataLoader,
     source_type: str | None = None,
     on_error: Callable[[TransformationError], None] | None = None,
-) -> Iterator[dict[str, Any]]:
+    with_class_derivation: bool = False,
+    pipeline: Pipeline | None = None,
+    progress: TransformProgress | None = None,
+    manifest: RowManifest | None = None,
+    join_engine: bool = True,
+    explain: bool = False,
+    metrics: TransformMetrics | None = None,
+) -> Iterator[dict[str, Any]] | Iterator[tuple[str, dict[str, Any]]]:
     """
     Iterate class_derivation blocks and stream transformed rows.
 
@@ -91,7 +160,33 @@ def transform_spec(
         :class:`TransformationError` is caught, enriched with row context,
         and passed to the callback. When ``None`` (default), errors propagate
         immediately (fail-fast).
-    :returns: Iterator of transformed row dicts.
+    :param with_class_derivation: When ``True``, yield ``(class_derivation_name, row)``
+        pairs instead of bare rows, so consumers can route rows by target class.
+    :param pipeline: Optional :class:`~linkml_map.utils.pipeline.Pipeline`. When
+        given, source rows are read on a background thread (stage ``read``) so
+        file I/O and DuckDB fetches overlap with transformation.
+    :param progress: Optional :class:`TransformProgress`. Blocks before
+        ``progress.block`` and the first ``progress.row`` source rows of that
+        block are skipped, and the object is updated in place as rows are
+        consumed. Join-engine blocks are read in source order when this is set.
+    :param manifest: Optional :class:`~linkml_map.utils.manifest.RowManifest`
+        for incremental runs. Only source rows that are new or changed since
+        the manifest was written are transformed and yielded; rows that
+        disappeared are recorded as tombstones in the manifest. A row counts
+        as changed when its values, the spec, or (for the join engine) its
+        joined rows change; on the per-row path any change to a joined
+        table's file invalidates every row of the block.
+    :param join_engine: When ``False``, every block takes the per-row lookup
+        path even if the set-based join engine could run it (for diagnosing
+        divergences and benchmarking the fallback).
+    :param explain: When ``True``, log each block's execution plan (see
+        :func:`~linkml_map.transformer.explain.explain_block`) at INFO level
+        before running it: the chosen path, why the join engine was rejected,
+        the collected joins and the SQL.
+    :param metrics: Optional :class:`~linkml_map.utils.metrics.TransformMetrics`
+        updated with rows read and written, errors and join hits/misses per
+        block, and given the DuckDB connections so it can report their memory.
+    :returns: Iterator of transformed row dicts (or name/row pairs).
     """
     spec = transformer.derived_specification
     if spec is None:
@@ -103,30 +198,97 @@ def transform_spec(
     # index. owns_index records that we'd own any index we later create, for cleanup.
     owns_index = transformer.lookup_index is None
     engine_con = None
+    start_block, start_row = (progress.block, progress.row) if progress is not None else (0, 0)
+    spec_digest = content_digest(spec.model_dump(mode="json", exclude_none=True)) if manifest is not None else None
+    block = None
+    if metrics is not None:
+        tables = {cd.populated_from or cd.name for cd in spec.class_derivations}
+        input_bytes = sum(Path(_table_path(data_loader, t)).stat().st_size for t in tables if t in data_loader)
+        metrics.start_run(len(spec.class_derivations), input_bytes)
 
     try:
-        for class_deriv in spec.class_derivations:
+        for block_idx, class_deriv in enumerate(spec.class_derivations):
+            if block_idx < start_block:
+                continue
+            skip_rows = start_row if block_idx == start_block else 0
+            if progress is not None:
+                progress.block, progress.row = block_idx, skip_rows
             table_name = class_deriv.populated_from or class_deriv.name
+            if explain:
+                if engine_con is None:
+                    engine_con = make_connection()
+                plan = explain_block(
+                    transformer,
+                    data_loader,
+                    class_deriv,
+                    block_idx,
+                    join_engine=join_engine,
+                    con=engine_con,
+                    source_type=source_type,
+                    incremental=manifest is not None,
+                )
+                logger.info("Execution plan:\n%s", plan.format())
             if table_name not in data_loader:
                 logger.debug("Skipping class_derivation %s: no data found", class_deriv.name)
+                if manifest is not None:
+                    # No rows seen: everything recorded for a removed table is tombstoned.
+                    manifest.start_block(block_key(block_idx, class_deriv), name=class_deriv.name)
+                    manifest.finish_block()
                 continue
 
             # Fast path: the set-based join engine, when the block is engine-capable.
             # The per-row point-lookup path below is the correctness fallback for
             # everything it can't handle (FK chains, non-file data, multi-hop joins).
-            if can_use_join_engine(class_deriv, data_loader, sv):
+            if explain:
+                use_engine = plan.path == JOIN_ENGINE
+            else:
+                use_engine = join_engine and can_use_join_engine(class_deriv, data_loader, sv)
+            if use_engine:
+                if manifest is not None:
+                    manifest.start_block(
+                        block_key(block_idx, class_deriv), [spec_digest, class_deriv.name], name=class_deriv.name
+                    )
                 if engine_con is None:
                     engine_con = make_connection()
+                if metrics is not None:
+                    metrics.attach_duckdb(engine_con)
+                    metrics.start_block(
+                        block_idx, class_deriv.name, table_name, "join_engine", _table_path(data_loader, table_name)
+                    )
                 logger.debug("Join engine for class_derivation %s", class_deriv.name)
-                yield from transform_block_via_join(
-                    transformer, data_loader, class_deriv, source_type, engine_con, on_error
+                block_rows = transform_block_via_join(
+                    transformer,
+                    data_loader,
+                    class_deriv,
+                    source_type,
+                    engine_con,
+                    on_error,
+                    pipeline=pipeline,
+                    progress=progress,
+                    manifest=manifest,
+                    metrics=metrics,
                 )
+                if with_class_derivation:
+                    for row in block_rows:
+                        yield class_deriv.name, row
+                else:
+                    yield from block_rows
+                if manifest is not None:
+                    manifest.finish_block()
+                if metrics is not None:
+                    metrics.finish_block()
                 continue
 
             # Fallback: per-row point-lookup path. Create the LookupIndex on first use
             # here, so an all-engine run never opened one.
             if transformer.lookup_index is None:
                 transformer.lookup_index = LookupIndex()
+            if metrics is not None:
+                metrics.attach_duckdb(transformer.lookup_index._conn)
+                block = metrics.start_block(
+                    block_idx, class_deriv.name, table_name, "per_row", _table_path(data_loader, table_name)
+                )
+                metrics.attach_lookup_index(transformer.lookup_index)
             joined_tables: list[str] = []
             try:
                 # Register all joined tables (explicit + synthesized from normalization).
@@ -137,25 +299,80 @@ def transform_spec(
                         transformer.lookup_index.register_table(join_name, join_path, lookup_key)
                         joined_tables.append(join_name)
 
-                for row_idx, row in enumerate(data_loader[table_name]):
-                    try:
-                        yield transformer.map_object(
-                            row,
-                            source_type=source_type or table_name,
-                            class_derivation=class_deriv,
+                if manifest is not None:
+                    joined_paths = [data_loader.get_path(name) for name in all_joins if name in data_loader]
+                    manifest.start_block(
+                        block_key(block_idx, class_deriv),
+                        [spec_digest, class_deriv.name, joined_tables_salt(joined_paths)],
+                        name=class_deriv.name,
+                    )
+                    row_id_slot = identifier_slot_name(sv, table_name)
+                    target_id_slot = identifier_slot_name(transformer.target_schemaview, class_deriv.name)
+
+                source_rows = data_loader[table_name]
+                if skip_rows:
+                    source_rows = islice(source_rows, skip_rows, None)
+                if pipeline is not None:
+                    source_rows = pipeline.prefetch(source_rows, "read", batch=True)
+                # With a manifest, only changed rows are mapped, so rows are
+                # mapped one at a time as the manifest lets them through.
+                if manifest is None:
+                    mapped_rows = _mapped_in_batches(transformer, source_rows, class_deriv, source_type or table_name)
+                else:
+                    if transformer.batch_call_sites(class_deriv):
+                        source_rows = _prefetching_batch_calls(
+                            transformer, source_rows, class_deriv, source_type or table_name
                         )
+                    mapped_rows = ((row, _UNMAPPED) for row in source_rows)
+                for row_idx, (row, mapped) in enumerate(mapped_rows, start=skip_rows):
+                    if progress is not None:
+                        progress.row = row_idx + 1
+                    if block is not None:
+                        block.rows_in += 1
+                    if manifest is not None:
+                        row_id = row.get(row_id_slot) if row_id_slot else None
+                        digest = manifest.changed(row_id, row)
+                        if digest is None:
+                            continue
+                    try:
+                        if mapped is _UNMAPPED:
+                            target_row = transformer.map_object(
+                                row,
+                                source_type=source_type or table_name,
+                                class_derivation=class_deriv,
+                            )
+                        elif isinstance(mapped, TransformationError):
+                            raise mapped
+                        else:
+                            target_row = mapped
                     except TransformationError as err:
                         if on_error is None:
                             raise
                         err.row_index = row_idx
                         err.class_derivation_name = err.class_derivation_name or class_deriv.name
+                        if block is not None:
+                            block.errors += 1
                         on_error(err)
+                        continue
+                    if manifest is not None:
+                        manifest.update(row_id, digest, target_row.get(target_id_slot) if target_id_slot else None)
+                    if block is not None:
+                        block.rows_out += 1
+                    yield (class_deriv.name, target_row) if with_class_derivation else target_row
+                if manifest is not None:
+                    manifest.finish_block()
+                if metrics is not None:
+                    metrics.finish_block()
             finally:
                 for jt in joined_tables:
                     transformer.lookup_index.drop(jt)
     finally:
         if engine_con is not None:
+            if metrics is not None:
+                metrics.detach_duckdb(engine_con)
             engine_con.close()
+        if metrics is not None and transformer.lookup_index is not None:
+            metrics.detach_duckdb(transformer.lookup_index._conn)
         # Close and detach a LookupIndex we created, so a later call reinitializes
         # a fresh one rather than reusing the now-closed connection. It may never
         # have been created if every block used the engine.
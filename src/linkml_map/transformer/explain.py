@@ -0,0 +1,200 @@
+"""Execution plans for :func:`~linkml_map.transformer.engine.transform_spec`.
+
+For each class_derivation block, :func:`explain_block` reports which path
+``transform_spec`` takes — the set-based join engine or the per-row lookup
+fallback — and why, the joins gathered for the block, the SQL each path
+runs and the ``expr:`` slots the join query computes. With ``analyze=True`` the join query is executed under DuckDB's
+``EXPLAIN ANALYZE`` to time it.
+"""
+
+from __future__ import annotations
+
+import time
+from dataclasses import asdict, dataclass, field
+from typing import TYPE_CHECKING, Any
+
+from linkml_map.transformer.join_engine import (
+    _build_join_sql,
+    _collect_joins,
+    _expr_pushdown,
+    join_engine_rejection,
+)
+from linkml_map.utils.lookup_index import make_connection
+
+if TYPE_CHECKING:
+    import duckdb
+
+    from linkml_map.datamodel.transformer_model import ClassDerivation
+    from linkml_map.loaders.data_loaders import DataLoader
+    from linkml_map.transformer.object_transformer import ObjectTransformer
+
+JOIN_ENGINE = "join_engine"
+PER_ROW = "per_row"
+SKIPPED = "skipped"
+
+_PATH_LABELS = {JOIN_ENGINE: "join engine", PER_ROW: "per-row lookup", SKIPPED: "skipped"}
+
+
+@dataclass
+class BlockPlan:
+    """How ``transform_spec`` runs one class_derivation block."""
+
+    index: int
+    class_derivation: str
+    table: str
+    path: str
+    """One of :data:`JOIN_ENGINE`, :data:`PER_ROW` or :data:`SKIPPED`."""
+    reason: str | None = None
+    """Why the join engine was not used (``None`` on the join engine path)."""
+    joins: dict[str, dict[str, str | None]] = field(default_factory=dict)
+    """Joins collected for the block and its nested derivations, by join name."""
+    sql: list[str] = field(default_factory=list)
+    """The star join query, or the per-row lookup queries (run once per source row)."""
+    params: list[str] = field(default_factory=list)
+    sql_exprs: list[str] = field(default_factory=list)
+    """Slots whose ``expr:`` the join query computes (rows its guard rejects are evaluated in Python)."""
+    analyze: str | None = None
+    """DuckDB ``EXPLAIN ANALYZE`` output, when requested on the join engine path."""
+    seconds: float | None = None
+    """Wall-clock time of the ``EXPLAIN ANALYZE`` run."""
+
+    def to_dict(self) -> dict[str, Any]:
+        """JSON-serializable form."""
+        return asdict(self)
+
+    def format(self) -> str:
+        """Render the plan as indented text."""
+        head = f"[{self.index}] {self.class_derivation} <- {self.table}: {_PATH_LABELS[self.path]}"
+        lines = [head if self.reason is None else f"{head} ({self.reason})"]
+        if self.joins:
+            lines.append("  joins:")
+            for name, keys in self.joins.items():
+                lines.append(f"    {name}: {self.table}.{keys['source_key']} = {name}.{keys['lookup_key']}")
+        if self.sql:
+            lines.append("  sql:" if self.path == JOIN_ENGINE else "  sql (per source row):")
+            lines.extend(f"    {statement}" for statement in self.sql)
+        if self.params:
+            lines.append(f"  params: {', '.join(self.params)}")
+        if self.sql_exprs:
+            lines.append(f"  expr computed in sql: {', '.join(self.sql_exprs)}")
+        if self.analyze is not None:
+            lines.append(f"  explain analyze ({self.seconds:.3f}s):")
+            lines.extend(f"    {line}" for line in self.analyze.splitlines())
+        return "\n".join(lines)
+
+
+def explain_block(
+    transformer: ObjectTransformer,
+    data_loader: DataLoader,
+    class_deriv: ClassDerivation,
+    index: int = 0,
+    *,
+    join_engine: bool = True,
+    con: duckdb.DuckDBPyConnection | None = None,
+    analyze: bool = False,
+    source_type: str | None = None,
+    incremental: bool = False,
+) -> BlockPlan:
+    """
+    Explain how ``transform_spec`` runs *class_deriv*.
+
+    :param index: Position of the block in the derived specification.
+    :param join_engine: As for ``transform_spec``; ``False`` forces the per-row path.
+    :param con: DuckDB connection used to build (and analyze) the join query;
+        without one, the join engine plan omits its SQL.
+    :param source_type: As for ``transform_spec``.
+    :param incremental: Whether the run uses a manifest; its join query then
+        computes no expressions.
+    :param analyze: Run the join query under ``EXPLAIN ANALYZE``. This reads
+        every joined file, so it costs about as much as the join itself.
+    """
+    table = class_deriv.populated_from or class_deriv.name
+    plan = BlockPlan(index=index, class_derivation=str(class_deriv.name), table=table, path=PER_ROW)
+    try:
+        joins = _collect_joins(class_deriv, {})
+    except ValueError as err:
+        plan.reason = str(err)
+        return plan
+    plan.joins = {
+        name: {"source_key": join.source_key or join.join_on, "lookup_key": join.lookup_key or join.join_on}
+        for name, join in joins.items()
+    }
+    if table not in data_loader:
+        plan.path, plan.reason = SKIPPED, f"no data found for {table!r}"
+        return plan
+
+    reason = join_engine_rejection(class_deriv, data_loader, transformer.source_schemaview)
+    if reason is None and not join_engine:
+        reason = "join engine disabled"
+    if reason is not None:
+        plan.reason = reason
+        plan.sql = [
+            f'SELECT * FROM "{name}" WHERE "{keys["lookup_key"]}" = ? LIMIT 1'  # noqa: S608 - display only
+            for name, keys in plan.joins.items()
+            if name in data_loader
+        ]
+        return plan
+
+    plan.path = JOIN_ENGINE
+    if con is not None:
+        # The same query transform_block_via_join runs, expression columns included.
+        pushdown = _expr_pushdown(transformer, class_deriv, source_type or table, con, incremental=incremental)
+        try:
+            sql, plan.params = _build_join_sql(
+                table, joins, data_loader, con, exprs=pushdown.select if pushdown is not None else None
+            )
+            plan.sql = [sql]
+            plan.sql_exprs = list(pushdown.slots) if pushdown is not None else []
+            if analyze:
+                start = time.perf_counter()
+                rows = con.execute(f"EXPLAIN ANALYZE {sql}", plan.params).fetchall()
+                plan.seconds = time.perf_counter() - start
+                plan.analyze = "\n".join(str(row[-1]) for row in rows)
+        finally:
+            if pushdown is not None:
+                pushdown.close()
+    return plan
+
+
+def explain_spec(
+    transformer: ObjectTransformer,
+    data_loader: DataLoader,
+    *,
+    join_engine: bool = True,
+    analyze: bool = False,
+    source_type: str | None = None,
+) -> list[BlockPlan]:
+    """
+    Explain every class_derivation block of the transformer's derived specification.
+
+    :param join_engine: As for ``transform_spec``; ``False`` forces the per-row path.
+    :param analyze: Time each join engine query with ``EXPLAIN ANALYZE``.
+    :param source_type: As for ``transform_spec``.
+    """
+    spec = transformer.derived_specification
+    if spec is None:
+        return []
+    con = make_connection()
+    try:
+        return [
+            explain_block(
+                transformer,
+                data_loader,
+                cd,
+                i,
+                join_engine=join_engine,
+                con=con,
+                analyze=analyze,
+                source_type=source_type,
+            )
+            for i, cd in enumerate(spec.class_derivations)
+        ]
+    finally:
+        con.close()
+
+
+def format_plans(plans: list[BlockPlan]) -> str:
+    """Render *plans* followed by a count of blocks per path."""
+    counts = {path: sum(p.path == path for p in plans) for path in _PATH_LABELS}
+    summary = ", ".join(f"{counts[path]} {label}" for path, label in _PATH_LABELS.items())
+    return "\n".join([*(p.format() for p in plans), f"{len(plans)} block(s): {summary}"])
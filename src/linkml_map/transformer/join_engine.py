@@ -27,13 +27,18 @@ from typing import TYPE_CHECKING, Any
 
 from linkml_map.loaders.data_loaders import FileFormat
 from linkml_map.transformer.errors import TransformationError
-from linkml_map.transformer.object_transformer import MergedRow
+from linkml_map.transformer.object_transformer import BindingPlan, MergedRow
+from linkml_map.utils.eval_utils import _resolve_functions
+from linkml_map.utils.expr_memo import MISS
+from linkml_map.utils.expr_sql import SqlColumn, translate_expr
+from linkml_map.utils.expr_udf import ExprUdfs, arrow_udfs_available
 from linkml_map.utils.join_utils import join_keys
 from linkml_map.utils.lookup_index import (
     _duckdb_read_expr,
     _parse_numeric,
     _validate_identifier,
 )
+from linkml_map.utils.manifest import identifier_slot_name
 
 if TYPE_CHECKING:
     from collections.abc import Callable, Iterator
@@ -43,7 +48,11 @@ if TYPE_CHECKING:
 
     from linkml_map.datamodel.transformer_model import AliasedClass, ClassDerivation
     from linkml_map.loaders.data_loaders import DataLoader
+    from linkml_map.transformer.engine import TransformProgress
     from linkml_map.transformer.object_transformer import ObjectTransformer
+    from linkml_map.utils.manifest import RowManifest
+    from linkml_map.utils.metrics import TransformMetrics
+    from linkml_map.utils.pipeline import Pipeline
 
 logger = logging.getLogger(__name__)
 
@@ -85,24 +94,69 @@ def _collect_joins(class_deriv: ClassDerivation, acc: dict[str, AliasedClass]) -
     return acc
 
 
-def _refs_engine_safe(class_deriv: ClassDerivation, available: set[str]) -> bool:
-    """True if every dotted ``populated_from`` resolves to an available table (no FK chain / multi-hop).
+def _unsafe_ref(class_deriv: ClassDerivation, available: set[str]) -> str | None:
+    """Describe the first dotted ``populated_from`` the engine cannot resolve, or ``None``.
 
     A dotted ``populated_from`` ``X.col`` is engine-safe only when ``X`` is the
     primary or a joined table (so it resolves from the MergedRow) and the field
     is a single column (no ``a.b.c`` foreign-key traversal, which needs
     ``object_index``).
     """
-    for slot_deriv in class_deriv.slot_derivations.values():
+    for slot_name, slot_deriv in class_deriv.slot_derivations.items():
         pf = slot_deriv.populated_from
         if pf and "." in pf:
             head, _, tail = pf.partition(".")
-            if head not in available or "." in tail:
-                return False
+            where = f"{class_deriv.name}.{slot_name} populated_from {pf!r}"
+            if "." in tail:
+                return f"{where} is a multi-hop foreign-key path"
+            if head not in available:
+                return f"{where} references {head!r}, which is neither the primary nor a joined table"
         for nested in slot_deriv.class_derivations or []:
-            if not _refs_engine_safe(nested, available):
-                return False
-    return True
+            reason = _unsafe_ref(nested, available)
+            if reason is not None:
+                return reason
+    return None
+
+
+def _refs_engine_safe(class_deriv: ClassDerivation, available: set[str]) -> bool:
+    """True if every dotted ``populated_from`` resolves to an available table (no FK chain / multi-hop)."""
+    return _unsafe_ref(class_deriv, available) is None
+
+
+def join_engine_rejection(class_deriv: ClassDerivation, data_loader: DataLoader, sv: SchemaView | None) -> str | None:
+    """Why a class_derivation block cannot use the set-based join engine, or ``None`` if it can.
+
+    See :func:`can_use_join_engine` for the conditions checked; the returned
+    reason names the first one that fails.
+    """
+    primary = class_deriv.populated_from or class_deriv.name
+    if primary not in data_loader:
+        return f"no data file for primary table {primary!r}"
+    if not _duckdb_readable(data_loader, primary):
+        return f"primary table {primary!r} is not DuckDB-readable ({_table_path(data_loader, primary)})"
+    if sv is None:
+        return "no source schema"
+    if primary not in sv.all_classes():
+        return f"primary table {primary!r} is not a class of the source schema"
+    joins = _collect_joins(class_deriv, {})
+    if not joins:
+        return "no joins (the per-row path needs no lookups)"
+    primary_cols = {s.name for s in sv.class_induced_slots(primary)}
+    for table, join in joins.items():
+        if table not in data_loader:
+            return f"no data file for joined table {table!r}"
+        if not _duckdb_readable(data_loader, table):
+            return f"joined table {table!r} is not DuckDB-readable ({_table_path(data_loader, table)})"
+        # Inline (not join_keys) on purpose: this is a non-raising capability probe —
+        # a join missing either key makes the block ineligible, it must not raise
+        # mid-dispatch (join_keys would later raise in _build_join_sql otherwise).
+        source_key = join.source_key or join.join_on
+        lookup_key = join.lookup_key or join.join_on
+        if not source_key or not lookup_key:
+            return f"join {table!r} has no source_key/lookup_key"
+        if source_key not in primary_cols:
+            return f"source_key {source_key!r} of join {table!r} is not a slot of primary {primary!r}"
+    return _unsafe_ref(class_deriv, {primary, *joins})
 
 
 def can_use_join_engine(class_deriv: ClassDerivation, data_loader: DataLoader, sv: SchemaView | None) -> bool:
@@ -119,28 +173,10 @@ def can_use_join_engine(class_deriv: ClassDerivation, data_loader: DataLoader, s
     - every join keys on a column present in the primary (a subject-keyed star
       join, not a multi-hop chain);
     - no dotted ``populated_from`` references an FK chain or a non-available table.
+
+    :func:`join_engine_rejection` reports which condition failed.
     """
-    primary = class_deriv.populated_from or class_deriv.name
-    if primary not in data_loader or not _duckdb_readable(data_loader, primary):
-        return False
-    if sv is None or primary not in sv.all_classes():
-        return False
-    joins = _collect_joins(class_deriv, {})
-    if not joins:
-        return False
-    primary_cols = {s.name for s in sv.class_induced_slots(primary)}
-    for table, join in joins.items():
-        if table not in data_loader or not _duckdb_readable(data_loader, table):
-            return False
-        # Inline (not join_keys) on purpose: this is a non-raising capability probe —
-        # a join missing either key makes the block ineligible, it must not raise
-        # mid-dispatch (join_keys would later raise in _build_join_sql otherwise).
-        source_key = join.source_key or join.join_on
-        lookup_key = join.lookup_key or join.join_on
-        if not source_key or not lookup_key or source_key not in primary_cols:
-            return False
-    available = {primary, *joins}
-    return _refs_engine_safe(class_deriv, available)
+    return join_engine_rejection(class_deriv, data_loader, sv) is None
 
 
 #: File formats the DuckDB join can read (matches :func:`_duckdb_read_expr`).
@@ -151,6 +187,22 @@ _DUCKDB_READABLE_FORMATS = frozenset({FileFormat.TSV, FileFormat.CSV, FileFormat
 #: otherwise drop that primary column from the row).
 _JOIN_STRUCT_PREFIX = "__join__"
 
+#: Column numbering primary rows in file order, for resumable (ordered) queries.
+_ROW_NUMBER = "__linkml_map_row"
+
+#: Prefix for the columns computing ``expr:`` slot derivations in the query
+#: (see :class:`_ExprPushdown`); like the join STRUCTs, they are not primary columns.
+_EXPR_PREFIX = "__expr__"
+
+#: Python type of a column's values by schema range, as assumed by the SQL
+#: translation of expressions (any other range is assumed to hold strings).
+_RANGE_KINDS = {"integer": "int", "float": "float", "double": "float", "decimal": "float"}
+
+#: Tables visible to a join query, as passed to an ``exprs`` callback of
+#: :func:`_build_join_sql`: join name → (SQL alias, file columns), or None for a
+#: join degraded to an all-miss NULL STRUCT.
+_JoinedColumns = dict[str, tuple[str, set[str]] | None]
+
 
 def _table_path(data_loader: DataLoader, table: str) -> str:
     """Resolve *table*'s file path (``get_path`` raises in single-file mode, so use ``base_path`` there)."""
@@ -180,6 +232,9 @@ def _build_join_sql(
     joins: dict[str, AliasedClass],
     data_loader: DataLoader,
     con: duckdb.DuckDBPyConnection,
+    ordered: bool = False,
+    skip_rows: int = 0,
+    exprs: Callable[[set[str], _JoinedColumns], list[str]] | None = None,
 ) -> tuple[str, list[str]]:
     """Build a star ``LEFT JOIN`` query and its path parameters (in FROM order).
 
@@ -197,24 +252,35 @@ def _build_join_sql(
     result a header-only file produces, rather than binding a non-existent column
     (which raises ``BinderException`` and aborts the whole block, #276). Both files
     are probed the same way so the primary and joined sides degrade identically.
+
+    With ``ordered=True`` primary rows are numbered in file order and the result
+    is sorted by that number, so a block can be resumed after its first
+    *skip_rows* rows (see :class:`~linkml_map.transformer.engine.TransformProgress`).
+
+    *exprs*, if given, is called with the primary's file columns (alias ``m``)
+    and the joined tables' (see :data:`_JoinedColumns`) and returns extra select
+    items, e.g. from :meth:`_ExprPushdown.select`.
     """
     params: list[str] = []
 
-    def reader(table: str, alias: str, dedup_key: str | None = None) -> str:
+    def reader(table: str, alias: str, dedup_key: str | None = None, number_rows: bool = False) -> str:
         path = _table_path(data_loader, table)
         params.append(path)  # one '?' per reader, bound in FROM order
         select = _duckdb_read_expr(FileFormat.from_extension(path))
         if dedup_key is not None:
             select = f'{select} QUALIFY row_number() OVER (PARTITION BY "{dedup_key}") = 1'
+        if number_rows:
+            select = f'SELECT *, row_number() OVER () AS "{_ROW_NUMBER}" FROM ({select})'  # noqa: S608
         return f"({select}) {alias}"
 
     primary_path = _table_path(data_loader, primary)
     primary_cols = _readable_columns(con, primary_path, FileFormat.from_extension(primary_path))
-    from_parts = [reader(primary, "m")]
+    from_parts = [reader(primary, "m", number_rows=ordered)]
     # m.* projects the primary's actual file columns; the bare alias jN projects
     # the whole joined row as a STRUCT (its real file columns, not schema slots —
     # which may include FK relationships that aren't data columns).
     struct_select = []
+    joined: _JoinedColumns = {}
     for i, (table, join) in enumerate(joins.items()):
         alias = f"j{i}"
         source_key, lookup_key = join_keys(join)
@@ -234,7 +300,9 @@ def _build_join_sql(
             # column that isn't there, and surface the misfire for data-quality triage.
             logger.warning("Join %r skipped for this input: %s; emitting null.", table, missing)
             struct_select.append(f'NULL AS "{_JOIN_STRUCT_PREFIX}{table}"')
+            joined[table] = None
             continue
+        joined[table] = (alias, joined_cols)
         from_parts.append(
             f'LEFT JOIN {reader(table, alias, dedup_key=lookup_key)} ON m."{source_key}" = {alias}."{lookup_key}"'
         )
@@ -242,11 +310,152 @@ def _build_join_sql(
             f'CASE WHEN {alias}."{lookup_key}" IS NULL THEN NULL ELSE {alias} END AS "{_JOIN_STRUCT_PREFIX}{table}"'
         )
 
-    projection = "m.*" + ("".join(f", {s}" for s in struct_select))
+    if exprs is not None:
+        struct_select.extend(exprs(primary_cols, joined))
+    primary_projection = f'm.* EXCLUDE ("{_ROW_NUMBER}")' if ordered else "m.*"
+    projection = primary_projection + ("".join(f", {s}" for s in struct_select))
     sql = f"SELECT {projection} FROM {' '.join(from_parts)}"  # noqa: S608 - identifiers from schema/spec
+    if ordered:
+        if skip_rows:
+            sql += f' WHERE m."{_ROW_NUMBER}" > {int(skip_rows)}'
+        sql += f' ORDER BY m."{_ROW_NUMBER}"'
     return sql, params
 
 
+def _merged_row(
+    record: dict[str, Any], primary: str, primary_cols: list[str], joins: dict[str, AliasedClass]
+) -> MergedRow:
+    """Build the row ``map_object`` sees from one join-query result record."""
+    # Coerce VARCHAR values exactly as the per-row lookup path does.
+    primary_row = {c: _parse_numeric(record[c]) for c in primary_cols}
+    rows_by_table = {primary: primary_row}
+    for table in joins:
+        struct = record[f"{_JOIN_STRUCT_PREFIX}{table}"]  # STRUCT dict, or None on a miss
+        rows_by_table[table] = {k: _parse_numeric(v) for k, v in struct.items()} if struct else struct
+    return MergedRow(primary_row, rows_by_table=rows_by_table)
+
+
+class _ExprPushdown:
+    """Compute a block's translatable ``expr:`` slot derivations in the join query.
+
+    Each top-level ``expr:`` slot derivation that
+    :func:`~linkml_map.utils.expr_sql.translate_expr` can express becomes two
+    query columns: its value, and its guard (whether the value is exact for
+    the row). :meth:`precomputed` hands the guarded values to
+    :meth:`ObjectTransformer.map_batch
+    <linkml_map.transformer.object_transformer.ObjectTransformer.map_batch>`,
+    which evaluates the remaining rows and slots in Python as before.
+
+    Where Arrow UDFs are available, calls to functions without a SQL
+    equivalent run as UDFs on *con* (see :mod:`linkml_map.utils.expr_udf`);
+    :meth:`close` removes them.
+    """
+
+    def __init__(
+        self,
+        transformer: ObjectTransformer,
+        class_deriv: ClassDerivation,
+        source_type: str,
+        con: duckdb.DuckDBPyConnection,
+    ) -> None:
+        self.sv = transformer.source_schemaview
+        self.source_type = source_type
+        self.plan = BindingPlan.build(self.sv, source_type, class_deriv)
+        self.functions = _resolve_functions(transformer.extension_functions)
+        self.udfs = ExprUdfs(con, self.functions) if arrow_udfs_available() else None
+        # Mirrors the dispatch order of _derive_slot: value, unit_conversion and
+        # pivot_operation take precedence over expr.
+        self.exprs = {
+            str(sd.name): sd.expr
+            for sd in class_deriv.slot_derivations.values()
+            if sd.expr and sd.value is None and not sd.unit_conversion and not sd.pivot_operation
+        }
+        self.slots: list[str] = []
+
+    def select(self, primary_cols: set[str], joined: _JoinedColumns) -> list[str]:
+        """Translate the expressions against the query's columns; return the select items."""
+        tables = {self.source_type, *joined, *self.plan.join_names}
+
+        def bind(name: str, attr: str | None) -> SqlColumn | None:
+            if attr is None:
+                # Bindings resolves join and table names before columns, and
+                # a name outside the schema is an unbound reference.
+                if name in tables or name not in self.plan.schema_slots:
+                    return None
+                return self._column("m", primary_cols, name, self.source_type)
+            if name in primary_cols:
+                return None
+            if name in joined:
+                if joined[name] is None:
+                    return SqlColumn("NULL")
+                alias, columns = joined[name]
+                return self._column(alias, columns, attr, name)
+            if name == self.source_type:
+                return self._column("m", primary_cols, attr, name)
+            return None
+
+        select = []
+        self.slots = []
+        for slot, expr in self.exprs.items():
+            translated = translate_expr(expr, self.functions, bind, self.udfs)
+            if translated is None:
+                continue
+            i = len(self.slots)
+            self.slots.append(slot)
+            select.append(f'{translated.guard} AS "{_EXPR_PREFIX}ok{i}"')
+            select.append(f'{translated.sql} AS "{_EXPR_PREFIX}{i}"')
+        if self.slots:
+            logger.debug("Computing expressions of %s in the join query", ", ".join(self.slots))
+        return select
+
+    def _column(self, alias: str, columns: set[str], name: str, table: str) -> SqlColumn:
+        if name not in columns:
+            return SqlColumn("NULL")
+        try:
+            kind = _RANGE_KINDS.get(self.sv.induced_slot(name, table).range, "str")
+        except Exception:  # noqa: BLE001 - an undeclared column holds whatever it parses to
+            kind = "str"
+        return SqlColumn(f'{alias}."{name}"', kind)
+
+    def close(self) -> None:
+        """Remove the UDFs registered for the query."""
+        if self.udfs is not None:
+            self.udfs.close()
+
+    def precomputed(self, records: list[dict[str, Any]]) -> dict[str, list[Any]]:
+        """Per slot, each record's computed value, or ``MISS`` where its guard does not hold."""
+        return {
+            slot: [r[f"{_EXPR_PREFIX}{i}"] if r[f"{_EXPR_PREFIX}ok{i}"] else MISS for r in records]
+            for i, slot in enumerate(self.slots)
+        }
+
+
+def _expr_pushdown(
+    transformer: ObjectTransformer,
+    class_deriv: ClassDerivation,
+    source_type: str,
+    con: duckdb.DuckDBPyConnection,
+    *,
+    incremental: bool = False,
+) -> _ExprPushdown | None:
+    """
+    The block's :class:`_ExprPushdown`, or None if its join query computes no expressions.
+
+    Expressions are computed in SQL only where map_batch would evaluate them
+    plainly (no memo, FK index or profiler) and every row is mapped (not an
+    *incremental* run).
+    """
+    if (
+        incremental
+        or transformer.profiler is not None
+        or transformer.expression_memo is not None
+        or transformer._fk_index() is not None
+    ):
+        return None
+    pushdown = _ExprPushdown(transformer, class_deriv, source_type, con)
+    return pushdown if pushdown.exprs else None
+
+
 def transform_block_via_join(
     transformer: ObjectTransformer,
     data_loader: DataLoader,
@@ -254,42 +463,129 @@ def transform_block_via_join(
     source_type: str | None,
     con: duckdb.DuckDBPyConnection,
     on_error: Callable[[TransformationError], None] | None = None,
+    pipeline: Pipeline | None = None,
+    progress: TransformProgress | None = None,
+    manifest: RowManifest | None = None,
+    metrics: TransformMetrics | None = None,
 ) -> Iterator[dict[str, Any]]:
-    """Transform one class_derivation block with a single set-based join query."""
+    """Transform one class_derivation block with a single set-based join query.
+
+    With a *pipeline*, result batches are fetched from DuckDB on a background
+    thread (stage ``read``) while earlier batches are transformed. With
+    *progress*, rows are read in source order starting after ``progress.row``,
+    and ``progress.row`` is advanced as rows are consumed. With a *manifest*
+    (whose block the caller has started), only rows whose primary values or
+    joined rows changed are transformed. With *metrics* (whose block the
+    caller has started), rows, errors and join hits/misses are counted.
+
+    Without a manifest, ``expr:`` slot derivations that translate to SQL are
+    computed by the join query itself (see :class:`_ExprPushdown`).
+    """
     primary = class_deriv.populated_from or class_deriv.name
     # Every join is guaranteed loadable here (can_use_join_engine gates on it); a
     # missing table therefore fails loud in _build_join_sql rather than silently
     # dropping the join.
     joins = _collect_joins(class_deriv, {})
-    sql, params = _build_join_sql(primary, joins, data_loader, con)
+    skip_rows = progress.row if progress is not None else 0
+    pushdown = _expr_pushdown(transformer, class_deriv, source_type or primary, con, incremental=manifest is not None)
+    sql, params = _build_join_sql(
+        primary,
+        joins,
+        data_loader,
+        con,
+        ordered=progress is not None,
+        skip_rows=skip_rows,
+        exprs=pushdown.select if pushdown is not None else None,
+    )
 
     cursor = con.execute(sql, params)
     names = [d[0] for d in cursor.description]
-    # Join STRUCTs are namespaced (_JOIN_STRUCT_PREFIX); everything else is a real
+    # Join STRUCTs and expression columns are namespaced; everything else is a real
     # primary column, so a primary column sharing a joined table's name is kept.
-    primary_cols = [n for n in names if not n.startswith(_JOIN_STRUCT_PREFIX)]
-    row_idx = 0
-    while batch := cursor.fetchmany(10000):
-        for row in batch:
-            record = dict(zip(names, row))
-            # Coerce VARCHAR values exactly as the per-row lookup path does.
-            primary_row = {c: _parse_numeric(record[c]) for c in primary_cols}
-            rows_by_table = {primary: primary_row}
-            for table in joins:
-                struct = record[f"{_JOIN_STRUCT_PREFIX}{table}"]  # STRUCT dict, or None on a miss
-                rows_by_table[table] = {k: _parse_numeric(v) for k, v in struct.items()} if struct else struct
-            merged = MergedRow(primary_row, rows_by_table=rows_by_table)
-            try:
-                yield transformer.map_object(
-                    merged,
-                    source_type=source_type or primary,
-                    target_type=class_deriv.name,
-                    class_derivation=class_deriv,
+    primary_cols = [n for n in names if not n.startswith((_JOIN_STRUCT_PREFIX, _EXPR_PREFIX))]
+    if manifest is not None:
+        row_id_slot = identifier_slot_name(transformer.source_schemaview, primary)
+        target_id_slot = identifier_slot_name(transformer.target_schemaview, class_deriv.name)
+    block = metrics.current if metrics is not None else None
+    row_idx = skip_rows
+    batches = iter(lambda: cursor.fetchmany(10000), [])
+    if pipeline is not None:
+        batches = pipeline.prefetch(batches, "read")
+    prefetch_batch_calls = bool(transformer.batch_call_sites(class_deriv))
+    try:
+        for batch in batches:
+            records = [dict(zip(names, row)) for row in batch]
+            # Without a manifest every row is mapped, so the whole fetched batch is
+            # mapped column-wise up front; with one, only changed rows are mapped.
+            mapped: list[dict[str, Any] | TransformationError | None] | None = None
+            if manifest is None:
+                errors: dict[int, TransformationError] = {}
+                mapped = transformer.map_batch(
+                    [_merged_row(record, primary, primary_cols, joins) for record in records],
+                    class_deriv,
+                    source_type or primary,
+                    class_deriv.name,
+                    on_error=errors.__setitem__,
+                    precomputed=pushdown.precomputed(records) if pushdown is not None else None,
+                )
+                for i, err in errors.items():
+                    mapped[i] = err
+            elif prefetch_batch_calls:
+                transformer.prefetch_batch_calls(
+                    [_merged_row(record, primary, primary_cols, joins) for record in records],
+                    class_deriv,
+                    source_type or primary,
                 )
-            except TransformationError as err:
-                if on_error is None:
-                    raise
-                err.row_index = row_idx
-                err.class_derivation_name = err.class_derivation_name or class_deriv.name
-                on_error(err)
-            row_idx += 1
+            for i, record in enumerate(records):
+                if progress is not None:
+                    progress.row = row_idx + 1
+                if block is not None:
+                    block.rows_in += 1
+                if manifest is not None:
+                    # The record holds the primary row and every joined STRUCT, so a
+                    # change on either side of the join invalidates the row.
+                    row_id = record.get(row_id_slot) if row_id_slot else None
+                    digest = manifest.changed(row_id, record)
+                    if digest is None:
+                        row_idx += 1
+                        continue
+                if block is not None:
+                    for table in joins:
+                        if record[f"{_JOIN_STRUCT_PREFIX}{table}"]:
+                            block.join_hits += 1
+                        else:
+                            block.join_misses += 1
+                try:
+                    if mapped is None:
+                        target_row = transformer.map_object(
+                            _merged_row(record, primary, primary_cols, joins),
+                            source_type=source_type or primary,
+                            target_type=class_deriv.name,
+                            class_derivation=class_deriv,
+                        )
+                    elif isinstance(mapped[i], TransformationError):
+                        raise mapped[i]
+                    else:
+                        target_row = mapped[i]
+                except TransformationError as err:
+                    if on_error is None:
+                        raise
+                    err.row_index = row_idx
+                    err.class_derivation_name = err.class_derivation_name or class_deriv.name
+                    if block is not None:
+                        block.errors += 1
+                    on_error(err)
+                else:
+                    if manifest is not None:
+                        manifest.update(row_id, digest, target_row.get(target_id_slot) if target_id_slot else None)
+                    if block is not None:
+                        block.rows_out += 1
+                    yield target_row
+                row_idx += 1
+    finally:
+        # Stop the prefetching thread before the query's UDFs are removed.
+        close = getattr(batches, "close", None)
+        if close is not None:
+            close()
+        if pushdown is not None:
+            pushdown.close()
@@ -2,15 +2,15 @@
 
 from __future__ import annotations
 
+import ast
 import json
 import logging
-from collections.abc import Callable, Iterator, Mapping
-from contextlib import contextmanager
+from collections.abc import Callable, Iterable, Iterator, Mapping
+from contextlib import contextmanager, suppress
 from dataclasses import dataclass, field
-from typing import Any
+from typing import Any, NamedTuple
 
 import yaml
-from asteval import Interpreter
 from linkml_runtime import SchemaView
 from linkml_runtime.index.object_index import ObjectIndex
 from linkml_runtime.linkml_model import SlotDefinition
@@ -28,10 +28,21 @@ from linkml_map.datamodel.transformer_model import (
 )
 from linkml_map.functions.unit_conversion import UnitSystem, convert_units
 from linkml_map.transformer.errors import TransformationError
+from linkml_map.transformer.profiling import SlotProfiler
 from linkml_map.transformer.transformer import OBJECT_TYPE, Transformer
 from linkml_map.utils.dynamic_object import DynObj, dynamic_object
-from linkml_map.utils.eval_utils import _uuid5, eval_expr, eval_expr_with_mapping
-from linkml_map.utils.fk_utils import FKResolution, resolve_fk_path
+from linkml_map.utils.eval_utils import (
+    _parse_cached,
+    _resolve_functions,
+    _uuid5,
+    eval_expr,
+    eval_expr_with_mapping,
+    eval_unrestricted,
+)
+from linkml_map.utils.expr_compile import RowFn, compile_row_expr
+from linkml_map.utils.expr_memo import MISS, ExpressionMemo
+from linkml_map.utils.extensions import BatchFunction, batch_function
+from linkml_map.utils.fk_utils import FKIndex, FKResolution, FKView, resolve_fk_path
 from linkml_map.utils.join_utils import join_keys
 
 DICT_OBJ = dict[str, Any]
@@ -103,6 +114,162 @@ def _raise_ambiguous_column(
 logger = logging.getLogger(__name__)
 
 
+@dataclass(frozen=True)
+class BindingPlan:
+    """
+    Name classification shared by every row of one class derivation.
+
+    Built once per (class derivation, source type) by
+    :meth:`ObjectTransformer._binding_plan` so that :class:`Bindings` does no
+    schema work per row: join aliases and schema-declared slots are looked up
+    in frozen sets, and a plain column that is a declared slot with a scalar
+    value is bound directly instead of going through :func:`dynamic_object`.
+    """
+
+    join_names: frozenset[str]
+    schema_slots: frozenset[str]
+    """Slot names declared on the source class.
+
+    Used by ``Bindings.__getitem__`` to distinguish a schema-declared slot
+    absent from the current row (legitimate SQL null) from a name
+    that does not exist in the schema (typo / stale reference).
+
+    Explicit-join aliases are not added here — they are already
+    handled earlier in ``__getitem__`` via ``join_names``. Slots on
+    join-target classes are intentionally excluded so that a bare
+    reference like ``{score}`` (instead of ``{Reading.score}``)
+    surfaces as a typo in strict mode for explicit-join specs.
+    Implicit-join column resolution is a separate concern handled
+    by the runtime merge in ``_derive_nested_objects`` (#217).
+    """
+
+    @classmethod
+    def build(cls, sv: SchemaView, source_type: str, class_deriv: ClassDerivation | None) -> BindingPlan:
+        """Classify the names available to expressions over *source_type*."""
+        join_names = frozenset(class_deriv.joins) if class_deriv and class_deriv.joins else frozenset()
+        if source_type and source_type in sv.all_classes():
+            schema_slots = frozenset(s.name for s in sv.class_induced_slots(source_type))
+        else:
+            schema_slots = frozenset()
+        return cls(join_names=join_names, schema_slots=schema_slots)
+
+
+#: Values a column kernel passes through as-is; anything else is derived per row.
+_SCALAR_TYPES = frozenset({str, int, float, bool, type(None)})
+
+
+class _PerRow(Exception):  # noqa: N818 - control flow, not an error
+    """Raised by a column kernel for a row it cannot handle; the row is derived by ``_derive_slot``."""
+
+
+def _scalar_column(row: DICT_OBJ, name: str) -> Any:  # noqa: ANN401
+    """Value of column *name* in *row* if it binds as-is (a scalar, or absent); else raise ``_PerRow``."""
+    v = row.get(name)
+    if type(v) not in _SCALAR_TYPES:
+        raise _PerRow
+    return v
+
+
+def _column_binder(binding_plan: BindingPlan, source_type: str, reads: set[str]) -> Callable[[str], RowFn | None]:
+    """
+    Return the ``bind`` callback for :func:`compile_row_expr` over plain source columns.
+
+    Only source slots that bind to their column value are compiled; joined
+    tables and the source type name are left to :class:`Bindings`. Each bound
+    name is added to *reads*.
+    """
+
+    def bind(name: str) -> RowFn | None:
+        if name == "NULL":
+            return lambda row, target: None
+        if name in binding_plan.join_names or name == source_type or name not in binding_plan.schema_slots:
+            return None
+        reads.add(name)
+        return lambda row, target: _scalar_column(row, name)
+
+    return bind
+
+
+def _reject_collections(v: Any) -> Any:  # noqa: ANN401
+    """Pass scalars through; collections are mapped recursively by ``_map_value_by_range``."""
+    if isinstance(v, dict | list):
+        raise _PerRow
+    return v
+
+
+class SlotColumn(NamedTuple):
+    """How :meth:`ObjectTransformer.map_batch` derives one slot across a chunk of rows."""
+
+    slot_derivation: SlotDerivation
+    kernel: RowFn | None
+    """Derives the slot from a row and the slots derived so far, or None to use ``_derive_slot``.
+
+    A kernel raises ``_PerRow`` for a row it cannot handle; that row is then
+    derived by ``_derive_slot``. Any other exception is the row's error and is
+    reported with the usual context, without deriving the slot again.
+    """
+    reads: frozenset[str] = frozenset()
+    """Source columns an expression kernel binds as plain values."""
+    is_expr: bool = False
+
+
+class BatchCallSite(NamedTuple):
+    """A call to a ``@safe_function(batch=True)`` extension inside a slot expression."""
+
+    func: BatchFunction
+    distributes: bool
+    """Whether the call goes through the scalar-distributing wrapper."""
+    args: tuple[str, ...]
+    """Source text of each positional argument, evaluated per row to prefetch results."""
+
+
+def _batch_call_sites(expr: str, functions: Mapping[str, Callable]) -> list[BatchCallSite]:
+    """
+    Find calls in *expr* to batched *functions* whose arguments can be evaluated up front.
+
+    Calls with keyword or starred arguments, calls inside comprehensions or
+    lambdas (whose arguments read local names), and calls whose arguments call
+    ``slot()`` or another batched function are left to per-row evaluation.
+    """
+    try:
+        tree = _parse_cached(expr)
+    except Exception:  # noqa: BLE001 - the evaluator reports syntax errors
+        return []
+    sites = []
+    stack = [tree]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, ast.Lambda | ast.ListComp | ast.SetComp | ast.DictComp | ast.GeneratorExp):
+            continue
+        stack.extend(ast.iter_child_nodes(node))
+        if not (isinstance(node, ast.Call) and isinstance(node.func, ast.Name)):
+            continue
+        fn = functions.get(node.func.id)
+        batched = batch_function(fn) if fn is not None else None
+        if batched is None or node.keywords or any(isinstance(a, ast.Starred) for a in node.args):
+            continue
+        if any(
+            isinstance(n, ast.Call)
+            and isinstance(n.func, ast.Name)
+            and (n.func.id == "slot" or batch_function(functions.get(n.func.id)) is not None)
+            for a in node.args
+            for n in ast.walk(a)
+        ):
+            continue
+        sites.append(BatchCallSite(batched, fn is not batched, tuple(ast.unparse(a) for a in node.args)))
+    return sites
+
+
+class BatchArgKernels(NamedTuple):
+    """A batched call site with its argument expressions compiled for :meth:`ObjectTransformer.prefetch_batch_calls`."""
+
+    site: BatchCallSite
+    kernels: list[RowFn] | None
+    """One row function per argument, or None if any argument is outside the compiled subset."""
+    reads: frozenset[str]
+    """Source columns the kernels read; rows where a joined table shadows one use full bindings."""
+
+
 class Bindings(Mapping):
     """
     Efficiently access source object attributes.
@@ -117,6 +284,7 @@ class Bindings(Mapping):
         sv: SchemaView,
         bindings: dict,
         class_deriv: ClassDerivation | None = None,
+        plan: BindingPlan | None = None,
     ) -> None:
         self.object_transformer: ObjectTransformer = object_transformer
         self.source_obj: OBJECT_TYPE = source_obj
@@ -127,26 +295,7 @@ class Bindings(Mapping):
         self.class_deriv: ClassDerivation | None = class_deriv
         if bindings:
             self.bindings.update(bindings)
-        self._schema_slots: set[str] = self._collect_schema_slots()
-
-    def _collect_schema_slots(self) -> set[str]:
-        """Slot names declared on the source class.
-
-        Used by ``__getitem__`` to distinguish a schema-declared slot
-        absent from the current row (legitimate SQL null) from a name
-        that does not exist in the schema (typo / stale reference).
-
-        Explicit-join aliases are not added here — they are already
-        handled earlier in ``__getitem__`` via ``_join_specs``. Slots on
-        join-target classes are intentionally excluded so that a bare
-        reference like ``{score}`` (instead of ``{Reading.score}``)
-        surfaces as a typo in strict mode for explicit-join specs.
-        Implicit-join column resolution is a separate concern handled
-        by the runtime merge in ``_derive_nested_objects`` (#217).
-        """
-        if self.source_type and self.source_type in self.sv.all_classes():
-            return {s.name for s in self.sv.class_induced_slots(self.source_type)}
-        return set()
+        self.plan: BindingPlan = plan or BindingPlan.build(sv, source_type, class_deriv)
 
     @classmethod
     def from_context(cls, transformer: ObjectTransformer, context: DerivationContext) -> Bindings:
@@ -159,33 +308,28 @@ class Bindings(Mapping):
             sv=context.sv,
             bindings={"NULL": None},
             class_deriv=context.class_deriv,
+            plan=transformer._binding_plan(context),
         )
 
-    def get_ctxt_obj_and_dict(self, source_obj: OBJECT_TYPE = None) -> tuple[DynObj, OBJECT_TYPE]:
+    def get_ctxt_obj_and_dict(self, source_obj: OBJECT_TYPE = None) -> tuple[DynObj | FKView, OBJECT_TYPE]:
         """
         Transform a source object into a typed context object and dictionary, and cache results.
 
         :param source_obj: Source data. Should be a subset of source_obj provided in the constructor.
         If None the full source_obj from constructor is used.
         :return: Tuple of typed context object and context dictionary. The object is the dictionary
-        with keys converted to member variables.
+        with keys converted to member variables. When the transformer has an index, foreign keys
+        in both are dereferenced through it.
         """
         if source_obj is None:
             source_obj = self.source_obj
 
-        if self.object_transformer.object_index:
-            if not self.source_obj_typed:
-                source_obj_dyn = dynamic_object(source_obj, self.sv, self.source_type)
-            else:
-                source_obj_dyn = self.source_obj_typed
-            # Clear cache: Cache doesn't work since the cache key is the same when source_obj has only a subset
-            # of its keys. eg. {"age": self.source_obj["age"]} and {"name": self.source_obj["name"]}
-            # (with optionally the identifier key included) will have the same cache key, and so `bless` will
-            # incorrectly return the same cached values.
-            self.object_transformer.object_index.clear_proxy_object_cache()
-
-            ctxt_obj = self.object_transformer.object_index.bless(source_obj_dyn)
-            ctxt_dict = {k: getattr(ctxt_obj, k) for k in ctxt_obj._attributes() if not k.startswith("_")}
+        fk_index = self.object_transformer._fk_index()
+        if fk_index is not None:
+            if self.source_obj_typed is not None and source_obj is self.source_obj:
+                source_obj = vars(self.source_obj_typed)
+            ctxt_obj = fk_index.view(source_obj, self.source_type)
+            ctxt_dict = {k: fk_index.bind(v, k, self.source_type) for k, v in source_obj.items()}
         else:
             do = dynamic_object(source_obj, self.sv, self.source_type)
             ctxt_obj = do
@@ -206,36 +350,43 @@ class Bindings(Mapping):
     def __iter__(self) -> Iterator:
         return iter(self._all_keys())
 
-    @property
-    def _join_specs(self) -> dict:
-        """Active join specs from the class derivation, or empty dict."""
-        if self.class_deriv and self.class_deriv.joins:
-            return self.class_deriv.joins
-        return {}
-
     def __getitem__(self, name: Any) -> Any:
-        if name not in self.bindings:
-            if name in self._join_specs:
-                self.bindings[name] = self._resolve_join(name)
-            elif name in self.source_obj and self.source_obj[name] is _AMBIGUOUS:
+        bindings = self.bindings
+        if name in bindings:
+            return bindings[name]
+        source_obj = self.source_obj
+        if name in self.plan.join_names:
+            bindings[name] = self._resolve_join(name)
+        elif name in source_obj:
+            value = source_obj[name]
+            if value is _AMBIGUOUS:
                 _raise_ambiguous_column(name, class_deriv=self.class_deriv)
-            elif isinstance(self.source_obj, MergedRow) and name in self.source_obj.rows_by_table:
-                self.bindings[name] = DynObj(**self.source_obj.rows_by_table[name])
-            elif name == self.source_type and name not in self.source_obj:
-                # Self-reference: {Reading.score} when source_type is Reading (non-merge context)
-                self.bindings[name] = DynObj(**self.source_obj)
-            elif name in self.source_obj:
-                _ = self.get_ctxt_obj_and_dict({name: self.source_obj[name]})
-            elif name in self._schema_slots:
-                # Schema-declared slot absent from this row → SQL null.
-                # Distinct from a name that is not in the schema at all,
-                # which falls through and raises KeyError so simpleeval
-                # surfaces it as NameNotDefined (handled in strict mode).
-                return None
+            elif isinstance(source_obj, MergedRow) and name in source_obj.rows_by_table:
+                bindings[name] = DynObj(**source_obj.rows_by_table[name])
+            elif (
+                name in self.plan.schema_slots
+                and not isinstance(value, dict | list)
+                and self.object_transformer._fk_index() is None
+            ):
+                # A declared scalar slot: dynamic_object would return the value unchanged.
+                bindings[name] = value
             else:
-                raise KeyError(name)
+                _ = self.get_ctxt_obj_and_dict({name: value})
+        elif isinstance(source_obj, MergedRow) and name in source_obj.rows_by_table:
+            bindings[name] = DynObj(**source_obj.rows_by_table[name])
+        elif name == self.source_type:
+            # Self-reference: {Reading.score} when source_type is Reading (non-merge context)
+            bindings[name] = DynObj(**source_obj)
+        elif name in self.plan.schema_slots:
+            # Schema-declared slot absent from this row → SQL null.
+            # Distinct from a name that is not in the schema at all,
+            # which falls through and raises KeyError so simpleeval
+            # surfaces it as NameNotDefined (handled in strict mode).
+            return None
+        else:
+            raise KeyError(name)
 
-        return self.bindings.get(name)
+        return bindings.get(name)
 
     def _resolve_join(self, table_name: str) -> DynObj | None:
         """Resolve a cross-table lookup, returning a DynObj or None."""
@@ -270,6 +421,8 @@ class ObjectTransformer(Transformer):
     """
 
     object_index: ObjectIndex = None
+    fk_index: FKIndex | None = None
+    """Identifier index used to dereference foreign keys; built by :meth:`index`."""
     lookup_index: Any = None  # Optional[LookupIndex] — lazy import to avoid hard duckdb dep
 
     extension_functions: dict[str, Callable] = field(default_factory=dict)
@@ -282,6 +435,32 @@ class ObjectTransformer(Transformer):
     :func:`~linkml_map.utils.extensions.load_extensions`.
     """
 
+    profiler: SlotProfiler | None = None
+    """Per-slot-derivation profiler; ``None`` (the default) disables profiling."""
+
+    expression_memo: ExpressionMemo | None = None
+    """Cache of pure expression results; ``None`` (the default) disables memoization."""
+
+    _binding_plans: dict[tuple[int, str], tuple[ClassDerivation, SchemaView, BindingPlan]] = field(
+        default_factory=dict, repr=False
+    )
+    """Binding plans by class derivation identity and source type; see :meth:`_binding_plan`."""
+
+    _column_plans: dict[tuple[int, str], tuple[ClassDerivation, SchemaView, dict[str, Callable], list[SlotColumn]]] = (
+        field(default_factory=dict, repr=False)
+    )
+    """Column plans by class derivation identity and source type; see :meth:`_column_plan`."""
+
+    _batch_sites: dict[int, tuple[ClassDerivation, dict[str, Callable], list[BatchCallSite]]] = field(
+        default_factory=dict, repr=False
+    )
+    """Batched-function call sites by class derivation identity; see :meth:`batch_call_sites`."""
+
+    _batch_arg_plans: dict[
+        tuple[int, str], tuple[ClassDerivation, SchemaView, dict[str, Callable], list[BatchArgKernels]]
+    ] = field(default_factory=dict, repr=False)
+    """Compiled arguments of batched calls by class derivation identity and source type; see :meth:`_batch_arg_plan`."""
+
     _warned_unbound_names: set[str] = field(default_factory=set, repr=False)
     """Names already warned about in non-strict mode.
 
@@ -307,10 +486,148 @@ class ObjectTransformer(Transformer):
             if target is None:
                 msg = f"target must be passed if source_obj is dict: {source_obj}"
                 raise ValueError(msg)
-            source_obj_typed = dynamic_object(source_obj, self.source_schemaview, target)
-            self.object_index = ObjectIndex(source_obj_typed, schemaview=self.source_schemaview)
-        else:
-            self.object_index = ObjectIndex(source_obj, schemaview=self.source_schemaview)
+            source_obj = dynamic_object(source_obj, self.source_schemaview, target)
+        self.object_index = ObjectIndex(source_obj, schemaview=self.source_schemaview)
+        self.fk_index = FKIndex(source_obj, self.source_schemaview)
+
+    def _fk_index(self) -> FKIndex | None:
+        """Return the FK index, building it from an ``object_index`` assigned directly."""
+        if self.fk_index is None and self.object_index is not None:
+            self.fk_index = FKIndex(self.object_index._root_object, self.source_schemaview)
+        return self.fk_index
+
+    def _binding_plan(self, context: DerivationContext) -> BindingPlan:
+        """
+        Return the binding plan for *context*, building it on first use.
+
+        Plans are keyed on the identity of the class derivation, so a
+        specification replaced after derivation simply gets new plans; the
+        stored references guard against a recycled ``id``.
+        """
+        key = (id(context.class_deriv), context.source_type)
+        cached = self._binding_plans.get(key)
+        if cached is not None and cached[0] is context.class_deriv and cached[1] is context.sv:
+            return cached[2]
+        plan = BindingPlan.build(context.sv, context.source_type, context.class_deriv)
+        self._binding_plans[key] = (context.class_deriv, context.sv, plan)
+        return plan
+
+    def batch_call_sites(self, class_deriv: ClassDerivation) -> list[BatchCallSite]:
+        """
+        Return the calls to batched extension functions in *class_deriv*'s slot expressions.
+
+        Empty unless :attr:`extension_functions` holds ``@safe_function(batch=True)``
+        functions; the engines then skip prefetching entirely.
+        """
+        functions = self.extension_functions
+        if not any(batch_function(fn) is not None for fn in functions.values()):
+            return []
+        cached = self._batch_sites.get(id(class_deriv))
+        if cached is not None and cached[0] is class_deriv and cached[1] == functions:
+            return cached[2]
+        sites = [
+            site
+            for slot_deriv in class_deriv.slot_derivations.values()
+            if slot_deriv.expr
+            for site in _batch_call_sites(slot_deriv.expr, functions)
+        ]
+        self._batch_sites[id(class_deriv)] = (class_deriv, dict(functions), sites)
+        return sites
+
+    def _batch_arg_plan(self, class_deriv: ClassDerivation, source_type: str) -> list[BatchArgKernels]:
+        """
+        Return the batched call sites of *class_deriv* with their arguments compiled.
+
+        Arguments are compiled against the cached binding plan like the
+        columns of :meth:`_column_plan`, and cached the same way.
+        """
+        key = (id(class_deriv), source_type)
+        functions = self.extension_functions
+        sv = self.source_schemaview
+        cached = self._batch_arg_plans.get(key)
+        if cached is not None and cached[0] is class_deriv and cached[1] is sv and cached[2] == functions:
+            return cached[3]
+        binding_plan = self._binding_plan(DerivationContext({}, None, source_type, sv, class_deriv))
+        namespace = _resolve_functions(functions)
+        plan = []
+        for site in self.batch_call_sites(class_deriv):
+            reads: set[str] = set()
+            bind = _column_binder(binding_plan, source_type, reads)
+            kernels = [compile_row_expr(a, namespace, bind) for a in site.args]
+            compiled = None if None in kernels else kernels
+            plan.append(BatchArgKernels(site, compiled, frozenset(reads)))
+        self._batch_arg_plans[key] = (class_deriv, sv, dict(functions), plan)
+        return plan
+
+    def prefetch_batch_calls(self, rows: Iterable[OBJECT_TYPE], class_deriv: ClassDerivation, source_type: str) -> None:
+        """
+        Compute the results of batched extension calls for a chunk of rows in one call each.
+
+        The arguments of every call site found by :meth:`batch_call_sites` are
+        evaluated against each row, and each batched function is called once
+        with the distinct argument tuples. Results from the previous chunk are
+        dropped first. Arguments are evaluated with kernels compiled once per
+        class derivation (see :meth:`_batch_arg_plan`); rows or arguments they
+        cannot handle go through the full :class:`Bindings`.
+
+        Rows whose arguments fail to evaluate are skipped here: :meth:`map_object`
+        then calls the function for that row alone and reports any error in
+        the row's context. A batch call that raises is logged as a warning and
+        the function is marked failed until the next chunk, so the rows calling
+        it report the error without calling the function again.
+        """
+        plan = self._batch_arg_plan(class_deriv, source_type)
+        if not plan:
+            return
+        pending: dict[int, tuple[BatchFunction, list[tuple]]] = {}
+        for entry in plan:
+            entry.site.func.clear()
+            pending.setdefault(id(entry.site.func), (entry.site.func, []))
+        sv = self.source_schemaview
+        for row in rows:
+            if isinstance(row, BaseModel | YAMLRoot):
+                row = vars(row)  # noqa: PLW2901
+            if not isinstance(row, dict):
+                continue
+            tables = row.rows_by_table if isinstance(row, MergedRow) else ()
+            bindings = None
+            for site, kernels, reads in plan:
+                args = None
+                if kernels is not None and not any(t in reads for t in tables):
+                    with suppress(Exception):  # evaluated with full bindings below
+                        args = tuple(kernel(row, {}) for kernel in kernels)
+                if args is None:
+                    if bindings is None:
+                        bindings = Bindings.from_context(
+                            self, DerivationContext(row, None, source_type, sv, class_deriv)
+                        )
+                    try:
+                        args = tuple(
+                            eval_expr_with_mapping(a, bindings, functions=self.extension_functions, strict=True)
+                            for a in site.args
+                        )
+                    except Exception:  # noqa: BLE001, S112 - left to per-row evaluation
+                        continue
+                arg_tuples = pending[id(site.func)][1]
+                if not site.distributes:
+                    arg_tuples.append(args)
+                elif None in args[1:]:
+                    continue
+                elif args and isinstance(args[0], list):
+                    arg_tuples.extend((x, *args[1:]) for x in args[0] if x is not None)
+                elif not args or args[0] is not None:
+                    arg_tuples.append(args)
+        for func, arg_tuples in pending.values():
+            try:
+                func.prefetch(arg_tuples)
+            except Exception as err:  # noqa: BLE001 - reported per row by the marked function
+                logger.warning(
+                    "Batch function %r failed for a chunk of %d argument tuples: %s: %s",
+                    func.__name__,
+                    len(arg_tuples),
+                    type(err).__name__,
+                    err,
+                )
 
     def _resolve_source_type(self, source_type: str | None, sv: SchemaView | None) -> str | None:
         """
@@ -408,17 +725,289 @@ class ObjectTransformer(Transformer):
         tgt_attrs = {}
         bindings = Bindings.from_context(self, context)
         expr_functions = {**self.extension_functions, "slot": lambda name: tgt_attrs.get(name)}
+        profiler = self.profiler
         for slot_deriv in class_deriv.slot_derivations.values():
             with self._slot_error_context(slot_deriv, context):
-                tgt_attrs[str(slot_deriv.name)] = self._derive_slot(
-                    slot_deriv, context, target_type, bindings, expr_functions
-                )
+                if profiler is None:
+                    tgt_attrs[str(slot_deriv.name)] = self._derive_slot(
+                        slot_deriv, context, target_type, bindings, expr_functions
+                    )
+                else:
+                    tgt_attrs[str(slot_deriv.name)] = profiler.call(
+                        class_deriv,
+                        slot_deriv,
+                        sv,
+                        source_type,
+                        self._derive_slot,
+                        slot_deriv,
+                        context,
+                        target_type,
+                        bindings,
+                        expr_functions,
+                    )
         # Remove hidden slots from output (they exist only for slot() references)
         for slot_deriv in class_deriv.slot_derivations.values():
             if slot_deriv.hide:
                 tgt_attrs.pop(str(slot_deriv.name), None)
         return tgt_attrs
 
+    def map_batch(
+        self,
+        rows: list[OBJECT_TYPE],
+        class_derivation: ClassDerivation,
+        source_type: str | None = None,
+        target_type: str | None = None,
+        *,
+        on_error: Callable[[int, TransformationError], None] | None = None,
+        precomputed: Mapping[str, list[Any]] | None = None,
+    ) -> list[DICT_OBJ | None]:
+        """
+        Transform a chunk of source rows of one class derivation, slot by slot.
+
+        Produces the same objects as calling :meth:`map_object` on each row,
+        but evaluates each slot derivation column-wise across the chunk where
+        it can (see :meth:`_column_plan`): literal values, direct copies with
+        ``missing_values``, ``value_mappings``, offsets and datatype coercion,
+        and expressions in the subset compiled by
+        :func:`~linkml_map.utils.expr_compile.compile_row_expr`. Other slot
+        derivations, and rows a column kernel cannot handle, are derived per
+        row. Batched extension calls are prefetched for the chunk first.
+
+        :param rows: Source rows, all of *source_type*.
+        :param class_derivation: The class derivation to apply.
+        :param source_type: Type of the rows (resolved as in :meth:`map_object`).
+        :param target_type: Target type, passed to nested derivations.
+        :param on_error: Called with ``(index, error)`` for each row whose
+            derivation raised; that row's result is ``None``. Without it, the
+            error of the first failing row is raised.
+        :param precomputed: Values of top-level ``expr:`` slot derivations
+            already computed elsewhere (e.g. in the join engine's query), by
+            slot name, one per row; ``MISS`` where a row must be evaluated
+            here. They must be exactly what the expression evaluates to.
+        :return: One target object (or ``None``) per row, in order.
+        """
+        sv = self.source_schemaview
+        source_type = self._resolve_source_type(source_type, sv)
+        if (
+            self.profiler is not None
+            or class_derivation.pivot_operation
+            or source_type in sv.all_types()
+            or source_type in sv.all_enums()
+            or not all(type(row) is dict or type(row) is MergedRow for row in rows)
+        ):
+            return self._map_rows(rows, class_derivation, source_type, target_type, on_error)
+
+        self.prefetch_batch_calls(rows, class_derivation, source_type)
+        tables = {t for row in rows if type(row) is MergedRow for t in row.rows_by_table}
+        use_exprs = self.expression_memo is None and self._fk_index() is None
+        unrestricted = self.unrestricted_eval
+        targets: list[DICT_OBJ] = [{} for _ in rows]
+        per_row: list[tuple[DerivationContext, Bindings, dict[str, Any]] | None] = [None] * len(rows)
+        errors: dict[int, TransformationError] = {}
+        for column in self._column_plan(class_derivation, source_type):
+            slot_deriv = column.slot_derivation
+            name = str(slot_deriv.name)
+            kernel = column.kernel
+            if kernel is not None and ((column.is_expr and not use_exprs) or column.reads & tables):
+                kernel = None
+            # With unrestricted eval, _eval_expr retries these errors with asteval.
+            retried = (
+                (_PerRow, InvalidExpression, TypeError, ValueError) if unrestricted and column.is_expr else _PerRow
+            )
+            values = precomputed.get(name) if precomputed and slot_deriv.expr else None
+            for i, row in enumerate(rows):
+                if i in errors:
+                    continue
+                tgt = targets[i]
+                if values is not None and values[i] is not MISS:
+                    tgt[name] = values[i]
+                    continue
+                if kernel is not None:
+                    try:
+                        tgt[name] = kernel(row, tgt)
+                        continue
+                    except retried:
+                        pass
+                    except Exception as exc:  # noqa: BLE001 - reported as _derive_slot would
+                        context = DerivationContext(row, None, source_type, sv, class_derivation)
+                        try:
+                            with self._slot_error_context(slot_deriv, context):
+                                raise exc
+                        except TransformationError as err:
+                            errors[i] = err
+                        continue
+                state = per_row[i]
+                if state is None:
+                    context = DerivationContext(row, None, source_type, sv, class_derivation)
+                    state = per_row[i] = (
+                        context,
+                        Bindings.from_context(self, context),
+                        {**self.extension_functions, "slot": tgt.get},
+                    )
+                context, bindings, functions = state
+                try:
+                    with self._slot_error_context(slot_deriv, context):
+                        tgt[name] = self._derive_slot(slot_deriv, context, target_type, bindings, functions)
+                except TransformationError as err:
+                    errors[i] = err
+        if errors and on_error is None:
+            raise errors[min(errors)]
+        hidden = [str(sd.name) for sd in class_derivation.slot_derivations.values() if sd.hide]
+        results: list[DICT_OBJ | None] = []
+        for i, tgt in enumerate(targets):
+            if i in errors:
+                on_error(i, errors[i])
+                results.append(None)
+                continue
+            for name in hidden:
+                tgt.pop(name, None)
+            results.append(tgt)
+        return results
+
+    def _map_rows(
+        self,
+        rows: list[OBJECT_TYPE],
+        class_derivation: ClassDerivation,
+        source_type: str | None,
+        target_type: str | None,
+        on_error: Callable[[int, TransformationError], None] | None,
+    ) -> list[DICT_OBJ | None]:
+        """:meth:`map_batch` for chunks it cannot evaluate column-wise: :meth:`map_object` per row."""
+        results = []
+        for i, row in enumerate(rows):
+            try:
+                results.append(
+                    self.map_object(row, source_type, target_type=target_type, class_derivation=class_derivation)
+                )
+            except TransformationError as err:
+                if on_error is None:
+                    raise
+                on_error(i, err)
+                results.append(None)
+        return results
+
+    def _column_plan(self, class_deriv: ClassDerivation, source_type: str) -> list[SlotColumn]:
+        """
+        Return how :meth:`map_batch` derives each slot of *class_deriv*, building it on first use.
+
+        Cached like :meth:`_binding_plan`, and rebuilt when the extension
+        functions change (expressions are compiled against them).
+        """
+        key = (id(class_deriv), source_type)
+        functions = self.extension_functions
+        sv = self.source_schemaview
+        cached = self._column_plans.get(key)
+        if cached is not None and cached[0] is class_deriv and cached[1] is sv and cached[2] == functions:
+            return cached[3]
+        binding_plan = self._binding_plan(DerivationContext({}, None, source_type, sv, class_deriv))
+        namespace = _resolve_functions(functions)
+        columns = [
+            self._slot_column(slot_deriv, class_deriv, source_type, binding_plan, namespace)
+            for slot_deriv in class_deriv.slot_derivations.values()
+        ]
+        self._column_plans[key] = (class_deriv, sv, dict(functions), columns)
+        return columns
+
+    def _slot_column(
+        self,
+        slot_deriv: SlotDerivation,
+        class_deriv: ClassDerivation,
+        source_type: str,
+        binding_plan: BindingPlan,
+        functions: dict[str, Any],
+    ) -> SlotColumn:
+        """Build the column kernel for one slot derivation, mirroring :meth:`_derive_slot`."""
+        if slot_deriv.value is not None:
+            value = slot_deriv.value
+            return SlotColumn(slot_deriv, lambda row, target: value)
+        if slot_deriv.unit_conversion or slot_deriv.pivot_operation:
+            return SlotColumn(slot_deriv, None)
+        if slot_deriv.expr:
+            reads: set[str] = set()
+            kernel = compile_row_expr(slot_deriv.expr, functions, _column_binder(binding_plan, source_type, reads))
+            return SlotColumn(slot_deriv, kernel, frozenset(reads), is_expr=True)
+        populated_from = slot_deriv.populated_from
+        if slot_deriv.sources or slot_deriv.class_derivations or (populated_from and "." in populated_from):
+            return SlotColumn(slot_deriv, None)
+        column = populated_from or slot_deriv.name
+        try:
+            source_slot = self.source_schemaview.induced_slot(column, source_type)
+            post = None if slot_deriv.hide else self._column_post_processor(slot_deriv, class_deriv, source_slot)
+        except Exception:  # noqa: BLE001 - _derive_slot raises it per row, with context
+            return SlotColumn(slot_deriv, None)
+        if post is _PerRow:
+            return SlotColumn(slot_deriv, None)
+        missing = frozenset(str(mv) for mv in slot_deriv.missing_values) if slot_deriv.missing_values else None
+        mappings = None
+        offset = False
+        if populated_from:
+            if slot_deriv.expression_mappings:
+                return SlotColumn(slot_deriv, None)
+            if slot_deriv.value_mappings:
+                mappings = {k: vm.value for k, vm in slot_deriv.value_mappings.items()}
+            offset = bool(slot_deriv.offset)
+        apply_offset = self._apply_offset
+
+        def kernel(row: DICT_OBJ, target: DICT_OBJ) -> Any:  # noqa: ANN401
+            v = _scalar_column(row, column)
+            if v is None or (missing is not None and str(v) in missing):
+                return None
+            if mappings is not None:
+                v = mappings.get(str(v))
+                if v is None:
+                    return None
+            if offset:
+                v = apply_offset(v, slot_deriv, row)
+            return v if post is None else post(v)
+
+        return SlotColumn(slot_deriv, kernel)
+
+    def _column_post_processor(
+        self, slot_deriv: SlotDerivation, class_deriv: ClassDerivation, source_slot: SlotDefinition
+    ) -> Callable[[Any], Any] | type[_PerRow]:
+        """
+        Range mapping and coercion of a copied value, as applied by :meth:`_derive_slot`.
+
+        Covers single-valued source slots whose range is a type (or absent);
+        returns ``_PerRow`` for anything else.
+        """
+        sv = self.source_schemaview
+        target_range = slot_deriv.range
+        if source_slot.multivalued:
+            return _PerRow
+        if source_slot.range in sv.all_types():
+            # map_object on a type only converts to these target types.
+            convert = {
+                "string": str,
+                "integer": int,
+                "float": float,
+                "double": float,
+                "uri": self.expand_curie,
+                "curie": self.compress_uri,
+            }.get(target_range)
+        elif source_slot.range in (None, "Any") and not self._get_any_of_enum_names(source_slot, sv):
+            convert = _reject_collections
+        else:
+            return _PerRow
+        to_multivalued = self._is_coerce_to_multivalued(slot_deriv, class_deriv)
+        to_singlevalued = self._is_coerce_to_singlevalued(slot_deriv, class_deriv)
+        reshape = bool(slot_deriv.dictionary_key or slot_deriv.cast_collection_as)
+
+        def post(v: Any) -> Any:  # noqa: ANN401
+            if convert is not None:
+                v = convert(v)
+            if to_multivalued and not isinstance(v, list):
+                v = self._singlevalued_to_multivalued(v, slot_deriv)
+            elif to_singlevalued and isinstance(v, list):
+                v = self._multivalued_to_singlevalued(v, slot_deriv)
+            if target_range is not None:
+                v = self._coerce_datatype(v, target_range)
+            if reshape:
+                v = self._reshape_collection(v, slot_deriv, source_slot)
+            return v
+
+        return post
+
     @contextmanager
     def _slot_error_context(
         self,
@@ -573,15 +1162,23 @@ class ObjectTransformer(Transformer):
         """Evaluate an expression string against bindings.
 
         Uses the restricted evaluator by default, with fallback to asteval
-        when ``unrestricted_eval`` is enabled on the transformer.
+        when ``unrestricted_eval`` is enabled on the transformer. With an
+        :attr:`expression_memo`, results of pure expressions over scalar
+        inputs are looked up before evaluating.
 
         :param expr: The expression string to evaluate.
         :param bindings: Variable bindings for the expression.
         :param functions: Extra functions injected into the evaluator
             (e.g. ``slot`` for referencing previously derived target slots).
         """
+        memo = self.expression_memo
+        memo_key = None if memo is None else memo.key(expr, bindings, functions)
+        if memo_key is not None:
+            v = memo.get(memo_key)
+            if v is not MISS:
+                return v
         try:
-            return eval_expr_with_mapping(
+            v = eval_expr_with_mapping(
                 expr,
                 bindings,
                 functions=functions,
@@ -595,9 +1192,10 @@ class ObjectTransformer(Transformer):
             usersyms = {"src": ctxt_obj, "target": None, "uuid5": _uuid5}
             if functions:
                 usersyms.update(functions)
-            aeval = Interpreter(usersyms=usersyms)
-            aeval(expr)
-            return aeval.symtable["target"]
+            return eval_unrestricted(expr, usersyms)
+        if memo_key is not None:
+            memo.put(memo_key, v)
+        return v
 
     def _apply_mappings(
         self,
@@ -628,26 +1226,15 @@ class ObjectTransformer(Transformer):
         slot_derivation: SlotDerivation,
         fk_value: Any,
     ) -> tuple[Any, SlotDefinition | None]:
-        """Resolve a foreign key value through the object index and walk the remaining path."""
-        if fk_value is not None and self.object_index:
-            cache_key = (fk_resolution.target_class, str(fk_value))
-            referenced_obj = self.object_index._source_object_cache.get(cache_key)
-
-            if referenced_obj:
-                v = referenced_obj
-                for attr in fk_resolution.remaining_path.split("."):
-                    if isinstance(v, dict):
-                        v = v.get(attr)
-                    elif v is not None:
-                        v = getattr(v, attr, None)
-                    if v is None:
-                        break
-            else:
-                v = None
+        """Resolve a foreign key value through the FK index and walk the remaining path."""
+        fk_index = self._fk_index()
+        if fk_value is not None and fk_index is not None:
+            v = fk_index.resolve(fk_resolution.target_class, fk_value, fk_resolution.remaining_path)
+            if v is None and fk_index.get(fk_resolution.target_class, fk_value) is None:
                 logger.debug(f"FK reference not found for {slot_derivation.name}")
         else:
             v = None
-            if fk_value is not None and not self.object_index:
+            if fk_value is not None:
                 logger.warning(
                     "Cross-class lookup requires object_index. Call transformer.index(container_data) first."
                 )
@@ -1291,9 +1878,7 @@ class ObjectTransformer(Transformer):
                 try:
                     v = eval_expr(enum_deriv.expr, **source_obj, NULL=None)
                 except Exception:
-                    aeval = Interpreter(usersyms={"src": source_obj, "target": None, "uuid5": _uuid5})
-                    aeval(enum_deriv.expr)
-                    v = aeval.symtable["target"]
+                    v = eval_unrestricted(enum_deriv.expr, {"src": source_obj, "target": None, "uuid5": _uuid5})
                 if v is not None:
                     return v
             for pv_deriv in enum_deriv.permissible_value_derivations.values():
@@ -34,6 +34,7 @@ from linkml_map.utils.expression_locations import (
 )
 from linkml_map.utils.join_utils import infer_join_key
 from linkml_map.utils.schema_patch import apply_schema_patch
+from linkml_map.utils.schema_snapshot import load_schemaview
 
 logger = logging.getLogger(__name__)
 
@@ -160,7 +161,7 @@ class Transformer(ABC):
         """
         if isinstance(path, Path):
             path = str(path)
-        self.source_schemaview = SchemaView(path)
+        self.source_schemaview = load_schemaview(path)
 
     def load_transformer_specification(self, path: str | Path) -> None:
         """
@@ -613,6 +614,17 @@ class Transformer(ABC):
             self._derived_specification = derived
         return self._derived_specification
 
+    def use_derived_specification(self, derived: TransformationSpecification) -> None:
+        """Adopt a previously derived specification for the current one, e.g. from a cache.
+
+        *derived* must have been derived from an equal ``specification`` and
+        source schema. Source schema patches are still applied to
+        ``source_schemaview``, exactly as on first access to
+        ``derived_specification``.
+        """
+        self._apply_source_schema_patches()
+        self._derived_specification = derived
+
     def _synthesize_implicit_joins(self, spec: TransformationSpecification) -> None:
         """Add explicit join specs for every implicit cross-table reference.
 
@@ -1,5 +1,7 @@
 """Generate an object from a dict."""
 
+import weakref
+from functools import lru_cache
 from typing import Any
 
 from linkml_runtime import SchemaView
@@ -8,14 +10,54 @@ from linkml_runtime.utils.formatutils import camelcase
 
 class DynObj:
     def __init__(self, **kwargs) -> None:
-        for k, v in kwargs.items():
-            setattr(self, k, v)
+        self.__dict__.update(kwargs)
 
     def __str__(self) -> str:
         return str(vars(self))
 
     def __getattr__(self, p: str) -> Any:
-        return vars(self).get(p, None)
+        # Only reached for attributes not set on the instance.
+        return None
+
+
+@lru_cache(None)
+def _dyn_class(target: str) -> type[DynObj]:
+    """Return the DynObj subclass named after *target*, created once per name."""
+    return type(camelcase(target), (DynObj,), {})
+
+
+#: Slot lookups per view, as ``(sv.modifications, {key: value})``. Held weakly,
+#: so a view's cache goes away with the view.
+_VIEW_CACHES: weakref.WeakKeyDictionary[SchemaView, tuple[int, dict[tuple, Any]]] = weakref.WeakKeyDictionary()
+
+
+def _view_cache(sv: SchemaView) -> dict[tuple, Any]:
+    """Lookup cache for *sv*, dropped when the schema is modified (``sv.modifications`` changes)."""
+    cached = _VIEW_CACHES.get(sv)
+    if cached is None or cached[0] != sv.modifications:
+        cached = _VIEW_CACHES[sv] = (sv.modifications, {})
+    return cached[1]
+
+
+def slot_info(sv: SchemaView, slot_name: str, target: str) -> tuple[str | None, bool]:
+    """Range and multivalued flag of *slot_name* induced on *target*, cached per view."""
+    cache = _view_cache(sv)
+    key = ("slot", slot_name, target)
+    info = cache.get(key)
+    if info is None:
+        slot = sv.induced_slot(slot_name, target)
+        info = cache[key] = (slot.range, bool(slot.multivalued))
+    return info
+
+
+def identifier_slot_name(sv: SchemaView, class_name: str) -> str | None:
+    """Name of *class_name*'s identifier (or key) slot, cached per view."""
+    cache = _view_cache(sv)
+    key = ("identifier", class_name)
+    if key not in cache:
+        id_slot = sv.get_identifier_slot(class_name, use_key=True)
+        cache[key] = id_slot.name if id_slot is not None else None
+    return cache[key]
 
 
 def dynamic_object(obj: dict, sv: SchemaView, target: str):
@@ -27,27 +69,25 @@ def dynamic_object(obj: dict, sv: SchemaView, target: str):
     :param target:
     :return:
     """
+    if not isinstance(obj, dict):
+        return obj
     if target in sv.all_enums():
         return obj
     if target in sv.all_types():
         return obj
-    if not isinstance(obj, dict):
-        return obj
     attrs = {}
     for k, v in obj.items():
-        slot = sv.induced_slot(k, target)
-        rng = slot.range
-        if slot.multivalued:
+        rng, multivalued = slot_info(sv, k, target)
+        if multivalued:
             if isinstance(v, list):
                 v = [dynamic_object(x, sv, rng) for x in v]
             if isinstance(v, dict):
                 v = {xk: dynamic_object(x, sv, rng) for xk, x in v.items()}
-                id_slot = sv.get_identifier_slot(slot.range, use_key=True)
-                if id_slot is not None:
+                id_slot_name = identifier_slot_name(sv, rng)
+                if id_slot_name is not None:
                     for k1, v1 in v.items():
-                        setattr(v1, id_slot.name, k1)
-        else:
+                        setattr(v1, id_slot_name, k1)
+        elif isinstance(v, dict):
             v = dynamic_object(v, sv, rng)
         attrs[k] = v
-    cls = type(camelcase(target), (DynObj,), {})
-    return cls(**attrs)
+    return _dyn_class(target)(**attrs)
@@ -24,6 +24,7 @@ import math
 import threading
 import uuid
 from collections.abc import Iterable, Mapping
+from contextlib import suppress
 from functools import lru_cache
 from typing import Any
 
@@ -143,8 +144,9 @@ def _null_safe(func):  # noqa: ANN001, ANN202
     """Wrap a function to return None if any argument is None."""
 
     def wrapper(*args: Any) -> Any:  # noqa: ANN401
-        if any(a is None for a in args):
-            return None
+        for a in args:
+            if a is None:
+                return None
         return func(*args)
 
     wrapper.__name__ = func.__name__
@@ -152,17 +154,38 @@ def _null_safe(func):  # noqa: ANN001, ANN202
 
 
 def _distributing(func):  # noqa: ANN001, ANN202
-    """Wrap a scalar function so it distributes over lists and propagates None."""
+    """Wrap a scalar function so it distributes over lists and propagates None.
+
+    When the first argument is a list, *func* is applied to each element with
+    the remaining arguments; None elements stay None. The trailing arguments
+    are checked for None once per call, not once per element, and no wrapper
+    is built per element.
+
+    >>> _distributing(str.upper)(["a", None, "b"])
+    ['A', None, 'B']
+    >>> _distributing(str.replace)(["a-b", "c-d"], "-", "_")
+    ['a_b', 'c_d']
+    >>> _distributing(str.replace)(["a-b"], None, "_")
+    [None]
+    """
 
     def wrapper(*args: Any) -> Any:  # noqa: ANN401
         if args and isinstance(args[0], list):
+            items = args[0]
+            if len(args) == 1:
+                return [None if x is None else func(x) for x in items]
             tail = args[1:]
-            return [_null_safe(func)(x, *tail) for x in args[0]]
-        if any(a is None for a in args):
-            return None
+            for a in tail:
+                if a is None:
+                    return [None] * len(items)
+            return [None if x is None else func(x, *tail) for x in items]
+        for a in args:
+            if a is None:
+                return None
         return func(*args)
 
     wrapper.__name__ = func.__name__
+    wrapper.__wrapped__ = func  # so inspect.signature reports func's parameters and return type
     return wrapper
 
 
@@ -943,6 +966,65 @@ def eval_expr_with_mapping(
     return evaluator.eval(expr, previously_parsed=_parse_cached(expr))
 
 
+#: Per-thread reusable asteval interpreter for :func:`eval_unrestricted`, with
+#: the symbol table it starts from. Thread-local for the same reason as
+#: ``_evaluator_pool``.
+_interpreter_pool = threading.local()
+
+
+@lru_cache(maxsize=512)
+def _parse_unrestricted_cached(expr: str) -> ast.Module:
+    """Parse a statement block the way :meth:`asteval.Interpreter.parse` does, cached by text."""
+    return ast.fix_missing_locations(ast.parse(expr))
+
+
+def eval_unrestricted(expr: str, usersyms: dict[str, Any]) -> Any:  # noqa: ANN401
+    """
+    Evaluate *expr* with asteval and return the value it assigns to ``target``.
+
+    Used by ``unrestricted_eval`` for Python-style statements the restricted
+    evaluator rejects. The interpreter is built once per thread and reused;
+    each call restores its initial symbol table and adds *usersyms*, so names
+    assigned by one expression never leak into the next. Statement blocks are
+    parsed once per expression text and the parsed tree is passed to
+    :meth:`asteval.Interpreter.eval`.
+
+    :param expr: Statement block to run; it should assign ``target``.
+    :param usersyms: Symbols for this call, e.g. ``src`` and any functions.
+    """
+    from asteval import Interpreter
+
+    pool = _interpreter_pool
+    if getattr(pool, "busy", False):
+        # Re-entered from a function the running expression called.
+        aeval = Interpreter(usersyms=usersyms)
+        aeval(expr)
+        return aeval.symtable["target"]
+    aeval = getattr(pool, "interpreter", None)
+    if aeval is None:
+        aeval = pool.interpreter = Interpreter()
+        pool.symtable = dict(aeval.symtable)
+        pool.no_deepcopy = list(aeval.no_deepcopy)
+    symtable = aeval.symtable
+    symtable.clear()
+    symtable.update(pool.symtable)
+    symtable.update(usersyms)
+    aeval.no_deepcopy = pool.no_deepcopy + [k for k, v in usersyms.items() if callable(v)]
+    # Each top-level evaluation appends to the statement history; keep it bounded.
+    aeval.code_text.clear()
+    code: str | ast.Module = expr
+    if len(expr) <= aeval.max_statement_length:
+        with suppress(Exception):  # asteval parses and reports it
+            code = _parse_unrestricted_cached(expr)
+    pool.busy = True
+    try:
+        aeval.eval(code)
+    finally:
+        pool.busy = False
+    # Procedure calls may swap the interpreter's symbol table, so read it afresh.
+    return aeval.symtable["target"]
+
+
 def eval_expr(expr: str, **kwargs: Any) -> Any:  # noqa: ANN401
     """
     Evaluate a given expression, with restricted syntax.
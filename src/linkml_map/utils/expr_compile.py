@@ -0,0 +1,195 @@
+"""Compile a subset of restricted expressions into plain row functions.
+
+:meth:`ObjectTransformer.map_batch
+<linkml_map.transformer.object_transformer.ObjectTransformer.map_batch>`
+evaluates slot derivations column-wise over a chunk of rows. For an ``expr:``
+that only uses
+
+- constants, ``NULL``, and names bound to plain source columns (bare or ``{x}``),
+- arithmetic, unary, boolean and comparison operators, and ``a if c else b``,
+- tuple and list displays (as in ``case((cond, value), ...)``),
+- calls by name to functions in the eval namespace (including ``slot()``),
+
+:func:`compile_row_expr` builds a closure ``fn(row, target) -> value`` once per
+expression, so each row costs one Python call per AST node instead of a walk of
+the tree through the evaluator's dispatch table. Operators are taken from
+:class:`~linkml_map.utils.eval_utils.LinkMLEvaluator`, so SQL-style null
+propagation and numeric-string coercion are exactly those of the evaluator.
+
+Anything else (attribute access, subscripts, comprehensions, dict and set
+displays, lambdas) makes the expression non-compilable; the caller then
+evaluates it row by row with the evaluator.
+"""
+
+from __future__ import annotations
+
+import ast
+from collections.abc import Callable, Mapping
+from functools import lru_cache
+from typing import Any
+
+from simpleeval import DISALLOW_FUNCTIONS, MAX_STRING_LENGTH
+
+from linkml_map.utils.eval_utils import LinkMLEvaluator, _parse_cached
+
+#: ``fn(row, target)``: evaluate against a source row and the target slots derived so far.
+RowFn = Callable[[Any, Mapping[str, Any]], Any]
+
+
+class NotCompilable(Exception):
+    """Raised internally when an expression uses syntax outside the compilable subset."""
+
+
+@lru_cache(None)
+def _operators() -> dict[type, Callable]:
+    """Operator table of the restricted evaluator (with its null-propagating overrides)."""
+    return dict(LinkMLEvaluator(names={}).operators)
+
+
+def compile_row_expr(
+    expr: str,
+    functions: Mapping[str, Any],
+    bind: Callable[[str], RowFn | None],
+) -> RowFn | None:
+    """
+    Compile *expr* into a row function, or return None if it is outside the subset.
+
+    :param expr: The expression string.
+    :param functions: The full function namespace (built-ins and extensions);
+        ``slot`` is handled here and need not be present.
+    :param bind: Returns a row function for a variable name, or None if the
+        name cannot be bound from a plain column (the expression is then not
+        compilable).
+    """
+    if expr == "None":
+        return lambda row, target: None
+    try:
+        tree = _parse_cached(expr)
+    except Exception:  # noqa: BLE001 - the evaluator reports syntax errors
+        return None
+    if not isinstance(tree, ast.Expr):
+        return None
+    try:
+        return _Compiler(functions, bind).compile(tree.value)
+    except NotCompilable:
+        return None
+
+
+class _Compiler:
+    def __init__(self, functions: Mapping[str, Any], bind: Callable[[str], RowFn | None]) -> None:
+        self.functions = functions
+        self.bind = bind
+        self.operators = _operators()
+
+    def compile(self, node: ast.AST) -> RowFn:  # noqa: C901, PLR0911, PLR0912
+        if isinstance(node, ast.Constant):
+            value = node.value
+            if hasattr(value, "__len__") and len(value) > MAX_STRING_LENGTH:
+                raise NotCompilable
+            return lambda row, target: value
+        if isinstance(node, ast.Name):
+            return self._name(node.id)
+        if isinstance(node, ast.Set):
+            # ``{x}`` is the same variable reference as bare ``x``.
+            if len(node.elts) != 1 or not isinstance(node.elts[0], ast.Name):
+                raise NotCompilable
+            return self._name(node.elts[0].id)
+        if isinstance(node, ast.BinOp):
+            op = self._operator(node.op)
+            left, right = self.compile(node.left), self.compile(node.right)
+            return lambda row, target: op(left(row, target), right(row, target))
+        if isinstance(node, ast.UnaryOp):
+            op = self._operator(node.op)
+            operand = self.compile(node.operand)
+            return lambda row, target: op(operand(row, target))
+        if isinstance(node, ast.BoolOp):
+            values = [self.compile(v) for v in node.values]
+            if isinstance(node.op, ast.And):
+                return lambda row, target: _and(values, row, target)
+            return lambda row, target: _or(values, row, target)
+        if isinstance(node, ast.Compare):
+            return self._compare(node)
+        if isinstance(node, ast.IfExp):
+            test, body, orelse = self.compile(node.test), self.compile(node.body), self.compile(node.orelse)
+            return lambda row, target: body(row, target) if test(row, target) else orelse(row, target)
+        if isinstance(node, ast.Tuple | ast.List):
+            if any(isinstance(e, ast.Starred) for e in node.elts):
+                raise NotCompilable
+            items = [self.compile(e) for e in node.elts]
+            make = tuple if isinstance(node, ast.Tuple) else list
+            return lambda row, target: make([item(row, target) for item in items])
+        if isinstance(node, ast.Call):
+            return self._call(node)
+        raise NotCompilable
+
+    def _name(self, name: str) -> RowFn:
+        fn = self.bind(name)
+        if fn is None:
+            raise NotCompilable
+        return fn
+
+    def _operator(self, op: ast.AST) -> Callable:
+        try:
+            return self.operators[type(op)]
+        except KeyError:
+            raise NotCompilable from None
+
+    def _compare(self, node: ast.Compare) -> RowFn:
+        first = self.compile(node.left)
+        steps = [(self._operator(op), self.compile(comp)) for op, comp in zip(node.ops, node.comparators, strict=True)]
+        if len(steps) == 1:
+            [(op, comp)] = steps
+            return lambda row, target: op(first(row, target), comp(row, target))
+
+        def compare(row: Any, target: Mapping[str, Any]) -> Any:  # noqa: ANN401
+            right = first(row, target)
+            result = True
+            for op, comp in steps:
+                if not result:
+                    break
+                left, right = right, comp(row, target)
+                result = op(left, right)
+            return result
+
+        return compare
+
+    def _call(self, node: ast.Call) -> RowFn:
+        if not isinstance(node.func, ast.Name) or any(isinstance(a, ast.Starred) for a in node.args):
+            raise NotCompilable
+        if any(k.arg is None for k in node.keywords):
+            raise NotCompilable
+        args = [self.compile(a) for a in node.args]
+        kwargs = [(k.arg, self.compile(k.value)) for k in node.keywords]
+        name = node.func.id
+        if name == "slot":
+            if len(args) != 1 or kwargs:
+                raise NotCompilable
+            [arg] = args
+            return lambda row, target: target.get(arg(row, target))
+        func = self.functions.get(name)
+        if func is None or func in DISALLOW_FUNCTIONS:
+            raise NotCompilable
+        if kwargs:
+            return lambda row, target: func(*[a(row, target) for a in args], **{k: v(row, target) for k, v in kwargs})
+        if len(args) == 1:
+            [arg] = args
+            return lambda row, target: func(arg(row, target))
+        return lambda row, target: func(*[a(row, target) for a in args])
+
+
+def _and(values: list[RowFn], row: Any, target: Mapping[str, Any]) -> Any:  # noqa: ANN401
+    result = False
+    for value in values:
+        result = value(row, target)
+        if not result:
+            break
+    return result
+
+
+def _or(values: list[RowFn], row: Any, target: Mapping[str, Any]) -> Any:  # noqa: ANN401
+    result = False
+    for value in values:
+        result = value(row, target)
+        if result:
+            break
+    return result
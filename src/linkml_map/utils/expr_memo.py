@@ -0,0 +1,230 @@
+"""Opt-in memoization of pure expression results.
+
+Many ``expr:`` derivations see only a handful of distinct inputs —
+``slugify({category})``, ``uuid5(NS, {code})``, ``case(...)`` over a
+low-cardinality code — yet are evaluated once per row. An
+:class:`ExpressionMemo` caches the result per (expression, bound input values)
+when the expression is safe to memoize:
+
+- every function it calls is pure: a built-in, or an extension declared with
+  ``@safe_function(pure=True)`` (per-call functions such as ``slot()`` are not);
+- every name it reads is bound to a scalar (``str``, ``int``, ``float``,
+  ``bool`` or ``None``), so the inputs can be used as a cache key;
+- the result is a scalar, so a cached value is never shared mutable state.
+
+The cache is a bounded LRU shared by all expressions. An expression whose hit
+rate stays below ``min_hit_rate`` after ``min_lookups`` lookups stops being
+memoized and its entries are dropped.
+"""
+
+from __future__ import annotations
+
+import ast
+import threading
+from collections import OrderedDict
+from collections.abc import Mapping
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Any, NamedTuple
+
+from linkml_map.utils.eval_utils import _DEFAULT_FUNCTIONS, _parse_cached
+from linkml_map.utils.extensions import is_pure
+
+#: Sentinel returned by :meth:`ExpressionMemo.get` on a miss.
+MISS = object()
+
+_SCALAR_TYPES = frozenset({str, int, float, bool, type(None)})
+
+#: Built-in functions; all are deterministic in their arguments.
+_PURE_BUILTINS = frozenset(_DEFAULT_FUNCTIONS)
+
+
+class _ExprInputs(NamedTuple):
+    names: tuple[str, ...]
+    """Variable names the expression reads, in first-use order."""
+    calls: frozenset[str]
+    """Names of the functions the expression calls."""
+
+
+@lru_cache(maxsize=512)
+def _expr_inputs(expr: str) -> _ExprInputs | None:
+    """Names read and functions called by *expr*, or None if it cannot be memoized."""
+    try:
+        tree = _parse_cached(expr)
+    except Exception:  # noqa: BLE001 - the evaluator reports syntax errors
+        return None
+    calls: set[str] = set()
+    func_nodes: set[int] = set()
+    for node in ast.walk(tree):
+        if isinstance(node, ast.comprehension | ast.Lambda | ast.NamedExpr):
+            return None
+        if isinstance(node, ast.Call):
+            if not isinstance(node.func, ast.Name):
+                return None
+            calls.add(node.func.id)
+            func_nodes.add(id(node.func))
+    names = [n.id for n in ast.walk(tree) if isinstance(n, ast.Name) and id(n) not in func_nodes]
+    return _ExprInputs(tuple(dict.fromkeys(names)), frozenset(calls))
+
+
+@dataclass
+class MemoStats:
+    """Lookups of one expression."""
+
+    hits: int = 0
+    misses: int = 0
+    uncacheable: int = 0
+    """Rows whose inputs were not all scalars, or whose result was not a scalar."""
+    disabled: str | None = None
+    """Why memoization was turned off for the expression, if it was."""
+
+    @property
+    def lookups(self) -> int:
+        return self.hits + self.misses + self.uncacheable
+
+    @property
+    def hit_rate(self) -> float:
+        return self.hits / self.lookups if self.lookups else 0.0
+
+
+@dataclass
+class ExpressionMemo:
+    """
+    Bounded LRU cache of pure expression results.
+
+    Attach one to :attr:`ObjectTransformer.expression_memo
+    <linkml_map.transformer.object_transformer.ObjectTransformer.expression_memo>`
+    (``map-data --memoize-expressions``); the transformer calls :meth:`key`,
+    :meth:`get` and :meth:`put` around each restricted evaluation.
+    """
+
+    maxsize: int = 100_000
+    """Maximum number of cached results across all expressions."""
+    min_lookups: int = 1_000
+    """Lookups of an expression before its hit rate is judged."""
+    min_hit_rate: float = 0.2
+    """Below this hit rate, memoization is disabled for the expression."""
+    stats: dict[str, MemoStats] = field(default_factory=dict)
+    _cache: OrderedDict[tuple, Any] = field(default_factory=OrderedDict, repr=False)
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
+
+    def key(self, expr: str, mapping: Mapping, functions: Mapping[str, Any] | None = None) -> tuple | None:
+        """
+        Return the cache key for evaluating *expr* against *mapping*, or None.
+
+        None means the result must be computed normally: the expression is not
+        memoizable, memoization was disabled for it, or an input is not a scalar.
+        """
+        stats = self.stats.get(expr)
+        if stats is None:
+            stats = self.stats[expr] = MemoStats()
+            inputs = _expr_inputs(expr)
+            if inputs is None:
+                stats.disabled = "unsupported syntax"
+            else:
+                impure = sorted(name for name in inputs.calls if not _is_pure_call(name, functions))
+                if impure:
+                    stats.disabled = f"calls impure function(s): {', '.join(impure)}"
+        if stats.disabled is not None:
+            return None
+        values = []
+        try:
+            for name in _expr_inputs(expr).names:
+                v = mapping[name]
+                if type(v) not in _SCALAR_TYPES:
+                    break
+                values.append((type(v), v))
+            else:
+                return (expr, *values)
+        except Exception:  # noqa: BLE001 - unbound or failing names: let the evaluator report them
+            pass
+        stats.uncacheable += 1
+        self._judge(expr, stats)
+        return None
+
+    def get(self, key: tuple) -> Any:
+        """Return the cached result for *key*, or :data:`MISS`."""
+        with self._lock:
+            result = self._cache.get(key, MISS)
+            if result is not MISS:
+                self._cache.move_to_end(key)
+        if result is not MISS:
+            self.stats[key[0]].hits += 1
+        return result
+
+    def put(self, key: tuple, result: Any) -> None:
+        """Record a computed *result* for *key* (a miss); only scalar results are kept."""
+        expr = key[0]
+        stats = self.stats[expr]
+        if type(result) in _SCALAR_TYPES:
+            stats.misses += 1
+            with self._lock:
+                self._cache[key] = result
+                if len(self._cache) > self.maxsize:
+                    self._cache.popitem(last=False)
+        else:
+            stats.uncacheable += 1
+        self._judge(expr, stats)
+
+    def _judge(self, expr: str, stats: MemoStats) -> None:
+        """Disable memoization of *expr* once its hit rate has proven poor."""
+        if stats.lookups >= self.min_lookups and stats.hit_rate < self.min_hit_rate:
+            stats.disabled = f"hit rate {stats.hit_rate:.0%} after {stats.lookups} lookups"
+            with self._lock:
+                for k in [k for k in self._cache if k[0] == expr]:
+                    del self._cache[k]
+
+    def __len__(self) -> int:
+        return len(self._cache)
+
+    def to_dict(self) -> dict[str, Any]:
+        """Per-expression stats, most looked-up first, plus totals."""
+        rows = [
+            {
+                "expr": expr,
+                "lookups": s.lookups,
+                "hits": s.hits,
+                "misses": s.misses,
+                "uncacheable": s.uncacheable,
+                "hit_rate": round(s.hit_rate, 4),
+                "disabled": s.disabled,
+            }
+            for expr, s in sorted(self.stats.items(), key=lambda item: -item[1].lookups)
+        ]
+        hits = sum(s.hits for s in self.stats.values())
+        lookups = sum(s.lookups for s in self.stats.values())
+        return {
+            "expressions": rows,
+            "hits": hits,
+            "lookups": lookups,
+            "hit_rate": round(hits / lookups, 4) if lookups else 0.0,
+            "cached": len(self._cache),
+        }
+
+    def report(self, limit: int | None = None) -> str:
+        """
+        Render per-expression hit rates as text.
+
+        :param limit: Show at most this many expressions.
+        """
+        data = self.to_dict()
+        rows = data["expressions"][:limit] if limit else data["expressions"]
+        lines = [f"{'expr':<48} {'lookups':>10} {'hits':>10} {'hit rate':>9}  disabled"]
+        for row in rows:
+            expr = row["expr"] if len(row["expr"]) <= 48 else row["expr"][:45] + "..."
+            lines.append(
+                f"{expr:<48} {row['lookups']:>10} {row['hits']:>10} {row['hit_rate']:>9.1%}  {row['disabled'] or ''}"
+            )
+        lines.append("")
+        lines.append(
+            f"Total: {data['hits']} hits / {data['lookups']} lookups ({data['hit_rate']:.1%}), "
+            f"{data['cached']} results cached"
+        )
+        return "\n".join(lines)
+
+
+def _is_pure_call(name: str, functions: Mapping[str, Any] | None) -> bool:
+    """Whether calling *name* is pure, given the caller-supplied *functions* (which take precedence)."""
+    if functions and name in functions:
+        return is_pure(functions[name])
+    return name in _PURE_BUILTINS
@@ -0,0 +1,460 @@
+"""Translate a subset of restricted expressions into DuckDB SQL.
+
+The set-based join engine (:mod:`linkml_map.transformer.join_engine`) computes
+``expr:`` slot derivations inside its join query when :func:`translate_expr`
+can express them in SQL, instead of evaluating them per row in Python. The
+translation must give *exactly* the value the restricted evaluator would, so it
+is deliberately conservative:
+
+- Source columns arrive as VARCHAR and are coerced per value in Python
+  (:func:`~linkml_map.utils.lookup_index._parse_numeric`), so a column's Python
+  type is only known per row. Each column is given the type its schema range
+  suggests (``int``, ``float`` or ``str``) together with a *guard*: a SQL
+  predicate that holds exactly when the value parses to that type (or is
+  NULL). The translated expression comes with the conjunction of its guards;
+  rows where it is not true are evaluated in Python as before.
+- Operators are translated only for operand types whose SQL semantics match
+  the evaluator's: ``+ - *`` on numbers (integers in ``HUGEINT``, bounded so
+  they cannot overflow), ``/`` (guarded against a zero divisor), string
+  concatenation (guarded against the evaluator's length limit), ``-x``, single
+  comparisons between operands of one kind (``==``/``!=`` as ``IS [NOT]
+  DISTINCT FROM``, ordering comparisons propagating NULL), and
+  ``a if c else b`` on a boolean condition.
+- Calls are translated for the built-ins ``case``, ``coalesce``, ``upper`` and
+  ``lower`` (on ASCII text), and ``str`` of an integer or string, unless an
+  extension overrides them.
+
+Other function calls are translated only if the caller supplies a ``udf``
+hook that runs the Python function inside DuckDB (see :class:`SqlFunction`).
+``and``/``or`` (which return an operand, not a boolean, and short-circuit
+around NULL differently from SQL), and anything not listed make the
+expression untranslatable; :func:`translate_expr` then returns None.
+"""
+
+from __future__ import annotations
+
+import ast
+import math
+from collections.abc import Callable, Mapping
+from typing import Any, NamedTuple
+
+from simpleeval import MAX_STRING_LENGTH
+
+from linkml_map.utils.eval_utils import FUNCTIONS, _parse_cached
+
+#: Decimal digits an integer may reach before ``HUGEINT`` (about 1.7e38) could overflow.
+_MAX_INT_DIGITS = 38
+
+#: Integers mixed with floats must convert to ``DOUBLE`` exactly.
+_MAX_EXACT_FLOAT_DIGITS = 15
+
+#: Bound on the decimal exponent of float results, far from ``DOUBLE`` overflow.
+_MAX_FLOAT_DIGITS = 300
+
+#: Values the column guards admit have at most this many digits on each side of the point.
+_COLUMN_DIGITS = 15
+
+_INT_PATTERN = f"-?[0-9]{{1,{_COLUMN_DIGITS}}}"
+_FLOAT_PATTERN = rf"-?[0-9]{{1,{_COLUMN_DIGITS}}}\.[0-9]{{1,{_COLUMN_DIGITS}}}"
+
+#: Characters that can occur in a string ``int()`` or ``float()`` accept (digits,
+#: whitespace, signs, ``.``, ``_``, exponents, ``inf``/``infinity``/``nan``). A
+#: value with an ASCII digit stays a string only if it has some other character.
+_NOT_NUMERIC_CHAR = r"[^\p{Nd}\p{Z}\t\n\x0b\x0c\r\x1c-\x1f\x{85}+\-._eEiInNfFtTyYaA]"
+
+_NUMERIC = frozenset({"int", "float"})
+
+#: How an argument of each kind is passed to a UDF. Integers go as ``BIGINT``
+#: (Arrow has no exact 128-bit integer for Python), so they must fit in it.
+_UDF_PARAMS = {
+    "int": "CAST({} AS BIGINT)",
+    "float": "{}",
+    "str": "{}",
+    "bool": "{}",
+    "null": "CAST({} AS VARCHAR)",
+}
+_MAX_UDF_INT_DIGITS = 18
+
+#: Digits of the numbers a UDF returns (see :class:`SqlFunction`).
+_UDF_RESULT_DIGITS = 15
+
+
+class SqlColumn(NamedTuple):
+    """A source column an expression name resolves to.
+
+    :param sql: SQL expression for the column's raw VARCHAR value, or ``NULL``
+        for a column that is absent (the name then evaluates to None).
+    :param kind: Type the column's values are expected to parse to: ``"int"``,
+        ``"float"`` or ``"str"``. Rows where they do not are left to Python.
+    """
+
+    sql: str
+    kind: str = "str"
+
+
+class SqlExpr(NamedTuple):
+    """A translated expression.
+
+    :param sql: SQL computing the expression's value. Only meaningful where
+        *guard* is true.
+    :param guard: SQL predicate that is true for rows whose value *sql*
+        computes exactly (``TRUE`` when it always does).
+    """
+
+    sql: str
+    guard: str
+
+
+class SqlFunction(NamedTuple):
+    """A DuckDB UDF that runs a Python function of the expression namespace.
+
+    The UDF must return the function's result where it is a value of *kind*
+    (with integers and floats below 10**15 in magnitude), and NULL where the
+    function returns anything else or raises; such rows are evaluated in Python.
+
+    :param name: SQL name of the UDF.
+    :param kind: ``"str"``, ``"int"``, ``"float"`` or ``"bool"``.
+    :param strict: The function returns None whenever an argument is None.
+    """
+
+    name: str
+    kind: str
+    strict: bool = False
+
+
+class NotTranslatable(Exception):
+    """Raised internally when an expression uses syntax outside the translatable subset."""
+
+
+class _Sql(NamedTuple):
+    sql: str
+    kind: str  # "int" | "float" | "str" | "bool" | "null"
+    guards: tuple[str, ...] = ()
+    digits: int = 0  # bound on the number of integer digits of a numeric value
+    scale: int | None = None  # a nonzero numeric value is at least 10**-scale in magnitude, if known
+
+
+_NULL = _Sql("NULL", "null")
+
+
+class _CallGuard(str):
+    """A guard that checks the result of a UDF call (see :func:`translate_expr`)."""
+
+    __slots__ = ()
+
+
+def translate_expr(
+    expr: str,
+    functions: Mapping[str, Any],
+    bind: Callable[[str, str | None], SqlColumn | None],
+    udf: Callable[[str, tuple[str, ...]], SqlFunction | None] | None = None,
+) -> SqlExpr | None:
+    """
+    Translate *expr* into DuckDB SQL, or return None if it is outside the subset.
+
+    :param expr: The expression string.
+    :param functions: The full function namespace (built-ins and extensions);
+        a built-in is only translated if it has not been overridden.
+    :param bind: Returns the column a name resolves to, called as
+        ``bind(name, None)`` for ``name``/``{name}`` and ``bind(table, attr)``
+        for ``{table.attr}``; None makes the expression untranslatable.
+    :param udf: Called as ``udf(name, argument_kinds)`` for a call that has
+        no SQL equivalent; returns the DuckDB UDF running the Python function
+        (see :class:`SqlFunction`), or None to leave the expression untranslatable.
+    """
+    try:
+        tree = _parse_cached(expr)
+    except Exception:  # noqa: BLE001 - the evaluator reports syntax errors
+        return None
+    if not isinstance(tree, ast.Expr):
+        return None
+    try:
+        result = _Translator(functions, bind, udf).translate(tree.value)
+    except NotTranslatable:
+        return None
+    guards = list(dict.fromkeys(result.guards))
+    calls = [g for g in guards if isinstance(g, _CallGuard)]
+    if calls:
+        # DuckDB shares a UDF call between the guard and the value only where
+        # the guard evaluates it unconditionally: in the first conjunct of the
+        # AND, not in a later one, which only sees rows the earlier ones passed.
+        # So all call checks form the first conjunct, as one list.
+        first = calls[0] if len(calls) == 1 else f"list_bool_and([{', '.join(calls)}])"
+        guards = [first, *(g for g in guards if not isinstance(g, _CallGuard))]
+    return SqlExpr(result.sql, " AND ".join(guards) or "TRUE")
+
+
+def _literal(value: str) -> str:
+    return "'" + value.replace("'", "''") + "'"
+
+
+def _int_digits(value: int) -> int:
+    return len(str(abs(value)))
+
+
+def _bounds(values: list[_Sql]) -> tuple[int, int | None]:
+    """Magnitude bounds (digits, scale) of a value that is one of *values*."""
+    numeric = [v for v in values if v.kind != "null"]
+    digits = max((v.digits for v in numeric), default=0)
+    scales = [v.scale for v in numeric]
+    scale = None if None in scales else max(scales, default=0)
+    return digits, scale
+
+
+class _Translator:
+    def __init__(
+        self,
+        functions: Mapping[str, Any],
+        bind: Callable[[str, str | None], SqlColumn | None],
+        udf: Callable[[str, tuple[str, ...]], SqlFunction | None] | None,
+    ) -> None:
+        self.functions = functions
+        self.bind = bind
+        self.udf = udf
+
+    def translate(self, node: ast.AST) -> _Sql:  # noqa: PLR0911
+        if isinstance(node, ast.Constant):
+            return self._constant(node.value)
+        if isinstance(node, ast.Name):
+            return self._name(node.id, None)
+        if isinstance(node, ast.Set):
+            if len(node.elts) != 1:
+                raise NotTranslatable
+            [elt] = node.elts
+            if isinstance(elt, ast.Name):
+                return self._name(elt.id, None)
+            if isinstance(elt, ast.Attribute) and isinstance(elt.value, ast.Name):
+                return self._name(elt.value.id, elt.attr)
+            raise NotTranslatable
+        if isinstance(node, ast.Attribute) and isinstance(node.value, ast.Name):
+            return self._name(node.value.id, node.attr)
+        if isinstance(node, ast.BinOp):
+            return self._binop(node.op, self.translate(node.left), self.translate(node.right))
+        if isinstance(node, ast.UnaryOp):
+            return self._unaryop(node.op, self.translate(node.operand))
+        if isinstance(node, ast.Compare):
+            if len(node.ops) != 1:
+                raise NotTranslatable
+            return self._compare(node.ops[0], self.translate(node.left), self.translate(node.comparators[0]))
+        if isinstance(node, ast.IfExp):
+            test = self._condition(self.translate(node.test))
+            return self._choice([(test, self.translate(node.body))], self.translate(node.orelse))
+        if isinstance(node, ast.Call):
+            return self._call(node)
+        raise NotTranslatable
+
+    def _constant(self, value: Any) -> _Sql:  # noqa: ANN401
+        if value is None:
+            return _NULL
+        if isinstance(value, bool):
+            return _Sql("TRUE" if value else "FALSE", "bool")
+        if isinstance(value, int):
+            digits = _int_digits(value)
+            if digits > _MAX_INT_DIGITS:
+                raise NotTranslatable
+            return _Sql(f"CAST({value} AS HUGEINT)", "int", digits=digits, scale=0)
+        if isinstance(value, float):
+            if not math.isfinite(value):
+                raise NotTranslatable
+            exponent = math.floor(math.log10(abs(value))) if value else 0
+            return _Sql(f"CAST('{value!r}' AS DOUBLE)", "float", digits=max(1, exponent + 1), scale=max(0, -exponent))
+        if isinstance(value, str):
+            if len(value) > MAX_STRING_LENGTH or "\x00" in value:
+                raise NotTranslatable
+            return _Sql(_literal(value), "str")
+        raise NotTranslatable
+
+    def _name(self, name: str, attr: str | None) -> _Sql:
+        if name == "NULL" and attr is None:
+            return _NULL
+        if attr is not None and attr.startswith("_"):
+            raise NotTranslatable
+        column = self.bind(name, attr)
+        if column is None:
+            raise NotTranslatable
+        ref = column.sql
+        if ref == "NULL":
+            return _NULL
+        if column.kind == "int":
+            match = f"regexp_full_match({ref}, '{_INT_PATTERN}')"
+            return _Sql(
+                f"CASE WHEN {match} THEN CAST({ref} AS HUGEINT) END",
+                "int",
+                (f"({ref} IS NULL OR {match})",),
+                _COLUMN_DIGITS,
+                0,
+            )
+        if column.kind == "float":
+            match = f"regexp_full_match({ref}, '{_FLOAT_PATTERN}')"
+            return _Sql(
+                f"CASE WHEN {match} THEN CAST({ref} AS DOUBLE) END",
+                "float",
+                (f"({ref} IS NULL OR {match})",),
+                _COLUMN_DIGITS,
+                _COLUMN_DIGITS,
+            )
+        guard = f"({ref} IS NULL OR NOT regexp_matches({ref}, '[0-9]') OR regexp_matches({ref}, '{_NOT_NUMERIC_CHAR}'))"
+        return _Sql(ref, "str", (guard,))
+
+    def _binop(self, op: ast.operator, left: _Sql, right: _Sql) -> _Sql:
+        guards = left.guards + right.guards
+        if left.kind == "null" or right.kind == "null":
+            # Null propagation; the other operand is still evaluated by Python.
+            if not isinstance(op, ast.Add | ast.Sub | ast.Mult | ast.Div):
+                raise NotTranslatable
+            return _Sql("NULL", "null", guards)
+        if isinstance(op, ast.Add) and left.kind == right.kind == "str":
+            limit = f"coalesce(length({left.sql}) + length({right.sql}) <= {MAX_STRING_LENGTH}, TRUE)"
+            return _Sql(f"({left.sql} || {right.sql})", "str", (*guards, limit))
+        if left.kind not in _NUMERIC or right.kind not in _NUMERIC:
+            raise NotTranslatable
+        if isinstance(op, ast.Div):
+            return self._divide(left, right, guards)
+        symbol = {ast.Add: "+", ast.Sub: "-", ast.Mult: "*"}.get(type(op))
+        if symbol is None:
+            raise NotTranslatable
+        digits = left.digits + right.digits if symbol == "*" else max(left.digits, right.digits) + 1
+        if left.kind == right.kind == "int":
+            if digits > _MAX_INT_DIGITS:
+                raise NotTranslatable
+            return _Sql(f"({left.sql} {symbol} {right.sql})", "int", guards, digits)
+        if digits > _MAX_FLOAT_DIGITS:
+            raise NotTranslatable
+        return _Sql(f"({self._double(left)} {symbol} {self._double(right)})", "float", guards, digits)
+
+    def _divide(self, left: _Sql, right: _Sql, guards: tuple[str, ...]) -> _Sql:
+        # The quotient is bounded only if the divisor's magnitude is bounded below.
+        if right.scale is None:
+            raise NotTranslatable
+        digits = left.digits + right.scale + 1
+        if digits > _MAX_FLOAT_DIGITS:
+            raise NotTranslatable
+        nonzero = f"coalesce({right.sql} <> 0, TRUE)"
+        return _Sql(f"({self._double(left)} / {self._double(right)})", "float", (*guards, nonzero), digits)
+
+    @staticmethod
+    def _double(operand: _Sql) -> str:
+        if operand.kind == "float":
+            return operand.sql
+        if operand.digits > _MAX_EXACT_FLOAT_DIGITS:
+            raise NotTranslatable
+        return f"CAST({operand.sql} AS DOUBLE)"
+
+    @staticmethod
+    def _unaryop(op: ast.unaryop, operand: _Sql) -> _Sql:
+        if operand.kind == "null" and isinstance(op, ast.USub | ast.UAdd):
+            return operand
+        if operand.kind not in _NUMERIC:
+            raise NotTranslatable
+        if isinstance(op, ast.USub):
+            return operand._replace(sql=f"(-{operand.sql})")
+        if isinstance(op, ast.UAdd):
+            return operand
+        raise NotTranslatable
+
+    def _compare(self, op: ast.cmpop, left: _Sql, right: _Sql) -> _Sql:
+        guards = left.guards + right.guards
+        kinds = {left.kind, right.kind} - {"null"}
+        if len(kinds) > 1 and kinds != _NUMERIC:
+            raise NotTranslatable
+        if kinds == _NUMERIC:
+            left = left._replace(sql=self._double(left))
+            right = right._replace(sql=self._double(right))
+        if isinstance(op, ast.Eq):
+            return _Sql(f"({left.sql} IS NOT DISTINCT FROM {right.sql})", "bool", guards)
+        if isinstance(op, ast.NotEq):
+            return _Sql(f"({left.sql} IS DISTINCT FROM {right.sql})", "bool", guards)
+        symbol = {ast.Lt: "<", ast.LtE: "<=", ast.Gt: ">", ast.GtE: ">="}.get(type(op))
+        if symbol is None:
+            raise NotTranslatable
+        if "null" in (left.kind, right.kind):
+            return _Sql("NULL", "null", guards)
+        return _Sql(f"({left.sql} {symbol} {right.sql})", "bool", guards)
+
+    @staticmethod
+    def _condition(test: _Sql) -> _Sql:
+        # Only a boolean (or null) condition has the same truthiness in SQL.
+        if test.kind not in ("bool", "null"):
+            raise NotTranslatable
+        return test
+
+    @staticmethod
+    def _same_kind(values: list[_Sql]) -> str:
+        kinds = {v.kind for v in values} - {"null"}
+        if len(kinds) > 1:
+            raise NotTranslatable
+        return kinds.pop() if kinds else "null"
+
+    def _choice(self, branches: list[tuple[_Sql, _Sql]], default: _Sql) -> _Sql:
+        values = [value for _, value in branches] + [default]
+        kind = self._same_kind(values)
+        guards = tuple(g for test, value in branches for g in test.guards + value.guards) + default.guards
+        whens = " ".join(f"WHEN {test.sql} THEN {value.sql}" for test, value in branches)
+        return _Sql(f"CASE {whens} ELSE {default.sql} END", kind, guards, *_bounds(values))
+
+    def _call(self, node: ast.Call) -> _Sql:
+        if not isinstance(node.func, ast.Name) or node.keywords:
+            raise NotTranslatable
+        if any(isinstance(a, ast.Starred) for a in node.args):
+            raise NotTranslatable
+        name = node.func.id
+        builtin = name in FUNCTIONS and self.functions.get(name) is FUNCTIONS[name]
+        if builtin and name == "case":
+            branches = []
+            for arg in node.args:
+                if not isinstance(arg, ast.Tuple) or len(arg.elts) != 2:  # noqa: PLR2004
+                    raise NotTranslatable
+                cond, value = arg.elts
+                branches.append((self._condition(self.translate(cond)), self.translate(value)))
+            if not branches:
+                return _NULL
+            return self._choice(branches, _NULL)
+        args = [self.translate(a) for a in node.args]
+        translated = self._builtin(name, args) if builtin else None
+        return translated if translated is not None else self._python_call(name, args)
+
+    def _builtin(self, name: str, args: list[_Sql]) -> _Sql | None:
+        """SQL for a built-in call, or None if it has no exact SQL equivalent."""
+        if name == "coalesce":
+            if not args:
+                return _NULL
+            kind = self._same_kind(args)
+            guards = tuple(g for a in args for g in a.guards)
+            if len(args) == 1:
+                return args[0]
+            return _Sql(f"coalesce({', '.join(a.sql for a in args)})", kind, guards, *_bounds(args))
+        if len(args) != 1:
+            return None
+        [arg] = args
+        if arg.kind == "null" and name in ("upper", "lower", "str"):
+            return arg
+        if name in ("upper", "lower") and arg.kind == "str":
+            ascii_only = f"coalesce(NOT regexp_matches({arg.sql}, '[[:^ascii:]]'), TRUE)"
+            return _Sql(f"{name}({arg.sql})", "str", (*arg.guards, ascii_only))
+        if name == "str" and arg.kind == "str":
+            return arg
+        if name == "str" and arg.kind == "int":
+            return _Sql(f"CAST({arg.sql} AS VARCHAR)", "str", arg.guards)
+        return None
+
+    def _python_call(self, name: str, args: list[_Sql]) -> _Sql:
+        """Call the Python function *name* through a UDF, if the ``udf`` hook provides one."""
+        if self.udf is None or not args:
+            raise NotTranslatable
+        if any(a.kind == "int" and a.digits > _MAX_UDF_INT_DIGITS for a in args):
+            raise NotTranslatable
+        function = self.udf(name, tuple(a.kind for a in args))
+        if function is None:
+            raise NotTranslatable
+        params = [_UDF_PARAMS[a.kind].format(a.sql) for a in args]
+        call = f"{function.name}({', '.join(params)})"
+        # NULL is the UDF's answer for "evaluate in Python" as well as for a
+        # None result, which is only known to be exact for NULL arguments of a
+        # strict function.
+        exact = [f"{call} IS NOT NULL"]
+        if function.strict:
+            exact.extend(f"{a.sql} IS NULL" for a in args)
+        guards = (*(g for a in args for g in a.guards), _CallGuard(f"({' OR '.join(exact)})"))
+        if function.kind in _NUMERIC:
+            return _Sql(call, function.kind, guards, _UDF_RESULT_DIGITS, 0 if function.kind == "int" else None)
+        return _Sql(call, function.kind, guards)
@@ -0,0 +1,228 @@
+"""Run expression functions inside DuckDB as vectorized Python UDFs.
+
+The join engine computes ``expr:`` slot derivations in its query where
+:func:`~linkml_map.utils.expr_sql.translate_expr` can express them in SQL.
+Calls to functions with no SQL equivalent (``slugify``, ``uuid5``, the
+inflection case conversions, extension functions) can still be part of such a
+query: :class:`ExprUdfs` registers the Python function as a DuckDB Arrow UDF,
+which DuckDB calls once per vector of rows (2,048 by default) rather than once
+per row, and which calls the function once per distinct argument tuple of the
+vector.
+
+Only functions whose result is a known scalar type are registered:
+
+- built-ins returning a string, integer, float or boolean (list functions,
+  ``round`` and ``abs`` are not);
+- extensions declared ``@safe_function(pure=True)`` with a ``str``, ``int``,
+  ``float`` or ``bool`` return annotation (DuckDB may call them in any order
+  and on several threads). Batch functions are excluded; they are prefetched
+  per chunk instead.
+
+The UDF returns NULL where the function raises or returns a value of another
+type, and the row is then evaluated in Python, which reports any error as
+before. Arrow UDFs need ``pyarrow`` and ``numpy``, installed by the optional
+``arrow`` extra; without them (see :func:`arrow_udfs_available`) these
+expressions are evaluated in Python.
+"""
+
+from __future__ import annotations
+
+import inspect
+import itertools
+import logging
+import types
+import typing
+from collections.abc import Callable, Mapping
+from functools import lru_cache
+from importlib.util import find_spec
+from typing import TYPE_CHECKING, Any
+
+from linkml_map.utils.eval_utils import _SCALAR_FUNCTIONS, FUNCTIONS
+from linkml_map.utils.expr_sql import SqlFunction
+from linkml_map.utils.extensions import batch_function, is_pure
+
+if TYPE_CHECKING:
+    import duckdb
+
+logger = logging.getLogger(__name__)
+
+#: Result kinds of the built-ins that can run as UDFs.
+_BUILTIN_KINDS: dict[str, str] = {
+    **dict.fromkeys(
+        [
+            "str",
+            "uuid5",
+            "substr",
+            "upper",
+            "lower",
+            "title",
+            "capitalize",
+            "strip",
+            "lstrip",
+            "rstrip",
+            "replace",
+            "slugify",
+            "to_snake",
+            "to_camel",
+            "to_pascal",
+        ],
+        "str",
+    ),
+    **dict.fromkeys(["int", "floor", "ceil", "strlen"], "int"),
+    "float": "float",
+    **dict.fromkeys(
+        [
+            "bool",
+            "startswith",
+            "endswith",
+            "contains",
+            "is_str",
+            "is_int",
+            "is_float",
+            "is_bool",
+            "is_list",
+            "is_numeric",
+        ],
+        "bool",
+    ),
+}
+
+_ANNOTATION_KINDS: dict[Any, str] = {str: "str", int: "int", float: "float", bool: "bool"}
+_KIND_TYPES: dict[str, type] = {"str": str, "int": int, "float": float, "bool": bool}
+_SQL_TYPES: dict[str, str] = {
+    "str": "VARCHAR",
+    "int": "BIGINT",
+    "float": "DOUBLE",
+    "bool": "BOOLEAN",
+    "null": "VARCHAR",
+}
+
+#: Bound on the magnitude of numeric results (see :class:`~linkml_map.utils.expr_sql.SqlFunction`).
+_NUMERIC_LIMIT = 10**15
+
+_udf_ids = itertools.count()
+
+
+@lru_cache(None)
+def arrow_udfs_available() -> bool:
+    """Whether DuckDB can run Arrow UDFs here (it needs ``pyarrow`` and ``numpy``)."""
+    return find_spec("pyarrow") is not None and find_spec("numpy") is not None
+
+
+def result_kind(name: str, func: Callable) -> str | None:
+    """The kind of value *func* (bound to *name* in the eval namespace) returns, or None if unknown or unsafe."""
+    if func is FUNCTIONS.get(name):
+        return _BUILTIN_KINDS.get(name)
+    if not is_pure(func) or batch_function(func) is not None:
+        return None
+    try:
+        annotation = inspect.signature(func, eval_str=True).return_annotation
+    except Exception:  # noqa: BLE001 - an unresolvable annotation is no annotation
+        return None
+    if isinstance(annotation, types.UnionType) or typing.get_origin(annotation) is typing.Union:
+        options = [a for a in typing.get_args(annotation) if a is not type(None)]
+    else:
+        options = [annotation]
+    kinds = {_ANNOTATION_KINDS.get(a) for a in options}
+    return kinds.pop() if len(kinds) == 1 else None
+
+
+class ExprUdfs:
+    """
+    The UDFs registered on a connection for one query.
+
+    Pass an instance as the ``udf`` hook of
+    :func:`~linkml_map.utils.expr_sql.translate_expr`: each call registers (at
+    most once per function and argument kinds) a UDF running the function of
+    that name from *functions*. :meth:`close` removes them.
+    """
+
+    def __init__(self, con: duckdb.DuckDBPyConnection, functions: Mapping[str, Any]) -> None:
+        self.con = con
+        self.functions = functions
+        self.registered: dict[tuple[str, tuple[str, ...]], SqlFunction] = {}
+
+    def __call__(self, name: str, arg_kinds: tuple[str, ...]) -> SqlFunction | None:
+        key = (name, arg_kinds)
+        if key in self.registered:
+            return self.registered[key]
+        func = self.functions.get(name)
+        kind = None if func is None else result_kind(name, func)
+        if kind is None:
+            return None
+        sql_name = f"__linkml_udf_{next(_udf_ids)}"
+        self.con.create_function(
+            sql_name,
+            _vectorized(func, kind, len(arg_kinds)),
+            [self.con.type(_SQL_TYPES[k]) for k in arg_kinds],
+            self.con.type(_SQL_TYPES[kind]),
+            type="arrow",
+            null_handling="special",
+            side_effects=False,
+        )
+        strict = name in _SCALAR_FUNCTIONS and func is FUNCTIONS[name]
+        function = self.registered[key] = SqlFunction(sql_name, kind, strict)
+        logger.debug("Registered %s(%s) as DuckDB UDF %s", name, ", ".join(arg_kinds), sql_name)
+        return function
+
+    def close(self) -> None:
+        """Remove the registered UDFs from the connection."""
+        for function in self.registered.values():
+            self.con.remove_function(function.name)
+        self.registered.clear()
+
+
+def _vectorized(func: Callable, kind: str, arity: int) -> Callable:
+    """
+    Wrap *func* as an Arrow UDF of *arity* columns returning NULL wherever its result is not of *kind*.
+
+    The function is pure, so it is called once per distinct argument tuple of
+    a vector: each column is dictionary-encoded, the tuples of codes are
+    deduplicated with numpy, and the results are spread back over the rows
+    with ``take``.
+    """
+    import numpy as np
+    import pyarrow as pa
+    import pyarrow.compute as pc
+
+    arrow_type = {"str": pa.string(), "int": pa.int64(), "float": pa.float64(), "bool": pa.bool_()}[kind]
+    expected = _KIND_TYPES[kind]
+    numeric = kind in ("int", "float")
+
+    def accept(value: Any) -> bool:  # noqa: ANN401
+        if type(value) is not expected:
+            return False
+        if numeric:
+            return -_NUMERIC_LIMIT < value < _NUMERIC_LIMIT  # also rejects NaN
+        if kind == "str" and not value.isascii():
+            try:
+                value.encode()
+            except UnicodeEncodeError:  # e.g. lone surrogates, which Arrow cannot hold
+                return False
+        return True
+
+    def call(args: tuple) -> Any:  # noqa: ANN401
+        try:
+            value = func(*args)
+        except Exception:  # noqa: BLE001 - the row is evaluated in Python, which reports the error
+            return None
+        return value if accept(value) else None
+
+    def udf(*columns: Any) -> Any:  # noqa: ANN401 - DuckDB resolves annotations, which cannot name pyarrow here
+        values, codes = [], []
+        for column in columns:
+            if isinstance(column, pa.ChunkedArray):
+                column = column.combine_chunks()  # noqa: PLW2901
+            encoded = pc.dictionary_encode(column)
+            # NULL gets the code after the last dictionary entry.
+            values.append([*encoded.dictionary.to_pylist(), None])
+            codes.append(encoded.indices.fill_null(len(encoded.dictionary)).to_numpy(zero_copy_only=False))
+        distinct, rows = np.unique(np.stack(codes, axis=1), axis=0, return_inverse=True)
+        results = [call(tuple(v[c] for v, c in zip(values, key, strict=True))) for key in distinct.tolist()]
+        return pa.array(results, type=arrow_type).take(pa.array(rows.reshape(-1)))
+
+    # DuckDB checks the declared parameter types against the signature.
+    udf.__signature__ = inspect.Signature(
+        [inspect.Parameter(f"arg{i}", inspect.Parameter.POSITIONAL_ONLY) for i in range(arity)]
+    )
+    return udf
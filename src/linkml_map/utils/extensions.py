@@ -28,6 +28,14 @@ A user-supplied ``my_helpers.py``::
     def my_aggregator(items):
         ...
 
+    @safe_function(pure=True)  # result depends only on the arguments; may be memoized
+    def normalize_code(code):
+        ...
+
+    @safe_function(batch=True)  # called once per chunk with a list of argument tuples
+    def ontology_label(arg_tuples):
+        ...
+
 Then::
 
     linkml-map map-data ... --functions ./my_helpers.py
@@ -56,6 +64,8 @@ from typing import Any
 from linkml_map.utils.eval_utils import FUNCTIONS, _distributing
 
 _SAFE_FUNCTION_ATTR = "_linkml_safe_function"
+_PURE_ATTR = "_linkml_pure"
+_BATCH_ATTR = "_linkml_batch"
 
 #: Names injected per-call by the transformer (e.g. ``slot``). Extensions cannot
 #: use these — they would be silently shadowed at expression-evaluation time.
@@ -73,6 +83,8 @@ def safe_function(
     *,
     override: bool = False,
     distributes: bool = True,
+    pure: bool = False,
+    batch: bool = False,
 ) -> Callable:
     """Tag a function for inclusion in the safe-function namespace.
 
@@ -93,10 +105,20 @@ def safe_function(
     :param distributes: Apply the scalar-distributing wrapper (broadcasts over
         lists, propagates ``None``). Default ``True``; set ``False`` for
         functions that accept a list as their first argument.
+    :param pure: Declare that the result depends only on the arguments (no
+        randomness, clock, counters or other state), so that
+        ``map-data --memoize-expressions`` may reuse results of expressions
+        calling it. See :mod:`linkml_map.utils.expr_memo`.
+    :param batch: The function takes a list of argument tuples and returns a
+        list of results, one per tuple, in order. Expressions still call it
+        with scalar arguments; the engine collects the argument tuples for a
+        whole chunk of rows up front and calls the function once per chunk.
+        See :class:`BatchFunction`.
     """
 
     def _tag(fn: Callable) -> Callable:
-        setattr(fn, _SAFE_FUNCTION_ATTR, {"override": override, "distributes": distributes})
+        meta = {"override": override, "distributes": distributes, "pure": pure, "batch": batch}
+        setattr(fn, _SAFE_FUNCTION_ATTR, meta)
         return fn
 
     if func is not None:
@@ -105,6 +127,84 @@ def safe_function(
     return _tag
 
 
+def is_pure(func: Callable) -> bool:
+    """Whether *func* was loaded from an extension declared ``@safe_function(pure=True)``."""
+    return getattr(func, _PURE_ATTR, False) is True
+
+
+def batch_function(func: Callable) -> BatchFunction | None:
+    """The :class:`BatchFunction` behind a loaded extension, or None if *func* is not batched."""
+    return getattr(func, _BATCH_ATTR, None)
+
+
+class BatchFunction:
+    """Scalar-callable adapter for a ``@safe_function(batch=True)`` extension.
+
+    Expressions call it like any other function, one argument tuple at a time.
+    Before a chunk of rows is mapped, the transformer hands it every argument
+    tuple the chunk will need (:meth:`prefetch`); the wrapped function is then
+    called once for the distinct, not yet computed tuples and per-row calls are
+    answered from the results. A call whose arguments were not prefetched (or
+    are unhashable) falls back to a one-element batch, so results never depend
+    on whether prefetching happened. If the prefetch call itself raises, the
+    error is kept until the next chunk and every per-row call re-raises it
+    instead of calling the wrapped function again.
+    """
+
+    def __init__(self, func: Callable[[list[tuple]], list], name: str) -> None:
+        self.func = func
+        self.__name__ = name
+        self.__doc__ = func.__doc__
+        self.results: dict[tuple, Any] = {}
+        self.batches = 0
+        """Number of calls made to the wrapped function."""
+        self.error: Exception | None = None
+        """The exception raised by the last :meth:`prefetch`, until :meth:`clear`."""
+
+    def __call__(self, *args: Any) -> Any:
+        if self.error is not None:
+            msg = f"Batch function {self.__name__!r} failed for this chunk: {type(self.error).__name__}: {self.error}"
+            raise RuntimeError(msg) from self.error
+        try:
+            return self.results[args]
+        except (KeyError, TypeError):
+            return self._call([args])[0]
+
+    def prefetch(self, arg_tuples: Iterable[tuple]) -> None:
+        """Compute results for all distinct *arg_tuples* not already known, in one call."""
+        pending: dict[tuple, None] = {}
+        for args in arg_tuples:
+            try:
+                if args not in self.results:
+                    pending[args] = None
+            except TypeError:  # unhashable arguments are answered per call
+                continue
+        if pending:
+            todo = list(pending)
+            try:
+                results = self._call(todo)
+            except Exception as err:
+                self.error = err
+                raise
+            self.results.update(zip(todo, results, strict=True))
+
+    def clear(self) -> None:
+        """Forget prefetched results and any prefetch error (called between chunks)."""
+        self.results.clear()
+        self.error = None
+
+    def _call(self, arg_tuples: list[tuple]) -> list:
+        self.batches += 1
+        results = list(self.func(arg_tuples))
+        if len(results) != len(arg_tuples):
+            msg = (
+                f"Batch function {self.__name__!r} returned {len(results)} results "
+                f"for {len(arg_tuples)} argument tuples"
+            )
+            raise ValueError(msg)
+        return results
+
+
 def _load_module_from_path(path: Path) -> ModuleType:
     """Import a Python file as an anonymous module.
 
@@ -155,7 +255,8 @@ def load_extensions(paths: Iterable[str | Path]) -> dict[str, Callable]:
 
     Applies the scalar-distributing wrapper to functions declared with
     ``distributes=True`` (the default), so they broadcast over lists and
-    propagate ``None`` consistently with the built-ins.
+    propagate ``None`` consistently with the built-ins. Functions declared with
+    ``batch=True`` are wrapped in a :class:`BatchFunction` first.
 
     :param paths: Iterable of file paths to ``.py`` modules with tagged functions.
     :returns: Mapping of ``name → callable`` ready to merge into
@@ -197,8 +298,15 @@ def load_extensions(paths: Iterable[str | Path]) -> dict[str, Callable]:
                 )
 
             fn = meta["func"]
+            batched = None
+            if meta.get("batch"):
+                fn = batched = BatchFunction(fn, name)
             if meta["distributes"]:
                 fn = _distributing(fn)
+            if batched is not None:
+                setattr(fn, _BATCH_ATTR, batched)
+            if meta.get("pure"):
+                setattr(fn, _PURE_ATTR, True)
             merged[name] = fn
             sources[name] = path
 
@@ -1,10 +1,14 @@
 """Utilities for resolving foreign key paths in LinkML schemas."""
 
-from typing import NamedTuple
+from __future__ import annotations
+
+from typing import Any, NamedTuple
 
 from linkml_runtime import SchemaView
 from linkml_runtime.linkml_model import SlotDefinition
 
+from linkml_map.utils.dynamic_object import identifier_slot_name, slot_info
+
 
 class FKResolution(NamedTuple):
     """Result of resolving a dot-notation FK path."""
@@ -65,3 +69,148 @@ def resolve_fk_path(schemaview: SchemaView, source_class: str, path: str) -> FKR
             break
 
     return FKResolution(fk_slot_name, target_class, remaining_path, final_slot)
+
+
+class FKIndex:
+    """
+    Identifier index over a container object, for dereferencing foreign keys.
+
+    Built once by :meth:`~linkml_map.transformer.object_transformer.ObjectTransformer.index`:
+    every object whose type is a schema class and that has an identifier (or
+    key) value is stored under ``(class name, str(identifier))``. Lookups are
+    plain dict accesses, so unlike ``ObjectIndex.bless`` there is no proxy
+    cache to keep consistent between rows.
+    """
+
+    def __init__(self, root: Any, schemaview: SchemaView) -> None:
+        self.schemaview = schemaview
+        self._class_map = schemaview.class_name_mappings()
+        self._objects: dict[tuple[str, str], Any] = {}
+        self._add(root)
+
+    def __len__(self) -> int:
+        return len(self._objects)
+
+    def _add(self, obj: Any) -> None:
+        if obj is None or isinstance(obj, str | int | float | bool):
+            return
+        if isinstance(obj, list):
+            for v in obj:
+                self._add(v)
+            return
+        if isinstance(obj, dict):
+            for v in obj.values():
+                self._add(v)
+            return
+        cls = self._class_map.get(type(obj).__name__)
+        if cls is None:
+            return
+        id_slot_name = identifier_slot_name(self.schemaview, cls.name)
+        if id_slot_name is not None:
+            id_val = getattr(obj, id_slot_name, None)
+            if id_val is not None:
+                self._objects[(cls.name, str(id_val))] = obj
+        for v in vars(obj).values():
+            self._add(v)
+
+    def get(self, class_name: str, identifier: Any) -> Any:
+        """Return the object of *class_name* with *identifier*, or None."""
+        return self._objects.get((class_name, str(identifier)))
+
+    def resolve(self, class_name: str, identifier: Any, path: str) -> Any:
+        """
+        Dereference *identifier* and walk the dot-separated *path* from it.
+
+        Intermediate segments that hold a reference to another indexed class
+        are dereferenced in turn; the final segment is returned as stored.
+        Returns None as soon as a reference is dangling or a value is missing.
+        """
+        obj = self.get(class_name, identifier)
+        segments = path.split(".")
+        for i, attr in enumerate(segments):
+            if obj is None:
+                return None
+            v = obj.get(attr) if isinstance(obj, dict) else getattr(obj, attr, None)
+            if i == len(segments) - 1 or v is None:
+                return v
+            rng = _slot_info_or_none(self.schemaview, attr, class_name)[0]
+            if isinstance(v, str | int) and rng in self._class_map:
+                obj = self.get(rng, v)
+            else:
+                obj = v
+            class_name = rng
+        return obj
+
+    def view(self, obj: Any, class_name: str) -> FKView:
+        """Wrap *obj* (a dict or object) so that attribute access follows references."""
+        return FKView(obj, class_name, self)
+
+    def map_value(self, value: Any, slot_range: str | None, *, multivalued: bool = False) -> Any:
+        """
+        Bind *value* of a slot with *slot_range* for expression evaluation.
+
+        References to an indexed class become views of the referenced object
+        (a dangling reference becomes a view holding only its identifier);
+        inlined objects become views; other values are returned unchanged.
+        """
+        if value is None:
+            return None
+        if isinstance(value, list):
+            return [self.map_value(v, slot_range) for v in value]
+        if isinstance(value, dict):
+            if multivalued:
+                return {k: self.map_value(v, slot_range) for k, v in value.items()}
+            return FKView(value, slot_range, self) if slot_range in self._class_map else value
+        cls = self._class_map.get(type(value).__name__)
+        if cls is not None:
+            return FKView(value, cls.name, self)
+        if slot_range in self._class_map and isinstance(value, str | int):
+            target = self.get(slot_range, value)
+            if target is None:
+                id_slot_name = identifier_slot_name(self.schemaview, slot_range)
+                target = {id_slot_name: value} if id_slot_name else {}
+            return FKView(target, slot_range, self)
+        return value
+
+    def bind(self, value: Any, slot_name: str, class_name: str) -> Any:
+        """Bind the value of *slot_name* on an object of *class_name*; see :meth:`map_value`."""
+        slot_range, multivalued = _slot_info_or_none(self.schemaview, slot_name, class_name)
+        return self.map_value(value, slot_range, multivalued=multivalued)
+
+
+class FKView:
+    """
+    Read-only attribute view of a source object that dereferences foreign keys.
+
+    Missing attributes read as None, like :class:`~linkml_map.utils.dynamic_object.DynObj`.
+    """
+
+    __slots__ = ("_class_name", "_index", "_obj")
+
+    def __init__(self, obj: Any, class_name: str, index: FKIndex) -> None:
+        self._obj = obj
+        self._class_name = class_name
+        self._index = index
+
+    def __getattr__(self, p: str) -> Any:
+        if p.startswith("__"):
+            raise AttributeError(p)
+        obj = self._obj
+        return self._index.bind(obj.get(p) if isinstance(obj, dict) else getattr(obj, p, None), p, self._class_name)
+
+    def __str__(self) -> str:
+        obj = self._obj
+        return str(obj if isinstance(obj, dict) else vars(obj))
+
+    def __repr__(self) -> str:
+        return f"FKView({self._class_name}, {self})"
+
+
+def _slot_info_or_none(schemaview: SchemaView, slot_name: str, class_name: str | None) -> tuple[str | None, bool]:
+    """Range and multivalued flag of *slot_name* on *class_name*; ``(None, False)`` when it cannot be induced."""
+    if class_name is None:
+        return None, False
+    try:
+        return slot_info(schemaview, slot_name, class_name)
+    except ValueError:
+        return None, False
@@ -7,12 +7,13 @@ import os
 import re
 import tempfile
 from pathlib import Path
-from typing import Any
-
-import duckdb
+from typing import TYPE_CHECKING, Any
 
 from linkml_map.loaders.data_loaders import FileFormat
 
+if TYPE_CHECKING:
+    import duckdb
+
 logger = logging.getLogger(__name__)
 
 _IDENTIFIER_RE = re.compile(r"^[a-zA-Z_][a-zA-Z0-9_]*$")
@@ -157,6 +158,8 @@ def make_connection() -> duckdb.DuckDBPyConnection:
     so a memory-capped container fails with a catchable error instead of being
     OOM-killed. Shared by :class:`LookupIndex` and the set-based join engine.
     """
+    import duckdb
+
     con = duckdb.connect(":memory:")
     settings = _resolve_duckdb_settings()
     for name, value in settings.items():
@@ -186,6 +189,8 @@ class LookupIndex:
         """
         self._conn = make_connection()
         self._tables: dict[str, str] = {}  # table_name -> key_column
+        self.hits = 0
+        self.misses = 0
 
     def register_table(self, name: str, file_path: Path | str, key_column: str) -> None:
         """
@@ -225,6 +230,8 @@ class LookupIndex:
         :param key_col: Column to match on.
         :param key_val: Value to look up.
         :returns: Row as a dict, or None if not found.
+
+        Each call counts towards ``hits`` or ``misses``.
         """
         _validate_identifier(table)
         _validate_identifier(key_col)
@@ -233,7 +240,9 @@ class LookupIndex:
             [str(key_val)],
         ).fetchone()
         if result is None:
+            self.misses += 1
             return None
+        self.hits += 1
         columns = [desc[0] for desc in self._conn.description]
         return {col: _parse_numeric(val) for col, val in zip(columns, result)}
 
@@ -0,0 +1,206 @@
+"""SQLite-backed row manifest for incremental re-transformation."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import sqlite3
+from collections.abc import Iterable, Iterator, Mapping
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from linkml_runtime import SchemaView
+
+    from linkml_map.datamodel.transformer_model import ClassDerivation
+
+logger = logging.getLogger(__name__)
+
+_READ_BLOCK = 1 << 20
+
+
+def content_digest(obj: Any) -> str:  # noqa: ANN401
+    """Return a stable digest of a JSON-compatible value (key order does not matter)."""
+    payload = json.dumps(obj, sort_keys=True, default=str, separators=(",", ":"))
+    return hashlib.blake2b(payload.encode("utf-8"), digest_size=16).hexdigest()
+
+
+def file_digest(path: str | Path) -> str:
+    """Return a digest of a file's contents."""
+    h = hashlib.blake2b(digest_size=16)
+    with open(path, "rb") as fh:
+        for block in iter(lambda: fh.read(_READ_BLOCK), b""):
+            h.update(block)
+    return h.hexdigest()
+
+
+def joined_tables_salt(paths: Iterable[str | Path]) -> list[list[str]]:
+    """Salt for a block whose joined tables are looked up row by row: their file digests."""
+    return [[str(p), file_digest(p)] for p in paths]
+
+
+def identifier_slot_name(sv: SchemaView | None, class_name: str) -> str | None:
+    """Name of *class_name*'s identifier slot in *sv*, or ``None`` if it has none."""
+    if sv is None or class_name not in sv.all_classes():
+        return None
+    slot = sv.get_identifier_slot(class_name)
+    return slot.name if slot is not None else None
+
+
+def block_key(block_idx: int, class_deriv: ClassDerivation) -> str:
+    """
+    Manifest block key of the *block_idx*-th class derivation of a spec.
+
+    Names alone are not unique: a spec may hold several class derivations of
+    the same name populated from different tables.
+    """
+    return f"{block_idx}:{class_deriv.populated_from or class_deriv.name}:{class_deriv.name}"
+
+
+class RowManifest:
+    """
+    Record, per class derivation, the identity and input digest of every source row.
+
+    A later run over the same (changed) input consults the manifest to
+    transform only rows that are new or whose input changed, and to report
+    rows that disappeared as tombstones. A row's digest covers its own
+    values, the *salt* of its block (see :meth:`start_block`, typically the
+    class derivation itself and any joined tables it depends on), and,
+    in the join engine, the joined rows merged into it.
+
+    All changes happen in one transaction, made durable by :meth:`commit`
+    once the run's outputs are written; closing without committing leaves
+    the previous manifest untouched.
+
+    :param path: SQLite file to create or update.
+    """
+
+    def __init__(self, path: str | Path) -> None:
+        """Open (or create) the manifest database and start a transaction."""
+        self.path = Path(path)
+        # The transform may run on a pipeline thread; access is never concurrent.
+        self._con = sqlite3.connect(str(self.path), isolation_level=None, check_same_thread=False)
+        self._con.execute(
+            "CREATE TABLE IF NOT EXISTS rows ("
+            "block TEXT NOT NULL, row_id TEXT NOT NULL, digest TEXT NOT NULL, target_id TEXT, "
+            "PRIMARY KEY (block, row_id)) WITHOUT ROWID"
+        )
+        self._con.execute(
+            "CREATE TEMP TABLE seen (block TEXT NOT NULL, row_id TEXT NOT NULL, PRIMARY KEY (block, row_id))"
+        )
+        self._con.execute("CREATE TEMP TABLE deleted (block TEXT NOT NULL, row_id TEXT NOT NULL, target_id TEXT)")
+        self._con.execute("BEGIN")
+        self._block: str | None = None
+        self._salt = ""
+        self._names: dict[str, str] = {}
+        self.counts = {"new": 0, "changed": 0, "unchanged": 0, "deleted": 0}
+
+    def start_block(self, block: str, salt: Any = None, name: str | None = None) -> None:  # noqa: ANN401
+        """
+        Begin tracking rows of class derivation *block*.
+
+        :param block: Block key, unique within the spec (see :func:`block_key`).
+        :param salt: JSON-compatible value mixed into every row digest of the
+            block; when it changes, every row of the block counts as changed.
+        :param name: Class derivation name reported in tombstones; defaults
+            to *block*.
+        """
+        self._block = block
+        self._salt = content_digest(salt)
+        self._names[block] = name or block
+
+    def changed(self, row_id: Any, row: Mapping[str, Any]) -> str | None:  # noqa: ANN401
+        """
+        Mark *row_id* as seen and return its digest if it is new or changed.
+
+        Rows without an identifier cannot be tracked and always count as new.
+
+        :param row_id: The row's source identifier value, or ``None``.
+        :param row: The row's input (JSON-compatible).
+        :return: The row digest to pass to :meth:`update`, or ``None`` when
+            the row is unchanged since the manifest was written.
+        """
+        digest = content_digest([self._salt, row])
+        if row_id is None:
+            self.counts["new"] += 1
+            return digest
+        key = str(row_id)
+        self._con.execute("INSERT OR IGNORE INTO seen VALUES (?, ?)", (self._block, key))
+        previous = self._con.execute(
+            "SELECT digest FROM rows WHERE block = ? AND row_id = ?", (self._block, key)
+        ).fetchone()
+        if previous is None:
+            self.counts["new"] += 1
+            return digest
+        if previous[0] == digest:
+            self.counts["unchanged"] += 1
+            return None
+        self.counts["changed"] += 1
+        return digest
+
+    def update(self, row_id: Any, digest: str, target_id: Any = None) -> None:  # noqa: ANN401
+        """Record that *row_id* was transformed from input with *digest*."""
+        if row_id is None:
+            return
+        self._con.execute(
+            "INSERT OR REPLACE INTO rows VALUES (?, ?, ?, ?)",
+            (self._block, str(row_id), digest, None if target_id is None else str(target_id)),
+        )
+
+    def finish_block(self) -> int:
+        """
+        Close the current block, turning rows not seen in it into tombstones.
+
+        Call only after every source row of the block was passed to
+        :meth:`changed`.
+
+        :return: Number of rows removed from the block.
+        """
+        cur = self._con.execute(
+            "INSERT INTO deleted SELECT block, row_id, target_id FROM rows r WHERE block = ? "
+            "AND NOT EXISTS (SELECT 1 FROM seen s WHERE s.block = r.block AND s.row_id = r.row_id)",
+            (self._block,),
+        )
+        removed = cur.rowcount
+        if removed:
+            self._con.execute(
+                "DELETE FROM rows WHERE block = ? AND row_id IN (SELECT row_id FROM deleted WHERE block = ?)",
+                (self._block, self._block),
+            )
+        self.counts["deleted"] += removed
+        logger.debug("Manifest block %s: %d row(s) removed", self._block, removed)
+        self._block = None
+        return removed
+
+    def tombstones(self) -> Iterator[dict[str, Any]]:
+        """Yield one record per row removed since the manifest was written."""
+        for block, row_id, target_id in self._con.execute("SELECT block, row_id, target_id FROM deleted"):
+            record = {"class_derivation": self._names.get(block, block), "id": row_id}
+            if target_id is not None:
+                record["target_id"] = target_id
+            yield record
+
+    def summary(self) -> str:
+        """One-line summary of the row counts."""
+        c = self.counts
+        return f"{c['new']} new, {c['changed']} changed, {c['unchanged']} unchanged, {c['deleted']} deleted"
+
+    def commit(self) -> None:
+        """Make this run's changes durable."""
+        self._con.execute("COMMIT")
+        self._con.execute("BEGIN")
+
+    def close(self) -> None:
+        """Close the manifest, discarding uncommitted changes."""
+        if self._con.in_transaction:
+            self._con.execute("ROLLBACK")
+        self._con.close()
+
+    def __enter__(self) -> RowManifest:
+        """Enter the context manager."""
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        """Exit the context manager, closing without committing."""
+        self.close()
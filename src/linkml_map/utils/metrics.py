@@ -0,0 +1,482 @@
+"""Run-time metrics for long streaming transforms.
+
+:class:`TransformMetrics` is updated by
+:func:`~linkml_map.transformer.engine.transform_spec` as it runs: rows read and
+written, errors and join hits/misses per class_derivation block. While active
+(``with metrics:``) a background thread periodically takes a
+:meth:`~TransformMetrics.snapshot` — adding throughput, progress and ETA
+estimates, bytes read, process RSS and DuckDB memory use — and passes it to
+each reporter. Reporters are plain callables; :class:`ProgressLineReporter`,
+:class:`JsonFileReporter` and :class:`PrometheusTextfileReporter` cover the
+common sinks. Because reporting runs on its own thread, a stalled transform
+still reports (with a growing ``stalled_seconds``).
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import sys
+import threading
+import time
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import IO, TYPE_CHECKING, Any
+
+from linkml_map.utils.lookup_index import _detect_cgroup_memory_bytes
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable
+
+    import duckdb
+
+    from linkml_map.utils.lookup_index import LookupIndex
+
+logger = logging.getLogger(__name__)
+
+#: Bytes sampled from the start of a delimited file to estimate its row count.
+_SAMPLE_BYTES = 1 << 20
+
+
+def estimate_rows(path: str | Path) -> int | None:
+    """
+    Estimate the data rows of a TSV/CSV file from the line length of its first MiB.
+
+    Exact for files smaller than the sample; ``None`` for other formats.
+    """
+    path = Path(path)
+    if path.suffix.lower() not in (".tsv", ".csv"):
+        return None
+    size = path.stat().st_size
+    with open(path, "rb") as fh:
+        sample = fh.read(_SAMPLE_BYTES)
+    lines = sample.count(b"\n") + (1 if sample and not sample.endswith(b"\n") else 0)
+    if len(sample) >= size:
+        return max(lines - 1, 0)
+    return max(round(size * lines / len(sample)) - 1, 0)
+
+
+def _proc_bytes_read() -> int | None:
+    """Bytes this process has read through ``read()`` calls (Linux ``rchar``), or ``None``."""
+    try:
+        with open("/proc/self/io") as fh:
+            for line in fh:
+                if line.startswith("rchar:"):
+                    return int(line.split()[1])
+    except OSError:
+        pass
+    return None
+
+
+def _rss_bytes() -> int | None:
+    """Current resident set size of this process (Linux), or ``None``."""
+    try:
+        with open("/proc/self/statm") as fh:
+            return int(fh.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError):
+        return None
+
+
+def _peak_rss_bytes() -> int | None:
+    """Peak resident set size of this process, or ``None`` where unsupported."""
+    try:
+        import resource
+    except ImportError:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports KiB, macOS bytes.
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+@dataclass
+class BlockMetrics:
+    """Counters for one class_derivation block."""
+
+    index: int
+    class_derivation: str
+    table: str
+    path: str
+    """How the block runs: ``join_engine`` or ``per_row``."""
+    input_bytes: int | None = None
+    estimated_rows: int | None = None
+    rows_in: int = 0
+    rows_out: int = 0
+    errors: int = 0
+    join_hits: int = 0
+    join_misses: int = 0
+    seconds: float = 0.0
+    done: bool = False
+
+
+class TransformMetrics:
+    """
+    Collect counters from ``transform_spec`` and report snapshots periodically.
+
+    Pass it to ``transform_spec(..., metrics=...)`` and run the transform
+    inside ``with metrics:`` (or between :meth:`start` and :meth:`stop`);
+    leaving the block stops the reporting thread and sends a final snapshot
+    with ``done`` set.
+
+    :param reporters: Callables receiving each snapshot dict. They run on the
+        reporting thread.
+    :param interval: Seconds between snapshots.
+    """
+
+    def __init__(self, reporters: Iterable[Callable[[dict[str, Any]], None]] = (), interval: float = 10.0) -> None:
+        """Initialize with reporters and the reporting interval."""
+        self.reporters = list(reporters)
+        self.interval = interval
+        self.blocks: list[BlockMetrics] = []
+        self.current: BlockMetrics | None = None
+        self.total_blocks = 0
+        self.total_input_bytes = 0
+        self._started = time.monotonic()
+        self._block_started = self._started
+        self._bytes_read_base = _proc_bytes_read()
+        self._lookup_index: LookupIndex | None = None
+        self._lookup_base = (0, 0)
+        self._duckdb: dict[int, duckdb.DuckDBPyConnection] = {}
+        self._duckdb_lock = threading.Lock()
+        self._peak_duckdb_bytes = 0
+        self._last_rows = 0
+        self._last_time = self._started
+        self._stalled_since: float | None = None
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    # -- updates from transform_spec ---------------------------------------
+
+    def start_run(self, total_blocks: int, total_input_bytes: int = 0) -> None:
+        """Record the number of blocks and the combined size of their primary files."""
+        self.total_blocks = total_blocks
+        self.total_input_bytes = total_input_bytes
+
+    def start_block(
+        self,
+        index: int,
+        class_derivation: str,
+        table: str,
+        path: str,
+        file_path: str | Path | None = None,
+    ) -> BlockMetrics:
+        """Open the counters of a block; ``transform_spec`` increments them directly."""
+        if self.current is not None:
+            self.finish_block()
+        block = BlockMetrics(index=index, class_derivation=class_derivation, table=table, path=path)
+        if file_path is not None:
+            block.input_bytes = Path(file_path).stat().st_size
+            block.estimated_rows = estimate_rows(file_path)
+        self.blocks.append(block)
+        self._block_started = time.monotonic()
+        self.current = block
+        return block
+
+    def finish_block(self) -> None:
+        """Close the current block, folding in any lookup index counters."""
+        block = self.current
+        if block is None:
+            return
+        self._fold_lookup_index()
+        block.seconds = time.monotonic() - self._block_started
+        block.done = True
+        self.current = None
+
+    def attach_lookup_index(self, index: LookupIndex) -> None:
+        """Count the join hits and misses of *index* against the current block."""
+        self._lookup_index = index
+        self._lookup_base = (index.hits, index.misses)
+
+    def _fold_lookup_index(self) -> None:
+        index = self._lookup_index
+        if index is not None and self.current is not None:
+            self.current.join_hits += index.hits - self._lookup_base[0]
+            self.current.join_misses += index.misses - self._lookup_base[1]
+        self._lookup_index = None
+
+    def attach_duckdb(self, con: duckdb.DuckDBPyConnection) -> None:
+        """Report the memory use of *con*'s database (through a separate cursor)."""
+        with self._duckdb_lock:
+            self._duckdb.setdefault(id(con), con.cursor())
+
+    def detach_duckdb(self, con: duckdb.DuckDBPyConnection) -> None:
+        """Stop querying *con*; call before closing it."""
+        with self._duckdb_lock:
+            cursor = self._duckdb.pop(id(con), None)
+            if cursor is not None:
+                cursor.close()
+
+    # -- snapshots -------------------------------------------------------
+
+    def _duckdb_memory(self) -> tuple[int | None, str | None]:
+        """Memory used by the attached DuckDB databases, and the configured limit."""
+        if not self._duckdb:
+            return None, None
+        total, limit = 0, None
+        with self._duckdb_lock:
+            for cursor in self._duckdb.values():
+                try:
+                    total += cursor.execute("SELECT sum(memory_usage_bytes) FROM duckdb_memory()").fetchone()[0] or 0
+                    limit = cursor.execute("SELECT current_setting('memory_limit')").fetchone()[0]
+                except Exception as err:  # noqa: BLE001 - metrics must never break the run
+                    logger.debug("Could not read DuckDB memory use: %s", err)
+        self._peak_duckdb_bytes = max(self._peak_duckdb_bytes, total)
+        return total, limit
+
+    def snapshot(self, done: bool = False) -> dict[str, Any]:
+        """Return the current counters and estimates as a JSON-serializable dict."""
+        now = time.monotonic()
+        elapsed = now - self._started
+        # Counters are updated on the transform thread while this runs on the
+        # reporting thread; read the current block first and match it by identity.
+        current, index = self.current, self._lookup_index
+        block_list = list(self.blocks)
+        blocks = [asdict(b) for b in block_list]
+        current_dict = next((d for b, d in zip(block_list, blocks) if b is current), None)
+        if current_dict is not None:
+            current_dict["seconds"] = now - self._block_started
+            if index is not None:
+                current_dict["join_hits"] += index.hits - self._lookup_base[0]
+                current_dict["join_misses"] += index.misses - self._lookup_base[1]
+        rows_in = sum(b["rows_in"] for b in blocks)
+        rows_out = sum(b["rows_out"] for b in blocks)
+
+        recent_seconds = now - self._last_time
+        recent_rate = (rows_in - self._last_rows) / recent_seconds if recent_seconds > 0 else None
+        if rows_in != self._last_rows or done:
+            self._stalled_since = None
+        elif self._stalled_since is None:
+            self._stalled_since = self._last_time
+        self._last_rows, self._last_time = rows_in, now
+
+        # Progress by input bytes: finished blocks count in full, the current one
+        # by its share of estimated rows (capped, as the estimate can be short).
+        progress = eta = None
+        if self.total_input_bytes:
+            done_bytes = 0.0
+            for b in blocks:
+                if b["input_bytes"] is None:
+                    continue
+                if b["done"]:
+                    done_bytes += b["input_bytes"]
+                elif b["estimated_rows"]:
+                    done_bytes += b["input_bytes"] * min(b["rows_in"] / b["estimated_rows"], 0.99)
+            progress = 1.0 if done else min(done_bytes / self.total_input_bytes, 1.0)
+            if 0 < progress < 1:
+                eta = elapsed * (1 - progress) / progress
+
+        bytes_read = _proc_bytes_read()
+        duckdb_bytes, duckdb_limit = self._duckdb_memory()
+        return {
+            "timestamp": time.time(),
+            "done": done,
+            "elapsed_seconds": round(elapsed, 3),
+            "blocks_total": self.total_blocks,
+            "blocks_done": sum(b["done"] for b in blocks),
+            "current_block": current_dict,
+            "rows_in": rows_in,
+            "rows_out": rows_out,
+            "errors": sum(b["errors"] for b in blocks),
+            "join_hits": sum(b["join_hits"] for b in blocks),
+            "join_misses": sum(b["join_misses"] for b in blocks),
+            "rows_per_second": round(rows_in / elapsed, 1) if elapsed > 0 else None,
+            "recent_rows_per_second": None if recent_rate is None else round(recent_rate, 1),
+            "stalled_seconds": 0.0 if self._stalled_since is None else round(now - self._stalled_since, 1),
+            "input_bytes": self.total_input_bytes or None,
+            "bytes_read": None
+            if bytes_read is None or self._bytes_read_base is None
+            else bytes_read - self._bytes_read_base,
+            "progress": None if progress is None else round(progress, 4),
+            "eta_seconds": None if eta is None else round(eta, 1),
+            "rss_bytes": _rss_bytes(),
+            "peak_rss_bytes": _peak_rss_bytes(),
+            "memory_limit_bytes": _detect_cgroup_memory_bytes(),
+            "duckdb_memory_bytes": duckdb_bytes,
+            "peak_duckdb_memory_bytes": self._peak_duckdb_bytes or None,
+            "duckdb_memory_limit": duckdb_limit,
+            "blocks": blocks,
+        }
+
+    def report(self, done: bool = False) -> dict[str, Any]:
+        """Take a snapshot and pass it to every reporter."""
+        snapshot = self.snapshot(done=done)
+        for reporter in self.reporters:
+            try:
+                reporter(snapshot)
+            except Exception:
+                logger.exception("Metrics reporter %r failed", reporter)
+        return snapshot
+
+    # -- reporting thread ------------------------------------------------
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            self.report()
+
+    def start(self) -> None:
+        """Start the reporting thread."""
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="linkml-map-metrics", daemon=True)
+        self._thread.start()
+
+    def stop(self, done: bool = True) -> None:
+        """Stop the reporting thread and send a final snapshot; does nothing if not started."""
+        if self._thread is None:
+            return
+        self._stop.set()
+        self._thread.join()
+        self._thread = None
+        self.finish_block()
+        self.report(done=done)
+        with self._duckdb_lock:
+            for cursor in self._duckdb.values():
+                cursor.close()
+            self._duckdb.clear()
+
+    def __enter__(self) -> TransformMetrics:
+        """Start the reporting thread."""
+        self.start()
+        return self
+
+    def __exit__(self, exc_type: object, *exc_info: object) -> None:
+        """Stop the reporting thread; the final snapshot has ``done`` set unless an exception escaped."""
+        self.stop(done=exc_type is None)
+
+
+def _human_bytes(value: float | None) -> str:
+    if value is None:
+        return "?"
+    for unit in ("B", "KiB", "MiB", "GiB"):
+        if value < 1024:
+            return f"{value:.0f} {unit}" if unit == "B" else f"{value:.1f} {unit}"
+        value /= 1024
+    return f"{value:.1f} TiB"
+
+
+def _human_seconds(value: float | None) -> str:
+    if value is None:
+        return "?"
+    minutes, seconds = divmod(int(value), 60)
+    hours, minutes = divmod(minutes, 60)
+    return f"{hours:d}:{minutes:02d}:{seconds:02d}"
+
+
+def format_progress_line(snapshot: dict[str, Any]) -> str:
+    """One-line summary of a snapshot: block, rows, rate, progress, ETA and memory."""
+    parts = [f"[{_human_seconds(snapshot['elapsed_seconds'])}]"]
+    block = snapshot["current_block"]
+    if block is not None:
+        parts.append(
+            f"block {block['index'] + 1}/{snapshot['blocks_total']} {block['class_derivation']} ({block['path']})"
+        )
+    elif snapshot["done"]:
+        parts.append(f"done, {snapshot['blocks_done']} block(s)")
+    parts.append(f"{snapshot['rows_in']:,} rows in, {snapshot['rows_out']:,} out, {snapshot['errors']:,} errors")
+    rate = snapshot["recent_rows_per_second"] if not snapshot["done"] else snapshot["rows_per_second"]
+    if rate is not None:
+        parts.append(f"{rate:,.0f} rows/s")
+    if snapshot["progress"] is not None and not snapshot["done"]:
+        parts.append(f"~{snapshot['progress']:.0%} ETA {_human_seconds(snapshot['eta_seconds'])}")
+    if snapshot["join_hits"] or snapshot["join_misses"]:
+        parts.append(f"joins {snapshot['join_hits']:,} hit / {snapshot['join_misses']:,} miss")
+    memory = f"RSS {_human_bytes(snapshot['rss_bytes'])}"
+    if snapshot["memory_limit_bytes"]:
+        memory += f" of {_human_bytes(snapshot['memory_limit_bytes'])}"
+    if snapshot["duckdb_memory_bytes"] is not None:
+        memory += f", DuckDB {_human_bytes(snapshot['duckdb_memory_bytes'])} (limit {snapshot['duckdb_memory_limit']})"
+    parts.append(memory)
+    if snapshot["stalled_seconds"]:
+        parts.append(f"no progress for {snapshot['stalled_seconds']:.0f}s")
+    return ", ".join(parts)
+
+
+class ProgressLineReporter:
+    """Write :func:`format_progress_line` for each snapshot to a stream (stderr by default)."""
+
+    def __init__(self, stream: IO[str] | None = None) -> None:
+        """Initialize with the output stream."""
+        self.stream = stream
+
+    def __call__(self, snapshot: dict[str, Any]) -> None:
+        """Write one progress line."""
+        stream = self.stream or sys.stderr
+        stream.write(format_progress_line(snapshot) + "\n")
+        stream.flush()
+
+
+def _write_atomic(path: Path, text: str) -> None:
+    tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    try:
+        tmp.write_text(text, encoding="utf-8")
+        os.replace(tmp, path)
+    finally:
+        tmp.unlink(missing_ok=True)
+
+
+class JsonFileReporter:
+    """Atomically replace a file with each snapshot as JSON."""
+
+    def __init__(self, path: str | Path) -> None:
+        """Initialize with the file to write."""
+        self.path = Path(path)
+
+    def __call__(self, snapshot: dict[str, Any]) -> None:
+        """Write the snapshot."""
+        _write_atomic(self.path, json.dumps(snapshot, indent=2) + "\n")
+
+
+#: Prometheus metrics written by :class:`PrometheusTextfileReporter`: (snapshot key, type, help).
+_PROMETHEUS_METRICS = (
+    ("rows_in", "counter", "Source rows read."),
+    ("rows_out", "counter", "Target rows produced."),
+    ("errors", "counter", "Rows that failed to transform."),
+    ("join_hits", "counter", "Joined rows found."),
+    ("join_misses", "counter", "Joined rows not found."),
+    ("bytes_read", "counter", "Bytes read by the process."),
+    ("rows_per_second", "gauge", "Mean source rows read per second."),
+    ("blocks_done", "gauge", "class_derivation blocks finished."),
+    ("blocks_total", "gauge", "class_derivation blocks in the specification."),
+    ("progress", "gauge", "Estimated fraction of the input processed."),
+    ("eta_seconds", "gauge", "Estimated seconds until the run finishes."),
+    ("stalled_seconds", "gauge", "Seconds since the last source row was read."),
+    ("rss_bytes", "gauge", "Resident set size of the process."),
+    ("peak_rss_bytes", "gauge", "Peak resident set size of the process."),
+    ("memory_limit_bytes", "gauge", "Container (cgroup) memory limit."),
+    ("duckdb_memory_bytes", "gauge", "Memory used by DuckDB."),
+)
+
+_PROMETHEUS_BLOCK_METRICS = (
+    ("rows_in", "counter", "Source rows read per class_derivation."),
+    ("rows_out", "counter", "Target rows produced per class_derivation."),
+    ("errors", "counter", "Rows that failed to transform per class_derivation."),
+)
+
+
+class PrometheusTextfileReporter:
+    """
+    Atomically replace a file with each snapshot in the Prometheus text format.
+
+    Point the node_exporter textfile collector at the file's directory. Metric
+    names are prefixed with ``linkml_map_``; counters end in ``_total``.
+    """
+
+    def __init__(self, path: str | Path) -> None:
+        """Initialize with the file to write."""
+        self.path = Path(path)
+
+    def __call__(self, snapshot: dict[str, Any]) -> None:
+        """Write the snapshot."""
+        lines = []
+        for key, kind, help_text in _PROMETHEUS_METRICS:
+            value = snapshot[key]
+            if value is None:
+                continue
+            name = f"linkml_map_{key}" + ("_total" if kind == "counter" else "")
+            lines += [f"# HELP {name} {help_text}", f"# TYPE {name} {kind}", f"{name} {value}"]
+        for key, kind, help_text in _PROMETHEUS_BLOCK_METRICS:
+            name = f"linkml_map_block_{key}_total"
+            lines += [f"# HELP {name} {help_text}", f"# TYPE {name} {kind}"]
+            for block in snapshot["blocks"]:
+                label = block["class_derivation"].replace("\\", "\\\\").replace('"', '\\"')
+                lines.append(f'{name}{{class_derivation="{label}",block="{block["index"]}"}} {block[key]}')
+        _write_atomic(self.path, "\n".join(lines) + "\n")
@@ -0,0 +1,153 @@
+"""Threaded pipeline stages with bounded queues for streaming transforms.
+
+``map-data`` reads source rows, transforms them and serializes the output.
+:class:`Pipeline` runs each upstream stage on a background thread connected to
+the next by a bounded queue, so disk reads (and DuckDB fetches), Python
+transformation and serialization overlap instead of taking turns.
+
+Each queue records how long its producer waited for space (the consumer is
+the bottleneck) and how long its consumer waited for items (the producer is
+the bottleneck), which is what :meth:`Pipeline.report` prints.
+"""
+
+from __future__ import annotations
+
+import logging
+import queue
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any
+
+from more_itertools import chunked
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
+
+logger = logging.getLogger(__name__)
+
+_DONE = object()
+_POLL_SECONDS = 0.1
+
+
+@dataclass
+class StageStats:
+    """Throughput and wait-time counters for one pipeline queue."""
+
+    name: str
+    items: int = 0
+    """Items passed through the queue; list entries count their length (rows)."""
+    producer_wait: float = 0.0
+    """Seconds the producing stage spent blocked on a full queue."""
+    consumer_wait: float = 0.0
+    """Seconds the consuming stage spent blocked on an empty queue."""
+
+    def summary(self) -> str:
+        """One-line human-readable summary.
+
+        A large producer wait means the downstream stage is the bottleneck; a
+        large consumer wait means the upstream stage is.
+        """
+        return (
+            f"{self.name}: {self.items} item(s), producer blocked {self.producer_wait:.2f}s, "
+            f"consumer waited {self.consumer_wait:.2f}s"
+        )
+
+
+@dataclass
+class Pipeline:
+    """
+    Configuration and statistics for a threaded, queue-connected pipeline.
+
+    :param queue_size: Maximum number of batches held in each stage's queue.
+        This is the backpressure bound: memory held per stage is roughly
+        ``queue_size * batch_size`` rows.
+    :param batch_size: Items grouped per queue entry when a stage is batched.
+    """
+
+    queue_size: int = 8
+    batch_size: int = 1000
+    stats: dict[str, StageStats] = field(default_factory=dict)
+
+    def stage(self, name: str) -> StageStats:
+        """Return the (accumulating) statistics for stage *name*."""
+        return self.stats.setdefault(name, StageStats(name))
+
+    def prefetch(self, iterable: Iterable[Any], name: str, batch: bool = False) -> Iterator[Any]:
+        """
+        Iterate *iterable* on a background thread, yielding its items here.
+
+        Items flow through a queue holding at most ``queue_size`` entries.
+        With ``batch=True``, items are grouped ``batch_size`` at a time per
+        queue entry to keep per-item queue overhead off the hot path.
+
+        Exceptions raised by *iterable* are re-raised in the consumer. If the
+        consumer stops early, the producer is signalled, *iterable* is closed
+        on the producer's thread (so generator cleanup runs where it started),
+        and the thread is joined before this generator returns.
+
+        :param iterable: Source of items; consumed only on the background thread.
+        :param name: Stage name for statistics.
+        :param batch: Group items into lists of ``batch_size`` per queue entry.
+        :yield: The items of *iterable*, in order.
+        """
+        stats = self.stage(name)
+        q: queue.Queue = queue.Queue(maxsize=self.queue_size)
+        stop = threading.Event()
+        errors: list[BaseException] = []
+
+        def put(item: Any) -> bool:
+            start = time.perf_counter()
+            while not stop.is_set():
+                try:
+                    q.put(item, timeout=_POLL_SECONDS)
+                except queue.Full:
+                    continue
+                stats.producer_wait += time.perf_counter() - start
+                return True
+            return False
+
+        def produce() -> None:
+            source = iter(iterable)
+            try:
+                entries = chunked(source, self.batch_size) if batch else source
+                for entry in entries:
+                    if not put(entry):
+                        break
+                    stats.items += len(entry) if isinstance(entry, list) else 1
+            except BaseException as err:  # noqa: BLE001 - re-raised on the consumer thread
+                errors.append(err)
+            finally:
+                close = getattr(source, "close", None)
+                if close is not None:
+                    close()
+                put(_DONE)
+
+        thread = threading.Thread(target=produce, name=f"linkml-map-{name}", daemon=True)
+        thread.start()
+        try:
+            while True:
+                start = time.perf_counter()
+                entry = q.get()
+                stats.consumer_wait += time.perf_counter() - start
+                if entry is _DONE:
+                    break
+                if batch:
+                    yield from entry
+                else:
+                    yield entry
+            if errors:
+                raise errors[0]
+        finally:
+            stop.set()
+            # Drain so a producer blocked on put() observes the stop flag promptly.
+            while thread.is_alive():
+                try:
+                    q.get(timeout=_POLL_SECONDS)
+                except queue.Empty:
+                    pass
+            thread.join()
+
+    def report(self) -> str:
+        """Multi-line summary of every stage, for printing at the end of a run."""
+        return "\n".join(f"  {s.summary()}" for s in self.stats.values())
@@ -74,3 +74,5 @@ def apply_schema_patch(schemaview: SchemaView, patch: dict[str, Any]) -> None:
                 existing = getattr(schema, key)[name]
                 for field, value in patch_data.items():
                     setattr(existing, field, value)
+
+    schemaview.set_modified()
@@ -0,0 +1,160 @@
+"""Precompiled schema snapshots for fast ``SchemaView`` startup.
+
+Building a ``SchemaView`` from YAML means parsing every file of the import
+closure, and the first ``induced_slot`` queries then walk class ancestry
+slot by slot. For large generated schemas both dominate the start of every
+command. A snapshot stores the fully merged ``SchemaDefinition`` together
+with the induced slots of every class in one compressed pickle, and
+:func:`load_schemaview` turns it back into a view without touching YAML or
+resolving imports.
+
+Snapshots are tied to the ``linkml-runtime`` version that wrote them and
+are pickles: only load snapshots you created or trust. A path is only ever
+treated as a snapshot when its name ends in :data:`SNAPSHOT_SUFFIX`, so an
+ordinary schema file is never unpickled, whatever its content.
+"""
+
+import logging
+import pickle
+import zlib
+from importlib.metadata import PackageNotFoundError, version
+from pathlib import Path
+from typing import Any
+
+from linkml_runtime import SchemaView
+from linkml_runtime.linkml_model import SchemaDefinition, SlotDefinition
+
+logger = logging.getLogger(__name__)
+
+SNAPSHOT_MAGIC = b"LINKML-MAP-SCHEMA-SNAPSHOT\n"
+SNAPSHOT_VERSION = 1
+#: File name suffix marking a schema snapshot; no other path is unpickled.
+SNAPSHOT_SUFFIX = ".schema-snapshot"
+
+
+def _runtime_version() -> str:
+    try:
+        return version("linkml-runtime")
+    except PackageNotFoundError:
+        return "unknown"
+
+
+class SnapshotSchemaView(SchemaView):
+    """
+    A ``SchemaView`` over a merged schema, answering induced-slot queries from a precomputed table.
+
+    Queries the table does not cover (non-default arguments, unknown
+    classes) fall through to ``SchemaView``. Any modification reported via
+    ``set_modified`` discards the table, so a patched schema is always
+    re-induced.
+
+    :param schema: The merged schema (no imports left to resolve).
+    :param induced: Induced slots per class name, as returned by
+        ``class_induced_slots``.
+    """
+
+    def __init__(self, schema: SchemaDefinition, induced: dict[str, list[SlotDefinition]]) -> None:
+        """Initialize over the merged schema and its precomputed induced slots."""
+        super().__init__(schema)
+        self._induced: dict[str, list[SlotDefinition]] | None = induced
+        self._induced_by_name = {cn: {s.name: s for s in slots} for cn, slots in induced.items()}
+
+    def set_modified(self) -> None:
+        """Record a schema modification and drop the precomputed induced slots."""
+        super().set_modified()
+        self._induced = None
+        self._induced_by_name = {}
+
+    def class_induced_slots(self, class_name: str | None = None, imports: bool = True) -> list[SlotDefinition]:
+        """Return the precomputed induced slots of *class_name*, or compute them."""
+        if imports and self._induced is not None and class_name in self._induced:
+            return self._induced[class_name]
+        return super().class_induced_slots(class_name, imports)
+
+    def induced_slot(
+        self,
+        slot_name: str,
+        class_name: str | None = None,
+        imports: bool = True,
+        mangle_name: bool = False,
+    ) -> SlotDefinition:
+        """Return the precomputed induced slot *slot_name* of *class_name*, or compute it."""
+        if imports and not mangle_name:
+            slot = self._induced_by_name.get(class_name, {}).get(slot_name)
+            if slot is not None:
+                return slot
+        return super().induced_slot(slot_name, class_name, imports, mangle_name)
+
+
+def is_schema_snapshot(path: str | Path) -> bool:
+    """Return whether *path* names a schema snapshot (by its suffix; the file is not opened)."""
+    return str(path).endswith(SNAPSHOT_SUFFIX)
+
+
+def write_schema_snapshot(schema: str | Path, output: str | Path) -> SchemaView:
+    """
+    Merge *schema* with its imports, induce every class's slots and write a snapshot.
+
+    :param schema: Path or URL of the schema YAML.
+    :param output: File to write; its name must end in :data:`SNAPSHOT_SUFFIX`.
+    :return: The merged view the snapshot was written from.
+    :raises ValueError: If *output* does not end in :data:`SNAPSHOT_SUFFIX`.
+    """
+    if not is_schema_snapshot(output):
+        msg = f"Schema snapshot file names must end in {SNAPSHOT_SUFFIX!r}: {output}"
+        raise ValueError(msg)
+    sv = SchemaView(str(schema), merge_imports=True)
+    induced = {cn: sv.class_induced_slots(cn) for cn in sv.all_classes()}
+    payload: dict[str, Any] = {
+        "version": SNAPSHOT_VERSION,
+        "linkml_runtime": _runtime_version(),
+        "source": str(schema),
+        "schema": sv.schema,
+        "induced": induced,
+    }
+    data = zlib.compress(pickle.dumps(payload, protocol=pickle.HIGHEST_PROTOCOL))
+    with open(output, "wb") as fh:
+        fh.write(SNAPSHOT_MAGIC)
+        fh.write(data)
+    logger.info("Wrote snapshot of %s (%d classes) to %s", schema, len(induced), output)
+    return sv
+
+
+def load_schema_snapshot(path: str | Path) -> SnapshotSchemaView:
+    """
+    Load a snapshot written by :func:`write_schema_snapshot`.
+
+    :raises ValueError: If *path* does not end in :data:`SNAPSHOT_SUFFIX` or
+        is not a snapshot, or was written by a different snapshot format or
+        ``linkml-runtime`` version.
+    """
+    if not is_schema_snapshot(path):
+        msg = f"{path} is not a linkml-map schema snapshot (expected a {SNAPSHOT_SUFFIX!r} file)"
+        raise ValueError(msg)
+    with open(path, "rb") as fh:
+        if fh.read(len(SNAPSHOT_MAGIC)) != SNAPSHOT_MAGIC:
+            msg = f"{path} is not a linkml-map schema snapshot"
+            raise ValueError(msg)
+        payload = pickle.loads(zlib.decompress(fh.read()))  # noqa: S301 - snapshots are trusted artifacts
+    if payload.get("version") != SNAPSHOT_VERSION or payload.get("linkml_runtime") != _runtime_version():
+        msg = (
+            f"Schema snapshot {path} was written by an incompatible version "
+            f"(linkml-runtime {payload.get('linkml_runtime')}); recreate it with `linkml-map schema-snapshot`"
+        )
+        raise ValueError(msg)
+    logger.info("Loaded schema snapshot of %s from %s", payload["source"], path)
+    return SnapshotSchemaView(payload["schema"], payload["induced"])
+
+
+def load_schemaview(schema: str | Path) -> SchemaView:
+    """
+    Load a ``SchemaView`` from a schema path or URL, or from a schema snapshot.
+
+    Only a path ending in :data:`SNAPSHOT_SUFFIX` is loaded as a snapshot;
+    anything else is parsed as YAML.
+
+    :param schema: Schema YAML path or URL, or a snapshot file.
+    """
+    if is_schema_snapshot(schema):
+        return load_schema_snapshot(schema)
+    return SchemaView(str(schema))
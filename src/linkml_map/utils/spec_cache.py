@@ -0,0 +1,188 @@
+"""On-disk cache of loaded, derived and pre-flight-validated specifications.
+
+Loading a large specification is dominated by work that depends only on its
+inputs: merging and normalizing the spec files, building the pydantic
+``TransformationSpecification``, deriving it against the source schema
+(``induce_missing_values`` and join synthesis) and pre-flight validation.
+:class:`SpecCache` stores those results keyed by a digest of every input, so
+an unchanged spec is restored from one file instead of being rebuilt.
+
+Entries are pickled; only point the cache at a directory you trust.
+"""
+
+import hashlib
+import logging
+import os
+import pickle
+import sys
+from dataclasses import dataclass
+from functools import lru_cache
+from importlib.metadata import PackageNotFoundError, version
+from pathlib import Path
+from typing import Any
+
+import yaml
+
+from linkml_map.datamodel.transformer_model import TransformationSpecification
+from linkml_map.utils.schema_snapshot import is_schema_snapshot
+from linkml_map.utils.spec_merge import resolve_spec_paths
+
+logger = logging.getLogger(__name__)
+
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+#: Bump when the layout of :class:`CachedSpec` changes.
+CACHE_FORMAT = 1
+
+
+@dataclass
+class CachedSpec:
+    """Everything restored from the cache for one set of inputs."""
+
+    specification: TransformationSpecification
+    spec_messages: list[Any]
+    derived_specification: TransformationSpecification | None
+    """``None`` when derivation failed (the failure is then recomputed and reported)."""
+    preflight_messages: list[Any]
+
+
+def _package_version(name: str) -> str:
+    try:
+        return version(name)
+    except PackageNotFoundError:
+        return "unknown"
+
+
+@lru_cache(None)
+def _code_digest() -> str:
+    """
+    Digest of the linkml-map source that loads, derives and validates specs.
+
+    The package version alone does not change with the code in editable or
+    VCS-versioned installs, so every module of the package is hashed (the
+    whole package, since the cached values come from code spread across it).
+    """
+    root = Path(__file__).resolve().parent.parent
+    h = hashlib.sha256()
+    for path in sorted(root.rglob("*.py")):
+        h.update(path.relative_to(root).as_posix().encode("utf-8") + b"\0")
+        h.update(path.read_bytes())
+    return h.hexdigest()
+
+
+def schema_files(schema: str | Path) -> list[Path]:
+    """
+    Return a local schema file and every local schema it imports, transitively.
+
+    CURIE and URL imports (such as ``linkml:types``) are skipped: they are
+    versioned with ``linkml-runtime``, which is part of the cache key. A
+    schema snapshot already contains its imports and is returned alone.
+
+    :param schema: Path to a schema YAML file.
+    :return: Resolved paths, starting with *schema*.
+    """
+    files: list[Path] = []
+    pending = [Path(schema).resolve()]
+    while pending:
+        path = pending.pop()
+        if path in files:
+            continue
+        files.append(path)
+        if is_schema_snapshot(path):
+            continue
+        doc = yaml.load(path.read_text(encoding="utf-8"), Loader=_YAML_LOADER)  # noqa: S506 - safe loader
+        imports = doc.get("imports", []) if isinstance(doc, dict) else []
+        for imp in imports or []:
+            if not isinstance(imp, str) or ":" in imp:
+                continue
+            candidate = path.parent / imp
+            if candidate.suffix not in (".yaml", ".yml"):
+                candidate = candidate.with_name(candidate.name + ".yaml")
+            if candidate.exists():
+                pending.append(candidate.resolve())
+    return files
+
+
+class SpecCache:
+    """
+    Directory of cached specifications, one pickle per input digest.
+
+    :param cache_dir: Directory holding cache entries (created on first write).
+    """
+
+    def __init__(self, cache_dir: str | Path) -> None:
+        """Initialize with the cache directory."""
+        self.cache_dir = Path(cache_dir)
+
+    def key(
+        self,
+        spec_paths: tuple[str | Path, ...],
+        source_schema: str | Path | None = None,
+        target_schema: str | Path | None = None,
+    ) -> str | None:
+        """
+        Digest every input that determines the cached result.
+
+        Covers the spec files (and so any ``source_schema_patches`` in them),
+        the source and target schemas with their local imports, the
+        linkml-map source code (see :func:`_code_digest`) and
+        :data:`CACHE_FORMAT`, and the ``linkml-map``, ``linkml-runtime`` and
+        Python versions.
+
+        :return: The key, or ``None`` when an input is not a local file (a
+            remote schema could change without notice, so it is not cached).
+        """
+        h = hashlib.sha256()
+        for part in (
+            str(CACHE_FORMAT),
+            _code_digest(),
+            _package_version("linkml-map"),
+            _package_version("linkml-runtime"),
+            sys.version,
+        ):
+            h.update(part.encode("utf-8") + b"\0")
+        files = list(resolve_spec_paths(spec_paths))
+        for role, schema in (("source", source_schema), ("target", target_schema)):
+            h.update(role.encode("utf-8") + b"\0")
+            if schema is None:
+                continue
+            if not Path(schema).is_file():
+                return None
+            files.extend(schema_files(schema))
+        for path in files:
+            h.update(str(path).encode("utf-8") + b"\0")
+            h.update(Path(path).read_bytes())
+            h.update(b"\0")
+        return h.hexdigest()
+
+    def _path(self, key: str) -> Path:
+        return self.cache_dir / f"{key}.pickle"
+
+    def get(self, key: str) -> CachedSpec | None:
+        """Return the entry for *key*, or ``None`` if absent or unreadable."""
+        path = self._path(key)
+        if not path.exists():
+            return None
+        try:
+            with open(path, "rb") as fh:
+                entry = pickle.load(fh)  # noqa: S301 - the cache directory is trusted
+        except Exception as err:  # noqa: BLE001 - a stale or corrupt entry is just a miss
+            logger.warning("Ignoring unreadable spec cache entry %s: %s", path, err)
+            return None
+        if not isinstance(entry, CachedSpec):
+            return None
+        logger.info("Loaded specification from cache %s", path)
+        return entry
+
+    def put(self, key: str, entry: CachedSpec) -> None:
+        """Atomically store *entry* under *key*."""
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        path = self._path(key)
+        tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        try:
+            with open(tmp, "wb") as fh:
+                pickle.dump(entry, fh, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp, path)
+        finally:
+            tmp.unlink(missing_ok=True)
+        logger.debug("Stored specification in cache %s", path)
@@ -35,6 +35,7 @@ from linkml_map.datamodel import TR_SCHEMA
 from linkml_map.transformer.transformer import Transformer
 from linkml_map.utils.eval_utils import FUNCTIONS
 from linkml_map.utils.join_utils import resolve_join
+from linkml_map.utils.schema_snapshot import load_schemaview
 
 logger = logging.getLogger(__name__)
 
@@ -398,7 +399,7 @@ def _load_schemaview_with_timeout(path: str, timeout: int = _SCHEMA_LOAD_TIMEOUT
     :raises Exception: Any exception raised by :class:`SchemaView`.
     """
     executor = concurrent.futures.ThreadPoolExecutor(max_workers=1)
-    future = executor.submit(SchemaView, path)
+    future = executor.submit(load_schemaview, path)
     try:
         return future.result(timeout=timeout)
     except concurrent.futures.TimeoutError:
@@ -1,39 +1,65 @@
 """Output writers for linkml-map."""
 
+from linkml_map.writers.checkpoint import Checkpoint, CheckpointedWriter
+from linkml_map.writers.database import DATABASE_EXTENSIONS, DatabaseSink, is_database_path, tee_to_databases
 from linkml_map.writers.output_streams import (
+    DEFAULT_WRITE_BUFFER_SIZE,
     EXTENSION_FORMAT_MAP,
+    JSON_BACKENDS,
+    BufferedSink,
+    JSONBackend,
     JSONLStreamWriter,
     JSONStreamWriter,
     MultiStreamWriter,
+    OrjsonJSONBackend,
     OutputFormat,
+    StdlibJSONBackend,
     StreamWriter,
     TabularStreamWriter,
     YAMLStreamWriter,
     csv_stream,
+    get_json_backend,
     get_stream_writer,
     json_stream,
     jsonl_stream,
     make_stream_writer,
     rewrite_header_and_pad,
+    rewrite_tabular_output,
     tsv_stream,
     yaml_stream,
 )
+from linkml_map.writers.partitioned import PartitionedWriter
 
 __all__ = [
+    "DATABASE_EXTENSIONS",
+    "DEFAULT_WRITE_BUFFER_SIZE",
     "EXTENSION_FORMAT_MAP",
+    "JSON_BACKENDS",
+    "BufferedSink",
+    "Checkpoint",
+    "CheckpointedWriter",
+    "DatabaseSink",
+    "JSONBackend",
     "JSONLStreamWriter",
     "JSONStreamWriter",
     "MultiStreamWriter",
+    "OrjsonJSONBackend",
     "OutputFormat",
+    "PartitionedWriter",
+    "StdlibJSONBackend",
     "StreamWriter",
     "TabularStreamWriter",
     "YAMLStreamWriter",
     "csv_stream",
+    "get_json_backend",
     "get_stream_writer",
+    "is_database_path",
     "json_stream",
     "jsonl_stream",
     "make_stream_writer",
     "rewrite_header_and_pad",
+    "rewrite_tabular_output",
+    "tee_to_databases",
     "tsv_stream",
     "yaml_stream",
 ]
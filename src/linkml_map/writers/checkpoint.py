@@ -0,0 +1,176 @@
+"""Checkpoints for resumable streaming output."""
+
+import json
+import logging
+import os
+from collections.abc import Callable, Iterator
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import IO, Any
+
+from linkml_map.writers.output_streams import (
+    DEFAULT_WRITE_BUFFER_SIZE,
+    BufferedSink,
+    StreamWriter,
+    TabularStreamWriter,
+    rewrite_tabular_output,
+)
+
+logger = logging.getLogger(__name__)
+
+CHECKPOINT_VERSION = 1
+
+
+@dataclass
+class Checkpoint:
+    """
+    Saved position of a streaming run, persisted as JSON.
+
+    ``block`` and ``row`` record the input position (see
+    ``linkml_map.transformer.engine.TransformProgress``); ``outputs`` records,
+    per output, how much had been written and the writer state needed to
+    continue it. ``fingerprint`` identifies the run configuration, so a
+    checkpoint is never applied to a different spec, input or output set.
+
+    :param path: File the checkpoint is saved to.
+    :param fingerprint: Digest of the run configuration.
+    """
+
+    path: Path
+    fingerprint: str
+    block: int = 0
+    row: int = 0
+    rows_written: int = 0
+    errors: int = 0
+    outputs: dict[str, Any] = field(default_factory=dict)
+
+    @classmethod
+    def load(cls, path: str | Path, fingerprint: str) -> "Checkpoint | None":
+        """
+        Load the checkpoint at *path*, or return ``None`` if there is none.
+
+        :raises ValueError: If the checkpoint was written by a different run
+            configuration or an incompatible version.
+        """
+        path = Path(path)
+        if not path.exists():
+            return None
+        data = json.loads(path.read_text(encoding="utf-8"))
+        if data.pop("version", None) != CHECKPOINT_VERSION:
+            msg = f"Checkpoint {path} was written by an incompatible version of linkml-map"
+            raise ValueError(msg)
+        if data.get("fingerprint") != fingerprint:
+            msg = f"Checkpoint {path} belongs to a different spec, input or output configuration"
+            raise ValueError(msg)
+        return cls(path=path, **data)
+
+    def save(self) -> None:
+        """Atomically replace the checkpoint file with the current state."""
+        data = {"version": CHECKPOINT_VERSION, **asdict(self)}
+        del data["path"]
+        tmp = self.path.with_name(self.path.name + ".tmp")
+        with open(tmp, "w", encoding="utf-8") as fh:
+            json.dump(data, fh, indent=2)
+            fh.flush()
+            os.fsync(fh.fileno())
+        os.replace(tmp, self.path)
+
+    def remove(self) -> None:
+        """Delete the checkpoint file after a completed run."""
+        self.path.unlink(missing_ok=True)
+
+
+class CheckpointedWriter:
+    """
+    Write chunks to files, saving a :class:`Checkpoint` every few rows.
+
+    At each checkpoint every output is flushed and synced to disk, and its
+    length and writer state are stored in the checkpoint before
+    *before_save* fills in the input position and the checkpoint is saved.
+    When resuming, each output is truncated back to its recorded length,
+    discarding anything written after the last checkpoint, and its writer
+    state is restored, so the finished files match an uninterrupted run.
+
+    Outputs are written serially on the calling thread, so that a
+    checkpoint always describes fully written chunks.
+
+    :param outputs: ``(StreamWriter, Path)`` pairs.
+    :param checkpoint: The checkpoint to update; its ``outputs`` entries are
+        used to resume.
+    :param every: Save a checkpoint once at least this many rows were
+        written since the last one (checked between chunks).
+    :param before_save: Called with the checkpoint just before each save.
+    :param buffer_size: Size of each output's write-coalescing buffer.
+    """
+
+    def __init__(
+        self,
+        outputs: list[tuple[StreamWriter, Path]],
+        checkpoint: Checkpoint,
+        every: int,
+        before_save: Callable[[Checkpoint], None] | None = None,
+        buffer_size: int = DEFAULT_WRITE_BUFFER_SIZE,
+    ) -> None:
+        """Initialize with the outputs and checkpoint settings."""
+        self.outputs = outputs
+        self.checkpoint = checkpoint
+        self.every = every
+        self.before_save = before_save
+        self.buffer_size = buffer_size
+
+    def _open(self, writer: StreamWriter, path: Path) -> IO[str]:
+        """Open *path* fresh, or truncated to its checkpointed length when resuming."""
+        saved = self.checkpoint.outputs.get(str(path))
+        if saved is None:
+            return open(path, "w", encoding="utf-8")  # noqa: SIM115 - closed in write_all
+        fh = open(path, "r+", encoding="utf-8")  # noqa: SIM115
+        fh.truncate(saved["offset"])
+        fh.seek(saved["offset"])
+        writer.set_state(saved["writer"])
+        logger.info("Resuming %s at byte %d", path, saved["offset"])
+        return fh
+
+    def _save(self, handles: list[IO[str]], sinks: list[BufferedSink]) -> None:
+        """Sync every output and save the checkpoint."""
+        for (writer, path), fh, sink in zip(self.outputs, handles, sinks):  # noqa: B905
+            sink.flush()
+            fh.flush()
+            os.fsync(fh.fileno())
+            self.checkpoint.outputs[str(path)] = {"offset": fh.tell(), "writer": writer.get_state()}
+        if self.before_save is not None:
+            self.before_save(self.checkpoint)
+        self.checkpoint.save()
+        logger.debug("Checkpoint saved after %d row(s)", self.checkpoint.rows_written)
+
+    def write_all(self, chunks: Iterator[list[dict]]) -> None:
+        """
+        Consume *chunks*, writing every output and checkpointing as configured.
+
+        :param chunks: Iterator of lists of dictionaries.
+        """
+        handles: list[IO[str]] = []
+        try:
+            for writer, path in self.outputs:
+                handles.append(self._open(writer, path))
+            sinks = [BufferedSink(fh, self.buffer_size) for fh in handles]
+            since_save = 0
+            for chunk in chunks:
+                for (writer, _path), sink in zip(self.outputs, sinks):  # noqa: B905
+                    for fragment in writer.write_chunk(chunk):
+                        sink.write(fragment)
+                self.checkpoint.rows_written += len(chunk)
+                since_save += len(chunk)
+                if since_save >= self.every:
+                    self._save(handles, sinks)
+                    since_save = 0
+            for (writer, _path), sink in zip(self.outputs, sinks):  # noqa: B905
+                for fragment in writer.finalize():
+                    sink.write(fragment)
+                sink.flush()
+        finally:
+            for fh in handles:
+                fh.close()
+
+        for writer, path in self.outputs:
+            if isinstance(writer, TabularStreamWriter) and writer.headers_changed:
+                rewrite_tabular_output(path, writer)
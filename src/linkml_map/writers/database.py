@@ -0,0 +1,196 @@
+"""Database sinks: bulk-load transformed rows into DuckDB or SQLite tables."""
+
+import json
+import logging
+import sqlite3
+from collections.abc import Iterator
+from pathlib import Path
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+#: Output file extensions recognised as database targets, mapped to their dialect.
+DATABASE_EXTENSIONS = {
+    ".duckdb": "duckdb",
+    ".ddb": "duckdb",
+    ".sqlite": "sqlite",
+    ".sqlite3": "sqlite",
+}
+
+
+def is_database_path(path: str | Path) -> bool:
+    """Whether *path* has an extension handled by :class:`DatabaseSink`."""
+    return Path(path).suffix.lower() in DATABASE_EXTENSIONS
+
+
+def _quote(identifier: str) -> str:
+    """Quote an SQL identifier (both DuckDB and SQLite accept double quotes)."""
+    return '"' + identifier.replace('"', '""') + '"'
+
+
+def _adapt(value: Any, column_type: str) -> Any:
+    """Convert a transformed value into a parameter the column can store.
+
+    Nested objects become JSON text. Lists stay lists for DuckDB array
+    columns (with nested elements JSON-encoded) and become JSON text otherwise.
+    """
+    if isinstance(value, dict):
+        return json.dumps(value, ensure_ascii=False)
+    if isinstance(value, list):
+        if column_type.endswith("[]"):
+            return [json.dumps(v, ensure_ascii=False) if isinstance(v, dict | list) else v for v in value]
+        return json.dumps(value, ensure_ascii=False)
+    return value
+
+
+class DatabaseSink:
+    """
+    Append transformed rows to one table per target class in a database file.
+
+    Tables are created up front from *ddl* (typically
+    ``SQLCompiler.create_ddl`` over the target schema). Rows for a class with
+    no table get one with TEXT columns, and keys missing from a table's
+    columns are added as TEXT columns, so no transformed value is dropped.
+
+    Each chunk is appended in one transaction per table. DuckDB uses Arrow
+    registration when ``pyarrow`` is installed and the chunk converts to
+    Arrow, and ``executemany`` otherwise; SQLite uses ``executemany``.
+
+    :param path: Database file to create or append to.
+    :param ddl: Optional ``CREATE TABLE`` statements to run before loading.
+    :param dialect: ``duckdb`` or ``sqlite``; inferred from the extension if omitted.
+    """
+
+    def __init__(self, path: str | Path, ddl: str | None = None, dialect: str | None = None) -> None:
+        """Open the database and run *ddl*."""
+        self.path = Path(path)
+        self.dialect = dialect or DATABASE_EXTENSIONS.get(self.path.suffix.lower())
+        if self.dialect not in ("duckdb", "sqlite"):
+            msg = f"Cannot infer database dialect from {self.path}; use a .duckdb or .sqlite extension"
+            raise ValueError(msg)
+        self.rows_written: dict[str, int] = {}
+        self._columns: dict[str, dict[str, str]] = {}
+        if self.dialect == "duckdb":
+            import duckdb
+
+            self._con = duckdb.connect(str(self.path))
+        else:
+            self._con = sqlite3.connect(str(self.path), isolation_level=None)
+        if ddl:
+            for stmt in (s.strip() for s in ddl.split(";")):
+                if stmt:
+                    self._con.execute(stmt)
+
+    def _table_columns(self, table: str) -> dict[str, str]:
+        """Return ``{column: type}`` for *table* (empty if it does not exist)."""
+        if table not in self._columns:
+            if self.dialect == "duckdb":
+                rows = self._con.execute(
+                    "SELECT column_name, data_type FROM information_schema.columns "
+                    "WHERE table_name = ? ORDER BY ordinal_position",
+                    [table],
+                ).fetchall()
+            else:
+                rows = [(r[1], r[2]) for r in self._con.execute(f"PRAGMA table_info({_quote(table)})").fetchall()]
+            self._columns[table] = {name: str(typ).upper() for name, typ in rows}
+        return self._columns[table]
+
+    def _ensure_columns(self, table: str, keys: list[str]) -> dict[str, str]:
+        """Create *table* or add TEXT columns so every key in *keys* can be stored."""
+        columns = self._table_columns(table)
+        missing = [k for k in keys if k not in columns]
+        if not missing:
+            return columns
+        if not columns:
+            cols = ", ".join(f"{_quote(k)} TEXT" for k in missing)
+            self._con.execute(f"CREATE TABLE {_quote(table)} ({cols})")
+        else:
+            for key in missing:
+                self._con.execute(f"ALTER TABLE {_quote(table)} ADD COLUMN {_quote(key)} TEXT")
+        logger.debug("Added columns %s to table %s", missing, table)
+        columns.update(dict.fromkeys(missing, "TEXT"))
+        return columns
+
+    def write_rows(self, table: str, rows: list[dict[str, Any]]) -> None:
+        """Append *rows* to *table* in a single transaction."""
+        if not rows:
+            return
+        keys = list(dict.fromkeys(k for row in rows for k, v in row.items() if v is not None))
+        if not keys:
+            return
+        columns = self._ensure_columns(table, keys)
+        types = [columns[k] for k in keys]
+        records = [tuple(_adapt(row.get(k), t) for k, t in zip(keys, types)) for row in rows]  # noqa: B905
+        col_list = ", ".join(_quote(k) for k in keys)
+        self._con.execute("BEGIN TRANSACTION")
+        try:
+            if not (self.dialect == "duckdb" and self._append_arrow(table, keys, records)):
+                placeholders = ", ".join("?" for _ in keys)
+                self._con.executemany(
+                    f"INSERT INTO {_quote(table)} ({col_list}) VALUES ({placeholders})",  # noqa: S608
+                    records,
+                )
+            self._con.execute("COMMIT")
+        except BaseException:
+            self._con.execute("ROLLBACK")
+            raise
+        self.rows_written[table] = self.rows_written.get(table, 0) + len(rows)
+
+    def _append_arrow(self, table: str, keys: list[str], records: list[tuple]) -> bool:
+        """
+        Bulk insert through a registered Arrow table.
+
+        Returns ``False``, having inserted nothing, if pyarrow is unavailable
+        or a column mixes values Arrow cannot hold in one array (such as
+        numbers and strings bound for a TEXT column); the caller then inserts
+        with ``executemany``, which lets the database convert each value.
+        """
+        try:
+            import pyarrow as pa
+        except ImportError:
+            return False
+        try:
+            arrow_table = pa.Table.from_pydict({k: [r[i] for r in records] for i, k in enumerate(keys)})
+        except (pa.ArrowInvalid, pa.ArrowTypeError):
+            logger.debug("Chunk for table %s does not convert to Arrow; inserting row by row", table)
+            return False
+        view = "__linkml_map_chunk"
+        self._con.register(view, arrow_table)
+        try:
+            col_list = ", ".join(_quote(k) for k in keys)
+            self._con.execute(f"INSERT INTO {_quote(table)} ({col_list}) SELECT {col_list} FROM {view}")  # noqa: S608
+        finally:
+            self._con.unregister(view)
+        return True
+
+    def write_tagged(self, chunk: list[tuple[str, dict[str, Any]]]) -> None:
+        """Append a chunk of ``(class_name, row)`` pairs, one insert batch per class."""
+        groups: dict[str, list[dict[str, Any]]] = {}
+        for class_name, row in chunk:
+            groups.setdefault(class_name, []).append(row)
+        for class_name, rows in groups.items():
+            self.write_rows(class_name, rows)
+
+    def close(self) -> None:
+        """Close the database connection."""
+        self._con.close()
+
+
+def tee_to_databases(
+    tagged_chunks: Iterator[list[tuple[str, dict[str, Any]]]],
+    sinks: list[DatabaseSink],
+) -> Iterator[list[dict[str, Any]]]:
+    """
+    Load each tagged chunk into every sink, then yield its untagged rows.
+
+    Lets database sinks ride along with the text ``StreamWriter`` outputs in
+    a single transformation pass.
+
+    :param tagged_chunks: Iterator of lists of ``(class_name, row)`` pairs.
+    :param sinks: Database sinks to load each chunk into.
+    :yield: The rows of each chunk, without their class tags.
+    """
+    for chunk in tagged_chunks:
+        for sink in sinks:
+            sink.write_tagged(chunk)
+        yield [row for _, row in chunk]
@@ -3,6 +3,8 @@
 import json
 import logging
 import os
+import queue
+import threading
 from abc import ABC, abstractmethod
 from collections.abc import Iterator
 from enum import Enum
@@ -15,20 +17,186 @@ from flatten_dict.reducers import make_reducer
 
 logger = logging.getLogger(__name__)
 
+# Prefer the libyaml-backed emitter when PyYAML was built against it.  CDumper
+# is the C counterpart of the default ``yaml.Dumper`` (not ``SafeDumper``), so
+# output stays byte-identical to ``yaml.dump`` for the same input.
+_YAML_DUMPER: type = getattr(yaml, "CDumper", yaml.Dumper)
+
+
+def _dump_yaml(data: Any) -> str:
+    """Serialize *data* as block-style YAML using the fastest available dumper."""
+    return yaml.dump(data, Dumper=_YAML_DUMPER, default_flow_style=False, allow_unicode=True)
+
+
+def _dump_yaml_documents(objs: list[dict]) -> str:
+    """Serialize *objs* as a run of YAML documents, each followed by ``---``.
+
+    A single ``dump_all`` call emits the separators between documents itself,
+    so only the trailing separator needs to be appended.
+    """
+    return yaml.dump_all(objs, Dumper=_YAML_DUMPER, default_flow_style=False, allow_unicode=True) + "---\n"
+
 
 def _strip_nulls(obj: Any) -> Any:
     """Remove None values from dicts so JSON output matches YAML behavior.
 
+    Flat dicts without ``None`` values and lists of scalars are returned as
+    they are rather than copied.
+
     :param obj: Object to strip nulls from.
     :returns: Cleaned object with None values removed from dicts.
     """
     if isinstance(obj, dict):
-        return {k: _strip_nulls(v) for k, v in obj.items() if v is not None}
+        for v in obj.values():
+            if v is None or isinstance(v, dict | list):
+                return {
+                    k: _strip_nulls(v) if isinstance(v, dict | list) else v for k, v in obj.items() if v is not None
+                }
+        return obj
     if isinstance(obj, list):
-        return [_strip_nulls(item) for item in obj]
+        for item in obj:
+            if isinstance(item, dict | list):
+                return [_strip_nulls(item) if isinstance(item, dict | list) else item for item in obj]
+        return obj
     return obj
 
 
+# Default size (in characters) of the write-coalescing buffer used by
+# ``BufferedSink``.  Large enough that stdout and pipes see a handful of big
+# writes per chunk rather than one per object.
+DEFAULT_WRITE_BUFFER_SIZE = 1 << 20
+
+
+class BufferedSink:
+    """
+    Coalesce string fragments into large writes against a text handle.
+
+    Fragments are held in memory until *buffer_size* characters have
+    accumulated, then joined once and written with a single ``write`` call.
+    This matters most for stdout and pipes, whose own buffers are small.
+
+    :param fh: Target text handle.
+    :param buffer_size: Characters to accumulate before writing.  ``0``
+        disables buffering and writes every fragment through immediately.
+    """
+
+    def __init__(self, fh: IO[str], buffer_size: int = DEFAULT_WRITE_BUFFER_SIZE) -> None:
+        """Wrap *fh* with a coalescing buffer of *buffer_size* characters."""
+        self.fh = fh
+        self.buffer_size = buffer_size
+        self._parts: list[str] = []
+        self._pending = 0
+
+    def write(self, text: str) -> None:
+        """Buffer *text*, writing through once the buffer is full."""
+        if not text:
+            return
+        if self.buffer_size <= 0:
+            self.fh.write(text)
+            return
+        self._parts.append(text)
+        self._pending += len(text)
+        if self._pending >= self.buffer_size:
+            self.flush()
+
+    def flush(self) -> None:
+        """Write out any buffered text in a single call."""
+        if self._parts:
+            self.fh.write(self._parts[0] if len(self._parts) == 1 else "".join(self._parts))
+            self._parts.clear()
+            self._pending = 0
+
+
+class JSONBackend(ABC):
+    """
+    Pluggable JSON serializer used by the JSON and JSONL stream writers.
+
+    Backends own null suppression: ``encode`` drops ``None`` values from
+    dicts, so writers never pre-process objects. Neither the standard
+    library's C encoder nor ``orjson`` can skip values while encoding, so
+    the built-in backends prune first, copying only containers that need it.
+    """
+
+    name: str = ""
+
+    @abstractmethod
+    def encode(self, obj: Any, pretty: bool = False) -> str:
+        """
+        Serialize *obj* to JSON with ``None`` dict values removed.
+
+        :param obj: Object to serialize.
+        :param pretty: Indent by two spaces (JSON array output) instead of
+            emitting a single compact line (JSONL output).
+        :return: JSON text without a trailing newline.
+        """
+
+
+class StdlibJSONBackend(JSONBackend):
+    """JSON backend built on the standard library ``json`` module.
+
+    Encoder instances are built once and reused; ``json.dumps`` with
+    non-default arguments would otherwise construct a new encoder per object.
+    """
+
+    name = "json"
+
+    def __init__(self) -> None:
+        """Build the compact and indented encoders."""
+        self._compact = json.JSONEncoder(ensure_ascii=False).encode
+        self._pretty = json.JSONEncoder(ensure_ascii=False, indent=2).encode
+
+    def encode(self, obj: Any, pretty: bool = False) -> str:
+        """Serialize *obj* with the standard library encoder."""
+        return (self._pretty if pretty else self._compact)(_strip_nulls(obj))
+
+
+class OrjsonJSONBackend(JSONBackend):
+    """JSON backend built on the optional ``orjson`` package.
+
+    Compact output omits the spaces the standard library inserts after
+    separators; both are valid JSON.
+    """
+
+    name = "orjson"
+
+    def __init__(self) -> None:
+        """Import ``orjson``, raising ``ValueError`` if it is not installed."""
+        try:
+            import orjson
+        except ImportError as err:
+            msg = "JSON backend 'orjson' requires the orjson package (pip install orjson)"
+            raise ValueError(msg) from err
+        self._dumps = orjson.dumps
+        self._options = orjson.OPT_NON_STR_KEYS
+        self._pretty_options = orjson.OPT_NON_STR_KEYS | orjson.OPT_INDENT_2
+
+    def encode(self, obj: Any, pretty: bool = False) -> str:
+        """Serialize *obj* with ``orjson``."""
+        options = self._pretty_options if pretty else self._options
+        return self._dumps(_strip_nulls(obj), option=options).decode("utf-8")
+
+
+JSON_BACKENDS: dict[str, type[JSONBackend]] = {
+    StdlibJSONBackend.name: StdlibJSONBackend,
+    OrjsonJSONBackend.name: OrjsonJSONBackend,
+}
+
+
+def get_json_backend(name: str | None = None) -> JSONBackend:
+    """
+    Return a JSON backend instance by name.
+
+    :param name: One of the keys of ``JSON_BACKENDS``; defaults to ``"json"``.
+    :return: A ``JSONBackend`` instance.
+    :raises ValueError: If the backend is unknown or its package is missing.
+    """
+    backend_cls = JSON_BACKENDS.get(name or StdlibJSONBackend.name)
+    if backend_cls is None:
+        msg = f"Unknown JSON backend: {name}. Available: {', '.join(JSON_BACKENDS)}"
+        raise ValueError(msg)
+    return backend_cls()
+
+
 class OutputFormat(str, Enum):
     """Supported output formats for streaming."""
 
@@ -48,6 +216,9 @@ class StreamWriter(ABC):
     over chunks, calling ``write_chunk`` for each, then ``finalize`` at the
     end.
 
+    The built-in writers emit a single fragment per chunk, so a chunk costs
+    one ``write`` call rather than one per object.
+
     Subclasses must implement ``write_chunk`` and ``finalize``.
     """
 
@@ -79,6 +250,43 @@ class StreamWriter(ABC):
             yield from self.write_chunk(chunk)
         yield from self.finalize()
 
+    def get_state(self) -> dict[str, Any]:
+        """
+        Return the state that depends on what has been written so far.
+
+        Together with the length of the output written so far, this lets a
+        fresh writer continue the same file after a restart (see
+        ``set_state``).
+
+        :return: A JSON-serializable dict (empty for stateless writers).
+        """
+        return {}
+
+    def set_state(self, state: dict[str, Any]) -> None:  # noqa: B027 - stateless writers need nothing
+        """
+        Restore state previously returned by ``get_state``.
+
+        :param state: The saved state.
+        """
+
+    def write_to(
+        self,
+        chunks: Iterator[list[dict]],
+        fh: IO[str],
+        buffer_size: int = DEFAULT_WRITE_BUFFER_SIZE,
+    ) -> None:
+        """
+        Drive the full lifecycle, writing the output to *fh*.
+
+        :param chunks: Iterator of lists of dictionaries.
+        :param fh: Target text handle (left open).
+        :param buffer_size: Size of the write-coalescing buffer; see ``BufferedSink``.
+        """
+        sink = BufferedSink(fh, buffer_size)
+        for fragment in self.process(chunks):
+            sink.write(fragment)
+        sink.flush()
+
 
 class JSONStreamWriter(StreamWriter):
     """
@@ -88,36 +296,43 @@ class JSONStreamWriter(StreamWriter):
     handling comma placement between objects.
 
     :param key_name: Optional key to wrap the array, e.g. ``{"people": [...]}``.
+    :param backend: JSON serializer; defaults to the standard library backend.
     """
 
-    def __init__(self, key_name: str | None = None) -> None:
-        """Initialize with an optional wrapping key name."""
+    def __init__(self, key_name: str | None = None, backend: JSONBackend | None = None) -> None:
+        """Initialize with an optional wrapping key name and JSON backend."""
         self.key_name = key_name
+        self.backend = backend or StdlibJSONBackend()
         self._started = False
         self._first_object = True
 
-    def _emit_preamble(self) -> Iterator[str]:
-        """Emit the opening bracket(s) exactly once."""
-        if not self._started:
-            self._started = True
-            if self.key_name:
-                yield f"{{{json.dumps(self.key_name)}: [\n"
-            else:
-                yield "[\n"
+    def _preamble(self) -> str:
+        """Return the opening bracket(s) the first time only."""
+        if self._started:
+            return ""
+        self._started = True
+        if self.key_name:
+            return f"{{{json.dumps(self.key_name)}: [\n"
+        return "[\n"
 
     def write_chunk(self, chunk: list[dict]) -> Iterator[str]:
         """
         Emit JSON fragments for each object in the chunk.
 
         :param chunk: A list of dictionaries.
-        :yield: JSON string fragments.
+        :yield: A single JSON string fragment for the whole chunk.
         """
-        yield from self._emit_preamble()
+        preamble = self._preamble()
+        if not chunk:
+            if preamble:
+                yield preamble
+            return
 
-        for obj in chunk:
-            prefix = "" if self._first_object else ",\n"
-            self._first_object = False
-            yield prefix + json.dumps(_strip_nulls(obj), ensure_ascii=False, indent=2)
+        encode = self.backend.encode
+        body = ",\n".join(encode(obj, True) for obj in chunk)
+        prefix = "" if self._first_object else ",\n"
+        self._first_object = False
+        yield preamble + prefix + body
 
     def finalize(self) -> Iterator[str]:
         """
@@ -125,12 +340,17 @@ class JSONStreamWriter(StreamWriter):
 
         :yield: Closing JSON fragments.
         """
-        yield from self._emit_preamble()
+        closing = "\n]}\n" if self.key_name else "\n]\n"
+        yield self._preamble() + closing
 
-        if self.key_name:
-            yield "\n]}\n"
-        else:
-            yield "\n]\n"
+    def get_state(self) -> dict[str, Any]:
+        """Whether the opening bracket and the first object have been written."""
+        return {"started": self._started, "first_object": self._first_object}
+
+    def set_state(self, state: dict[str, Any]) -> None:
+        """Restore the bracket/comma state."""
+        self._started = state["started"]
+        self._first_object = state["first_object"]
 
 
 class JSONLStreamWriter(StreamWriter):
@@ -139,17 +359,24 @@ class JSONLStreamWriter(StreamWriter):
 
     Each object is emitted as a single line of JSON. Stateless—no preamble
     or postamble is needed.
+
+    :param backend: JSON serializer; defaults to the standard library backend.
     """
 
+    def __init__(self, backend: JSONBackend | None = None) -> None:
+        """Initialize with an optional JSON backend."""
+        self.backend = backend or StdlibJSONBackend()
+
     def write_chunk(self, chunk: list[dict]) -> Iterator[str]:
         """
-        Emit one JSON line per object.
+        Emit the JSON lines for every object in the chunk as one fragment.
 
         :param chunk: A list of dictionaries.
-        :yield: JSONL string lines.
+        :yield: A single string holding one JSON line per object.
         """
-        for obj in chunk:
-            yield json.dumps(_strip_nulls(obj), ensure_ascii=False) + "\n"
+        if chunk:
+            encode = self.backend.encode
+            yield "\n".join(map(encode, chunk)) + "\n"
 
     def finalize(self) -> Iterator[str]:
         """
@@ -189,17 +416,15 @@ class YAMLStreamWriter(StreamWriter):
             return
 
         if self.key_name:
-            yaml_str = yaml.dump({self.key_name: chunk}, default_flow_style=False, allow_unicode=True)
             if self._first_chunk:
-                yield yaml_str
                 self._first_chunk = False
+                yield _dump_yaml({self.key_name: chunk})
             else:
-                lines = yaml_str.splitlines()
-                yield "\n".join(lines[1:]) + "\n"
+                # A top-level block sequence renders exactly as the items under
+                # the wrapping key do, so continuation chunks need no re-splitting.
+                yield _dump_yaml(chunk)
         else:
-            for obj in chunk:
-                yield yaml.dump(obj, default_flow_style=False, allow_unicode=True)
-                yield "---\n"
+            yield _dump_yaml_documents(chunk)
 
     def finalize(self) -> Iterator[str]:
         """
@@ -209,6 +434,14 @@ class YAMLStreamWriter(StreamWriter):
         """
         return iter(())
 
+    def get_state(self) -> dict[str, Any]:
+        """Whether the wrapping key has been written."""
+        return {"first_chunk": self._first_chunk}
+
+    def set_state(self, state: dict[str, Any]) -> None:
+        """Restore the wrapping-key state."""
+        self._first_chunk = state["first_chunk"]
+
 
 def yaml_stream(
     chunks: Iterator[list[dict[str, Any]]],
@@ -224,22 +457,7 @@ def yaml_stream(
     :param key_name: Optional key name to wrap all objects
     :yield: YAML formatted strings
     """
-    if key_name:
-        first_chunk = True
-        for chunk in chunks:
-            yaml_str = yaml.dump({key_name: chunk}, default_flow_style=False, allow_unicode=True)
-            if first_chunk:
-                yield yaml_str
-                first_chunk = False
-            else:
-                # Remove the key line and adjust indentation for continuation
-                lines = yaml_str.splitlines()
-                yield "\n".join(lines[1:]) + "\n"
-    else:
-        for chunk in chunks:
-            for obj in chunk:
-                yield yaml.dump(obj, default_flow_style=False, allow_unicode=True)
-                yield "---\n"
+    yield from YAMLStreamWriter(key_name=key_name).process(chunks)
 
 
 def json_stream(
@@ -255,22 +473,7 @@ def json_stream(
     :param key_name: Optional key name to wrap all objects
     :yield: JSON formatted strings
     """
-    first_chunk = True
-    if key_name:
-        yield f"{{{json.dumps(key_name)}: [\n"
-    else:
-        yield "[\n"
-
-    for chunk in chunks:
-        for obj in chunk:
-            prefix = "" if first_chunk else ",\n"
-            first_chunk = False
-            yield prefix + json.dumps(_strip_nulls(obj), ensure_ascii=False, indent=2)
-
-    if key_name:
-        yield "\n]}\n"
-    else:
-        yield "\n]\n"
+    yield from JSONStreamWriter(key_name=key_name).process(chunks)
 
 
 def jsonl_stream(
@@ -286,9 +489,7 @@ def jsonl_stream(
     :param key_name: Unused, kept for API consistency
     :yield: JSONL formatted strings (one JSON object per line)
     """
-    for chunk in chunks:
-        for obj in chunk:
-            yield json.dumps(_strip_nulls(obj), ensure_ascii=False) + "\n"
+    yield from JSONLStreamWriter().process(chunks)
 
 
 class TabularStreamWriter(StreamWriter):
@@ -323,24 +524,30 @@ class TabularStreamWriter(StreamWriter):
         Emit tabular rows for a single chunk of objects.
 
         :param chunk: A list of dictionaries.
-        :yield: TSV/CSV formatted strings.
+        :yield: A single string holding the TSV/CSV lines for the chunk.
         """
+        lines: list[str] = []
+        headers = self.headers
+        separator = self.separator
+        escape = self._escape_value
         for obj in chunk:
             flat = flatten(obj, reducer=self.reducer)
 
             # Track new headers
             for k in flat:
-                if k not in self.headers:
-                    self.headers.append(k)
+                if k not in headers:
+                    headers.append(k)
 
             # Emit header row on first object
             if len(self.initial_headers) == 0:
-                self.initial_headers = list(self.headers)
-                yield self.separator.join(self.headers) + "\n"
+                self.initial_headers = list(headers)
+                lines.append(separator.join(headers))
 
             # Emit data row
-            row = self.separator.join(self._escape_value(flat.get(h, "")) for h in self.headers)
-            yield row + "\n"
+            lines.append(separator.join(escape(flat.get(h, "")) for h in headers))
+        if lines:
+            lines.append("")
+            yield "\n".join(lines)
 
     def finalize(self) -> Iterator[str]:
         """
@@ -352,6 +559,15 @@ class TabularStreamWriter(StreamWriter):
             self._headers_changed = True
         return iter(())
 
+    def get_state(self) -> dict[str, Any]:
+        """The headers seen so far and those written in the header row."""
+        return {"headers": list(self.headers), "initial_headers": list(self.initial_headers)}
+
+    def set_state(self, state: dict[str, Any]) -> None:
+        """Restore the header tracking state."""
+        self.headers = list(state["headers"])
+        self.initial_headers = list(state["initial_headers"])
+
     def stream(
         self,
         chunks: Iterator[list[dict[str, Any]]],
@@ -526,6 +742,7 @@ def make_stream_writer(
     output_format: OutputFormat,
     key_name: str | None = None,
     separator: str | None = None,
+    json_backend: JSONBackend | None = None,
 ) -> StreamWriter:
     """
     Return the appropriate ``StreamWriter`` for a format.
@@ -533,13 +750,14 @@ def make_stream_writer(
     :param output_format: The desired output format.
     :param key_name: Optional key for formats that support wrapping (JSON, YAML).
     :param separator: Optional separator override for tabular formats.
+    :param json_backend: Optional JSON serializer for the JSON and JSONL formats.
     :return: A ``StreamWriter`` instance.
     :raises ValueError: If the format is not supported.
     """
     if output_format == OutputFormat.JSON:
-        return JSONStreamWriter(key_name=key_name)
+        return JSONStreamWriter(key_name=key_name, backend=json_backend)
     if output_format == OutputFormat.JSONL:
-        return JSONLStreamWriter()
+        return JSONLStreamWriter(backend=json_backend)
     if output_format == OutputFormat.YAML:
         return YAMLStreamWriter(key_name=key_name)
     if output_format == OutputFormat.TSV:
@@ -550,6 +768,76 @@ def make_stream_writer(
     raise ValueError(msg)
 
 
+def rewrite_tabular_output(path: Path | str, writer: "TabularStreamWriter", chunk_size: int = 1000) -> None:
+    """
+    Rewrite a finished tabular file in place with *writer*'s final headers.
+
+    The corrected content is written to a ``.tmp`` sibling and swapped in
+    with ``os.replace``; the temporary file is removed if the rewrite fails.
+
+    :param path: Tabular file written by *writer*.
+    :param writer: The writer that produced the file.
+    :param chunk_size: Number of lines to process at once.
+    """
+    logger.info("Rewriting %s with updated headers", path)
+    tmp_path = str(path) + ".tmp"
+    try:
+        with open(path, encoding="utf-8") as src, open(tmp_path, "w", encoding="utf-8") as dst:
+            for line in rewrite_header_and_pad(iter(src), writer.get_final_headers(), writer.separator, chunk_size):
+                dst.write(line)
+        os.replace(tmp_path, str(path))
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+
+_QUEUE_DONE = object()
+_QUEUE_ABORT = object()
+
+
+class _OutputWorker(threading.Thread):
+    """
+    Background thread that serializes and writes chunks for one output.
+
+    Chunks arrive on a bounded queue, so a slow output applies backpressure
+    to the producer instead of buffering without limit.  After a failure the
+    worker keeps draining its queue (discarding chunks) so the producer can
+    never block on it; the error is re-raised by ``MultiStreamWriter``.  If
+    the producer fails instead, it sends ``_QUEUE_ABORT`` and the output is
+    left unfinalized, as on the serial path.
+    """
+
+    def __init__(self, writer: StreamWriter, sink: BufferedSink, queue_size: int) -> None:
+        super().__init__(daemon=True, name=f"linkml-map-writer-{type(writer).__name__}")
+        self.writer = writer
+        self.sink = sink
+        self.queue: queue.Queue = queue.Queue(maxsize=queue_size)
+        self.error: BaseException | None = None
+
+    def run(self) -> None:
+        """Consume chunks until the end-of-stream or abort marker arrives."""
+        while True:
+            chunk = self.queue.get()
+            if chunk is _QUEUE_ABORT:
+                return
+            if chunk is _QUEUE_DONE:
+                break
+            if self.error is not None:
+                continue
+            try:
+                for fragment in self.writer.write_chunk(chunk):
+                    self.sink.write(fragment)
+            except BaseException as err:  # noqa: BLE001 - surfaced on the producer thread
+                self.error = err
+        if self.error is None:
+            try:
+                for fragment in self.writer.finalize():
+                    self.sink.write(fragment)
+                self.sink.flush()
+            except BaseException as err:  # noqa: BLE001
+                self.error = err
+
+
 class MultiStreamWriter:
     """
     Fan-out writer that sends the same chunks to multiple ``StreamWriter`` instances.
@@ -559,12 +847,32 @@ class MultiStreamWriter:
     open file handle such as ``sys.stdout`` (written to directly, never closed
     or rewritten by this class).
 
+    Writes to every target go through a ``BufferedSink`` of *buffer_size*
+    characters.
+
+    With ``threaded=True`` each output is serialized and written on its own
+    thread, fed through a queue holding at most *queue_size* chunks, so the
+    producer keeps transforming while slow outputs catch up.  Writers must
+    not mutate the chunks they receive, since all threads share them.
+
     :param outputs: List of ``(StreamWriter, target)`` tuples.
+    :param buffer_size: Size of each output's write-coalescing buffer.
+    :param threaded: Write each output on a dedicated thread.
+    :param queue_size: Chunks queued per output before the producer blocks.
     """
 
-    def __init__(self, outputs: list[tuple[StreamWriter, Path | IO[str]]]) -> None:
+    def __init__(
+        self,
+        outputs: list[tuple[StreamWriter, Path | IO[str]]],
+        buffer_size: int = DEFAULT_WRITE_BUFFER_SIZE,
+        threaded: bool = False,
+        queue_size: int = 4,
+    ) -> None:
         """Initialize with a list of (writer, target) output pairs."""
         self.outputs = outputs
+        self.buffer_size = buffer_size
+        self.threaded = threaded
+        self.queue_size = queue_size
 
     def write_all(self, chunks: Iterator[list[dict]]) -> None:
         """
@@ -583,17 +891,12 @@ class MultiStreamWriter:
                 else:
                     handles.append(target)
                     owned.append(False)
+            sinks = [BufferedSink(fh, self.buffer_size) for fh in handles]
 
-            # Fan out each chunk to every writer
-            for chunk in chunks:
-                for idx, (writer, _target) in enumerate(self.outputs):
-                    for fragment in writer.write_chunk(chunk):
-                        handles[idx].write(fragment)
-
-            # Finalize each writer
-            for idx, (writer, _target) in enumerate(self.outputs):
-                for fragment in writer.finalize():
-                    handles[idx].write(fragment)
+            if self.threaded:
+                self._write_threaded(chunks, sinks)
+            else:
+                self._write_serial(chunks, sinks)
 
         finally:
             for fh, is_owned in zip(handles, owned):  # noqa: B905
@@ -603,9 +906,47 @@ class MultiStreamWriter:
         # Post-process tabular Path outputs that had header changes
         for writer, target in self.outputs:
             if isinstance(target, Path) and isinstance(writer, TabularStreamWriter) and writer.headers_changed:
-                logger.info("Rewriting %s with updated headers", target)
-                tmp_path = str(target) + ".tmp"
-                with open(target, encoding="utf-8") as src, open(tmp_path, "w", encoding="utf-8") as dst:
-                    for line in rewrite_header_and_pad(iter(src), writer.get_final_headers(), writer.separator):
-                        dst.write(line)
-                os.replace(tmp_path, str(target))
+                rewrite_tabular_output(target, writer)
+
+    def _write_serial(self, chunks: Iterator[list[dict]], sinks: list[BufferedSink]) -> None:
+        """Serialize every chunk for every output on the calling thread."""
+        # Fan out each chunk to every writer
+        for chunk in chunks:
+            for idx, (writer, _target) in enumerate(self.outputs):
+                for fragment in writer.write_chunk(chunk):
+                    sinks[idx].write(fragment)
+
+        # Finalize each writer
+        for idx, (writer, _target) in enumerate(self.outputs):
+            for fragment in writer.finalize():
+                sinks[idx].write(fragment)
+            sinks[idx].flush()
+
+    def _write_threaded(self, chunks: Iterator[list[dict]], sinks: list[BufferedSink]) -> None:
+        """Hand each chunk to per-output writer threads through bounded queues."""
+        workers = [
+            _OutputWorker(writer, sink, self.queue_size)
+            for (writer, _target), sink in zip(self.outputs, sinks)  # noqa: B905
+        ]
+        for worker in workers:
+            worker.start()
+        # Workers drain their queues even after failing, so the end-of-stream
+        # puts cannot block indefinitely.
+        end = _QUEUE_ABORT
+        try:
+            for chunk in chunks:
+                for worker in workers:
+                    if worker.error is not None:
+                        raise worker.error
+                    worker.queue.put(chunk)
+            end = _QUEUE_DONE
+        finally:
+            # After a failure (ours or a worker's) no output is finalized, so a
+            # truncated JSON array or YAML stream is never closed off.
+            for worker in workers:
+                worker.queue.put(end)
+            for worker in workers:
+                worker.join()
+        for worker in workers:
+            if worker.error is not None:
+                raise worker.error
@@ -0,0 +1,208 @@
+"""Partitioned output: route transformed rows to per-class, rolling part files."""
+
+import logging
+import zlib
+from collections.abc import Callable, Iterator
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import IO, Any
+
+from linkml_map.writers.output_streams import (
+    DEFAULT_WRITE_BUFFER_SIZE,
+    BufferedSink,
+    JSONBackend,
+    OutputFormat,
+    StreamWriter,
+    TabularStreamWriter,
+    make_stream_writer,
+    rewrite_tabular_output,
+)
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class _PartFile:
+    """An open part file together with the writer that owns its headers."""
+
+    path: Path
+    writer: StreamWriter
+    handle: IO[str]
+    sink: BufferedSink
+    rows: int = 0
+    bytes: int = 0
+
+
+@dataclass
+class PartitionedWriter:
+    """
+    Write tagged rows into one directory per class, split into part files.
+
+    Rows arrive as ``(class_name, row)`` pairs, as produced by
+    ``transform_spec(..., with_class_derivation=True)``. Each class gets its
+    own subdirectory under *output_dir*. When *partition_key* is set, rows
+    are also hash-partitioned by that slot's value into *num_partitions*
+    ``bucket=NNN`` subdirectories. Within each directory, output rolls to a
+    new ``part-NNNNN`` file after *max_rows* rows or *max_bytes* UTF-8 bytes
+    (the byte limit is checked after each chunk is written).
+
+    Every part file has its own ``StreamWriter``, so JSON arrays are closed
+    and tabular headers are tracked (and rewritten if they grew) per file.
+
+    :param output_dir: Root directory for the partitioned output.
+    :param output_format: Format of every part file.
+    :param partition_key: Optional slot to hash-partition rows by.
+    :param num_partitions: Number of hash buckets when *partition_key* is set.
+    :param max_rows: Roll to a new part file after this many rows.
+    :param max_bytes: Roll to a new part file once this many bytes are written.
+    :param buffer_size: Size of each part file's write-coalescing buffer.
+    :param json_backend: Optional JSON serializer for JSON/JSONL part files.
+    """
+
+    output_dir: Path
+    output_format: OutputFormat
+    partition_key: str | None = None
+    num_partitions: int = 1
+    max_rows: int | None = None
+    max_bytes: int | None = None
+    buffer_size: int = DEFAULT_WRITE_BUFFER_SIZE
+    json_backend: JSONBackend | None = None
+    written: list[Path] = field(default_factory=list, init=False)
+    _open: dict[tuple[str, int | None], _PartFile] = field(default_factory=dict, init=False, repr=False)
+    _next_part: dict[tuple[str, int | None], int] = field(default_factory=dict, init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        """Validate the partitioning parameters."""
+        self.output_dir = Path(self.output_dir)
+        if self.num_partitions < 1:
+            msg = f"num_partitions must be at least 1, got {self.num_partitions}"
+            raise ValueError(msg)
+
+    def bucket(self, row: dict[str, Any]) -> int | None:
+        """Return the hash bucket for *row*, or ``None`` when not hash-partitioning.
+
+        Uses CRC32 of the key's string form, so bucket assignment is stable
+        across runs and processes. Rows without a key value go to bucket 0.
+        """
+        if self.partition_key is None:
+            return None
+        value = row.get(self.partition_key)
+        if value is None:
+            return 0
+        return zlib.crc32(str(value).encode("utf-8")) % self.num_partitions
+
+    def write_all(
+        self,
+        tagged_chunks: Iterator[list[tuple[str, dict[str, Any]]]],
+        checkpoint_every: int | None = None,
+        on_checkpoint: Callable[[dict[str, Any]], None] | None = None,
+    ) -> list[Path]:
+        """
+        Consume chunks of ``(class_name, row)`` pairs and write every part file.
+
+        With *checkpoint_every*, once at least that many rows were written
+        since the last checkpoint, every open part file is closed (so later
+        rows start new parts) and *on_checkpoint* is called with
+        :meth:`get_state`. Every part file listed in that state is complete.
+
+        :param tagged_chunks: Iterator of lists of ``(class_name, row)`` pairs.
+        :param checkpoint_every: Rows between checkpoints (checked between chunks).
+        :param on_checkpoint: Callback receiving the state at each checkpoint.
+        :return: Paths of all part files written, in creation order.
+        """
+        since_checkpoint = 0
+        try:
+            for chunk in tagged_chunks:
+                groups: dict[tuple[str, int | None], list[dict[str, Any]]] = {}
+                for class_name, row in chunk:
+                    groups.setdefault((class_name, self.bucket(row)), []).append(row)
+                for key, rows in groups.items():
+                    self._write_rows(key, rows)
+                since_checkpoint += len(chunk)
+                if checkpoint_every is not None and since_checkpoint >= checkpoint_every:
+                    for key in list(self._open):
+                        self._close(key)
+                    if on_checkpoint is not None:
+                        on_checkpoint(self.get_state())
+                    since_checkpoint = 0
+        finally:
+            for key in list(self._open):
+                self._close(key)
+        return self.written
+
+    def get_state(self) -> dict[str, Any]:
+        """Return the completed part files and next part numbers, for checkpointing."""
+        return {
+            "written": [str(p) for p in self.written],
+            "next_part": [[class_name, bucket, n] for (class_name, bucket), n in self._next_part.items()],
+        }
+
+    def set_state(self, state: dict[str, Any]) -> None:
+        """
+        Resume from a :meth:`get_state` snapshot.
+
+        Part files under *output_dir* that are not listed in the snapshot were
+        started after it was taken and are deleted.
+        """
+        self.written = [Path(p) for p in state["written"]]
+        self._next_part = {(class_name, bucket): n for class_name, bucket, n in state["next_part"]}
+        complete = set(self.written)
+        for path in self.output_dir.glob(f"**/part-*.{self.output_format.value}"):
+            if path not in complete:
+                path.unlink()
+                logger.info("Removed incomplete part file %s", path)
+
+    def _write_rows(self, key: tuple[str, int | None], rows: list[dict[str, Any]]) -> None:
+        """Write *rows* to the current part file for *key*, rolling as limits are reached."""
+        while rows:
+            part = self._open.get(key) or self._start(key)
+            take = len(rows) if self.max_rows is None else min(len(rows), self.max_rows - part.rows)
+            batch, rows = rows[:take], rows[take:]
+            for fragment in part.writer.write_chunk(batch):
+                part.sink.write(fragment)
+                if self.max_bytes is not None:
+                    part.bytes += len(fragment.encode("utf-8"))
+            part.rows += len(batch)
+            if (self.max_rows is not None and part.rows >= self.max_rows) or (
+                self.max_bytes is not None and part.bytes >= self.max_bytes
+            ):
+                self._close(key)
+
+    def _directory(self, key: tuple[str, int | None]) -> Path:
+        """Directory holding the part files for a ``(class_name, bucket)`` key."""
+        class_name, bucket = key
+        directory = self.output_dir / class_name
+        if bucket is not None:
+            directory = directory / f"bucket={bucket:03d}"
+        return directory
+
+    def _start(self, key: tuple[str, int | None]) -> _PartFile:
+        """Open the next part file for *key*."""
+        directory = self._directory(key)
+        directory.mkdir(parents=True, exist_ok=True)
+        index = self._next_part.get(key, 0)
+        self._next_part[key] = index + 1
+        path = directory / f"part-{index:05d}.{self.output_format.value}"
+        handle = open(path, "w", encoding="utf-8")  # noqa: SIM115 - closed in _close
+        part = _PartFile(
+            path=path,
+            writer=make_stream_writer(self.output_format, json_backend=self.json_backend),
+            handle=handle,
+            sink=BufferedSink(handle, self.buffer_size),
+        )
+        self._open[key] = part
+        self.written.append(path)
+        logger.debug("Opened part file %s", path)
+        return part
+
+    def _close(self, key: tuple[str, int | None]) -> None:
+        """Finalize and close the open part file for *key*."""
+        part = self._open.pop(key)
+        try:
+            for fragment in part.writer.finalize():
+                part.sink.write(fragment)
+            part.sink.flush()
+        finally:
+            part.handle.close()
+        if isinstance(part.writer, TabularStreamWriter) and part.writer.headers_changed:
+            rewrite_tabular_output(part.path, part.writer)
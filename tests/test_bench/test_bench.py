@@ -0,0 +1,72 @@
+"""Tests for synthetic data generation and the benchmark runner."""
+
+import csv
+import json
+
+import pytest
+from click.testing import CliRunner
+from linkml_runtime import SchemaView
+
+from linkml_map.bench import SCENARIOS, RowGenerator, format_report, run_benchmarks, write_synthetic_data
+from linkml_map.bench.scenarios import SOURCE_SCHEMA
+from linkml_map.cli.cli import main
+
+
+@pytest.fixture(scope="module")
+def sv() -> SchemaView:
+    return SchemaView(SOURCE_SCHEMA)
+
+
+def test_rows_respect_schema(sv):
+    generator = RowGenerator(sv, {"Person": 50, "Visit": 200}, references={("Visit", "person_id"): "Person"})
+    people = list(generator.rows("Person"))
+    visits = list(generator.rows("Visit"))
+
+    assert len({p["id"] for p in people}) == 50
+    assert {p["status"] for p in people} <= {"ACTIVE", "INACTIVE", "PENDING", "DECEASED"}
+    assert all(0 <= p["age_in_years"] <= 99 for p in people)
+    assert all(140 <= p["height_cm"] <= 210 for p in people)
+    assert "measurements" not in people[0]
+    assert {v["person_id"] for v in visits} <= {p["id"] for p in people}
+
+
+def test_rows_are_deterministic(sv):
+    assert list(RowGenerator(sv, {"Person": 5}, seed=1).rows("Person")) == list(
+        RowGenerator(sv, {"Person": 5}, seed=1).rows("Person")
+    )
+    assert list(RowGenerator(sv, {"Person": 5}, seed=1).rows("Person")) != list(
+        RowGenerator(sv, {"Person": 5}, seed=2).rows("Person")
+    )
+
+
+def test_write_synthetic_data(sv, tmp_path):
+    written = write_synthetic_data(RowGenerator(sv, {"Person": 3}), tmp_path)
+    with open(written["Person"], newline="") as fh:
+        rows = list(csv.DictReader(fh, delimiter="\t"))
+    assert [r["id"] for r in rows] == ["Person:00000000", "Person:00000001", "Person:00000002"]
+    assert rows[0]["smoker"] in ("true", "false")
+
+
+def test_every_scenario_runs():
+    report = run_benchmarks(SCENARIOS, rows=20, isolate=False)
+    assert [r["scenario"] for r in report["results"]] == [s.name for s in SCENARIOS]
+    for result in report["results"]:
+        assert result["rows_in"] == 20
+        assert result["rows_out"] == 20, result["scenario"]
+        assert set(result["stages"]) == {"load", "generate", "transform", "serialize"}
+    assert "speed-up" in format_report(report, baseline=report).splitlines()[0]
+
+
+def test_bench_cli(tmp_path):
+    output = tmp_path / "report.json"
+    result = CliRunner().invoke(
+        main, ["bench", "--rows", "10", "--scenario", "flat_copy", "--no-isolate", "-o", str(output)]
+    )
+    assert result.exit_code == 0, result.output
+    report = json.loads(output.read_text())
+    assert report["settings"]["rows"] == 10
+    assert report["results"][0]["rows_out"] == 10
+
+    result = CliRunner().invoke(main, ["bench", "--scenario", "nope"])
+    assert result.exit_code != 0
+    assert "Unknown scenario" in result.output
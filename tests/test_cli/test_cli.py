@@ -180,6 +180,26 @@ def test_map_data(runner: CliRunner) -> None:
     assert yaml.safe_load(result.stdout) == _drop_nulls(expected)
 
 
+def test_map_data_with_schema_snapshot(runner: CliRunner, tmp_path: Path) -> None:
+    """A schema snapshot can stand in for the source schema YAML."""
+    snapshot = tmp_path / "personinfo.schema-snapshot"
+    result = runner.invoke(main, ["schema-snapshot", "-o", str(snapshot), str(PERSONINFO_SRC_SCHEMA)])
+    assert result.exit_code == 0, result.output
+
+    cmd = _map_data_cmd("--unrestricted-eval")
+    cmd[cmd.index(str(PERSONINFO_SRC_SCHEMA))] = str(snapshot)
+    result = runner.invoke(main, cmd)
+    assert result.exit_code == 0, result.output
+    assert result.stdout == runner.invoke(main, _map_data_cmd("--unrestricted-eval")).stdout
+
+
+def test_schema_snapshot_requires_suffix(runner: CliRunner, tmp_path: Path) -> None:
+    """Snapshots must be named so that no other schema path is ever unpickled."""
+    result = runner.invoke(main, ["schema-snapshot", "-o", str(tmp_path / "s.yaml"), str(PERSONINFO_SRC_SCHEMA)])
+    assert result.exit_code != 0
+    assert ".schema-snapshot" in result.output
+
+
 def test_map_data_without_unrestricted_eval_fails(runner: CliRunner) -> None:
     """The example's ``src.`` expressions need unrestricted eval; safe mode must not
     silently emit partial data.
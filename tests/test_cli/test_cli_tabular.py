@@ -3,12 +3,14 @@
 import json
 import os
 from pathlib import Path
+from typing import Any
 
 import pytest
 import yaml
 from click.testing import CliRunner
 
 from linkml_map.cli.cli import main
+from linkml_map.transformer.object_transformer import ObjectTransformer
 
 # Test data directory
 TABULAR_TEST_DIR = Path(__file__).parent.parent / "input" / "examples" / "tabular"
@@ -511,6 +513,378 @@ def test_additional_output_stdout_primary(
     assert len(json_data) == 2
 
 
+def test_pipeline_matches_serial(
+    runner: CliRunner,
+    sample_tsv_data: Path,
+    sample_schema: Path,
+    sample_transform: Path,
+) -> None:
+    """--pipeline emits the same records as a serial run and reports stage waits."""
+    base = [
+        "map-data",
+        "-T",
+        str(sample_transform),
+        "-s",
+        str(sample_schema),
+        "--source-type",
+        "Person",
+        "-f",
+        "jsonl",
+        "--chunk-size",
+        "1",
+        str(sample_tsv_data),
+    ]
+    serial = runner.invoke(main, base)
+    piped = runner.invoke(main, [*base, "--pipeline", "--pipeline-queue-size", "1"])
+    assert serial.exit_code == 0, serial.stderr
+    assert piped.exit_code == 0, piped.stderr
+    assert piped.stdout == serial.stdout
+    assert "Pipeline stages:" in piped.stderr
+    assert "read:" in piped.stderr
+    assert "transform:" in piped.stderr
+
+
+@pytest.mark.parametrize("json_backend", ["json", "orjson"])
+def test_json_backend_and_write_buffer_size(
+    runner: CliRunner,
+    sample_tsv_data: Path,
+    sample_schema: Path,
+    sample_transform: Path,
+    json_backend: str,
+) -> None:
+    """--json-backend and --write-buffer-size do not change the emitted records."""
+    if json_backend == "orjson":
+        pytest.importorskip("orjson")
+    result = runner.invoke(
+        main,
+        [
+            "map-data",
+            "-T",
+            str(sample_transform),
+            "-s",
+            str(sample_schema),
+            "--source-type",
+            "Person",
+            "-f",
+            "jsonl",
+            "--json-backend",
+            json_backend,
+            "--write-buffer-size",
+            "0",
+            str(sample_tsv_data),
+        ],
+    )
+    assert result.exit_code == 0, result.stderr
+    rows = [json.loads(line) for line in result.stdout.strip().split("\n") if line]
+    assert [row["label"] for row in rows] == ["Alice", "Bob"]
+
+
+def test_output_dir_partitioned(
+    runner: CliRunner,
+    sample_tsv_data: Path,
+    sample_schema: Path,
+    sample_transform: Path,
+    tmp_path: Path,
+) -> None:
+    """--output-dir writes one directory per target class, rolled by row count."""
+    out_dir = tmp_path / "out"
+    result = runner.invoke(
+        main,
+        [
+            "map-data",
+            "-T",
+            str(sample_transform),
+            "-s",
+            str(sample_schema),
+            "--source-type",
+            "Person",
+            "--output-dir",
+            str(out_dir),
+            "--max-rows-per-file",
+            "1",
+            str(sample_tsv_data),
+        ],
+    )
+    assert result.exit_code == 0, result.stderr
+    parts = sorted((out_dir / "Agent").glob("part-*.jsonl"))
+    assert [p.name for p in parts] == ["part-00000.jsonl", "part-00001.jsonl"]
+    labels = [json.loads(p.read_text())["label"] for p in parts]
+    assert labels == ["Alice", "Bob"]
+
+
+def test_checkpoint_resume_after_crash(
+    runner: CliRunner,
+    sample_schema: Path,
+    sample_transform: Path,
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """A run interrupted mid-stream and resumed with --resume writes the same files as an uninterrupted run."""
+    import linkml_map.cli.cli as cli_module
+
+    data = tmp_path / "Person.tsv"
+    people = "".join(f"P:{i:03d}\tName{i}\tp{i}@example.com\t{20 + i}\tx\n" for i in range(9))
+    data.write_text("id\tname\tprimary_email\tage_in_years\tgender\n" + people)
+    base = ["map-data", "-T", str(sample_transform), "-s", str(sample_schema), "--source-type", "Person"]
+    base += ["--chunk-size", "2"]
+
+    expected = runner.invoke(
+        main, [*base, "-o", str(tmp_path / "expected.tsv"), "-O", str(tmp_path / "expected.json"), str(data)]
+    )
+    assert expected.exit_code == 0, expected.stderr
+
+    real_chunked = cli_module.chunked
+
+    def preempted(iterable, n):
+        for i, chunk in enumerate(real_chunked(iterable, n)):
+            if i == 3:
+                msg = "preempted"
+                raise RuntimeError(msg)
+            yield chunk
+
+    checkpoint = tmp_path / "out.ckpt"
+    args = [*base, "-o", str(tmp_path / "out.tsv"), "-O", str(tmp_path / "out.json")]
+    args += ["--checkpoint", str(checkpoint), "--checkpoint-every", "2", str(data)]
+    monkeypatch.setattr(cli_module, "chunked", preempted)
+    crashed = runner.invoke(main, args)
+    assert crashed.exit_code != 0
+    assert json.loads(checkpoint.read_text())["row"] == 6
+    monkeypatch.undo()
+
+    resumed = runner.invoke(main, [*args, "--resume"])
+    assert resumed.exit_code == 0, resumed.stderr
+    assert "Resuming from" in resumed.stderr
+    assert (tmp_path / "out.tsv").read_text() == (tmp_path / "expected.tsv").read_text()
+    assert (tmp_path / "out.json").read_text() == (tmp_path / "expected.json").read_text()
+    assert not checkpoint.exists()
+
+
+def test_checkpoint_requires_file_output(
+    runner: CliRunner,
+    sample_tsv_data: Path,
+    sample_schema: Path,
+    sample_transform: Path,
+    tmp_path: Path,
+) -> None:
+    result = runner.invoke(
+        main,
+        [
+            "map-data",
+            "-T",
+            str(sample_transform),
+            "-s",
+            str(sample_schema),
+            "--checkpoint",
+            str(tmp_path / "ckpt"),
+            str(sample_tsv_data),
+        ],
+    )
+    assert result.exit_code != 0
+    assert "--checkpoint requires -o/--output or --output-dir" in result.output
+
+
+def test_manifest_incremental_delta(
+    runner: CliRunner,
+    sample_tsv_data: Path,
+    sample_schema: Path,
+    sample_transform: Path,
+    tmp_path: Path,
+) -> None:
+    """With --manifest, a re-run outputs only changed rows and tombstones removed ones."""
+    manifest = tmp_path / "rows.manifest"
+    tombstones = tmp_path / "deleted.jsonl"
+    delta = tmp_path / "delta.jsonl"
+    args = ["map-data", "-T", str(sample_transform), "-s", str(sample_schema), "--source-type", "Person"]
+    args += ["-o", str(delta), "--manifest", str(manifest), "--tombstones", str(tombstones), str(sample_tsv_data)]
+
+    first = runner.invoke(main, args)
+    assert first.exit_code == 0, first.stderr
+    assert [json.loads(line)["id"] for line in delta.read_text().splitlines()] == ["P:001", "P:002"]
+    assert "2 new, 0 changed, 0 unchanged, 0 deleted" in first.stderr
+
+    sample_tsv_data.write_text(
+        "id\tname\tprimary_email\tage_in_years\tgender\n"
+        "P:001\tAlice\talice@example.com\t31\tcisgender woman\n"
+        "P:003\tCarol\tcarol@example.com\t40\tcisgender woman\n"
+    )
+    second = runner.invoke(main, args)
+    assert second.exit_code == 0, second.stderr
+    assert [json.loads(line)["id"] for line in delta.read_text().splitlines()] == ["P:001", "P:003"]
+    assert [json.loads(line) for line in tombstones.read_text().splitlines()] == [
+        {"class_derivation": "Agent", "id": "P:002"}
+    ]
+
+
+def test_spec_cache_reuses_loaded_spec(
+    runner: CliRunner,
+    sample_tsv_data: Path,
+    sample_schema: Path,
+    sample_transform: Path,
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """A second run with --spec-cache-dir restores the spec instead of loading it."""
+    cache_dir = tmp_path / "spec-cache"
+    args = ["map-data", "-T", str(sample_transform), "-s", str(sample_schema), "--source-type", "Person"]
+    args += ["--spec-cache-dir", str(cache_dir), "-f", "jsonl", str(sample_tsv_data)]
+
+    first = runner.invoke(main, args)
+    assert first.exit_code == 0, first.stderr
+    assert len(list(cache_dir.glob("*.pickle"))) == 1
+
+    def fail(*_args: Any, **_kwargs: Any) -> None:
+        msg = "spec should come from the cache"
+        raise AssertionError(msg)
+
+    monkeypatch.setattr(ObjectTransformer, "load_transformer_specifications", fail)
+    second = runner.invoke(main, args)
+    assert second.exit_code == 0, second.stderr
+    assert second.stdout == first.stdout
+
+
+def test_profile_reports_slot_derivations(
+    runner: CliRunner,
+    sample_tsv_data: Path,
+    sample_schema: Path,
+    sample_transform: Path,
+    tmp_path: Path,
+) -> None:
+    """--profile prints per-slot timings to stderr and --profile-output writes them as JSON."""
+    profile_path = tmp_path / "profile.json"
+    args = ["map-data", "-T", str(sample_transform), "-s", str(sample_schema), "--source-type", "Person"]
+    plain = runner.invoke(main, [*args, "-f", "jsonl", str(sample_tsv_data)])
+    result = runner.invoke(main, [*args, "--profile-output", str(profile_path), "-f", "jsonl", str(sample_tsv_data)])
+    assert result.exit_code == 0, result.stderr
+    assert result.stdout == plain.stdout
+    assert "Slot derivation profile:" in result.stderr
+    assert "By strategy:" in result.stderr
+
+    profile = json.loads(profile_path.read_text())
+    rows = len(plain.stdout.splitlines())
+    assert profile["slots"]
+    assert all(slot["calls"] == rows for slot in profile["slots"])
+    assert set(profile["strategies"]) == {slot["strategy"] for slot in profile["slots"]}
+
+
+def test_memoize_expressions_keeps_output(
+    runner: CliRunner,
+    sample_tsv_data: Path,
+    sample_schema: Path,
+    sample_transform: Path,
+) -> None:
+    """--memoize-expressions leaves output unchanged and reports hit rates to stderr."""
+    args = ["map-data", "-T", str(sample_transform), "-s", str(sample_schema), "--source-type", "Person"]
+    plain = runner.invoke(main, [*args, "-f", "jsonl", str(sample_tsv_data)])
+    result = runner.invoke(main, [*args, "--memoize-expressions", "-f", "jsonl", str(sample_tsv_data)])
+    assert result.exit_code == 0, result.stderr
+    assert result.stdout == plain.stdout
+    assert "Expression memo:" in result.stderr
+    assert "str({age_in_years}) + ' years'" in result.stderr
+
+
+def test_metrics_outputs(
+    runner: CliRunner,
+    sample_tsv_data: Path,
+    sample_schema: Path,
+    sample_transform: Path,
+    tmp_path: Path,
+) -> None:
+    """--progress, --metrics-file and --prometheus-file report the finished run."""
+    metrics_path, prom_path = tmp_path / "metrics.json", tmp_path / "metrics.prom"
+    args = ["map-data", "-T", str(sample_transform), "-s", str(sample_schema), "--source-type", "Person"]
+    args += ["--progress", "--metrics-file", str(metrics_path), "--prometheus-file", str(prom_path)]
+    result = runner.invoke(main, [*args, "-f", "jsonl", str(sample_tsv_data)])
+    assert result.exit_code == 0, result.stderr
+    assert "done, 1 block(s), 2 rows in, 2 out, 0 errors" in result.stderr
+
+    metrics = json.loads(metrics_path.read_text())
+    assert metrics["done"] is True
+    assert (metrics["rows_in"], metrics["rows_out"]) == (2, 2)
+    assert metrics["blocks"][0]["class_derivation"] == "Agent"
+    assert "linkml_map_rows_out_total 2\n" in prom_path.read_text()
+
+
+def test_explain_reports_block_plans(
+    runner: CliRunner,
+    sample_tsv_data: Path,
+    sample_schema: Path,
+    sample_transform: Path,
+) -> None:
+    """explain prints one plan per class_derivation block, as text or JSON."""
+    args = ["explain", "-T", str(sample_transform), "-s", str(sample_schema)]
+    result = runner.invoke(main, [*args, str(sample_tsv_data)])
+    assert result.exit_code == 0, result.stderr
+    assert "per-row lookup (no joins" in result.stdout
+    assert "block(s):" in result.stdout
+
+    result = runner.invoke(main, [*args, "--format", "json", str(sample_tsv_data)])
+    assert result.exit_code == 0, result.stderr
+    plans = json.loads(result.stdout)
+    assert plans
+    assert {plan["path"] for plan in plans} <= {"per_row", "skipped"}
+
+
+def test_output_dir_conflicts_with_output(
+    runner: CliRunner,
+    sample_tsv_data: Path,
+    sample_schema: Path,
+    sample_transform: Path,
+    tmp_path: Path,
+) -> None:
+    result = runner.invoke(
+        main,
+        [
+            "map-data",
+            "-T",
+            str(sample_transform),
+            "-s",
+            str(sample_schema),
+            "--output-dir",
+            str(tmp_path / "out"),
+            "-o",
+            str(tmp_path / "out.jsonl"),
+            str(sample_tsv_data),
+        ],
+    )
+    assert result.exit_code != 0
+    assert "--output-dir cannot be combined" in result.output
+
+
+def test_additional_output_duckdb(
+    runner: CliRunner,
+    sample_tsv_data: Path,
+    sample_schema: Path,
+    sample_transform: Path,
+    tmp_path: Path,
+) -> None:
+    """-O out.duckdb loads rows into a table named after the target class."""
+    import duckdb
+
+    db_path = tmp_path / "out.duckdb"
+    jsonl_path = tmp_path / "out.jsonl"
+    result = runner.invoke(
+        main,
+        [
+            "map-data",
+            "-T",
+            str(sample_transform),
+            "-s",
+            str(sample_schema),
+            "--source-type",
+            "Person",
+            "-o",
+            str(jsonl_path),
+            "-O",
+            str(db_path),
+            str(sample_tsv_data),
+        ],
+    )
+    assert result.exit_code == 0, result.stderr
+    assert len(jsonl_path.read_text().strip().split("\n")) == 2
+    con = duckdb.connect(str(db_path))
+    assert con.execute('SELECT label FROM "Agent" ORDER BY id').fetchall() == [("Alice",), ("Bob",)]
+
+
 class TestMapDataWithExistingTestData:
     """Tests using the existing test fixtures."""
 
@@ -0,0 +1,59 @@
+"""Startup budget for the command line interface.
+
+The CLI is invoked many times in short-lived workflow steps, where import time
+dominates. Importing it must not pull in the transformer stack or optional
+heavy dependencies; those are imported by the commands that use them.
+"""
+
+import json
+import os
+import subprocess
+import sys
+
+import pytest
+
+#: Modules that must only be imported on first use.
+DEFERRED_MODULES = [
+    "asteval",
+    "duckdb",
+    "graphviz",
+    "jinja2",
+    "linkml_map.transformer.object_transformer",
+    "linkml_runtime",
+    "pint",
+    "ucumvert",
+]
+
+#: Generous wall-clock budget (seconds) for ``import linkml_map.cli.cli``.
+IMPORT_BUDGET = float(os.environ.get("LINKML_MAP_STARTUP_BUDGET", "1.5"))
+
+_PROBE = """
+import json, sys, time
+start = time.perf_counter()
+import linkml_map.cli.cli
+elapsed = time.perf_counter() - start
+print(json.dumps({"elapsed": elapsed, "modules": sorted(sys.modules)}))
+"""
+
+
+@pytest.fixture(scope="module")
+def cli_import() -> dict:
+    """Import the CLI in a fresh interpreter and report what it loaded."""
+    result = subprocess.run([sys.executable, "-c", _PROBE], capture_output=True, text=True, check=True)  # noqa: S603
+    return json.loads(result.stdout)
+
+
+@pytest.mark.parametrize("module", DEFERRED_MODULES)
+def test_cli_import_defers_heavy_modules(cli_import: dict, module: str) -> None:
+    assert module not in cli_import["modules"]
+
+
+def test_cli_import_within_budget(cli_import: dict) -> None:
+    assert cli_import["elapsed"] < IMPORT_BUDGET
+
+
+def test_unit_conversion_import_defers_registry() -> None:
+    """Importing the unit conversion functions must not build a unit registry."""
+    probe = "import sys, linkml_map.functions.unit_conversion; print('pint' in sys.modules)"
+    result = subprocess.run([sys.executable, "-c", probe], capture_output=True, text=True, check=True)  # noqa: S603
+    assert result.stdout.strip() == "False"
@@ -0,0 +1,89 @@
+"""Tests for expression bindings and the per-derivation binding plan."""
+
+from __future__ import annotations
+
+import copy
+import textwrap
+
+import pytest
+import yaml
+
+from linkml_map.session import Session
+from linkml_map.transformer.object_transformer import Bindings, DerivationContext
+
+SRC = yaml.safe_load(
+    textwrap.dedent("""\
+    id: https://example.org/bind
+    name: bind
+    prefixes: {linkml: https://w3id.org/linkml/}
+    default_prefix: bind
+    default_range: string
+    imports: [linkml:types]
+    classes:
+      Person:
+        attributes:
+          id: {identifier: true}
+          name: {range: string}
+          age: {range: integer}
+          aliases: {range: string, multivalued: true}
+    """)
+)
+
+SPEC = {
+    "class_derivations": {
+        "Agent": {
+            "populated_from": "Person",
+            "slot_derivations": {
+                "id": {},
+                "age_in_months": {"expr": "age * 12"},
+                "label": {"expr": "name + ' (' + str(len(aliases)) + ')'"},
+                "me": {"expr": "Person.name"},
+            },
+        }
+    },
+}
+
+
+@pytest.fixture
+def transformer():
+    session = Session()
+    session.set_source_schema(SRC)
+    session.set_object_transformer(copy.deepcopy(SPEC))
+    tr = session.object_transformer
+    tr.source_schemaview = session.source_schemaview
+    return tr
+
+
+def _bindings(transformer, row: dict) -> Bindings:
+    class_deriv = transformer._get_class_derivation("Person")
+    context = DerivationContext(row, None, "Person", transformer.source_schemaview, class_deriv)
+    return Bindings.from_context(transformer, context)
+
+
+def test_plan_built_once_per_class_derivation(transformer, monkeypatch) -> None:
+    """Schema slots are collected once, not once per row."""
+    rows = [{"id": f"P{i}", "name": f"n{i}", "age": i, "aliases": ["a", "b"]} for i in range(5)]
+    first = transformer.map_object(rows[0], "Person")
+
+    sv = transformer.source_schemaview
+    calls = []
+    original = sv.class_induced_slots
+    monkeypatch.setattr(sv, "class_induced_slots", lambda *a, **kw: calls.append(a) or original(*a, **kw))
+    results = [first] + [transformer.map_object(row, "Person") for row in rows[1:]]
+
+    assert calls == []
+    assert len(transformer._binding_plans) == 1
+    assert results[2] == {"id": "P2", "age_in_months": 24, "label": "n2 (2)", "me": "n2"}
+
+
+def test_bindings_classify_names(transformer) -> None:
+    """Scalars bind directly; lists still go through dynamic_object; unknown names raise."""
+    bindings = _bindings(transformer, {"id": "P1", "age": 3, "aliases": ["x"]})
+
+    assert bindings["age"] == 3
+    assert bindings["aliases"] == ["x"]
+    assert bindings["Person"].age == 3
+    # Declared on Person but absent from the row: SQL null.
+    assert bindings["name"] is None
+    with pytest.raises(KeyError):
+        bindings["nmae"]
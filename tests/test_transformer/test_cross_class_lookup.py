@@ -214,6 +214,21 @@ def test_integration(integration_container_scaffold):
     assert result == integration_container_scaffold["expected"]
 
 
+def test_expr_fk_lookup_uses_fk_index(container_scaffold, monkeypatch):
+    """Expressions dereference FKs through the FK index, not ObjectIndex proxies."""
+    setup_expr_fk_lookup(container_scaffold)
+    obj_tr = ObjectTransformer(unrestricted_eval=False)
+    obj_tr.source_schemaview = container_scaffold["source_schema"]
+    obj_tr.target_schemaview = container_scaffold["target_schema"]
+    obj_tr.create_transformer_specification(container_scaffold["transform_spec"])
+    obj_tr.index(container_scaffold["input_data"], "Container")
+    monkeypatch.setattr(obj_tr.object_index, "bless", None)
+    monkeypatch.setattr(obj_tr.object_index, "clear_proxy_object_cache", None)
+
+    result = obj_tr.map_object(container_scaffold["input_data"]["persons"][0], source_type="Person")
+    assert result == container_scaffold["expected"]
+
+
 def test_no_object_index_warning(container_scaffold, caplog):
     """Without object_index, cross-class lookup returns None with warning."""
     apply_schema_patch(
@@ -11,13 +11,16 @@ See: https://github.com/linkml/linkml-map/pull/136
 # ruff: noqa: ANN401, PLR2004
 
 import textwrap
+from itertools import islice
 
+import pytest
 import yaml
 from linkml_runtime import SchemaView
 
 from linkml_map.loaders.data_loaders import DataLoader
-from linkml_map.transformer.engine import transform_spec
+from linkml_map.transformer.engine import TransformProgress, transform_spec
 from linkml_map.transformer.object_transformer import ObjectTransformer
+from linkml_map.utils.manifest import RowManifest
 
 # ---- shared schemas ----
 
@@ -229,3 +232,175 @@ def test_mixed_derivations_with_and_without_joins(tmp_path):
     # Second: SimpleSample without join
     assert results[1]["sample_id"] == "S001"
     assert results[1]["name"] == "Alpha"
+
+
+# ---- checkpoint / resume ----
+
+
+@pytest.mark.parametrize("cut", [0, 1, 17, 25, 26, 40, 50])
+def test_progress_resume_matches_uninterrupted(tmp_path, cut):
+    """Resuming from a saved TransformProgress yields exactly the remaining rows.
+
+    The first block uses the join engine and the second the per-row path, so
+    the cut points cover both, and the boundary between them.
+    """
+    samples = "".join(f"S{i:03d}\tName{i}\tSITE_{i % 3}\n" for i in range(25))
+    (tmp_path / "samples.tsv").write_text("sample_id\tname\tsite_code\n" + samples)
+    (tmp_path / "sites.tsv").write_text("site_code\tsite_name\n" + "".join(f"SITE_{i}\tSite {i}\n" for i in range(3)))
+    spec = textwrap.dedent("""\
+        class_derivations:
+          FlatSample:
+            populated_from: samples
+            joins:
+              sites:
+                join_on: site_code
+            slot_derivations:
+              sample_id:
+                populated_from: sample_id
+              site_name:
+                expr: "{sites.site_name}"
+          SimpleSample:
+            populated_from: samples
+            slot_derivations:
+              sample_id:
+                populated_from: sample_id
+    """)
+    target_sv = SchemaView(TARGET_SCHEMA_YAML + "  SimpleSample:\n    attributes:\n      sample_id: {}\n")
+    tr = _make_transformer(SchemaView(SOURCE_SCHEMA_YAML), target_sv, spec)
+    loader = DataLoader(tmp_path)
+
+    full = list(transform_spec(tr, loader, progress=TransformProgress()))
+    assert len(full) == 50
+
+    progress = TransformProgress()
+    rows = transform_spec(tr, loader, progress=progress)
+    head = list(islice(rows, cut))
+    saved = TransformProgress(progress.block, progress.row)
+    rows.close()
+
+    tail = list(transform_spec(tr, loader, progress=saved))
+    assert head + tail == full
+
+
+# ---- incremental (manifest) ----
+
+
+def test_manifest_transforms_only_changed_rows(tmp_path):
+    """A second run with a manifest yields only rows whose own or joined input changed."""
+    data = tmp_path / "data"
+    data.mkdir()
+    (data / "samples.tsv").write_text(
+        "sample_id\tname\tsite_code\nS001\tAlpha\tSITE_A\nS002\tBeta\tSITE_B\nS003\tGamma\tSITE_A\n"
+    )
+    (data / "sites.tsv").write_text("site_code\tsite_name\nSITE_A\tBoston\nSITE_B\tDenver\n")
+    spec = textwrap.dedent("""\
+        class_derivations:
+          FlatSample:
+            populated_from: samples
+            joins:
+              sites:
+                join_on: site_code
+            slot_derivations:
+              sample_id:
+                populated_from: sample_id
+              name:
+                populated_from: name
+              site_name:
+                expr: "{sites.site_name}"
+          SimpleSample:
+            populated_from: samples
+            slot_derivations:
+              sample_id:
+                populated_from: sample_id
+              name:
+                populated_from: name
+    """)
+    target_sv = SchemaView(
+        TARGET_SCHEMA_YAML + "  SimpleSample:\n    attributes:\n      sample_id: {}\n      name: {}\n"
+    )
+    tr = _make_transformer(SchemaView(SOURCE_SCHEMA_YAML), target_sv, spec)
+
+    def run():
+        with RowManifest(tmp_path / "rows.manifest") as manifest:
+            rows = list(transform_spec(tr, DataLoader(data), with_class_derivation=True, manifest=manifest))
+            tombstones = list(manifest.tombstones())
+            manifest.commit()
+        return [(cd, r["sample_id"]) for cd, r in rows], tombstones
+
+    first, _ = run()
+    assert len(first) == 6
+    assert run() == ([], [])
+
+    # S002's name changes, S003 is removed, and SITE_A's name changes (affecting
+    # S001 only through the join).
+    (data / "samples.tsv").write_text("sample_id\tname\tsite_code\nS001\tAlpha\tSITE_A\nS002\tBeta2\tSITE_B\n")
+    (data / "sites.tsv").write_text("site_code\tsite_name\nSITE_A\tCambridge\nSITE_B\tDenver\n")
+    rows, tombstones = run()
+    assert rows == [("FlatSample", "S001"), ("FlatSample", "S002"), ("SimpleSample", "S002")]
+    assert sorted((t["class_derivation"], t["id"]) for t in tombstones) == [
+        ("FlatSample", "S003"),
+        ("SimpleSample", "S003"),
+    ]
+
+
+@pytest.mark.parametrize("join_engine", [True, False])
+def test_manifest_same_named_class_derivations(tmp_path, join_engine):
+    """Class derivations sharing a name keep separate manifest blocks."""
+    data = tmp_path / "data"
+    data.mkdir()
+    (data / "samples.tsv").write_text("sample_id\tname\tsite_code\nS001\tAlpha\tSITE_A\n")
+    (data / "sites.tsv").write_text("site_code\tsite_name\nSITE_A\tBoston\n")
+    spec = textwrap.dedent("""\
+        class_derivations:
+          - name: FlatSample
+            populated_from: samples
+            slot_derivations:
+              sample_id: {populated_from: sample_id}
+          - name: FlatSample
+            populated_from: sites
+            slot_derivations:
+              sample_id: {populated_from: site_code}
+    """)
+    tr = _make_transformer(SchemaView(SOURCE_SCHEMA_YAML), SchemaView(TARGET_SCHEMA_YAML), spec)
+
+    def run():
+        with RowManifest(tmp_path / "rows.manifest") as manifest:
+            rows = list(transform_spec(tr, DataLoader(data), manifest=manifest, join_engine=join_engine))
+            tombstones = list(manifest.tombstones())
+            manifest.commit()
+        return [r["sample_id"] for r in rows], tombstones, manifest.summary()
+
+    assert run()[0] == ["S001", "SITE_A"]
+    assert run() == ([], [], "0 new, 0 changed, 2 unchanged, 0 deleted")
+    assert run() == ([], [], "0 new, 0 changed, 2 unchanged, 0 deleted")
+
+
+def test_manifest_tombstones_rows_of_removed_table(tmp_path):
+    """When a block's table disappears, all its recorded rows become tombstones."""
+    data = tmp_path / "data"
+    data.mkdir()
+    (data / "samples.tsv").write_text("sample_id\tname\tsite_code\nS001\tAlpha\tSITE_A\nS002\tBeta\tSITE_B\n")
+    spec = textwrap.dedent("""\
+        class_derivations:
+          FlatSample:
+            populated_from: samples
+            slot_derivations:
+              sample_id: {populated_from: sample_id}
+    """)
+    tr = _make_transformer(SchemaView(SOURCE_SCHEMA_YAML), SchemaView(TARGET_SCHEMA_YAML), spec)
+
+    def run():
+        with RowManifest(tmp_path / "rows.manifest") as manifest:
+            rows = list(transform_spec(tr, DataLoader(data), manifest=manifest))
+            tombstones = list(manifest.tombstones())
+            manifest.commit()
+        return [r["sample_id"] for r in rows], tombstones
+
+    assert run() == (["S001", "S002"], [])
+    (data / "samples.tsv").unlink()
+    rows, tombstones = run()
+    assert rows == []
+    assert sorted((t["class_derivation"], t["id"]) for t in tombstones) == [
+        ("FlatSample", "S001"),
+        ("FlatSample", "S002"),
+    ]
@@ -17,7 +17,17 @@ from linkml_runtime import SchemaView
 from linkml_map.loaders.data_loaders import DataLoader
 from linkml_map.session import Session
 from linkml_map.transformer.engine import transform_spec
-from linkml_map.transformer.join_engine import _collect_joins, can_use_join_engine
+from linkml_map.transformer.errors import TransformationError
+from linkml_map.transformer.explain import JOIN_ENGINE, PER_ROW, SKIPPED, explain_spec, format_plans
+from linkml_map.transformer.join_engine import (
+    _build_join_sql,
+    _collect_joins,
+    can_use_join_engine,
+    join_engine_rejection,
+)
+from linkml_map.utils.eval_utils import _distributing
+from linkml_map.utils.extensions import _BATCH_ATTR, BatchFunction
+from linkml_map.utils.metrics import TransformMetrics
 
 
 def _write(tmp_path, tables: dict[str, tuple[list[str], list[list]]]) -> None:
@@ -103,6 +113,244 @@ def test_flat_expr_join(tmp_path):
     assert out[0]["reading_score"] == 95.5
 
 
+def test_join_engine_disabled_matches_engine(tmp_path, monkeypatch):
+    """``join_engine=False`` forces the per-row path, with identical output."""
+    target = textwrap.dedent("""\
+        id: https://example.org/t
+        name: t
+        prefixes: {linkml: https://w3id.org/linkml/}
+        default_prefix: t
+        default_range: string
+        imports: [linkml:types]
+        classes:
+          Result: {attributes: {id: {identifier: true}, reading_score: {range: float}}}
+    """)
+    spec = yaml.safe_load(
+        textwrap.dedent("""\
+        id: t
+        title: flat
+        class_derivations:
+          Result:
+            populated_from: Measurement
+            slot_derivations:
+              id:
+              reading_score: {expr: '{Reading.score}'}
+    """)
+    )
+    _write(tmp_path, dict([MEAS, READING]))
+    tr = _transformer(SRC, spec, target)
+    loader = DataLoader(tmp_path, schemaview=tr.source_schemaview)
+    with_engine = list(transform_spec(tr, loader))
+
+    def no_engine(*_args, **_kwargs):
+        raise AssertionError("join engine used")
+
+    monkeypatch.setattr("linkml_map.transformer.engine.transform_block_via_join", no_engine)
+    assert list(transform_spec(tr, loader, join_engine=False)) == with_engine
+
+
+@pytest.mark.parametrize("join_engine", [True, False])
+def test_batch_function_called_once_per_chunk(tmp_path, join_engine):
+    """A ``batch=True`` extension sees every row's arguments in one call, on both paths."""
+    target = textwrap.dedent("""\
+        id: https://example.org/t
+        name: t
+        prefixes: {linkml: https://w3id.org/linkml/}
+        default_prefix: t
+        default_range: string
+        imports: [linkml:types]
+        classes:
+          Result: {attributes: {id: {identifier: true}, label: {range: string}, reading_label: {range: string}}}
+    """)
+    spec = yaml.safe_load(
+        textwrap.dedent("""\
+        id: t
+        title: batch
+        class_derivations:
+          Result:
+            populated_from: Measurement
+            slot_derivations:
+              id:
+              label: {expr: "label_of(method, '!')"}
+              reading_label: {expr: "label_of(str({Reading.visit}), '?')"}
+    """)
+    )
+    calls = []
+
+    def label_of(arg_tuples):
+        calls.append(list(arg_tuples))
+        return [value.upper() + suffix for value, suffix in arg_tuples]
+
+    label_of = BatchFunction(label_of, "label_of")
+    _write(tmp_path, dict([MEAS, READING]))
+    tr = _transformer(SRC, spec, target)
+    wrapped = _distributing(label_of)
+    setattr(wrapped, _BATCH_ATTR, label_of)
+    tr.extension_functions = {"label_of": wrapped}
+    out = list(transform_spec(tr, DataLoader(tmp_path, schemaview=tr.source_schemaview), join_engine=join_engine))
+
+    assert [(r["label"], r["reading_label"]) for r in out] == [("SPIRO!", "1?"), ("PEAK!", "2?")]
+    assert len(calls) == 1
+    assert sorted(calls[0]) == [("1", "?"), ("2", "?"), ("peak", "!"), ("spiro", "!")]
+    # Plain column arguments are compiled once; the joined reference uses full bindings.
+    plan = tr._batch_arg_plan(tr.specification.class_derivations[0], "Measurement")
+    assert [entry.kernels is not None for entry in plan] == [True, False]
+
+
+@pytest.mark.parametrize("join_engine", [True, False])
+def test_failing_batch_function_not_retried_per_row(tmp_path, join_engine, caplog):
+    """A batch call that raises is logged once and reported by the row, without a call per row."""
+    target = textwrap.dedent("""\
+        id: https://example.org/t
+        name: t
+        prefixes: {linkml: https://w3id.org/linkml/}
+        default_prefix: t
+        default_range: string
+        imports: [linkml:types]
+        classes:
+          Result: {attributes: {id: {identifier: true}, label: {range: string}}}
+    """)
+    spec = yaml.safe_load(
+        textwrap.dedent("""\
+        id: t
+        title: batch
+        class_derivations:
+          Result:
+            populated_from: Measurement
+            slot_derivations:
+              id:
+              label: {expr: "label_of(method)"}
+    """)
+    )
+    calls = []
+
+    def label_of(arg_tuples):
+        calls.append(list(arg_tuples))
+        raise ConnectionError("service down")
+
+    label_of = BatchFunction(label_of, "label_of")
+    _write(tmp_path, dict([MEAS, READING]))
+    tr = _transformer(SRC, spec, target)
+    wrapped = _distributing(label_of)
+    setattr(wrapped, _BATCH_ATTR, label_of)
+    tr.extension_functions = {"label_of": wrapped}
+    loader = DataLoader(tmp_path, schemaview=tr.source_schemaview)
+    with caplog.at_level("WARNING"), pytest.raises(TransformationError, match="failed for this chunk: ConnectionError"):
+        list(transform_spec(tr, loader, join_engine=join_engine))
+
+    assert len(calls) == 1
+    assert "Batch function 'label_of' failed" in caplog.text
+
+
+def test_translatable_exprs_computed_in_join_query(tmp_path, monkeypatch):
+    """Expressions that translate to SQL come from the query, with output identical to the per-row path."""
+    target = textwrap.dedent("""\
+        id: https://example.org/t
+        name: t
+        prefixes: {linkml: https://w3id.org/linkml/}
+        default_prefix: t
+        default_range: string
+        imports: [linkml:types]
+        classes:
+          Result:
+            attributes:
+              id: {identifier: true}
+              tag: {range: string}
+              scaled: {range: float}
+              band: {range: string}
+              slug: {range: string}
+    """)
+    spec = yaml.safe_load(
+        textwrap.dedent("""\
+        id: t
+        title: pushdown
+        class_derivations:
+          Result:
+            populated_from: Measurement
+            slot_derivations:
+              id:
+              tag: {expr: "upper({method}) + '-' + str({Reading.visit})"}
+              scaled: {expr: "{Reading.score} * 2 if {Reading.visit} > 1 else NULL"}
+              band: {expr: "case(({Reading.score} >= 90, 'high'), (True, 'low'))"}
+              slug: {expr: "slugify({Reading.subject_id} + ' ' + method)"}
+    """)
+    )
+    reading = ("Reading", (["subject_id", "score", "visit"], [["S1", "95.5", "1"], ["S2", "88.0", "x"]]))
+    _write(tmp_path, dict([MEAS, reading]))
+    tr = _transformer(SRC, spec, target)
+    loader = DataLoader(tmp_path, schemaview=tr.source_schemaview)
+    per_row = list(transform_spec(tr, loader, join_engine=False))
+
+    derived = []
+    original = tr._derive_slot
+
+    def spy(slot_derivation, *args, **kwargs):
+        derived.append(slot_derivation.name)
+        return original(slot_derivation, *args, **kwargs)
+
+    monkeypatch.setattr(tr, "_derive_slot", spy)
+    monkeypatch.setattr("linkml_map.transformer.join_engine.arrow_udfs_available", lambda: False)
+    assert list(transform_spec(tr, loader)) == per_row
+    assert per_row[0]["tag"] == "SPIRO-1"
+    assert per_row[1]["band"] == "low"
+    # slugify is not translated; the second row's visit "x" is not an integer,
+    # so the expressions reading it are evaluated in Python for that row.
+    assert sorted(derived) == ["scaled", "slug", "slug", "tag"]
+
+
+def test_untranslatable_calls_run_as_udfs(tmp_path, monkeypatch):
+    """Functions without a SQL equivalent run as DuckDB UDFs; failing rows fall back to Python."""
+    pytest.importorskip("pyarrow")
+    pytest.importorskip("numpy")
+    target = textwrap.dedent("""\
+        id: https://example.org/t
+        name: t
+        prefixes: {linkml: https://w3id.org/linkml/}
+        default_prefix: t
+        default_range: string
+        imports: [linkml:types]
+        classes:
+          Result:
+            attributes:
+              id: {identifier: true}
+              slug: {range: string}
+              key: {range: string}
+              visit: {range: integer}
+    """)
+    spec = yaml.safe_load(
+        textwrap.dedent("""\
+        id: t
+        title: udfs
+        class_derivations:
+          Result:
+            populated_from: Measurement
+            slot_derivations:
+              id:
+              slug: {expr: "slugify({Reading.subject_id} + ' ' + method)"}
+              key: {expr: "uuid5('https://example.org/', {Reading.subject_id})"}
+              visit: {expr: "strlen(str({Reading.visit}) + method)"}
+    """)
+    )
+    reading = ("Reading", (["subject_id", "score", "visit"], [["S1", "95.5", "1"], ["S2", "88.0", "x"]]))
+    _write(tmp_path, dict([MEAS, reading]))
+    tr = _transformer(SRC, spec, target)
+    loader = DataLoader(tmp_path, schemaview=tr.source_schemaview)
+    per_row = list(transform_spec(tr, loader, join_engine=False))
+
+    derived = []
+    original = tr._derive_slot
+
+    def spy(slot_derivation, *args, **kwargs):
+        derived.append(slot_derivation.name)
+        return original(slot_derivation, *args, **kwargs)
+
+    monkeypatch.setattr(tr, "_derive_slot", spy)
+    assert list(transform_spec(tr, loader)) == per_row
+    assert per_row[0]["slug"] == "s1_spiro"
+    # The second row's visit "x" is not an integer, so that row's visit is evaluated in Python.
+    assert derived == ["visit"]
+
+
 def test_nested_object(tmp_path):
     target = textwrap.dedent("""\
         id: https://example.org/t
@@ -679,3 +927,105 @@ def test_join_resolves_when_alias_differs_from_join_key(tmp_path):
         key=lambda r: r["id"],
     )
     assert out[0]["reading_score"] == 95.5
+
+
+def test_join_engine_rejection_names_the_failed_condition(tmp_path):
+    """``join_engine_rejection`` explains each fallback that ``can_use_join_engine`` decides."""
+    _write(tmp_path, dict([MEAS, READING]))
+    spec = yaml.safe_load(
+        "id: t\ntitle: t\nclass_derivations:\n  Result:\n    populated_from: Measurement\n"
+        "    slot_derivations:\n      id:\n      value: {expr: '{Reading.score}'}\n"
+        "      org: {populated_from: org.name}\n"
+    )
+    tr = _cd(FK_SRC, spec)
+    dl = DataLoader(tmp_path, schemaview=tr.source_schemaview)
+    cd = tr.derived_specification.class_derivations[0]
+    assert join_engine_rejection(cd, dl, None) == "no source schema"
+    reason = join_engine_rejection(cd, dl, tr.source_schemaview)
+    assert "Result.org populated_from 'org.name'" in reason
+    assert "neither the primary nor a joined table" in reason
+
+    (tmp_path / "Reading.tsv").unlink()
+    (tmp_path / "Reading.yaml").write_text("- subject_id: S1\n  score: 95.5\n")
+    dl = DataLoader(tmp_path, schemaview=tr.source_schemaview)
+    reason = join_engine_rejection(cd, dl, tr.source_schemaview)
+    assert reason.startswith("joined table 'Reading' is not DuckDB-readable")
+
+
+def test_explain_spec_reports_path_joins_and_sql(tmp_path, monkeypatch):
+    """``explain_spec`` shows the chosen path, the joins and the SQL for each block."""
+    _write(tmp_path, dict([MEAS, READING]))
+    spec = yaml.safe_load(
+        "id: t\ntitle: t\nclass_derivations:\n  Result:\n    populated_from: Measurement\n"
+        "    slot_derivations:\n      id:\n      value: {expr: '{Reading.score}'}\n"
+        "  Missing:\n    populated_from: Other\n    slot_derivations:\n      id:\n"
+    )
+    tr = _cd(FK_SRC, spec)
+    dl = DataLoader(tmp_path, schemaview=tr.source_schemaview)
+
+    engine_plan, skipped_plan = explain_spec(tr, dl, analyze=True)
+    assert engine_plan.path == JOIN_ENGINE
+    assert engine_plan.reason is None
+    assert engine_plan.joins == {"Reading": {"source_key": "subject_id", "lookup_key": "subject_id"}}
+    assert "LEFT JOIN" in engine_plan.sql[0]
+    assert engine_plan.params == [str(tmp_path / "Measurement.tsv"), str(tmp_path / "Reading.tsv")]
+    assert engine_plan.analyze
+    assert skipped_plan.path == SKIPPED
+    # The plan shows the query the join engine runs, expression columns included.
+    assert engine_plan.sql_exprs == ["value"]
+    assert "expr computed in sql: value" in engine_plan.format()
+    executed = []
+
+    def spy(*args, **kwargs):
+        executed.append(_build_join_sql(*args, **kwargs))
+        return executed[-1]
+
+    monkeypatch.setattr("linkml_map.transformer.join_engine._build_join_sql", spy)
+    list(transform_spec(tr, dl))
+    assert executed == [(engine_plan.sql[0], engine_plan.params)]
+
+    per_row_plan, _ = explain_spec(tr, dl, join_engine=False)
+    assert per_row_plan.path == PER_ROW
+    assert per_row_plan.reason == "join engine disabled"
+    assert per_row_plan.sql == ['SELECT * FROM "Reading" WHERE "subject_id" = ? LIMIT 1']
+    assert "1 join engine, 0 per-row lookup, 1 skipped" in format_plans([engine_plan, skipped_plan])
+
+
+def test_transform_spec_explain_logs_plan_and_keeps_output(tmp_path, caplog):
+    """``transform_spec(explain=True)`` logs each block's plan without changing the rows."""
+    _write(tmp_path, dict([MEAS, READING]))
+    spec = yaml.safe_load(
+        "id: t\ntitle: t\nclass_derivations:\n  Result:\n    populated_from: Measurement\n"
+        "    slot_derivations:\n      id:\n      value: {expr: '{Reading.score}'}\n"
+    )
+    tr = _cd(FK_SRC, spec)
+    dl = DataLoader(tmp_path, schemaview=tr.source_schemaview)
+    expected = list(transform_spec(tr, dl))
+    with caplog.at_level(logging.INFO, logger="linkml_map.transformer.engine"):
+        assert list(transform_spec(tr, dl, explain=True)) == expected
+    assert "[0] Result <- Measurement: join engine" in caplog.text
+
+
+@pytest.mark.parametrize("join_engine", [True, False])
+def test_transform_spec_metrics_count_rows_and_joins(tmp_path, join_engine):
+    """Both paths count rows in/out and join hits/misses per block."""
+    readings = ("Reading", (["subject_id", "score", "visit"], [["S1", "95.5", "1"]]))  # S2 misses
+    _write(tmp_path, dict([MEAS, readings]))
+    spec = yaml.safe_load(
+        "id: t\ntitle: t\nclass_derivations:\n  Result:\n    populated_from: Measurement\n"
+        "    slot_derivations:\n      id:\n      value: {expr: '{Reading.score}'}\n"
+    )
+    tr = _cd(FK_SRC, spec)
+    dl = DataLoader(tmp_path, schemaview=tr.source_schemaview)
+    metrics = TransformMetrics()
+    rows = list(transform_spec(tr, dl, join_engine=join_engine, metrics=metrics))
+
+    assert len(rows) == 2
+    (block,) = metrics.blocks
+    assert block.done
+    assert block.path == ("join_engine" if join_engine else "per_row")
+    assert (block.rows_in, block.rows_out, block.errors) == (2, 2, 0)
+    assert (block.join_hits, block.join_misses) == (1, 1)
+    assert block.estimated_rows == 2
+    assert metrics.total_blocks == 1
+    assert metrics.total_input_bytes == (tmp_path / "Measurement.tsv").stat().st_size
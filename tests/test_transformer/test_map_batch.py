@@ -0,0 +1,180 @@
+"""Tests for column-wise mapping of row chunks with ``map_batch``."""
+
+from __future__ import annotations
+
+import copy
+import textwrap
+
+import pytest
+import yaml
+from linkml_runtime import SchemaView
+
+from linkml_map.session import Session
+from linkml_map.transformer.errors import TransformationError
+
+SRC = yaml.safe_load(
+    textwrap.dedent("""\
+    id: https://example.org/batch
+    name: batch
+    prefixes: {linkml: https://w3id.org/linkml/}
+    default_prefix: batch
+    default_range: string
+    imports: [linkml:types]
+    classes:
+      Person:
+        attributes:
+          id: {identifier: true}
+          name: {range: string}
+          age: {range: integer}
+          days: {range: integer}
+          code: {range: string}
+          height: {range: string}
+          aliases: {range: string, multivalued: true}
+    """)
+)
+
+TGT = textwrap.dedent("""\
+    id: https://example.org/batch-target
+    name: batch_target
+    prefixes: {linkml: https://w3id.org/linkml/}
+    default_prefix: batch_target
+    default_range: string
+    imports: [linkml:types]
+    classes:
+      Agent:
+        attributes:
+          id: {identifier: true}
+          name: {range: string}
+          codes: {range: string, multivalued: true}
+          kind: {range: string}
+          age_in_months: {range: integer}
+          age_later: {range: integer}
+          height: {range: float}
+          label: {range: string}
+          tall: {range: boolean}
+          shout: {range: string}
+          me: {range: string}
+          alias_count: {range: integer}
+          source: {range: string}
+    """)
+
+SPEC = {
+    "class_derivations": {
+        "Agent": {
+            "populated_from": "Person",
+            "slot_derivations": {
+                "id": {},
+                "name": {"populated_from": "name", "missing_values": ["NA"]},
+                "codes": {"populated_from": "code"},
+                "kind": {
+                    "populated_from": "code",
+                    "value_mappings": {"A": {"value": "alpha"}, "B": {"value": "beta"}},
+                    "missing_values": ["-9"],
+                },
+                "age_in_months": {"expr": "age * 12"},
+                "age_later": {"populated_from": "age", "offset": {"offset_field": "days", "offset_value": 1}},
+                "height": {"populated_from": "height", "range": "float"},
+                "label": {"expr": "upper({name}) + '-' + str(age)"},
+                "_age": {"expr": "age", "hide": True},
+                "tall": {"expr": "height > 1.8 and slot('_age') > 30 if age is not None else NULL"},
+                "shout": {"expr": "case((age < 18, 'minor'), (True, lower(name)))"},
+                "me": {"expr": "Person.name"},
+                "alias_count": {"expr": "len(aliases)"},
+                "source": {"value": "batch"},
+            },
+        }
+    },
+}
+
+ROWS = [
+    {"id": "P1", "name": "Ann", "age": 40, "days": 3, "code": "A", "height": "1.9", "aliases": ["a"]},
+    {"id": "P2", "name": "NA", "age": 12, "days": None, "code": "-9", "height": "1.2", "aliases": []},
+    {"id": "P3", "name": "Bo", "age": None, "code": "Z", "height": None, "aliases": ["b", "c"]},
+    {"id": "P4", "age": 31, "days": 1, "code": "B", "height": "1.81", "aliases": ["d"]},
+]
+
+
+@pytest.fixture
+def transformer():
+    session = Session()
+    session.set_source_schema(SRC)
+    session.set_object_transformer(copy.deepcopy(SPEC))
+    tr = session.object_transformer
+    tr.source_schemaview = session.source_schemaview
+    tr.target_schemaview = SchemaView(TGT)
+    return tr
+
+
+def test_map_batch_matches_map_object(transformer) -> None:
+    """Column-wise results are exactly the per-row results, including nulls and hidden slots."""
+    class_deriv = transformer._get_class_derivation("Person")
+    expected = [transformer.map_object(row, "Person", class_derivation=class_deriv) for row in ROWS]
+
+    assert transformer.map_batch(ROWS, class_deriv, "Person") == expected
+    assert expected[0]["kind"] == "alpha"
+    assert expected[0]["age_later"] == 43
+    assert expected[0]["codes"] == ["A"]
+    assert expected[0]["tall"] is True
+    assert expected[1]["name"] is None
+    assert expected[2]["tall"] is None
+    assert "_age" not in expected[0]
+
+
+def test_map_batch_derives_only_uncompiled_slots_per_row(transformer, monkeypatch) -> None:
+    """Slots outside the column-wise subset, and rows a kernel rejects, go through _derive_slot."""
+    class_deriv = transformer._get_class_derivation("Person")
+    derived = []
+    original = transformer._derive_slot
+
+    def spy(slot_derivation, *args, **kwargs):
+        derived.append(slot_derivation.name)
+        return original(slot_derivation, *args, **kwargs)
+
+    monkeypatch.setattr(transformer, "_derive_slot", spy)
+    transformer.map_batch(ROWS, class_deriv, "Person")
+
+    # Attribute access and a list-valued name are not compiled; every other
+    # slot is derived column-wise for every row.
+    assert sorted(set(derived)) == ["alias_count", "me"]
+    assert len(derived) == 2 * len(ROWS)
+
+
+def test_map_batch_errors(transformer) -> None:
+    """Failing rows are reported by index; without on_error the first failing row raises."""
+    class_deriv = transformer._get_class_derivation("Person")
+    rows = [{**ROWS[0], "age": "x"}, ROWS[1], {**ROWS[0], "age": []}]
+    errors = {}
+    results = transformer.map_batch(rows, class_deriv, "Person", on_error=errors.__setitem__)
+
+    assert sorted(errors) == [0, 2]
+    assert all(isinstance(err, TransformationError) for err in errors.values())
+    assert results[0] is None
+    assert results[1] == transformer.map_object(ROWS[1], "Person", class_derivation=class_deriv)
+    with pytest.raises(TransformationError) as excinfo:
+        transformer.map_batch(rows, class_deriv, "Person")
+    assert excinfo.value.source_row == rows[0]
+
+
+def test_map_batch_kernel_errors_evaluate_once(transformer) -> None:
+    """A compiled expression that raises is reported like map_object, without evaluating it again."""
+    calls = []
+
+    def check(name):
+        calls.append(name)
+        if name == "Bo":
+            raise ValueError("no Bo")
+        return name
+
+    transformer.extension_functions = {"check": check}
+    class_deriv = transformer._get_class_derivation("Person")
+    class_deriv.slot_derivations["label"].expr = "check(name)"
+    errors = {}
+    results = transformer.map_batch(ROWS, class_deriv, "Person", on_error=errors.__setitem__)
+
+    assert calls == ["Ann", "NA", "Bo", None]
+    assert list(errors) == [2]
+    assert results[2] is None
+    with pytest.raises(TransformationError) as excinfo:
+        transformer.map_object(ROWS[2], "Person", class_derivation=class_deriv)
+    assert str(errors[2]) == str(excinfo.value)
+    assert errors[2].slot_derivation_name == "label"
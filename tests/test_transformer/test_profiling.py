@@ -0,0 +1,110 @@
+"""Tests for per-slot-derivation profiling."""
+
+from __future__ import annotations
+
+import copy
+import textwrap
+
+import pytest
+import yaml
+
+from linkml_map.session import Session
+from linkml_map.transformer.errors import TransformationError
+from linkml_map.transformer.profiling import SlotProfiler
+
+SRC = yaml.safe_load(
+    textwrap.dedent("""\
+    id: https://example.org/prof
+    name: prof
+    prefixes: {linkml: https://w3id.org/linkml/}
+    default_prefix: prof
+    default_range: string
+    imports: [linkml:types]
+    classes:
+      Person:
+        attributes:
+          id: {identifier: true}
+          name: {range: string}
+          age: {range: integer}
+          status: {range: Status}
+    enums:
+      Status:
+        permissible_values:
+          ALIVE: {description: alive}
+          DEAD: {description: dead}
+    """)
+)
+
+SPEC = {
+    "class_derivations": {
+        "Agent": {
+            "populated_from": "Person",
+            "slot_derivations": {
+                "id": {},
+                "label": {"populated_from": "name"},
+                "age_in_months": {"expr": "age * 12"},
+                "status": {"populated_from": "status"},
+                "kind": {"value": "person"},
+            },
+        }
+    },
+    "enum_derivations": {"Status": {"populated_from": "Status", "mirror_source": True}},
+}
+
+
+def _transformer(spec: dict):
+    session = Session()
+    session.set_source_schema(SRC)
+    session.set_object_transformer(copy.deepcopy(spec))
+    tr = session.object_transformer
+    tr.source_schemaview = session.source_schemaview
+    return tr
+
+
+@pytest.fixture
+def transformer():
+    return _transformer(SPEC)
+
+
+def test_profiler_records_calls_nulls_and_strategies(transformer) -> None:
+    """Each slot derivation is counted per call, with its strategy and null results."""
+    profiler = SlotProfiler()
+    transformer.profiler = profiler
+    transformer.map_object({"id": "P1", "name": "Ann", "age": 3, "status": "ALIVE"}, "Person")
+    transformer.map_object({"id": "P2", "age": 4, "status": "DEAD"}, "Person")
+
+    stats = {slot: s for (cd, slot), s in profiler.stats.items() if cd == "Agent"}
+    assert {slot: s.strategy for slot, s in stats.items()} == {
+        "id": "copy",
+        "label": "copy",
+        "age_in_months": "expr",
+        "status": "enum",
+        "kind": "constant",
+    }
+    assert all(s.calls == 2 for s in stats.values())
+    assert stats["label"].nulls == 1
+    assert stats["id"].nulls == 0
+
+    report = profiler.to_dict()
+    assert [row["seconds"] for row in report["slots"]] == sorted(
+        (row["seconds"] for row in report["slots"]), reverse=True
+    )
+    assert set(report["strategies"]) == {"copy", "expr", "enum", "constant"}
+    assert "Agent.age_in_months" in profiler.report()
+
+
+def test_profiler_counts_errors() -> None:
+    """A failing slot derivation is counted as an error and the failure still propagates."""
+    spec = copy.deepcopy(SPEC)
+    spec["class_derivations"]["Agent"]["slot_derivations"]["age_in_months"]["expr"] = "age.upper()"
+    transformer = _transformer(spec)
+    transformer.profiler = SlotProfiler()
+    with pytest.raises(TransformationError):
+        transformer.map_object({"id": "P1", "age": 3}, "Person")
+    assert transformer.profiler.stats[("Agent", "age_in_months")].errors == 1
+
+
+def test_no_profiler_by_default(transformer) -> None:
+    """Profiling is off unless a profiler is attached."""
+    assert transformer.profiler is None
+    assert transformer.map_object({"id": "P1", "age": 3}, "Person")["age_in_months"] == 36
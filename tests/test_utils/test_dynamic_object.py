@@ -3,7 +3,7 @@
 import yaml
 from linkml_runtime import SchemaView
 
-from linkml_map.utils.dynamic_object import dynamic_object
+from linkml_map.utils.dynamic_object import _VIEW_CACHES, dynamic_object
 from tests import FLATTENING_DATA, NORM_SCHEMA
 
 NO_ID_SCHEMA = """
@@ -84,3 +84,29 @@ def test_dynamic_object_no_identifier_or_key() -> None:
     assert type(dynobj).__name__ == "Container"
     assert isinstance(dynobj.items, dict)
     assert dynobj.items["x"].value == "one"
+
+
+def test_dynamic_object_reuses_classes() -> None:
+    """Objects of the same target share one generated class; unset attributes read as None."""
+    sv = SchemaView(KEY_BASED_SCHEMA)
+    first = dynamic_object({"items": {"alpha": {"value": "one"}}}, sv, "Container")
+    second = dynamic_object({"items": {"beta": {"value": "two"}}}, sv, "Container")
+    assert type(first) is type(second)
+    assert type(first.items["alpha"]) is type(second.items["beta"])
+    assert vars(second.items["beta"]) == {"value": "two", "name": "beta"}
+    assert second.items["beta"].missing is None
+
+
+def test_dynamic_object_cache_follows_schema_changes() -> None:
+    """Slot lookups are cached on the view and dropped when its schema is modified."""
+    sv = SchemaView(KEY_BASED_SCHEMA)
+    data = {"items": {"alpha": {"value": "one"}}}
+    assert dynamic_object(data, sv, "Container").items["alpha"].name == "alpha"
+    assert sv in _VIEW_CACHES
+
+    attributes = sv.get_class("Item").attributes
+    attributes["name"].key = False
+    attributes["value"].identifier = True
+    sv.set_modified()
+    assert dynamic_object(data, sv, "Container").items["alpha"].value == "alpha"
+    assert dynamic_object(data, SchemaView(KEY_BASED_SCHEMA), "Container").items["alpha"].name == "alpha"
@@ -10,10 +10,13 @@ import pytest
 
 from linkml_map.utils.eval_utils import (
     _evaluator_pool,
+    _interpreter_pool,
     _parse_cached,
+    _parse_unrestricted_cached,
     _uuid5,
     eval_expr,
     eval_expr_with_mapping,
+    eval_unrestricted,
 )
 
 # -- helpers for path / attribute tests --
@@ -441,6 +444,14 @@ def test_function_distributes_over_lists() -> None:
     assert eval_expr("strlen(items)", items=["ab", "cde", "f"]) == [2, 3, 1]
 
 
+def test_distribution_propagates_none_per_element_and_per_argument() -> None:
+    """None elements stay None; a None trailing argument nulls every element."""
+    items = ["a b", None, "c d"] * 50
+    assert eval_expr("replace(items, ' ', '_')", items=items) == ["a_b", None, "c_d"] * 50
+    assert eval_expr("replace(items, x, '_')", items=items, x=None) == [None] * 150
+    assert eval_expr("upper(items)", items=[]) == []
+
+
 def test_unknown_function_raises() -> None:
     """Calling an unknown function raises an error with a helpful message."""
     with pytest.raises(Exception, match="Unknown function 'my_func'") as excinfo:
@@ -1406,3 +1417,56 @@ def test_reused_evaluator_applies_per_call_functions(_reset_eval_caches: None) -
     assert eval_expr_with_mapping("f(2)", {}, functions={"f": lambda x: x + 10}) == 12
     # A subsequent call with a different closure must see the new function, not a stale one.
     assert eval_expr_with_mapping("f(2)", {}, functions={"f": lambda x: x * 10}) == 20
+
+
+# -- reusable unrestricted (asteval) interpreter --
+
+
+def test_unrestricted_interpreter_reused_and_parse_cached() -> None:
+    """One interpreter per thread; each statement block is parsed once."""
+    _parse_unrestricted_cached.cache_clear()
+    expr = "x = src * 2\nif x > 4:\n    target = 'big'\nelse:\n    target = x"
+    results = [eval_unrestricted(expr, {"src": i, "target": None}) for i in range(4)]
+    first = _interpreter_pool.interpreter
+    assert results == [0, 2, 4, "big"]
+    assert eval_unrestricted(expr, {"src": 5, "target": None}) == "big"
+    assert _interpreter_pool.interpreter is first
+    assert _parse_unrestricted_cached.cache_info().misses == 1
+
+
+def test_unrestricted_interpreter_isolates_calls() -> None:
+    """Names assigned by one call, including shadowed built-ins, do not leak into the next."""
+    assert eval_unrestricted("leaked = 1\nlen = None\ntarget = src", {"src": "a", "target": None}) == "a"
+    assert eval_unrestricted("target = len(src)", {"src": "abc", "target": None}) == 3
+    assert eval_unrestricted("target = leaked", {"target": None}) is None
+
+
+def test_unrestricted_interpreter_state_does_not_carry_over() -> None:
+    """A failing call, even inside a procedure, leaves the next call unaffected; history stays bounded."""
+    failing = "def f(v):\n    for x in v:\n        return 1 / 0\ntarget = f(src)"
+    assert eval_unrestricted(failing, {"src": [1], "target": None}) is None
+    expr = "def g(v):\n    return v + 1\ntarget = g(src)"
+    assert [eval_unrestricted(expr, {"src": i, "target": None}) for i in range(3)] == [1, 2, 3]
+    assert len(_interpreter_pool.interpreter.code_text) <= 1
+
+
+def test_unrestricted_interpreter_asteval_api() -> None:
+    """The asteval attributes and call forms eval_unrestricted relies on still exist."""
+    from asteval import Interpreter
+
+    aeval = Interpreter()
+    assert isinstance(aeval.symtable, dict)
+    assert isinstance(aeval.no_deepcopy, list)
+    assert isinstance(aeval.code_text, list)
+    assert isinstance(aeval.max_statement_length, int | float)
+    aeval.eval(_parse_unrestricted_cached("target = 6 * 7"))
+    assert aeval.symtable["target"] == 42
+
+
+def test_unrestricted_interpreter_reentrant() -> None:
+    """A function called from an expression may itself evaluate an unrestricted expression."""
+
+    def inner(v: Any) -> Any:
+        return eval_unrestricted("target = v + 1", {"v": v, "target": None})
+
+    assert eval_unrestricted("target = inner(src) * 10", {"src": 1, "target": None, "inner": inner}) == 20
@@ -0,0 +1,67 @@
+"""Tests for memoization of pure expression results."""
+
+from linkml_map.utils.eval_utils import eval_expr_with_mapping
+from linkml_map.utils.expr_memo import MISS, ExpressionMemo
+from linkml_map.utils.extensions import _PURE_ATTR
+
+
+def _eval(memo: ExpressionMemo, expr: str, mapping: dict, functions: dict | None = None):
+    key = memo.key(expr, mapping, functions)
+    if key is not None:
+        v = memo.get(key)
+        if v is not MISS:
+            return v
+    v = eval_expr_with_mapping(expr, mapping, functions=functions)
+    if key is not None:
+        memo.put(key, v)
+    return v
+
+
+def test_memo_hits_repeated_inputs() -> None:
+    """Results are reused per distinct input; inputs are keyed with their type."""
+    memo = ExpressionMemo()
+    rows = [{"category": c} for c in ["Red Fish", "Blue Fish", "Red Fish", "Red Fish"]]
+    results = [_eval(memo, "slugify({category})", row) for row in rows]
+    assert results == ["red_fish", "blue_fish", "red_fish", "red_fish"]
+    stats = memo.stats["slugify({category})"]
+    assert (stats.hits, stats.misses) == (2, 2)
+    assert _eval(memo, "str(x)", {"x": 1}) == "1"
+    assert _eval(memo, "str(x)", {"x": True}) == "True"
+
+
+def test_memo_skips_impure_functions_and_non_scalars() -> None:
+    """Impure calls disable an expression; non-scalar inputs and results are not cached."""
+    memo = ExpressionMemo()
+    functions = {"slot": lambda name: name, "norm": str.strip}
+    assert memo.key("upper(slot('a'))", {}, functions) is None
+    assert memo.stats["upper(slot('a'))"].disabled == "calls impure function(s): slot"
+    assert memo.key("norm(x)", {"x": " a "}, functions) is None
+
+    def pure_norm(s: str) -> str:
+        return s.strip()
+
+    setattr(pure_norm, _PURE_ATTR, True)
+    assert memo.key("pure_norm(x)", {"x": "a"}, {"pure_norm": pure_norm}) is not None
+
+    assert _eval(memo, "upper(items)", {"items": ["a", "b"]}) == ["A", "B"]
+    assert _eval(memo, "split(x)", {"x": "a b"}) == ["a", "b"]
+    assert memo.stats["upper(items)"].uncacheable == 1
+    assert memo.stats["split(x)"].uncacheable == 1
+    assert len(memo) == 0
+
+
+def test_memo_bounded_and_disables_on_poor_hit_rate() -> None:
+    """The LRU never exceeds maxsize; a mostly-unique expression stops being memoized."""
+    memo = ExpressionMemo(maxsize=10, min_lookups=1000)
+    for i in range(60):
+        assert _eval(memo, "x + 1", {"x": i}) == i + 1
+    assert len(memo) == 10
+
+    memo = ExpressionMemo(maxsize=10, min_lookups=50, min_hit_rate=0.5)
+    for i in range(60):
+        _eval(memo, "x + 1", {"x": i})
+    stats = memo.stats["x + 1"]
+    assert stats.disabled is not None
+    assert stats.lookups == 50
+    assert len(memo) == 0
+    assert "hit rate" in memo.report()
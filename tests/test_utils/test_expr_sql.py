@@ -0,0 +1,119 @@
+"""Tests for the SQL translation of restricted expressions."""
+
+import duckdb
+import pytest
+
+from linkml_map.utils.eval_utils import FUNCTIONS, _distributing, eval_expr_with_mapping
+from linkml_map.utils.expr_sql import SqlColumn, SqlFunction, translate_expr
+from linkml_map.utils.lookup_index import _parse_numeric
+
+KINDS = {"a": "int", "b": "int", "x": "float", "s": "str", "t": "str"}
+
+
+def _bind(name, attr):
+    if attr is not None:
+        return None
+    if name == "absent":
+        return SqlColumn("NULL")
+    kind = KINDS.get(name)
+    return None if kind is None else SqlColumn(f'"{name}"', kind)
+
+
+ROWS = [
+    {"a": "3", "b": "4", "x": "1.5", "s": "ab", "t": "Cd"},
+    {"a": "-2", "b": "0", "x": "0.25", "s": "7", "t": None},
+    {"a": None, "b": "007", "x": "2", "s": "4 2", "t": "é"},
+    {"a": "x", "b": "1", "x": "1e3", "s": "", "t": "zz"},
+]
+
+
+@pytest.mark.parametrize(
+    "expr",
+    [
+        "a + b * 2",
+        "a / b",
+        "x * 2 - a",
+        "-a",
+        "{s} + '-' + {t}",
+        "upper(s) + lower(t)",
+        "str(a) + s",
+        "s == t",
+        "a < x",
+        "case((a < b, 'lt'), (a == b, 'eq'), (True, 'gt'))",
+        "coalesce(t, s, 'none')",
+        "'big' if b > 2 else NULL",
+        "absent + 1",
+    ],
+)
+def test_translation_matches_evaluator(expr) -> None:
+    """Where the guard holds, SQL computes exactly the evaluator's value (and type)."""
+    translated = translate_expr(expr, FUNCTIONS, _bind)
+    assert translated is not None
+    con = duckdb.connect()
+    con.execute('CREATE TABLE t (a VARCHAR, b VARCHAR, x VARCHAR, s VARCHAR, "t" VARCHAR)')
+    con.executemany("INSERT INTO t VALUES (?, ?, ?, ?, ?)", [list(r.values()) for r in ROWS])
+    results = con.execute(f"SELECT {translated.guard}, {translated.sql} FROM t").fetchall()  # noqa: S608
+    checked = 0
+    for row, (ok, value) in zip(ROWS, results, strict=True):
+        if not ok:
+            continue
+        mapping = {k: _parse_numeric(v) for k, v in row.items()}
+        mapping["absent"] = None
+        expected = eval_expr_with_mapping(expr, mapping)
+        assert repr(value) == repr(expected)
+        checked += 1
+    assert checked
+
+
+def _guards(expr: str, column: str, values: list) -> list:
+    guard = translate_expr(expr, FUNCTIONS, _bind).guard
+    con = duckdb.connect()
+    return [con.execute(f"SELECT {guard} FROM (SELECT ? AS {column})", [v]).fetchone()[0] for v in values]
+
+
+def test_guards_reject_rows_of_unexpected_type() -> None:
+    """A value that does not parse to the column's assumed type is left to Python."""
+    assert _guards("a + 1", "a", ["1", "1.5", "x", None]) == [True, False, False, True]
+    assert _guards("s + 'x'", "s", ["ab", "12", " 1_0 ", "1b", "٣"]) == [True, False, False, True, True]
+
+
+@pytest.mark.parametrize(
+    "expr",
+    [
+        "a and b",
+        "s or t",
+        "a % b",
+        "a < b < 3",
+        "s + a",
+        "strip(s)",
+        "str(x)",
+        "unknown + 1",
+        "slot('a')",
+        "a / (b - 1)",
+        "[a, b]",
+    ],
+)
+def test_untranslatable(expr) -> None:
+    """Operators whose SQL semantics differ, other functions and unbound names stay in Python."""
+    assert translate_expr(expr, FUNCTIONS, _bind) is None
+
+
+def test_overridden_builtin_is_not_translated() -> None:
+    """An extension that shadows a built-in is evaluated in Python."""
+    functions = {**FUNCTIONS, "upper": _distributing(lambda s: s.upper() + "!")}
+    assert translate_expr("upper(s)", functions, _bind) is None
+
+
+def test_udf_hook_calls_python_functions() -> None:
+    """Without a SQL equivalent, a call goes through the ``udf`` hook; its NULL result means "use Python"."""
+    calls = []
+
+    def udf(name, arg_kinds):
+        calls.append((name, arg_kinds))
+        return SqlFunction("py_strip", "str", strict=True) if name == "strip" else None
+
+    translated = translate_expr("strip(s) + str(a)", FUNCTIONS, _bind, udf)
+    assert calls == [("strip", ("str",))]
+    assert translated.sql.startswith('(py_strip("s") ||')
+    assert '(py_strip("s") IS NOT NULL OR "s" IS NULL)' in translated.guard
+    assert translate_expr("slugify(s)", FUNCTIONS, _bind, udf) is None
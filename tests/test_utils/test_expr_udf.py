@@ -0,0 +1,126 @@
+"""Tests for running expression functions as DuckDB UDFs."""
+
+from pathlib import Path
+
+import duckdb
+import pytest
+
+from linkml_map.utils.eval_utils import FUNCTIONS, eval_expr_with_mapping
+from linkml_map.utils.expr_sql import SqlColumn, translate_expr
+from linkml_map.utils.expr_udf import ExprUdfs, result_kind
+from linkml_map.utils.extensions import load_extensions
+
+EXT = """
+from typing import Optional
+
+from linkml_map.utils.extensions import safe_function
+
+@safe_function(pure=True)
+def initials(s: str) -> str:
+    if s == "boom":
+        raise ValueError(s)
+    return "".join(w[0] for w in s.split())
+
+@safe_function(pure=True)
+def maybe_len(s: str) -> Optional[int]:
+    return len(s) or None
+
+@safe_function(pure=True)
+def untyped(s):
+    return s
+
+@safe_function
+def impure(s: str) -> str:
+    return s
+
+CALLS = []
+
+@safe_function(pure=True)
+def tagged(s: str, n: int) -> str:
+    CALLS.append((s, n))
+    return f"{s}#{n}"
+"""
+
+
+@pytest.fixture
+def functions(tmp_path: Path) -> dict:
+    path = tmp_path / "ext_udf.py"
+    path.write_text(EXT)
+    return {**FUNCTIONS, **load_extensions([path])}
+
+
+def test_result_kind(functions) -> None:
+    """Built-ins have known kinds; extensions need ``pure=True`` and a scalar return annotation."""
+    assert result_kind("slugify", functions["slugify"]) == "str"
+    assert result_kind("strlen", functions["strlen"]) == "int"
+    assert result_kind("round", functions["round"]) is None
+    assert result_kind("initials", functions["initials"]) == "str"
+    assert result_kind("maybe_len", functions["maybe_len"]) == "int"
+    assert result_kind("untyped", functions["untyped"]) is None
+    assert result_kind("impure", functions["impure"]) is None
+    # A function shadowing a built-in is judged as an extension.
+    assert result_kind("slugify", functions["impure"]) is None
+
+
+def _bind(name, attr):
+    return SqlColumn(f'"{name}"', "str") if attr is None and name == "s" else None
+
+
+@pytest.mark.parametrize(
+    "expr",
+    ["slugify(s)", "initials(s) + '!'", "maybe_len(s)", "strlen(strip(s)) * 2", "replace(s, 'l', upper(s))"],
+)
+def test_udf_calls_match_evaluator(functions, expr) -> None:
+    """Where the guard holds the UDF result is the evaluator's; other rows are left to Python."""
+    pytest.importorskip("pyarrow")
+    pytest.importorskip("numpy")
+    rows = ["Hello World", "boom", "", None, " é x ", "Hello World"]
+    con = duckdb.connect()
+    con.execute("CREATE TABLE t (s VARCHAR)")
+    con.executemany("INSERT INTO t VALUES (?)", [[s] for s in rows])
+    udfs = ExprUdfs(con, functions)
+    translated = translate_expr(expr, functions, _bind, udfs)
+    assert translated is not None
+    results = con.execute(f"SELECT {translated.guard}, {translated.sql} FROM t").fetchall()  # noqa: S608
+    checked = 0
+    for s, (ok, value) in zip(rows, results, strict=True):
+        if not ok:
+            continue
+        assert repr(value) == repr(eval_expr_with_mapping(expr, {"s": s}, functions=functions))
+        checked += 1
+    assert checked
+    if "initials" in expr:
+        assert results[1][0] is False  # the function raised; Python reports the error
+    udfs.close()
+    assert not udfs.registered
+
+
+def test_udf_calls_each_distinct_argument_tuple_once(functions) -> None:
+    """Within a vector, a pure function runs once per distinct tuple of arguments."""
+    pytest.importorskip("pyarrow")
+    pytest.importorskip("numpy")
+    con = duckdb.connect()
+    udfs = ExprUdfs(con, functions)
+    function = udfs("tagged", ("str", "int"))
+    values = "('a', 1), ('b', 1), ('a', 1), (NULL, 2), ('a', 2), (NULL, 2)"
+    rows = con.execute(f"SELECT {function.name}(s, n) FROM (VALUES {values}) v(s, n)").fetchall()  # noqa: S608
+    assert [r[0] for r in rows] == ["a#1", "b#1", "a#1", None, "a#2", None]
+    # NULL arguments are answered by the None-propagating wrapper.
+    calls = functions["tagged"].__wrapped__.__globals__["CALLS"]
+    assert sorted(calls) == [("a", 1), ("a", 2), ("b", 1)]
+    udfs.close()
+
+
+def test_guard_and_value_share_udf_calls(functions) -> None:
+    """Selecting the guard next to the value does not run the function a second time."""
+    pytest.importorskip("pyarrow")
+    pytest.importorskip("numpy")
+    con = duckdb.connect()
+    con.execute("CREATE TABLE t AS SELECT 'v' || range AS s FROM range(5000)")
+    udfs = ExprUdfs(con, functions)
+    translated = translate_expr("tagged(s, strlen(s)) + '!'", functions, _bind, udfs)
+    rows = con.execute(f"SELECT {translated.guard}, {translated.sql} FROM t").fetchall()  # noqa: S608
+    assert all(ok for ok, _ in rows)
+    assert rows[12][1] == "v12#3!"
+    assert len(functions["tagged"].__wrapped__.__globals__["CALLS"]) == 5000
+    udfs.close()
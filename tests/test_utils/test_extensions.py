@@ -17,7 +17,10 @@ from linkml_map.utils.eval_utils import (
 )
 from linkml_map.utils.extensions import (
     _SAFE_FUNCTION_ATTR,
+    BatchFunction,
     ExtensionError,
+    batch_function,
+    is_pure,
     load_extensions,
     safe_function,
 )
@@ -41,7 +44,7 @@ def test_decorator_bare() -> None:
         return x.upper()
 
     meta = getattr(f, _SAFE_FUNCTION_ATTR)
-    assert meta == {"override": False, "distributes": True}
+    assert meta == {"override": False, "distributes": True, "pure": False, "batch": False}
     assert f("hi") == "HI"
 
 
@@ -53,7 +56,7 @@ def test_decorator_with_kwargs() -> None:
         return len(items)
 
     meta = getattr(f, _SAFE_FUNCTION_ATTR)
-    assert meta == {"override": True, "distributes": False}
+    assert meta == {"override": True, "distributes": False, "pure": False, "batch": False}
 
 
 # ---- Loader ----
@@ -86,6 +89,95 @@ def untagged(s):
     assert loaded["reverse"]("abc") == "cba"
 
 
+def test_load_marks_pure_extensions(tmp_path: Path) -> None:
+    """``pure=True`` survives loading (and distribution wrapping); undeclared functions are not pure."""
+    path = _write_ext(
+        tmp_path,
+        "ext_pure.py",
+        """
+from linkml_map.utils.extensions import safe_function
+
+@safe_function(pure=True)
+def norm(s):
+    return s.strip()
+
+@safe_function
+def stamp(s):
+    return s
+""",
+    )
+
+    loaded = load_extensions([path])
+
+    assert is_pure(loaded["norm"])
+    assert not is_pure(loaded["stamp"])
+    assert loaded["norm"]([" a ", None]) == ["a", None]
+
+
+def test_load_batch_extension(tmp_path: Path) -> None:
+    """``batch=True`` functions are called per row with scalars and answered from prefetched results."""
+    path = _write_ext(
+        tmp_path,
+        "ext_batch.py",
+        """
+from linkml_map.utils.extensions import safe_function
+
+CALLS = []
+
+@safe_function(batch=True)
+def label(arg_tuples):
+    CALLS.append(list(arg_tuples))
+    return [code.upper() for (code,) in arg_tuples]
+""",
+    )
+
+    loaded = load_extensions([path])
+    batched = batch_function(loaded["label"])
+    assert isinstance(batched, BatchFunction)
+    calls = sys.modules[batched.func.__module__].CALLS
+
+    assert loaded["label"]("a") == "A"
+    assert loaded["label"](["a", None]) == ["A", None]
+    assert calls == [[("a",)], [("a",)]]
+
+    calls.clear()
+    batched.prefetch([("a",), ("b",), ("a",), (["unhashable"],)])
+    assert loaded["label"](["a", "b"]) == ["A", "B"]
+    assert calls == [[("a",), ("b",)]]
+    batched.clear()
+    assert loaded["label"]("b") == "B"
+    assert len(calls) == 2
+    assert batch_function(loaded["label"]) is batched
+    assert eval_expr_with_mapping("label(x)", {"x": "c"}, functions=loaded) == "C"
+
+
+def test_batch_function_result_count_checked() -> None:
+    """A batch function must return one result per argument tuple."""
+    batched = BatchFunction(lambda arg_tuples: [], "broken")
+    with pytest.raises(ValueError, match="returned 0 results for 1 argument tuples"):
+        batched("x")
+
+
+def test_batch_function_failure_kept_for_chunk() -> None:
+    """After a failed prefetch, calls re-raise without calling the function until :meth:`clear`."""
+    calls = []
+
+    def broken(arg_tuples):
+        calls.append(arg_tuples)
+        raise ConnectionError("down")
+
+    batched = BatchFunction(broken, "broken")
+    with pytest.raises(ConnectionError):
+        batched.prefetch([("a",), ("b",)])
+    with pytest.raises(RuntimeError, match="'broken' failed for this chunk: ConnectionError: down"):
+        batched("a")
+    assert len(calls) == 1
+    batched.clear()
+    with pytest.raises(ConnectionError):
+        batched("a")
+    assert len(calls) == 2
+
+
 def test_load_multiple_extensions(tmp_path: Path) -> None:
     """Loading multiple files merges their tagged functions."""
     a = _write_ext(
@@ -3,7 +3,8 @@
 import pytest
 from linkml_runtime import SchemaView
 
-from linkml_map.utils.fk_utils import resolve_fk_path
+from linkml_map.utils.dynamic_object import dynamic_object
+from linkml_map.utils.fk_utils import FKIndex, resolve_fk_path
 
 
 @pytest.fixture
@@ -31,6 +32,16 @@ classes:
     attributes:
       city:
       country:
+  Container:
+    attributes:
+      persons:
+        range: Person
+        multivalued: true
+        inlined_as_list: true
+      organizations:
+        range: Organization
+        multivalued: true
+        inlined_as_list: true
 """)
 
 
@@ -77,3 +88,35 @@ def test_resolve_fk_path_non_class_range(schema_with_fk):
     result = resolve_fk_path(schema_with_fk, "Person", "name.something")
 
     assert result is None
+
+
+@pytest.fixture
+def fk_index(schema_with_fk):
+    container = {
+        "persons": [{"id": "P1", "name": "Ann", "org_id": "O1"}, {"id": "P2", "name": "Bob", "org_id": "O9"}],
+        "organizations": [{"id": "O1", "name": "Acme", "address": {"city": "Berlin"}}],
+    }
+    return FKIndex(dynamic_object(container, schema_with_fk, "Container"), schema_with_fk)
+
+
+def test_fk_index_resolve_chained_paths(fk_index):
+    """Identifiers are indexed per class; paths walk into the referenced object."""
+    assert len(fk_index) == 3
+    assert fk_index.get("Organization", "O1").name == "Acme"
+    assert fk_index.get("Person", "O1") is None
+    assert fk_index.resolve("Person", "P1", "org_id.name") == "Acme"
+    assert fk_index.resolve("Organization", "O1", "address.city") == "Berlin"
+    # The final segment is returned as stored, not dereferenced.
+    assert fk_index.resolve("Person", "P1", "org_id") == "O1"
+    assert fk_index.resolve("Organization", "O9", "name") is None
+
+
+def test_fk_index_views_follow_references(fk_index):
+    """Views dereference FK slots on attribute access; dangling references keep their identifier."""
+    ann = fk_index.view(fk_index.get("Person", "P1"), "Person")
+    assert ann.org_id.name == "Acme"
+    assert ann.org_id.address.city == "Berlin"
+    assert ann.missing is None
+    bob = fk_index.view(fk_index.get("Person", "P2"), "Person")
+    assert bob.org_id.id == "O9"
+    assert bob.org_id.name is None
@@ -0,0 +1,71 @@
+"""Tests for the incremental row manifest."""
+
+import pytest
+
+from linkml_map.utils.manifest import RowManifest, content_digest
+
+
+@pytest.fixture()
+def path(tmp_path):
+    return tmp_path / "rows.manifest"
+
+
+def _run(path, rows, salt="spec", commit=True):
+    """One incremental pass over *rows*; return the ids that would be transformed and the tombstones."""
+    with RowManifest(path) as manifest:
+        manifest.start_block("Block", salt)
+        transformed = []
+        for row in rows:
+            digest = manifest.changed(row.get("id"), row)
+            if digest is not None:
+                transformed.append(row.get("id"))
+                manifest.update(row.get("id"), digest, target_id=f"T:{row.get('id')}")
+        manifest.finish_block()
+        tombstones = list(manifest.tombstones())
+        counts = dict(manifest.counts)
+        if commit:
+            manifest.commit()
+    return transformed, tombstones, counts
+
+
+def test_content_digest_ignores_key_order():
+    assert content_digest({"a": 1, "b": [1, 2]}) == content_digest({"b": [1, 2], "a": 1})
+    assert content_digest({"a": 1}) != content_digest({"a": "1"})
+
+
+def test_only_new_and_changed_rows_are_transformed(path):
+    rows = [{"id": "1", "v": "a"}, {"id": "2", "v": "b"}, {"id": "3", "v": "c"}]
+    transformed, tombstones, _ = _run(path, rows)
+    assert transformed == ["1", "2", "3"]
+    assert tombstones == []
+
+    rows = [{"id": "1", "v": "a"}, {"id": "2", "v": "B"}, {"id": "4", "v": "d"}]
+    transformed, tombstones, counts = _run(path, rows)
+    assert transformed == ["2", "4"]
+    assert tombstones == [{"class_derivation": "Block", "id": "3", "target_id": "T:3"}]
+    assert counts == {"new": 1, "changed": 1, "unchanged": 1, "deleted": 1}
+
+    # The tombstoned row is gone from the manifest: a third identical run is a no-op.
+    transformed, tombstones, _ = _run(path, rows)
+    assert transformed == []
+    assert tombstones == []
+
+
+def test_salt_change_invalidates_every_row(path):
+    rows = [{"id": "1"}, {"id": "2"}]
+    _run(path, rows, salt="v1")
+    transformed, _, _ = _run(path, rows, salt="v2")
+    assert transformed == ["1", "2"]
+
+
+def test_rows_without_identifier_always_transformed(path):
+    rows = [{"v": "x"}]
+    assert _run(path, rows)[0] == [None]
+    assert _run(path, rows)[0] == [None]
+
+
+def test_uncommitted_run_is_discarded(path):
+    rows = [{"id": "1"}]
+    _run(path, rows, commit=False)
+    transformed, _, _ = _run(path, rows)
+    assert transformed == ["1"]
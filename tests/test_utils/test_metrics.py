@@ -0,0 +1,88 @@
+"""Tests for run-time transform metrics."""
+
+import json
+import time
+
+import duckdb
+import pytest
+
+from linkml_map.utils.metrics import (
+    JsonFileReporter,
+    PrometheusTextfileReporter,
+    TransformMetrics,
+    estimate_rows,
+    format_progress_line,
+)
+
+
+@pytest.fixture()
+def tsv(tmp_path):
+    path = tmp_path / "Person.tsv"
+    path.write_text("id\tname\n" + "".join(f"P{i}\tname{i}\n" for i in range(100)))
+    return path
+
+
+def test_estimate_rows(tsv, tmp_path, monkeypatch):
+    assert estimate_rows(tsv) == 100
+    assert estimate_rows(tmp_path / "data.json") is None
+    # Larger than the sample: extrapolated from the sampled line length.
+    monkeypatch.setattr("linkml_map.utils.metrics._SAMPLE_BYTES", 200)
+    assert 80 <= estimate_rows(tsv) <= 120
+
+
+def test_snapshot_counts_progress_and_stalls(tsv):
+    metrics = TransformMetrics()
+    metrics.start_run(2, tsv.stat().st_size)
+    block = metrics.start_block(0, "Agent", "Person", "per_row", tsv)
+    block.rows_in, block.rows_out, block.errors = 50, 49, 1
+
+    snapshot = metrics.snapshot()
+    assert snapshot["current_block"]["class_derivation"] == "Agent"
+    assert (snapshot["rows_in"], snapshot["rows_out"], snapshot["errors"]) == (50, 49, 1)
+    assert snapshot["progress"] == pytest.approx(0.5)
+    assert snapshot["eta_seconds"] is not None
+    assert snapshot["stalled_seconds"] == 0.0
+    # No rows since the previous snapshot: the run is reported as stalled.
+    time.sleep(0.2)
+    assert metrics.snapshot()["stalled_seconds"] > 0.0
+    assert metrics.snapshot()["recent_rows_per_second"] == 0
+
+    metrics.finish_block()
+    snapshot = metrics.snapshot(done=True)
+    assert snapshot["current_block"] is None
+    assert snapshot["blocks_done"] == 1
+    assert snapshot["progress"] == 1.0
+    assert "done, 1 block(s)" in format_progress_line(snapshot)
+
+
+def test_duckdb_memory_is_reported_until_detached():
+    con = duckdb.connect()
+    metrics = TransformMetrics()
+    metrics.attach_duckdb(con)
+    snapshot = metrics.snapshot()
+    assert snapshot["duckdb_memory_bytes"] is not None
+    assert snapshot["duckdb_memory_limit"]
+    metrics.detach_duckdb(con)
+    con.close()
+    assert metrics.snapshot()["duckdb_memory_bytes"] is None
+
+
+def test_reporters_run_periodically_and_finally(tmp_path):
+    seen = []
+    json_path, prom_path = tmp_path / "metrics.json", tmp_path / "metrics.prom"
+    metrics = TransformMetrics([seen.append, JsonFileReporter(json_path), PrometheusTextfileReporter(prom_path)])
+    metrics.interval = 0.01
+    with metrics:
+        block = metrics.start_block(0, 'Agent "A"', "Person", "join_engine")
+        block.rows_in = block.rows_out = 3
+        deadline = time.monotonic() + 5
+        while not seen and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert seen, "no periodic snapshot"
+    assert seen[-1]["done"] is True
+    assert seen[-1]["blocks"][0]["done"] is True
+
+    assert json.loads(json_path.read_text())["rows_out"] == 3
+    prom = prom_path.read_text()
+    assert "# TYPE linkml_map_rows_out_total counter\nlinkml_map_rows_out_total 3\n" in prom
+    assert 'linkml_map_block_rows_in_total{class_derivation="Agent \\"A\\"",block="0"} 3' in prom
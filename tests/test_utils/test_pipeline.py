@@ -0,0 +1,73 @@
+"""Tests for threaded pipeline stages."""
+
+import threading
+
+import pytest
+
+from linkml_map.utils.pipeline import Pipeline
+
+
+@pytest.mark.parametrize("batch", [False, True])
+def test_prefetch_preserves_order(batch):
+    """Items come out in source order, batched or not."""
+    pipeline = Pipeline(queue_size=2, batch_size=3)
+    assert list(pipeline.prefetch(range(20), "read", batch=batch)) == list(range(20))
+    assert pipeline.stats["read"].items == 20
+
+
+def test_prefetch_runs_on_background_thread():
+    """The source is consumed on a different thread than the consumer."""
+    seen = []
+
+    def source():
+        for i in range(3):
+            seen.append(threading.current_thread().name)
+            yield i
+
+    assert list(Pipeline().prefetch(source(), "read")) == [0, 1, 2]
+    assert set(seen) == {"linkml-map-read"}
+
+
+def test_prefetch_reraises_producer_error():
+    """An exception in the source surfaces in the consumer after earlier items."""
+
+    def source():
+        yield 1
+        msg = "boom"
+        raise ValueError(msg)
+
+    got = []
+    with pytest.raises(ValueError, match="boom"):
+        got.extend(Pipeline().prefetch(source(), "read"))
+    assert got == [1]
+
+
+def test_prefetch_early_close_stops_and_closes_source():
+    """Closing the consumer stops the producer and runs the source's cleanup."""
+    closed = threading.Event()
+
+    def source():
+        try:
+            i = 0
+            while True:
+                yield i
+                i += 1
+        finally:
+            closed.set()
+
+    it = Pipeline(queue_size=1).prefetch(source(), "read")
+    assert next(it) == 0
+    it.close()
+    assert closed.is_set()
+
+
+def test_stages_chain_and_report():
+    """Chained stages accumulate stats under their own names."""
+    pipeline = Pipeline(queue_size=2, batch_size=4)
+    read = pipeline.prefetch(range(10), "read", batch=True)
+    doubled = pipeline.prefetch((i * 2 for i in read), "transform")
+    assert list(doubled) == [i * 2 for i in range(10)]
+    assert set(pipeline.stats) == {"read", "transform"}
+    report = pipeline.report()
+    assert "read: 10 item(s)" in report
+    assert "transform: 10 item(s)" in report
@@ -0,0 +1,68 @@
+"""Tests for precompiled schema snapshots."""
+
+import pytest
+from linkml_runtime import SchemaView
+
+from linkml_map.utils.schema_patch import apply_schema_patch
+from linkml_map.utils.schema_snapshot import (
+    SnapshotSchemaView,
+    is_schema_snapshot,
+    load_schema_snapshot,
+    load_schemaview,
+    write_schema_snapshot,
+)
+from tests import PERSONINFO_SRC_SCHEMA
+
+
+@pytest.fixture()
+def snapshot(tmp_path):
+    path = tmp_path / "personinfo.schema-snapshot"
+    write_schema_snapshot(PERSONINFO_SRC_SCHEMA, path)
+    return path
+
+
+def test_snapshot_matches_schema(snapshot):
+    sv = load_schemaview(snapshot)
+    assert isinstance(sv, SnapshotSchemaView)
+    assert sv.schema.imports == []
+
+    original = SchemaView(str(PERSONINFO_SRC_SCHEMA))
+    assert set(sv.all_classes()) == set(original.all_classes())
+    assert set(sv.all_types()) == set(original.all_types())
+    for cn in original.all_classes():
+        assert sv.class_induced_slots(cn) == original.class_induced_slots(cn)
+    assert sv.induced_slot("age_in_years", "Person") == original.induced_slot("age_in_years", "Person")
+
+
+def test_yaml_path_is_not_a_snapshot():
+    assert not is_schema_snapshot(PERSONINFO_SRC_SCHEMA)
+    assert type(load_schemaview(PERSONINFO_SRC_SCHEMA)) is SchemaView
+    with pytest.raises(ValueError, match="not a linkml-map schema snapshot"):
+        load_schema_snapshot(PERSONINFO_SRC_SCHEMA)
+
+
+def test_patch_invalidates_precomputed_slots(snapshot):
+    sv = load_schemaview(snapshot)
+    assert "nickname" not in {s.name for s in sv.class_induced_slots("Person")}
+    apply_schema_patch(sv, {"classes": {"Person": {"attributes": {"nickname": {"range": "string"}}}}})
+    assert "nickname" in {s.name for s in sv.class_induced_slots("Person")}
+    assert sv.induced_slot("nickname", "Person").range == "string"
+
+
+def test_snapshot_content_without_suffix_is_not_unpickled(snapshot, tmp_path, monkeypatch):
+    """Only the file name makes a path a snapshot; a renamed snapshot is never unpickled."""
+    disguised = tmp_path / "schema.yaml"
+    disguised.write_bytes(snapshot.read_bytes())
+    unpickled = []
+    monkeypatch.setattr("linkml_map.utils.schema_snapshot.pickle.loads", unpickled.append)
+    assert not is_schema_snapshot(disguised)
+    with pytest.raises(ValueError, match="not a linkml-map schema snapshot"):
+        load_schema_snapshot(disguised)
+    with pytest.raises(Exception):  # noqa: B017, PT011 - the bytes are not YAML
+        load_schemaview(disguised)
+    assert unpickled == []
+
+
+def test_write_requires_snapshot_suffix(tmp_path):
+    with pytest.raises(ValueError, match="must end in '.schema-snapshot'"):
+        write_schema_snapshot(PERSONINFO_SRC_SCHEMA, tmp_path / "personinfo.pkl")
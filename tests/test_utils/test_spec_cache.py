@@ -0,0 +1,65 @@
+"""Tests for the on-disk specification cache."""
+
+import pytest
+
+from linkml_map.datamodel.transformer_model import TransformationSpecification
+from linkml_map.utils.spec_cache import CachedSpec, SpecCache, schema_files
+
+
+@pytest.fixture()
+def inputs(tmp_path):
+    spec = tmp_path / "spec.yaml"
+    spec.write_text("class_derivations:\n  Agent:\n    populated_from: Person\n")
+    core = tmp_path / "core.yaml"
+    core.write_text("id: https://example.org/core\nname: core\n")
+    schema = tmp_path / "schema.yaml"
+    schema.write_text("id: https://example.org/s\nname: s\nimports:\n  - linkml:types\n  - core\n")
+    return spec, schema, core
+
+
+def test_schema_files_follows_local_imports(inputs):
+    _spec, schema, core = inputs
+    assert schema_files(schema) == [schema.resolve(), core.resolve()]
+
+
+def test_key_tracks_every_input(inputs):
+    spec, schema, core = inputs
+    cache = SpecCache(spec.parent / "cache")
+    key = cache.key((str(spec),), schema)
+    assert key == cache.key((str(spec),), schema)
+    assert key != cache.key((str(spec),), schema, schema)
+
+    keys = {key}
+    for path in (spec, schema, core):
+        path.write_text(path.read_text() + "# edited\n")
+        keys.add(cache.key((str(spec),), schema))
+    assert len(keys) == 4
+
+
+def test_key_tracks_code(inputs, monkeypatch):
+    """A change to linkml-map's code or cache format invalidates entries, even at the same version."""
+    spec, schema, _core = inputs
+    cache = SpecCache(spec.parent / "cache")
+    key = cache.key((str(spec),), schema)
+    monkeypatch.setattr("linkml_map.utils.spec_cache._code_digest", lambda: "edited")
+    edited = cache.key((str(spec),), schema)
+    monkeypatch.setattr("linkml_map.utils.spec_cache.CACHE_FORMAT", 2)
+    assert len({key, edited, cache.key((str(spec),), schema)}) == 3
+
+
+def test_remote_schema_is_not_cached(inputs):
+    spec, _schema, _core = inputs
+    assert SpecCache(spec.parent).key((str(spec),), "https://example.org/schema.yaml") is None
+
+
+def test_round_trip_and_corrupt_entry(tmp_path):
+    cache = SpecCache(tmp_path / "cache")
+    spec = TransformationSpecification(id="test")
+    assert cache.get("k") is None
+    cache.put("k", CachedSpec(spec, [], None, ["warning"]))
+    entry = cache.get("k")
+    assert entry.specification == spec
+    assert entry.preflight_messages == ["warning"]
+
+    (tmp_path / "cache" / "k.pickle").write_bytes(b"not a pickle")
+    assert cache.get("k") is None
@@ -0,0 +1,116 @@
+"""Tests for checkpointed, resumable output."""
+
+import json
+
+import pytest
+
+from linkml_map.writers import (
+    Checkpoint,
+    CheckpointedWriter,
+    OutputFormat,
+    PartitionedWriter,
+    make_stream_writer,
+)
+
+
+class _Crash(Exception):
+    pass
+
+
+def _chunks(n_chunks, size=2, start=0, crash_after=None):
+    """Yield chunks of rows; columns appear late so tabular headers grow."""
+    for c in range(start, n_chunks):
+        if crash_after is not None and c == crash_after:
+            raise _Crash
+        chunk = []
+        for i in range(c * size, (c + 1) * size):
+            row = {"id": f"x{i}", "n": i}
+            if i >= 5:
+                row["late"] = f"v{i}"
+            chunk.append(row)
+        yield chunk
+
+
+def _writers(tmp_path, formats):
+    return [(make_stream_writer(fmt), tmp_path / f"out.{fmt.value}") for fmt in formats]
+
+
+FORMATS = [OutputFormat.JSON, OutputFormat.JSONL, OutputFormat.YAML, OutputFormat.TSV, OutputFormat.CSV]
+
+
+def test_resume_after_crash_matches_uninterrupted(tmp_path):
+    """Truncating to the checkpoint and continuing reproduces an uninterrupted run."""
+    expected_dir = tmp_path / "expected"
+    expected_dir.mkdir()
+    CheckpointedWriter(_writers(expected_dir, FORMATS), Checkpoint(expected_dir / "ckpt", "fp"), every=100).write_all(
+        _chunks(6)
+    )
+
+    run_dir = tmp_path / "run"
+    run_dir.mkdir()
+    checkpoint = Checkpoint(run_dir / "ckpt", "fp")
+    positions = []
+
+    def before_save(cp):
+        cp.row = cp.rows_written
+        positions.append(cp.row)
+
+    with pytest.raises(_Crash):
+        CheckpointedWriter(_writers(run_dir, FORMATS), checkpoint, every=3, before_save=before_save).write_all(
+            _chunks(6, crash_after=5)
+        )
+    # Chunks of 2 rows, a checkpoint once 3+ rows were written since the last one.
+    assert positions == [4, 8]
+
+    resumed = Checkpoint.load(run_dir / "ckpt", "fp")
+    assert resumed.row == 8
+    CheckpointedWriter(_writers(run_dir, FORMATS), resumed, every=3).write_all(_chunks(6, start=resumed.row // 2))
+
+    for fmt in FORMATS:
+        name = f"out.{fmt.value}"
+        assert (run_dir / name).read_text() == (expected_dir / name).read_text(), fmt
+
+
+def test_load_missing_returns_none(tmp_path):
+    assert Checkpoint.load(tmp_path / "nope", "fp") is None
+
+
+def test_load_rejects_other_fingerprint(tmp_path):
+    Checkpoint(tmp_path / "ckpt", "fp").save()
+    with pytest.raises(ValueError, match="different spec"):
+        Checkpoint.load(tmp_path / "ckpt", "other")
+
+
+def test_save_round_trip_and_remove(tmp_path):
+    checkpoint = Checkpoint(tmp_path / "ckpt", "fp", block=2, row=7, errors=1, outputs={"a": {"offset": 3}})
+    checkpoint.save()
+    assert json.loads((tmp_path / "ckpt").read_text())["version"] == 1
+    assert Checkpoint.load(tmp_path / "ckpt", "fp") == checkpoint
+    checkpoint.remove()
+    assert not (tmp_path / "ckpt").exists()
+
+
+def test_partitioned_checkpoint_and_resume(tmp_path):
+    """Checkpoints close part files; resuming drops parts started after the last one."""
+    states = []
+
+    def tagged(start, stop):
+        for c in range(start, stop):
+            if c == 3:
+                raise _Crash
+            yield [("Person", {"id": f"P{i}"}) for i in range(c * 2, c * 2 + 2)]
+
+    writer = PartitionedWriter(tmp_path, OutputFormat.JSONL)
+    with pytest.raises(_Crash):
+        writer.write_all(tagged(0, 5), checkpoint_every=4, on_checkpoint=states.append)
+    assert len(states) == 1
+    assert states[0]["written"] == [str(tmp_path / "Person" / "part-00000.jsonl")]
+    # The part started after the checkpoint was closed by the crash but is incomplete.
+    assert (tmp_path / "Person" / "part-00001.jsonl").exists()
+
+    resumed = PartitionedWriter(tmp_path, OutputFormat.JSONL)
+    resumed.set_state(states[0])
+    written = resumed.write_all(iter([[("Person", {"id": f"P{i}"}) for i in range(4, 10)]]))
+    assert [p.name for p in written] == ["part-00000.jsonl", "part-00001.jsonl"]
+    ids = [json.loads(line)["id"] for p in written for line in p.read_text().splitlines()]
+    assert ids == [f"P{i}" for i in range(10)]
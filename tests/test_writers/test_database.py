@@ -0,0 +1,101 @@
+"""Tests for the DuckDB/SQLite database sink."""
+
+import sqlite3
+import sys
+
+import duckdb
+import pytest
+from linkml_runtime import SchemaView
+
+from linkml_map.compiler.sql_compiler import SQLCompiler
+from linkml_map.writers import DatabaseSink, is_database_path, tee_to_databases
+
+SCHEMA = """
+id: https://example.org/db
+name: db
+prefixes:
+  linkml: https://w3id.org/linkml/
+imports:
+  - linkml:types
+default_range: string
+classes:
+  Person:
+    attributes:
+      id:
+        identifier: true
+      age:
+        range: integer
+      aliases:
+        multivalued: true
+"""
+
+ROWS = [
+    ("Person", {"id": "P:1", "age": 30, "aliases": ["a", "b"]}),
+    ("Person", {"id": "P:2", "age": None, "aliases": ["c"], "extra": "x"}),
+    ("Org", {"id": "O:1", "name": "Acme"}),
+]
+
+
+def _ddl(dialect):
+    compiler = SQLCompiler()
+    compiler.dialect = dialect
+    return compiler.create_ddl(SchemaView(SCHEMA))
+
+
+def test_is_database_path():
+    assert is_database_path("out.duckdb")
+    assert is_database_path("out.SQLITE")
+    assert not is_database_path("out.tsv")
+
+
+def test_duckdb_sink_creates_typed_tables(tmp_path):
+    path = tmp_path / "out.duckdb"
+    sink = DatabaseSink(path, ddl=_ddl("duckdb"))
+    sink.write_tagged(ROWS)
+    sink.close()
+    con = duckdb.connect(str(path))
+    assert con.execute("SELECT id, age, aliases, extra FROM Person ORDER BY id").fetchall() == [
+        ("P:1", 30, ["a", "b"], None),
+        ("P:2", None, ["c"], "x"),
+    ]
+    assert con.execute("SELECT * FROM Org").fetchall() == [("O:1", "Acme")]
+
+
+def test_sqlite_sink_stores_lists_as_json(tmp_path):
+    path = tmp_path / "out.sqlite"
+    sink = DatabaseSink(path, ddl=_ddl("sqlite"))
+    sink.write_tagged(ROWS)
+    sink.write_tagged(ROWS[:1])
+    sink.close()
+    con = sqlite3.connect(path)
+    assert con.execute("SELECT count(*) FROM Person").fetchone() == (3,)
+    assert con.execute("SELECT aliases FROM Person WHERE id = 'P:1' LIMIT 1").fetchone() == ('["a", "b"]',)
+    assert sink.rows_written == {"Person": 3, "Org": 1}
+
+
+def test_unknown_extension(tmp_path):
+    with pytest.raises(ValueError, match="Cannot infer database dialect"):
+        DatabaseSink(tmp_path / "out.db")
+
+
+def test_tee_to_databases_yields_untagged_rows(tmp_path):
+    sink = DatabaseSink(tmp_path / "out.duckdb")
+    chunks = list(tee_to_databases(iter([ROWS]), [sink]))
+    sink.close()
+    assert chunks == [[row for _, row in ROWS]]
+
+
+@pytest.mark.parametrize("with_arrow", [True, False])
+def test_duckdb_sink_mixed_value_types(tmp_path, monkeypatch, with_arrow):
+    """A column mixing numbers and strings loads the same with and without the Arrow path."""
+    if with_arrow:
+        pytest.importorskip("pyarrow")
+    else:
+        monkeypatch.setitem(sys.modules, "pyarrow", None)
+    path = tmp_path / "out.duckdb"
+    sink = DatabaseSink(path)
+    sink.write_rows("T", [{"id": "a", "v": 1}, {"id": "b", "v": "x"}])
+    sink.write_rows("T", [{"id": "c", "v": 2}])
+    sink.close()
+    con = duckdb.connect(str(path))
+    assert con.execute("SELECT id, v FROM T ORDER BY id").fetchall() == [("a", "1"), ("b", "x"), ("c", "2")]
@@ -7,14 +7,17 @@ import pytest
 import yaml
 
 from linkml_map.writers import (
+    BufferedSink,
     JSONLStreamWriter,
     JSONStreamWriter,
     MultiStreamWriter,
     OutputFormat,
+    StdlibJSONBackend,
     StreamWriter,
     TabularStreamWriter,
     YAMLStreamWriter,
     csv_stream,
+    get_json_backend,
     get_stream_writer,
     json_stream,
     jsonl_stream,
@@ -22,6 +25,7 @@ from linkml_map.writers import (
     tsv_stream,
     yaml_stream,
 )
+from linkml_map.writers.output_streams import _strip_nulls
 
 
 @pytest.fixture
@@ -411,6 +415,22 @@ def test_yaml_stream_writer_empty_chunk_before_data_with_key():
     assert len(parsed["people"]) == 1
 
 
+def test_yaml_stream_writer_documents_match_per_object_dump():
+    """Batched document output is identical to dumping each object separately."""
+    writer = YAMLStreamWriter()
+    result = "".join(writer.process(iter(_make_chunks(2, 1))))
+    expected = "".join(yaml.dump(obj, default_flow_style=False, allow_unicode=True) + "---\n" for obj in SAMPLE_DATA)
+    assert result == expected
+
+
+def test_yaml_stream_writer_continuation_matches_single_dump():
+    """Continuation chunks under a key render exactly as one whole-list dump."""
+    writer = YAMLStreamWriter(key_name="people")
+    result = "".join(writer.process(iter(_make_chunks(1, 1, 1))))
+    expected = yaml.dump({"people": SAMPLE_DATA}, default_flow_style=False, allow_unicode=True)
+    assert result == expected
+
+
 # --- Null suppression tests ---
 
 DATA_WITH_NULLS = [
@@ -624,3 +644,166 @@ def test_multi_stream_writer_with_file_handle_target(tmp_path):
     # Path target should have JSON content
     json_data = json.loads(json_path.read_text())
     assert len(json_data) == 3
+
+
+# --- Batched write path tests ---
+
+
+@pytest.mark.parametrize("fmt", list(OutputFormat))
+def test_write_chunk_emits_single_fragment(fmt):
+    """Each writer emits one fragment per non-empty chunk."""
+    writer = make_stream_writer(fmt, key_name="items")
+    list(writer.write_chunk(SAMPLE_DATA[:1]))
+    assert len(list(writer.write_chunk(SAMPLE_DATA))) == 1
+
+
+class _CountingIO(StringIO):
+    """StringIO that records how many times ``write`` was called."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.write_calls = 0
+
+    def write(self, text: str) -> int:
+        self.write_calls += 1
+        return super().write(text)
+
+
+def test_buffered_sink_coalesces_writes():
+    fh = _CountingIO()
+    sink = BufferedSink(fh, buffer_size=10)
+    for _ in range(4):
+        sink.write("abc")
+    assert fh.write_calls == 1
+    sink.write("d")
+    sink.flush()
+    assert fh.write_calls == 2
+    assert fh.getvalue() == "abc" * 4 + "d"
+
+
+def test_buffered_sink_zero_size_writes_through():
+    fh = _CountingIO()
+    sink = BufferedSink(fh, buffer_size=0)
+    sink.write("a")
+    sink.write("b")
+    assert fh.write_calls == 2
+
+
+def test_write_to_matches_process():
+    fh = _CountingIO()
+    JSONLStreamWriter().write_to(iter(_make_chunks(1, 2)), fh)
+    assert fh.write_calls == 1
+    assert fh.getvalue() == "".join(JSONLStreamWriter().process(iter(_make_chunks(1, 2))))
+
+
+def test_stdlib_backend_strips_nulls():
+    backend = get_json_backend()
+    assert isinstance(backend, StdlibJSONBackend)
+    assert backend.encode({"a": 1, "b": None, "c": [{"d": None}]}) == '{"a": 1, "c": [{}]}'
+
+
+def test_strip_nulls_copies_only_what_changes():
+    flat = {"a": 1, "b": "x"}
+    scalars = [1, "x", None]
+    assert _strip_nulls(flat) is flat
+    assert _strip_nulls(scalars) is scalars
+    row = {"a": None, "b": {"c": None, "d": [1]}}
+    assert _strip_nulls(row) == {"b": {"d": [1]}}
+    assert row == {"a": None, "b": {"c": None, "d": [1]}}
+
+
+def test_orjson_backend_round_trips():
+    pytest.importorskip("orjson")
+    writer = JSONLStreamWriter(backend=get_json_backend("orjson"))
+    result = "".join(writer.process(iter([DATA_WITH_NULLS])))
+    lines = [json.loads(line) for line in result.strip().split("\n")]
+    assert lines == [json.loads(line) for line in "".join(jsonl_stream(iter([DATA_WITH_NULLS]))).split("\n") if line]
+
+
+def test_orjson_backend_pretty_json_array():
+    pytest.importorskip("orjson")
+    writer = JSONStreamWriter(key_name="people", backend=get_json_backend("orjson"))
+    data = json.loads("".join(writer.process(iter(_make_chunks(2, 1)))))
+    assert len(data["people"]) == 3
+
+
+def test_get_json_backend_unknown():
+    with pytest.raises(ValueError, match="Unknown JSON backend"):
+        get_json_backend("nope")
+
+
+def test_multi_stream_writer_buffer_size(tmp_path):
+    buf = _CountingIO()
+    multi = MultiStreamWriter([(JSONLStreamWriter(), buf)], buffer_size=1 << 20)
+    multi.write_all(iter(_make_chunks(1, 1, 1)))
+    assert buf.write_calls == 1
+    assert len(buf.getvalue().strip().split("\n")) == 3
+
+
+# --- Threaded MultiStreamWriter tests ---
+
+
+def test_multi_stream_writer_threaded_matches_serial(tmp_path):
+    chunks = _make_chunks(1, 1, 1)
+    formats = [(OutputFormat.JSON, "json"), (OutputFormat.YAML, "yaml"), (OutputFormat.TSV, "tsv")]
+    serial = [(make_stream_writer(fmt), tmp_path / f"serial.{ext}") for fmt, ext in formats]
+    threaded = [(make_stream_writer(fmt), tmp_path / f"threaded.{ext}") for fmt, ext in formats]
+    MultiStreamWriter(serial).write_all(iter(chunks))
+    MultiStreamWriter(threaded, threaded=True, queue_size=1).write_all(iter(chunks))
+    for (_, serial_path), (_, threaded_path) in zip(serial, threaded, strict=True):
+        assert serial_path.read_text() == threaded_path.read_text()
+
+
+def test_multi_stream_writer_threaded_header_rewrite(tmp_path):
+    tsv_path = tmp_path / "out.tsv"
+    multi = MultiStreamWriter([(TabularStreamWriter(), tsv_path)], threaded=True)
+    multi.write_all(iter([[{"id": "1"}], [{"id": "2", "email": "b@x.com"}]]))
+    lines = tsv_path.read_text().strip().split("\n")
+    assert lines[0] == "id\temail"
+    assert not (tmp_path / "out.tsv.tmp").exists()
+
+
+class _FailingWriter(JSONLStreamWriter):
+    """Writer that raises on its second chunk."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.calls = 0
+
+    def write_chunk(self, chunk):
+        self.calls += 1
+        if self.calls == 2:
+            msg = "disk full"
+            raise OSError(msg)
+        yield from super().write_chunk(chunk)
+
+
+def test_multi_stream_writer_threaded_propagates_errors_and_closes(tmp_path):
+    ok_path = tmp_path / "ok.jsonl"
+    bad_path = tmp_path / "bad.jsonl"
+    multi = MultiStreamWriter(
+        [(JSONLStreamWriter(), ok_path), (_FailingWriter(), bad_path)],
+        threaded=True,
+        queue_size=1,
+    )
+    chunks = ([row] for row in SAMPLE_DATA * 10)
+    with pytest.raises(OSError, match="disk full"):
+        multi.write_all(chunks)
+    # Handles are closed and the healthy output holds complete lines only
+    for line in ok_path.read_text().splitlines():
+        json.loads(line)
+
+
+def test_multi_stream_writer_threaded_producer_error_leaves_output_unfinalized(tmp_path):
+    json_path = tmp_path / "out.json"
+    multi = MultiStreamWriter([(JSONStreamWriter(), json_path)], threaded=True, queue_size=1)
+
+    def chunks():
+        yield [SAMPLE_DATA[0]]
+        msg = "transformation failed"
+        raise ValueError(msg)
+
+    with pytest.raises(ValueError, match="transformation failed"):
+        multi.write_all(chunks())
+    # As on the serial path, a failed run never closes the array
+    assert not json_path.read_text().rstrip().endswith("]")
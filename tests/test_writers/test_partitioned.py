@@ -0,0 +1,73 @@
+"""Tests for partitioned (per-class, rolling) output."""
+
+import json
+
+import pytest
+
+from linkml_map.writers import OutputFormat, PartitionedWriter
+
+
+def _tagged(class_name, n, start=0):
+    return [(class_name, {"id": f"{class_name}:{i}", "n": i}) for i in range(start, start + n)]
+
+
+def _read_jsonl(path):
+    return [json.loads(line) for line in path.read_text().splitlines() if line]
+
+
+def test_rows_routed_per_class(tmp_path):
+    writer = PartitionedWriter(tmp_path, OutputFormat.JSONL)
+    written = writer.write_all(iter([_tagged("Person", 2) + _tagged("Org", 1), _tagged("Person", 1, start=2)]))
+    assert sorted(p.relative_to(tmp_path).as_posix() for p in written) == [
+        "Org/part-00000.jsonl",
+        "Person/part-00000.jsonl",
+    ]
+    assert [r["n"] for r in _read_jsonl(tmp_path / "Person" / "part-00000.jsonl")] == [0, 1, 2]
+
+
+def test_roll_by_rows(tmp_path):
+    writer = PartitionedWriter(tmp_path, OutputFormat.JSON, max_rows=2)
+    written = writer.write_all(iter([_tagged("Person", 3), _tagged("Person", 2, start=3)]))
+    assert [p.name for p in written] == ["part-00000.json", "part-00001.json", "part-00002.json"]
+    # Every part is a complete JSON array
+    assert [len(json.loads(p.read_text())) for p in written] == [2, 2, 1]
+
+
+def test_roll_by_bytes(tmp_path):
+    writer = PartitionedWriter(tmp_path, OutputFormat.JSONL, max_bytes=1)
+    written = writer.write_all(iter([_tagged("Person", 1), _tagged("Person", 1, start=1)]))
+    assert len(written) == 2
+
+
+def test_hash_partitioning_is_stable(tmp_path):
+    rows = _tagged("Person", 50)
+    first = PartitionedWriter(tmp_path / "a", OutputFormat.JSONL, partition_key="id", num_partitions=4)
+    second = PartitionedWriter(tmp_path / "b", OutputFormat.JSONL, partition_key="id", num_partitions=4)
+    first.write_all(iter([rows]))
+    second.write_all(iter([rows]))
+    a = {p.relative_to(tmp_path / "a"): _read_jsonl(p) for p in first.written}
+    b = {p.relative_to(tmp_path / "b"): _read_jsonl(p) for p in second.written}
+    assert a == b
+    assert all(path.parts[1].startswith("bucket=") for path in a)
+    assert sum(len(v) for v in a.values()) == 50
+
+
+def test_tabular_headers_per_file(tmp_path):
+    writer = PartitionedWriter(tmp_path, OutputFormat.TSV)
+    writer.write_all(
+        iter(
+            [
+                [("Person", {"id": "1", "name": "A"}), ("Org", {"id": "O1"})],
+                [("Person", {"id": "2", "name": "B", "email": "b@x"})],
+            ]
+        )
+    )
+    person = (tmp_path / "Person" / "part-00000.tsv").read_text().splitlines()
+    assert person[0] == "id\tname\temail"
+    assert person[1] == "1\tA\t"
+    assert (tmp_path / "Org" / "part-00000.tsv").read_text().splitlines() == ["id", "O1"]
+
+
+def test_invalid_partitions(tmp_path):
+    with pytest.raises(ValueError, match="num_partitions"):
+        PartitionedWriter(tmp_path, OutputFormat.JSONL, partition_key="id", num_partitions=0)